@@ -2,12 +2,46 @@
 AI agent modules.
 """
 
-from .base import AgentRequest, AgentResponse, AgentType, AsyncAgent
-from .chatgpt_agent import ChatGPTAgent
-from .claude_agent import ClaudeAgent
-from .gemini_agent import GeminiAgent
-from .perplexity_agent import PerplexityAgent
-from .router import AgentMapping, AgentRouter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import AgentRequest, AgentResponse, AgentType, AsyncAgent
+    from .chatgpt_agent import ChatGPTAgent
+    from .claude_agent import ClaudeAgent
+    from .gemini_agent import GeminiAgent
+    from .perplexity_agent import PerplexityAgent
+    from .router import AgentMapping, AgentRouter, PhaseTask
+
+# Exports are resolved on first access so that agents.base/agents.router can be
+# imported without loading every provider (and Playwright).
+_MODULE_BY_NAME = {
+    "AsyncAgent": "base",
+    "AgentRequest": "base",
+    "AgentResponse": "base",
+    "AgentType": "base",
+    "ChatGPTAgent": "chatgpt_agent",
+    "ClaudeAgent": "claude_agent",
+    "GeminiAgent": "gemini_agent",
+    "PerplexityAgent": "perplexity_agent",
+    "AgentRouter": "router",
+    "AgentMapping": "router",
+    "PhaseTask": "router",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODULE_BY_NAME])
+
 
 __all__ = [
     "AsyncAgent",
@@ -3,11 +3,13 @@ Base agent protocol and utilities.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from core.models import AgentType
-from gateway.models import GatewayResponse
+from gateway.models import GatewayRequest, GatewayResponse
 
 
 class AgentRequest(BaseModel):
@@ -29,6 +31,16 @@ class AgentResponse(BaseModel):
     response_time: float = 0.0
     success: bool = True
     error: str | None = None
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+class AgentStreamChunk(BaseModel):
+    """Incremental piece of a streamed agent response."""
+
+    delta: str = ""
+    text: str = ""
+    done: bool = False
+    response: AgentResponse | None = None
 
 
 class AsyncAgent(ABC):
@@ -88,3 +100,44 @@ class AsyncAgent(ABC):
             success=response.success,
             error=response.error,
         )
+
+    async def execute_stream(
+        self,
+        request: AgentRequest,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[AgentStreamChunk]:
+        """
+        Execute agent task, yielding the response as it streams.
+
+        Gateways without send_message_stream() fall back to execute() and
+        yield a single final chunk.
+
+        Args:
+            request: AgentRequest with task_name and prompt
+            idle_timeout: Maximum gap between streamed text changes (seconds)
+
+        Yields:
+            AgentStreamChunk deltas, then a final chunk with done=True and
+            the validated AgentResponse
+        """
+        if not hasattr(self.gateway, "send_message_stream"):
+            response = await self.execute(request)
+            yield AgentStreamChunk(text=response.content, done=True, response=response)
+            return
+
+        gw_request = GatewayRequest(
+            task_name=request.task_name,
+            prompt=request.prompt,
+            max_tokens=request.max_tokens,
+            timeout=request.timeout,
+        )
+
+        async for chunk in self.gateway.send_message_stream(gw_request, idle_timeout=idle_timeout):
+            if not chunk.done:
+                yield AgentStreamChunk(delta=chunk.delta, text=chunk.text)
+                continue
+
+            response = await self.validate_response(chunk.response)
+            response.task_name = request.task_name
+            yield AgentStreamChunk(text=response.content, done=True, response=response)
+            return
@@ -2,16 +2,41 @@
 Agent router for mapping (phase, task) to AI agent.
 
 Implements the routing table defined in SPEC-PIPELINE-001.
+
+Provider-flexible tasks may also run on the alternatives listed in
+AgentMapping.get_flexible_tasks(); with a health tracker the router sends
+them to the allowed provider with the best expected completion time, so
+work moves away from a slow or failing provider. A failed attempt fails
+over to the next allowed provider through a FallbackChain sharing the same
+tracker, so routing and failover see one circuit state.
 """
 
+import asyncio
+import sqlite3
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager, nullcontext
 from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel
 
-from agents.base import AgentRequest, AgentResponse, AsyncAgent
-from core.exceptions import AgentException
+from agents.base import AgentRequest, AgentResponse, AgentStreamChunk, AsyncAgent
+from cache.manager import CacheManager, CacheMode
+from core.exceptions import AgentException, BudgetException, ErrorCode
+from core.logger import get_logger
 from core.models import AgentType, DocumentType
+from gateway.models import GatewayRequest, GatewayResponse
+from gateway.rate_limiter import RateGovernor, classify_outcome, get_rate_governor
+from monitoring.budget import AdmissionAction, AdmissionDecision, BudgetGuard, get_budget_guard
+from monitoring.health import HealthProbe, ProviderHealthTracker, get_provider_health
+from monitoring.ledger import UsageLedger, get_usage_ledger
+from monitoring.tracker import TokenTracker, TokenUsage
+from resilience.fallback_chain import FallbackChain, FallbackConfig
+
+logger = get_logger(__name__)
+
+# Called with (phase, task, chunk) for every streamed chunk
+StreamListener = Callable[[int, "PhaseTask", AgentStreamChunk], None]
 
 
 class PhaseTask(StrEnum):
@@ -48,6 +73,7 @@ class AgentMapping(BaseModel):
     doc_type: DocumentType
     agent: AgentType
     fallback: AgentType | None = None
+    alternatives: tuple[AgentType, ...] = ()
 
     @classmethod
     def get_default_mapping(cls) -> dict[tuple[int, PhaseTask, DocumentType], AgentType]:
@@ -72,22 +98,224 @@ class AgentMapping(BaseModel):
             (5, PhaseTask.POLISH_CLAUDE, DocumentType.BIZPLAN): AgentType.CLAUDE,
         }
 
+    @classmethod
+    def get_flexible_tasks(cls) -> dict[PhaseTask, tuple[AgentType, ...]]:
+        """
+        Get the other providers allowed to run each provider-flexible task.
+
+        Tasks not listed here always run on their mapped provider.
+        """
+        return {
+            PhaseTask.BRAINSTORM_CHATGPT: (AgentType.CLAUDE, AgentType.GEMINI),
+            PhaseTask.DEEP_SEARCH_GEMINI: (AgentType.PERPLEXITY,),
+            PhaseTask.FACT_CHECK_PERPLEXITY: (AgentType.GEMINI,),
+            PhaseTask.SWOT_CHATGPT: (AgentType.CLAUDE,),
+            PhaseTask.OUTLINE_CHATGPT: (AgentType.CLAUDE, AgentType.GEMINI),
+            PhaseTask.CHARTS_GEMINI: (AgentType.CHATGPT,),
+            PhaseTask.VERIFY_PERPLEXITY: (AgentType.GEMINI,),
+        }
+
+    @classmethod
+    def resolve_route(
+        cls,
+        task_name: str,
+        agent_type: AgentType | None = None,
+        doc_type: DocumentType = DocumentType.BIZPLAN,
+    ) -> tuple[int, PhaseTask] | None:
+        """
+        Find the (phase, task) route for a standalone request.
+
+        Used by callers that only know a task name (e.g. batched requests).
+
+        Args:
+            task_name: PhaseTask value of the request
+            agent_type: Agent whose first mapped task is used when task_name is unknown
+            doc_type: Document type of the route
+
+        Returns:
+            Tuple of (phase, task), or None if nothing matches
+        """
+        mapping = cls.get_default_mapping()
+        for phase, task, mapped_doc_type in mapping:
+            if task.value == task_name and mapped_doc_type == doc_type:
+                return phase, task
+        if agent_type is not None:
+            for (phase, task, mapped_doc_type), mapped_agent in mapping.items():
+                if mapped_agent == agent_type and mapped_doc_type == doc_type:
+                    return phase, task
+        return None
+
+    @classmethod
+    def get_task_dependencies(cls) -> dict[PhaseTask, tuple[PhaseTask, ...]]:
+        """
+        Get the upstream task outputs each task consumes.
+
+        Derived from the variables referenced by each prompt template.
+        Tasks without shared upstream outputs may run concurrently.
+        """
+        return {
+            # Phase 1: brainstorm -> validate
+            PhaseTask.BRAINSTORM_CHATGPT: (),
+            PhaseTask.VALIDATE_CLAUDE: (PhaseTask.BRAINSTORM_CHATGPT,),
+            # Phase 2: both research tasks build on Phase 1 ideas (parallel)
+            PhaseTask.DEEP_SEARCH_GEMINI: (),
+            PhaseTask.FACT_CHECK_PERPLEXITY: (
+                PhaseTask.BRAINSTORM_CHATGPT,
+                PhaseTask.VALIDATE_CLAUDE,
+            ),
+            # Phase 3: swot -> narrative
+            PhaseTask.SWOT_CHATGPT: (PhaseTask.VALIDATE_CLAUDE,),
+            PhaseTask.NARRATIVE_CLAUDE: (PhaseTask.SWOT_CHATGPT,),
+            # Phase 4: business plan -> (outline, charts)
+            PhaseTask.BUSINESS_PLAN_CLAUDE: (PhaseTask.SWOT_CHATGPT, PhaseTask.NARRATIVE_CLAUDE),
+            PhaseTask.OUTLINE_CHATGPT: (PhaseTask.BUSINESS_PLAN_CLAUDE,),
+            PhaseTask.CHARTS_GEMINI: (PhaseTask.BUSINESS_PLAN_CLAUDE,),
+            # Phase 5: verify runs alongside the Claude review chain
+            PhaseTask.VERIFY_PERPLEXITY: (PhaseTask.BUSINESS_PLAN_CLAUDE,),
+            PhaseTask.FINAL_REVIEW_CLAUDE: (
+                PhaseTask.BUSINESS_PLAN_CLAUDE,
+                PhaseTask.FACT_CHECK_PERPLEXITY,
+            ),
+            PhaseTask.POLISH_CLAUDE: (PhaseTask.BUSINESS_PLAN_CLAUDE, PhaseTask.FINAL_REVIEW_CLAUDE),
+        }
+
+
+class _AgentProvider:
+    """Presents a registered agent to the FallbackChain as a gateway provider."""
+
+    def __init__(self, agent: AsyncAgent) -> None:
+        self.agent = agent
+
+    async def send_message(self, request: GatewayRequest) -> GatewayResponse:
+        response = await self.agent.execute(
+            AgentRequest(
+                task_name=request.task_name,
+                prompt=request.prompt,
+                max_tokens=request.max_tokens,
+                timeout=request.timeout,
+            )
+        )
+        return GatewayResponse(
+            content=response.content,
+            success=response.success,
+            error=response.error,
+            tokens_used=response.tokens_used,
+            response_time=response.response_time,
+            metadata=dict(response.metadata),
+        )
+
 
 class AgentRouter:
     """
     Routes (phase, task) requests to appropriate AI agent.
     """
 
-    def __init__(self, settings: Any) -> None:
-        """Initialize router with settings."""
+    def __init__(
+        self,
+        settings: Any,
+        cache_manager: CacheManager | None = None,
+        cache_mode: CacheMode = CacheMode.USE,
+        rate_governor: RateGovernor | None = None,
+        usage_ledger: UsageLedger | None = None,
+        budget_guard: BudgetGuard | None = None,
+        provider_health: ProviderHealthTracker | None = None,
+    ) -> None:
+        """
+        Initialize router with settings.
+
+        Args:
+            settings: Configuration settings
+            cache_manager: Optional response cache consulted before agents run
+            cache_mode: How the cache is used (use, refresh or bypass)
+            rate_governor: Per-provider rate/concurrency governor
+                (process-wide governor from settings if None)
+            usage_ledger: Ledger every agent response is recorded into
+                (process-wide ledger from settings if None)
+            budget_guard: Admission control against cost budgets
+                (process-wide guard from settings if None)
+            provider_health: Provider health used to route provider-flexible tasks
+                (process-wide tracker from settings if None and usage_ledger is given,
+                else no health routing)
+        """
         self.settings = settings
         self.mapping = AgentMapping.get_default_mapping()
         self.agents: dict[AgentType, AsyncAgent] = {}
+        self.dependencies = AgentMapping.get_task_dependencies()
+        self.flexible_tasks = AgentMapping.get_flexible_tasks()
+        # Routes chosen by resolve_agent_type(), kept until the task executes
+        self._routes: dict[tuple[int, PhaseTask, DocumentType], AgentMapping] = {}
+        self.cache_manager = cache_manager
+        self.cache_mode = cache_mode
+        self.cache_ttl_hours: int | None = None
+        self.template_version: str | None = None
+        self.stream_listener: StreamListener | None = None
+        self.rate_governor = rate_governor or get_rate_governor(settings)
+        self.usage_ledger = usage_ledger or get_usage_ledger(settings)
+        self.budget_guard = budget_guard or get_budget_guard(
+            settings, TokenTracker(ledger=self.usage_ledger) if self.usage_ledger else None
+        )
+        # Shared, persisted health only when a ledger is wired in explicitly
+        self.provider_health = provider_health or (
+            get_provider_health(settings, usage_ledger) if usage_ledger is not None else None
+        )
+        # Failover of provider-flexible tasks; circuit state is the health tracker's
+        self.fallback_chain = (
+            FallbackChain(
+                FallbackConfig(max_retries=0),
+                provider_health=self.provider_health,
+                rate_governor=self.rate_governor,
+            )
+            if self.provider_health is not None
+            else None
+        )
 
     def register_agent(self, agent_type: AgentType, agent: AsyncAgent) -> None:
         """Register an agent instance."""
         self.agents[agent_type] = agent
 
+    def enable_cache(
+        self,
+        cache_manager: CacheManager,
+        mode: CacheMode = CacheMode.USE,
+        ttl_hours: int | None = None,
+    ) -> None:
+        """
+        Enable the read-through response cache.
+
+        Args:
+            cache_manager: Cache manager storing responses
+            mode: How the cache is used (use, refresh or bypass)
+            ttl_hours: Entry TTL (default: cache manager default)
+        """
+        self.cache_manager = cache_manager
+        self.cache_mode = mode
+        self.cache_ttl_hours = ttl_hours
+
+    def _build_cache_key(
+        self,
+        phase: int,
+        task: PhaseTask,
+        prompt: str,
+        doc_type: DocumentType,
+        agent_type: AgentType,
+    ) -> str:
+        """Build the cache key from normalized prompt, agent, phase and template version."""
+        context = {"task": task.value, "doc_type": doc_type.value}
+        if self.template_version:
+            context["template_version"] = self.template_version
+        return self.cache_manager.key_generator.generate(
+            prompt=prompt,
+            context=context,
+            agent_type=agent_type,
+            phase=phase,
+        )
+
+    def _similarity_scope(self, mapping: AgentMapping) -> str:
+        """Scope of near-duplicate lookups: only prompts of the same agent, phase, task and template."""
+        return ":".join(
+            [mapping.agent.value, str(mapping.phase), mapping.task.value, mapping.doc_type.value, self.template_version or ""]
+        )
+
     def get_agent(self, mapping: AgentMapping) -> AsyncAgent:
         """Get agent instance for mapping."""
         agent_type = mapping.agent
@@ -103,18 +331,67 @@ class AgentRouter:
             details={"mapping": mapping.model_dump()},
         )
 
-    async def execute(self, phase: int, task: PhaseTask, prompt: str, doc_type: DocumentType) -> AgentResponse:
+    def resolve_agent_type(self, phase: int, task: PhaseTask, doc_type: DocumentType) -> AgentType | None:
         """
-        Execute task with appropriate agent.
+        Choose which agent type serves a task before executing it.
+
+        Provider-flexible tasks are routed by provider health here, and the
+        route is kept so the next execute() of the task uses the same
+        provider (e.g. the one whose scheduler slot the task holds).
 
         Args:
             phase: Phase number
-            task: Task to execute
-            prompt: Prompt text
+            task: Task to route
             doc_type: Document type
 
         Returns:
-            AgentResponse
+            Routed AgentType, or None if no mapping exists
+        """
+        key = (phase, task, doc_type)
+        if key not in self.mapping:
+            return None
+        if key not in self._routes:
+            self._routes[key] = self._route(phase, task, doc_type)
+        return self._routes[key].agent
+
+    def release_route(self, phase: int, task: PhaseTask, doc_type: DocumentType) -> None:
+        """
+        Forget the route kept by resolve_agent_type() for a task.
+
+        Called once the task is done, so a route kept for a task that never
+        reached execute() (e.g. replayed from the journal) cannot override
+        health routing of a later run.
+
+        Args:
+            phase: Phase number
+            task: Task that finished
+            doc_type: Document type
+        """
+        self._routes.pop((phase, task, doc_type), None)
+
+    def get_dependencies(self, task: PhaseTask) -> tuple[PhaseTask, ...]:
+        """
+        Get the upstream tasks whose outputs a task consumes.
+
+        Args:
+            task: Task to look up
+
+        Returns:
+            Tuple of upstream PhaseTask values (empty if independent)
+        """
+        return self.dependencies.get(task, ())
+
+    def _resolve_mapping(self, phase: int, task: PhaseTask, doc_type: DocumentType) -> AgentMapping:
+        """Take the route chosen by resolve_agent_type(), or choose one now."""
+        pinned = self._routes.pop((phase, task, doc_type), None)
+        return pinned if pinned is not None else self._route(phase, task, doc_type)
+
+    def _route(self, phase: int, task: PhaseTask, doc_type: DocumentType) -> AgentMapping:
+        """
+        Build the mapping for a task or raise AgentException if it is unrouted.
+
+        Provider-flexible tasks go to the registered candidate the health
+        tracker expects to finish first.
         """
         agent_type = self.mapping.get((phase, task, doc_type))
         if agent_type is None:
@@ -128,21 +405,343 @@ class AgentRouter:
             task=task,
             doc_type=doc_type,
             agent=agent_type,
+            alternatives=self.flexible_tasks.get(task, ()),
         )
+        if self.provider_health is None or not mapping.alternatives:
+            return mapping
 
-        # Get agent
-        agent = self.get_agent(mapping)
+        candidates = [candidate for candidate in (agent_type, *mapping.alternatives) if candidate in self.agents]
+        if not candidates:
+            return mapping
+        chosen = self.provider_health.choose(candidates)
+        if chosen == agent_type:
+            return mapping
+        logger.info(f"Routing task={task.value} to {chosen.value} instead of {agent_type.value} (provider health)")
+        return mapping.model_copy(update={"agent": chosen})
+
+    def _observe(self, mapping: AgentMapping) -> AbstractContextManager[HealthProbe]:
+        """Record the agent call's latency and outcome in the health tracker, if any."""
+        if self.provider_health is None:
+            return nullcontext(HealthProbe())
+        return self.provider_health.observe(mapping.agent)
 
-        # Create request
+    async def _execute_observed(self, mapping: AgentMapping, agent: AsyncAgent, request: AgentRequest) -> AgentResponse:
+        """
+        Run an agent, recording its service time and outcome for health routing.
+
+        Called inside the rate governor slot, so time spent queued for the
+        slot does not count as provider latency.
+        """
+        with self._observe(mapping) as probe:
+            response = await agent.execute(request)
+            probe.record(response)
+        return response
+
+    async def _execute_with_failover(
+        self, mapping: AgentMapping, request: AgentRequest
+    ) -> tuple[AgentMapping, AgentResponse]:
+        """
+        Run a provider-flexible task, failing over to its other allowed providers.
+
+        The fallback chain holds each provider's governor slot and records
+        each attempt in the health tracker.
+
+        Returns:
+            Tuple of (mapping of the provider that answered, response)
+        """
+        mapped = self.mapping[(mapping.phase, mapping.task, mapping.doc_type)]
+        order = [
+            candidate
+            for candidate in dict.fromkeys((mapping.agent, mapped, *mapping.alternatives))
+            if candidate in self.agents
+        ]
+        gateway_response = await self.fallback_chain.execute(
+            GatewayRequest(
+                task_name=request.task_name,
+                prompt=request.prompt,
+                max_tokens=request.max_tokens,
+                timeout=request.timeout,
+            ),
+            mapping.agent,
+            {candidate: _AgentProvider(self.agents[candidate]) for candidate in order},
+            fallback_order=order,
+        )
+        served = AgentType(gateway_response.metadata.get("final_provider", mapping.agent))
+        if served != mapping.agent:
+            logger.info(f"Task={mapping.task.value} failed over from {mapping.agent.value} to {served.value}")
+            mapping = mapping.model_copy(update={"agent": served})
+        return mapping, AgentResponse(
+            agent_name=served,
+            task_name=request.task_name,
+            content=gateway_response.content,
+            tokens_used=gateway_response.tokens_used,
+            response_time=gateway_response.response_time,
+            success=gateway_response.success,
+            error=gateway_response.error,
+            metadata=gateway_response.metadata,
+        )
+
+    def _build_request(self, task: PhaseTask, prompt: str) -> AgentRequest:
+        """Build the agent request with the configured timeout."""
         timeout_seconds = 120
         if self.settings is not None and hasattr(self.settings, "timeout_seconds"):
             timeout_seconds = self.settings.timeout_seconds
 
-        request = AgentRequest(
+        return AgentRequest(
             task_name=task.value,
             prompt=prompt,
             timeout=timeout_seconds,
         )
 
+    async def _lookup_cache(
+        self,
+        mapping: AgentMapping,
+        prompt: str,
+    ) -> tuple[str | None, AgentResponse | None]:
+        """
+        Read-through cache lookup.
+
+        A cached response reports how it matched in its metadata
+        (``cache_match`` is "exact" or "similar").
+
+        Returns:
+            Tuple of (cache key or None when caching is off, cached response or None)
+        """
+        if self.cache_manager is None or self.cache_mode == CacheMode.BYPASS:
+            return None, None
+
+        cache_key = self._build_cache_key(mapping.phase, mapping.task, prompt, mapping.doc_type, mapping.agent)
+        if self.cache_mode == CacheMode.USE:
+            cached = await self.cache_manager.get(cache_key)
+            if cached is None and self.cache_manager.similarity_enabled(mapping.task.value):
+                cached = await self.cache_manager.find_similar(self._similarity_scope(mapping), prompt)
+                if cached is not None:
+                    logger.info(
+                        f"Similar-prompt cache hit for phase={mapping.phase}, task={mapping.task.value} "
+                        f"(similarity={cached.metadata['similarity']})"
+                    )
+            if cached is not None and cached.success:
+                logger.info(f"Cache hit for phase={mapping.phase}, task={mapping.task.value}")
+                return cache_key, AgentResponse(
+                    agent_name=mapping.agent,
+                    task_name=mapping.task.value,
+                    content=cached.content,
+                    tokens_used=cached.tokens_used,
+                    response_time=0.0,
+                    success=True,
+                    # Similar-prompt hits override cache_match and add similarity, matched_key
+                    metadata={"cache_match": "exact", **cached.metadata},
+                )
+        return cache_key, None
+
+    async def _store_cache(
+        self, cache_key: str | None, mapping: AgentMapping, prompt: str, response: AgentResponse
+    ) -> None:
+        """Store a response; only successful, non-empty responses are worth replaying."""
+        if cache_key is None or not response.success or not response.content:
+            return
+
+        await self.cache_manager.set(
+            key=cache_key,
+            response=GatewayResponse(
+                content=response.content,
+                success=True,
+                tokens_used=response.tokens_used,
+                response_time=response.response_time,
+                metadata={"agent": mapping.agent.value, "task": mapping.task.value, "phase": mapping.phase},
+            ),
+            ttl_hours=self.cache_ttl_hours,
+        )
+        if self.cache_manager.similarity_enabled(mapping.task.value):
+            self.cache_manager.index_prompt(self._similarity_scope(mapping), cache_key, prompt)
+
+    def _prompt_tokens(self, mapping: AgentMapping, prompt: str) -> int:
+        # context imports this module, so the tokenizer is loaded on first use
+        from context.tokenizer import get_token_counter
+
+        return get_token_counter().count(prompt, mapping.agent.value, estimate_only=True).total_tokens
+
+    async def _admit(self, mapping: AgentMapping, prompt: str) -> AdmissionDecision | None:
+        """
+        Wait until the budget guard admits a request.
+
+        Raises:
+            BudgetException: If running the request would exceed a budget
+        """
+        if self.budget_guard is None or not isinstance(prompt, str):
+            return None
+        prompt_tokens = self._prompt_tokens(mapping, prompt)
+        while True:
+            decision = self.budget_guard.admit(mapping.agent, mapping.task.value, prompt_tokens)
+            if decision.action == AdmissionAction.ALLOW:
+                return decision
+            if decision.action == AdmissionAction.REJECT:
+                raise BudgetException(
+                    message=f"Task {mapping.task.value} would exceed the {decision.period} budget",
+                    details={
+                        "error_code": ErrorCode.BUDGET_EXCEEDED,
+                        "phase": mapping.phase,
+                        "task": mapping.task.value,
+                        "period": decision.period,
+                        "estimated_cost": decision.estimated_cost,
+                    },
+                )
+            logger.info(
+                f"Deferring task={mapping.task.value} {decision.retry_after:.0f}s for the {decision.period} budget"
+            )
+            await asyncio.sleep(decision.retry_after)
+
+    def _record_usage(
+        self,
+        mapping: AgentMapping,
+        prompt: str,
+        response: AgentResponse | None,
+        admission: AdmissionDecision | None = None,
+    ) -> None:
+        """
+        Record an agent response's token usage.
+
+        Cache hits cost nothing and are not recorded; failed responses only
+        release their budget reservation.
+        """
+        output_tokens = getattr(response, "tokens_used", None)
+        usage: TokenUsage | None = None
+        if getattr(response, "success", False) is True and isinstance(output_tokens, int) and isinstance(prompt, str):
+            usage = TokenUsage(
+                provider=mapping.agent,
+                input_tokens=self._prompt_tokens(mapping, prompt),
+                output_tokens=output_tokens,
+                phase=mapping.phase,
+                task=mapping.task.value,
+            )
+        if self.budget_guard is not None:
+            self.budget_guard.settle(admission, usage)
+        if self.usage_ledger is None or usage is None:
+            return
+        try:
+            self.usage_ledger.record(usage)
+        except sqlite3.Error as exc:
+            logger.warning(f"Failed to record usage for task={mapping.task.value}: {exc}")
+
+    async def execute(self, phase: int, task: PhaseTask, prompt: str, doc_type: DocumentType) -> AgentResponse:
+        """
+        Execute task with appropriate agent.
+
+        When a stream_listener is set the response is streamed and every
+        chunk is passed to the listener as it arrives.
+
+        Args:
+            phase: Phase number
+            task: Task to execute
+            prompt: Prompt text
+            doc_type: Document type
+
+        Returns:
+            AgentResponse
+        """
+        if self.stream_listener is not None:
+            response = None
+            async for chunk in self.execute_stream(phase, task, prompt, doc_type):
+                try:
+                    self.stream_listener(phase, task, chunk)
+                except Exception as exc:
+                    logger.warning(f"Stream listener failed for task={task.value}: {exc}")
+                if chunk.done:
+                    response = chunk.response
+            if response is None:
+                raise AgentException(
+                    message=f"Stream for task={task.value} ended without a response",
+                    details={"phase": phase, "task": task.value},
+                )
+            return response
+
+        mapping = self._resolve_mapping(phase, task, doc_type)
+
+        # Read-through cache: a hit never touches the agent or browser
+        cache_key, cached = await self._lookup_cache(mapping, prompt)
+        if cached is not None:
+            return cached
+
         # Execute
-        return await agent.execute(request)
+        agent = self.get_agent(mapping)
+        request = self._build_request(task, prompt)
+        admission = await self._admit(mapping, prompt)
+        routed = mapping
+        try:
+            if self.fallback_chain is not None and mapping.alternatives:
+                mapping, response = await self._execute_with_failover(mapping, request)
+            elif self.rate_governor is None:
+                response = await self._execute_observed(mapping, agent, request)
+            else:
+                async with self.rate_governor.get(mapping.agent).slot() as slot:
+                    response = await self._execute_observed(mapping, agent, request)
+                    slot.record(classify_outcome(response))
+        except BaseException:
+            if self.budget_guard is not None:
+                self.budget_guard.settle(admission)
+            raise
+
+        if cache_key is not None and mapping is not routed:
+            cache_key = self._build_cache_key(mapping.phase, mapping.task, prompt, mapping.doc_type, mapping.agent)
+        self._record_usage(mapping, prompt, response, admission)
+        await self._store_cache(cache_key, mapping, prompt, response)
+        return response
+
+    async def execute_stream(
+        self,
+        phase: int,
+        task: PhaseTask,
+        prompt: str,
+        doc_type: DocumentType,
+    ) -> AsyncIterator[AgentStreamChunk]:
+        """
+        Execute task with appropriate agent, yielding the response as it streams.
+
+        Cache hits are yielded as a single final chunk. Streams are not
+        failed over, since their chunks have already been delivered.
+
+        Args:
+            phase: Phase number
+            task: Task to execute
+            prompt: Prompt text
+            doc_type: Document type
+
+        Yields:
+            AgentStreamChunk deltas, then a final chunk with done=True and the
+            AgentResponse
+        """
+        mapping = self._resolve_mapping(phase, task, doc_type)
+
+        cache_key, cached = await self._lookup_cache(mapping, prompt)
+        if cached is not None:
+            yield AgentStreamChunk(text=cached.content, done=True, response=cached)
+            return
+
+        idle_timeout = getattr(self.settings, "stream_idle_timeout", None)
+        if not isinstance(idle_timeout, int | float):
+            idle_timeout = None
+
+        agent = self.get_agent(mapping)
+        admission = await self._admit(mapping, prompt)
+        settled = False
+        stream = agent.execute_stream(self._build_request(task, prompt), idle_timeout=idle_timeout)
+        governed = self.rate_governor.get(mapping.agent).slot() if self.rate_governor is not None else nullcontext()
+        try:
+            # Observed inside the slot so health latency is service time, not queueing
+            async with governed as slot:
+                with self._observe(mapping) as probe:
+                    async for chunk in stream:
+                        if chunk.done:
+                            probe.record(chunk.response)
+                            if slot is not None:
+                                slot.record(classify_outcome(chunk.response))
+                            settled = True
+                            self._record_usage(mapping, prompt, chunk.response, admission)
+                            await self._store_cache(cache_key, mapping, prompt, chunk.response)
+                        yield chunk
+                        if chunk.done:
+                            return
+        finally:
+            # Streams that fail or end without a final chunk release their reservation
+            if not settled and self.budget_guard is not None:
+                self.budget_guard.settle(admission)
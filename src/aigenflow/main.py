@@ -4,25 +4,75 @@ Main CLI entry point for AigenFlow.
 Provides unified CLI interface for all commands.
 """
 
+import importlib
+from typing import Any, NamedTuple
+
 import typer
-from rich.console import Console
-
-# Import CLI command apps and individual commands
-from cli.cache import app as cache_app
-from cli.check import check_cmd
-from cli.config import app as config_app
-from cli.relogin import relogin as relogin_command
-from cli.resume import app as resume_app
-from cli.run import run as run_command
-from cli.setup import setup as setup_command
-from cli.stats import app as stats_app
-from cli.status import status as status_command
-from config import LogEnvironment, configure_logging
-
-console = Console()
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Where a subcommand lives, imported only when the command is used."""
+
+    module: str
+    attribute: str
+    help: str
+
+
+# Subcommands in display order. Modules are imported on first use so that
+# e.g. "aigenflow --version" or "aigenflow status" never load Playwright,
+# the pipeline or the providers.
+LAZY_COMMANDS: dict[str, LazyCommand] = {
+    "run": LazyCommand("cli.run", "run", "Execute pipeline and generate document"),
+    "setup": LazyCommand("cli.setup", "setup", "Interactive setup wizard for first-time configuration"),
+    "check": LazyCommand("cli.check", "check_cmd", "Check Playwright browser and AI provider sessions"),
+    "relogin": LazyCommand("cli.relogin", "relogin", "Re-login to an AI provider"),
+    "status": LazyCommand("cli.status", "status", "Display pipeline execution status"),
+    "resume": LazyCommand("cli.resume", "app", "Resume interrupted pipeline execution"),
+    "sessions": LazyCommand("cli.sessions", "app", "List and reindex pipeline sessions"),
+    "config": LazyCommand("cli.config", "app", "Manage configuration settings"),
+    "cache": LazyCommand("cli.cache", "app", "Manage AI response cache"),
+    "stats": LazyCommand("cli.stats", "app", "Show token usage and cost statistics"),
+    "browserd": LazyCommand("cli.browserd", "app", "Manage the warm browser daemon"),
+    "batch": LazyCommand("cli.batch", "app", "Run many topics in one batch"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that resolves LAZY_COMMANDS on demand."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        return [*super().list_commands(ctx), *(name for name in LAZY_COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        if cmd_name in self.commands or cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        spec = LAZY_COMMANDS[cmd_name]
+        if ctx.resilient_parsing:
+            # Shell completion only needs names and help text
+            return TyperCommand(cmd_name, help=spec.help)
+
+        command = _load_command(cmd_name, spec)
+        self.add_command(command, cmd_name)
+        return command
+
+
+def _load_command(name: str, spec: LazyCommand) -> Any:
+    """Import a subcommand module and build its command as add_typer()/command() would."""
+    target: Any = getattr(importlib.import_module(spec.module), spec.attribute)
+
+    wrapper = typer.Typer(add_completion=False)
+    if isinstance(target, typer.Typer):
+        wrapper.add_typer(target, name=name, help=spec.help)
+    else:
+        wrapper.command(name=name)(target)
+    return typer.main.get_group(wrapper).commands[name]
+
 
 # Create main Typer app
 app = typer.Typer(
+    cls=LazyGroup,
     help="AigenFlow - Multi-AI Pipeline CLI Tool for Automated Business Plan Generation",
     no_args_is_help=True,
     add_completion=False,
@@ -32,6 +82,9 @@ app = typer.Typer(
 # Preserve existing run command behavior
 def _preserve_run_command():
     """Preserve the original run command for backward compatibility."""
+    from rich.console import Console
+
+    console = Console()
     console.print("[bold green]aigenflow v0.1.0[/bold green]")
     console.print("Multi-AI Pipeline CLI Tool for Automated Business Plan Generation")
     console.print("")
@@ -39,14 +92,9 @@ def _preserve_run_command():
     console.print("[dim]  aigenflow run --topic \"Your topic here\"[/dim]")
     console.print("")
     console.print("[bold cyan]Available Commands:[/bold cyan]")
-    console.print("  run        Execute pipeline and generate document")
-    console.print("  setup       Interactive setup wizard for first-time configuration")
-    console.print("  check       Check Playwright browser and AI provider sessions")
-    console.print("  status      Display pipeline execution status")
-    console.print("  resume      Resume interrupted pipeline execution")
-    console.print("  config      Manage configuration settings")
-    console.print("  cache       Manage AI response cache")
-    console.print("  stats       Show token usage and cost statistics")
+    width = max(len(name) for name in LAZY_COMMANDS) + 2
+    for name, spec in LAZY_COMMANDS.items():
+        console.print(f"  {name:<{width}}{spec.help}", highlight=False)
     console.print("")
     console.print("[bold cyan]Run Command Options:[/bold cyan]")
     console.print("  --topic     Document topic (required, min 10 characters)")
@@ -78,9 +126,15 @@ def main(
     AigenFlow CLI main entry point.
     """
     if version:
-        console.print("[bold green]aigenflow v0.1.0[/bold green]")
+        typer.secho("aigenflow v0.1.0", fg=typer.colors.GREEN, bold=True)
         raise typer.Exit()
 
+    from rich.console import Console
+
+    from config import LogEnvironment, configure_logging
+
+    console = Console()
+
     # Configure logging based on environment and log level
     try:
         env = LogEnvironment(environment.lower())
@@ -102,17 +156,5 @@ def main(
         _preserve_run_command()
 
 
-# Register all CLI commands as subcommands
-app.add_typer(cache_app, name="cache", help="Manage AI response cache")
-app.command(name="check")(check_cmd)  # Register with explicit name
-app.command()(setup_command)  # Register setup directly
-app.command()(relogin_command)  # Register relogin directly
-app.command()(run_command)  # Register run directly
-app.command()(status_command)  # Register status directly
-app.add_typer(resume_app, name="resume", help="Resume interrupted pipeline execution")
-app.add_typer(config_app, name="config", help="Manage configuration settings")
-app.add_typer(stats_app, name="stats", help="Show token usage and cost statistics")
-
-
 if __name__ == "__main__":
     app()
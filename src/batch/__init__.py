@@ -5,13 +5,21 @@ This module provides:
 - FR-3: Batch queue management for grouping requests
 - US-2: Batch processing to reduce overhead
 - Integration with Phase 2 parallel processing (Gemini + Perplexity)
+- Multi-topic batch runs sharing one BrowserPool (aigenflow batch run)
 """
 
 from batch.processor import BatchProcessor
 from batch.queue import BatchQueue, BatchRequest
+from batch.runner import BatchLedger, BatchRunner, BatchTopic, LedgerEntry, TopicStatus, load_topics
 
 __all__ = [
+    "BatchLedger",
     "BatchProcessor",
     "BatchQueue",
     "BatchRequest",
+    "BatchRunner",
+    "BatchTopic",
+    "LedgerEntry",
+    "TopicStatus",
+    "load_topics",
 ]
@@ -8,11 +8,14 @@ Provides batch execution functionality:
 - Statistics tracking
 """
 
+import asyncio
 from typing import Any
 
 from agents.base import AgentRequest, AgentResponse
+from agents.router import AgentMapping
 from batch.queue import BatchQueue, BatchRequest
-from core.models import AgentType
+from core.exceptions import AgentException
+from core.models import AgentType, DocumentType
 
 
 class BatchProcessor:
@@ -60,6 +63,7 @@ class BatchProcessor:
         self,
         agent_type: AgentType,
         request: AgentRequest,
+        doc_type: DocumentType = DocumentType.BIZPLAN,
     ) -> str:
         """
         Enqueue a request for batch processing.
@@ -67,11 +71,12 @@ class BatchProcessor:
         Args:
             agent_type: AI agent type
             request: Agent request to enqueue
+            doc_type: Document type used to route the request
 
         Returns:
             Request ID or empty string if queue is full
         """
-        return self.queue.enqueue(agent_type=agent_type, request=request)
+        return self.queue.enqueue(agent_type=agent_type, request=request, doc_type=doc_type)
 
     async def process_batch(self) -> list[AgentResponse]:
         """
@@ -110,6 +115,65 @@ class BatchProcessor:
 
         return all_responses
 
+    async def _execute_one(self, batch_req: BatchRequest) -> AgentResponse:
+        """
+        Route and execute a single queued request.
+
+        The route comes from the request's task name; requests with an
+        unknown task name use the first task mapped to their agent type.
+
+        Args:
+            batch_req: Queued request
+
+        Returns:
+            Agent response (failed response on error)
+        """
+        try:
+            route = AgentMapping.resolve_route(
+                batch_req.request.task_name,
+                agent_type=batch_req.agent_type,
+                doc_type=batch_req.doc_type,
+            )
+            if route is None:
+                raise AgentException(
+                    message=f"No route for task '{batch_req.request.task_name}'",
+                    details={"agent_type": batch_req.agent_type.value},
+                )
+            phase, task = route
+
+            response = await self.router.execute(
+                phase=phase,
+                task=task,
+                prompt=batch_req.request.prompt,
+                doc_type=batch_req.doc_type,
+            )
+        except Exception as e:
+            # Create error response
+            response = AgentResponse(
+                agent_name=batch_req.agent_type,
+                task_name=batch_req.request.task_name,
+                content="",
+                success=False,
+                error=str(e),
+            )
+
+        self._total_processed += 1
+        if not response.success:
+            self._total_failures += 1
+        return response
+
+    async def _process_parallel(self, requests: list[BatchRequest]) -> list[AgentResponse]:
+        """
+        Execute requests concurrently, keeping response order.
+
+        Args:
+            requests: List of batch requests
+
+        Returns:
+            List of agent responses
+        """
+        return list(await asyncio.gather(*(self._execute_one(batch_req) for batch_req in requests)))
+
     async def _process_gemini_batch(
         self,
         requests: list[BatchRequest],
@@ -123,38 +187,7 @@ class BatchProcessor:
         Returns:
             List of agent responses
         """
-        responses: list[AgentResponse] = []
-
-        # Process requests sequentially (safe approach)
-        # Could be optimized with asyncio.gather for true parallel processing
-        for batch_req in requests:
-            try:
-                response = await self.router.execute(
-                    phase=2,  # Gemini is used in Phase 2
-                    task=None,  # Will use request.task_name
-                    prompt=batch_req.request.prompt,
-                    doc_type=None,  # Will use default
-                )
-                responses.append(response)
-                self._total_processed += 1
-
-                if not response.success:
-                    self._total_failures += 1
-
-            except Exception as e:
-                # Create error response
-                error_response = AgentResponse(
-                    agent_name=batch_req.agent_type,
-                    task_name=batch_req.request.task_name,
-                    content="",
-                    success=False,
-                    error=str(e),
-                )
-                responses.append(error_response)
-                self._total_processed += 1
-                self._total_failures += 1
-
-        return responses
+        return await self._process_parallel(requests)
 
     async def _process_perplexity_batch(
         self,
@@ -169,37 +202,7 @@ class BatchProcessor:
         Returns:
             List of agent responses
         """
-        responses: list[AgentResponse] = []
-
-        # Process requests sequentially (safe approach)
-        for batch_req in requests:
-            try:
-                response = await self.router.execute(
-                    phase=2,  # Perplexity is used in Phase 2
-                    task=None,  # Will use request.task_name
-                    prompt=batch_req.request.prompt,
-                    doc_type=None,  # Will use default
-                )
-                responses.append(response)
-                self._total_processed += 1
-
-                if not response.success:
-                    self._total_failures += 1
-
-            except Exception as e:
-                # Create error response
-                error_response = AgentResponse(
-                    agent_name=batch_req.agent_type,
-                    task_name=batch_req.request.task_name,
-                    content="",
-                    success=False,
-                    error=str(e),
-                )
-                responses.append(error_response)
-                self._total_processed += 1
-                self._total_failures += 1
-
-        return responses
+        return await self._process_parallel(requests)
 
     async def _process_sequential(
         self,
@@ -216,36 +219,7 @@ class BatchProcessor:
         Returns:
             List of agent responses
         """
-        responses: list[AgentResponse] = []
-
-        for batch_req in requests:
-            try:
-                response = await self.router.execute(
-                    phase=1,  # Default phase
-                    task=None,
-                    prompt=batch_req.request.prompt,
-                    doc_type=None,
-                )
-                responses.append(response)
-                self._total_processed += 1
-
-                if not response.success:
-                    self._total_failures += 1
-
-            except Exception as e:
-                # Create error response
-                error_response = AgentResponse(
-                    agent_name=batch_req.agent_type,
-                    task_name=batch_req.request.task_name,
-                    content="",
-                    success=False,
-                    error=str(e),
-                )
-                responses.append(error_response)
-                self._total_processed += 1
-                self._total_failures += 1
-
-        return responses
+        return [await self._execute_one(batch_req) for batch_req in requests]
 
     async def flush(self) -> list[AgentResponse]:
         """
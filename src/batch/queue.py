@@ -14,7 +14,7 @@ from typing import Any
 from uuid import uuid4
 
 from agents.base import AgentRequest
-from core.models import AgentType
+from core.models import AgentType, DocumentType
 
 
 @dataclass
@@ -27,12 +27,14 @@ class BatchRequest:
         agent_type: AI agent type (Gemini, Perplexity, etc.)
         request: Original agent request
         created_at: Timestamp when request was enqueued
+        doc_type: Document type used to route the request
     """
 
     request_id: str
     agent_type: AgentType
     request: AgentRequest
     created_at: datetime = field(default_factory=datetime.now)
+    doc_type: DocumentType = DocumentType.BIZPLAN
 
 
 class BatchQueue:
@@ -64,6 +66,7 @@ class BatchQueue:
         self,
         agent_type: AgentType,
         request: AgentRequest,
+        doc_type: DocumentType = DocumentType.BIZPLAN,
     ) -> str:
         """
         Enqueue a request for batch processing.
@@ -71,6 +74,7 @@ class BatchQueue:
         Args:
             agent_type: AI agent type
             request: Agent request to batch
+            doc_type: Document type used to route the request
 
         Returns:
             Request ID for tracking
@@ -85,6 +89,7 @@ class BatchQueue:
             request_id=str(uuid4()),
             agent_type=agent_type,
             request=request,
+            doc_type=doc_type,
         )
 
         self._queue.append(batch_req)
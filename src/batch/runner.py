@@ -0,0 +1,321 @@
+"""
+Multi-topic batch runner.
+
+Runs many pipeline configurations concurrently in one process:
+- Topics are read from a JSONL file (one PipelineConfig per line)
+- A bounded worker pool caps how many pipelines run at once
+- One shared TaskScheduler caps requests per provider and in flight overall
+- One BrowserPool serves every pipeline and is closed once at the end
+- An append-only JSONL ledger records progress so a rerun skips finished topics
+
+Output layout:
+output_dir/
+├── batch_ledger.jsonl
+└── <topic_id>/<session_id>/...
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from core.exceptions import PipelineException
+from core.logger import get_logger
+from core.models import DocumentType, PipelineConfig, PipelineState, TemplateType
+
+logger = get_logger(__name__)
+
+
+class TopicStatus(StrEnum):
+    """Lifecycle of a batch topic in the ledger."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class BatchTopic:
+    """
+    A topic to run in a batch.
+
+    Attributes:
+        topic_id: Stable identifier (explicit "id" or derived from the config)
+        config: Pipeline configuration for the topic
+    """
+
+    topic_id: str
+    config: PipelineConfig
+
+
+@dataclass
+class LedgerEntry:
+    """
+    One progress record in the batch ledger.
+
+    Attributes:
+        topic_id: Topic identifier
+        status: Topic status after this event
+        timestamp: Event time (epoch seconds)
+        session_id: Pipeline session ID, once known
+        output_dir: Session output directory, once known
+        error: Failure reason for failed topics
+    """
+
+    topic_id: str
+    status: TopicStatus
+    timestamp: float
+    session_id: str | None = None
+    output_dir: str | None = None
+    error: str | None = None
+
+
+def load_topics(path: Path, output_dir: Path) -> list[BatchTopic]:
+    """
+    Parse a topics JSONL file.
+
+    Each line is a JSON object with "topic" and optional "id", "doc_type",
+    "language" and "template". Blank lines and lines starting with "#" are
+    skipped.
+
+    Args:
+        path: Topics file
+        output_dir: Batch output root; each topic writes to output_dir/<topic_id>
+
+    Returns:
+        Parsed topics in file order
+
+    Raises:
+        PipelineException: If a line is invalid or topic IDs collide
+    """
+    topics: list[BatchTopic] = []
+    seen: set[str] = set()
+
+    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        try:
+            entry = json.loads(line)
+            doc_type = DocumentType(entry.get("doc_type", DocumentType.BIZPLAN.value))
+            default_template = TemplateType.RD if doc_type == DocumentType.RD else TemplateType.DEFAULT
+            config = PipelineConfig(
+                topic=entry["topic"],
+                doc_type=doc_type,
+                template=TemplateType(entry.get("template", default_template.value)),
+                language=entry.get("language", "ko"),
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, ValidationError) as exc:
+            raise PipelineException(
+                message=f"Invalid topic on line {line_number} of {path.name}: {exc}",
+                details={"line": line_number},
+            ) from exc
+
+        topic_id = str(entry.get("id") or _derive_topic_id(config))
+        if topic_id in seen:
+            raise PipelineException(
+                message=f"Duplicate topic id '{topic_id}' on line {line_number} of {path.name}",
+                details={"line": line_number, "topic_id": topic_id},
+            )
+        seen.add(topic_id)
+
+        config.output_dir = output_dir / topic_id
+        topics.append(BatchTopic(topic_id=topic_id, config=config))
+
+    return topics
+
+
+def _derive_topic_id(config: PipelineConfig) -> str:
+    """Derive a stable ID so reruns of the same file map onto the same ledger entries."""
+    digest = hashlib.sha256(
+        f"{config.topic}\x00{config.doc_type.value}\x00{config.language}\x00{config.template.value}".encode()
+    ).hexdigest()
+    return f"topic-{digest[:12]}"
+
+
+class BatchLedger:
+    """
+    Append-only progress ledger.
+
+    Every status change is appended and fsynced, so the ledger survives
+    crashes; the latest entry per topic wins when it is read back.
+    """
+
+    FILENAME = "batch_ledger.jsonl"
+
+    def __init__(self, output_dir: Path) -> None:
+        """
+        Initialize ledger.
+
+        Args:
+            output_dir: Batch output root
+        """
+        self.path = output_dir / self.FILENAME
+
+    def load(self) -> dict[str, LedgerEntry]:
+        """
+        Read the latest entry per topic.
+
+        Returns:
+            Mapping of topic_id to its latest entry (truncated lines are ignored)
+        """
+        if not self.path.exists():
+            return {}
+
+        latest: dict[str, LedgerEntry] = {}
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                data = json.loads(line)
+                entry = LedgerEntry(**{**data, "status": TopicStatus(data["status"])})
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue
+            latest[entry.topic_id] = entry
+        return latest
+
+    def record(self, entry: LedgerEntry) -> None:
+        """
+        Append an entry durably.
+
+        Args:
+            entry: Entry to append
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BatchRunner:
+    """
+    Run many pipelines concurrently over shared browser and provider limits.
+    """
+
+    DEFAULT_MAX_PARALLEL_TOPICS = 3
+
+    def __init__(
+        self,
+        orchestrator_factory: Callable[[], Any],
+        ledger: BatchLedger,
+        max_parallel_topics: int = DEFAULT_MAX_PARALLEL_TOPICS,
+        use_browser_pool: bool = True,
+        headless: bool = True,
+        on_update: Callable[[BatchTopic, LedgerEntry], None] | None = None,
+    ) -> None:
+        """
+        Initialize runner.
+
+        Args:
+            orchestrator_factory: Creates one PipelineOrchestrator per topic; orchestrators
+                should share a TaskScheduler and not manage the BrowserPool themselves
+            ledger: Progress ledger
+            max_parallel_topics: Maximum pipelines running at once
+            use_browser_pool: Open one BrowserPool for the whole batch
+            headless: Headless mode for the BrowserPool
+            on_update: Called after every ledger update (e.g. for console output)
+        """
+        if max_parallel_topics < 1:
+            raise ValueError("max_parallel_topics must be >= 1")
+
+        self.orchestrator_factory = orchestrator_factory
+        self.ledger = ledger
+        self.max_parallel_topics = max_parallel_topics
+        self.use_browser_pool = use_browser_pool
+        self.headless = headless
+        self.on_update = on_update
+
+    def pending_topics(self, topics: list[BatchTopic], retry_failed: bool = True) -> list[BatchTopic]:
+        """
+        Filter out topics the ledger already finished.
+
+        Args:
+            topics: All topics in the batch
+            retry_failed: Run topics that failed previously again
+
+        Returns:
+            Topics still to run
+        """
+        done = {TopicStatus.COMPLETED} if retry_failed else {TopicStatus.COMPLETED, TopicStatus.FAILED}
+        latest = self.ledger.load()
+        return [topic for topic in topics if topic.topic_id not in latest or latest[topic.topic_id].status not in done]
+
+    def _record(self, topic: BatchTopic, entry: LedgerEntry) -> None:
+        self.ledger.record(entry)
+        if self.on_update is not None:
+            try:
+                self.on_update(topic, entry)
+            except Exception as exc:
+                logger.warning(f"Batch update callback failed: {exc}")
+
+    async def _run_topic(self, topic: BatchTopic, slots: asyncio.Semaphore) -> LedgerEntry:
+        """Run one topic in a worker slot and record its outcome."""
+        async with slots:
+            self._record(topic, LedgerEntry(topic_id=topic.topic_id, status=TopicStatus.RUNNING, timestamp=time.time()))
+
+            session = None
+            try:
+                orchestrator = self.orchestrator_factory()
+                session = await orchestrator.run_pipeline(topic.config)
+            except Exception as exc:
+                logger.error(f"Batch topic {topic.topic_id} failed: {exc}")
+                entry = LedgerEntry(
+                    topic_id=topic.topic_id,
+                    status=TopicStatus.FAILED,
+                    timestamp=time.time(),
+                    error=str(exc),
+                )
+            else:
+                completed = session.state == PipelineState.COMPLETED
+                entry = LedgerEntry(
+                    topic_id=topic.topic_id,
+                    status=TopicStatus.COMPLETED if completed else TopicStatus.FAILED,
+                    timestamp=time.time(),
+                    session_id=session.session_id,
+                    output_dir=str(topic.config.output_dir / session.session_id),
+                    error=None if completed else f"Pipeline ended with state: {session.state.value}",
+                )
+
+            self._record(topic, entry)
+            return entry
+
+    async def run(self, topics: list[BatchTopic]) -> list[LedgerEntry]:
+        """
+        Run topics concurrently.
+
+        Args:
+            topics: Topics to run (see pending_topics() for resuming)
+
+        Returns:
+            Final ledger entry per topic, in input order
+        """
+        if not topics:
+            return []
+
+        browser_pool = None
+        if self.use_browser_pool:
+            from gateway.browser_pool import BrowserPool
+
+            try:
+                browser_pool = await BrowserPool.get_instance(headless=self.headless)
+                logger.info("BrowserPool initialized for batch")
+            except Exception as exc:
+                logger.warning(f"BrowserPool initialization failed: {exc}")
+
+        slots = asyncio.Semaphore(self.max_parallel_topics)
+        try:
+            return list(await asyncio.gather(*(self._run_topic(topic, slots) for topic in topics)))
+        finally:
+            if browser_pool is not None:
+                try:
+                    await browser_pool.close_all()
+                except Exception as exc:
+                    logger.warning(f"BrowserPool cleanup failed: {exc}")
@@ -3,19 +3,26 @@ Cache module for AI response caching following SPEC-ENHANCE-004.
 
 This module provides:
 - FR-1: Cache key generation with SHA-256
-- FR-2: File system cache storage
+- FR-2: Cache storage backends (SQLite, per-entry JSON files)
+- Near-duplicate prompt index (MinHash/LSH)
 - US-1: Cached response reuse
 - US-5: Cache management (list, clear, stats)
 """
 
 from cache.key_generator import CacheKeyGenerator
-from cache.manager import CacheManager
-from cache.storage import CacheEntry, CacheStats, CacheStorage
+from cache.manager import CacheManager, CacheMode
+from cache.similarity import SimilarityIndex
+from cache.sqlite_storage import SQLiteCacheStorage
+from cache.storage import CacheBackend, CacheEntry, CacheStats, CacheStorage
 
 __all__ = [
     "CacheKeyGenerator",
     "CacheManager",
+    "CacheMode",
+    "CacheBackend",
     "CacheStorage",
+    "SQLiteCacheStorage",
+    "SimilarityIndex",
     "CacheEntry",
     "CacheStats",
 ]
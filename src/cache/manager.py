@@ -5,19 +5,31 @@ Provides high-level cache management interface:
 - Get/Set cache entries
 - Cache invalidation
 - Statistics tracking
+- Near-duplicate prompt lookups (opt-in per task)
 - Integration with agent router
 
 Reference: SPEC-ENHANCE-004 US-1, US-5
 """
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
+from enum import StrEnum
 from pathlib import Path
 
 from cache.key_generator import CacheKeyGenerator
-from cache.storage import CacheStats, CacheStorage
+from cache.similarity import SimilarityIndex
+from cache.sqlite_storage import SQLiteCacheStorage
+from cache.storage import CacheBackend, CacheStats, CacheStorage
 from gateway.models import GatewayResponse
 
 
+class CacheMode(StrEnum):
+    """How callers should use the response cache."""
+
+    USE = "use"  # Read hits, write successful misses
+    REFRESH = "refresh"  # Skip reads, overwrite with fresh responses
+    BYPASS = "bypass"  # Neither read nor write
+
+
 class CacheManager:
     """
     High-level cache management for AI responses.
@@ -31,12 +43,20 @@ class CacheManager:
 
     DEFAULT_TTL_HOURS = 24
     DEFAULT_MAX_SIZE_MB = 500
+    DEFAULT_BACKEND = "sqlite"
+    DEFAULT_SIMILARITY_THRESHOLD = 0.9
+    SIMILARITY_INDEX_FILE = "similarity_index.json"
+    BACKENDS: dict[str, type[CacheBackend]] = {
+        "sqlite": SQLiteCacheStorage,
+        "json": CacheStorage,
+    }
 
     def __init__(
         self,
         cache_dir: Path | None = None,
         max_size_mb: int = DEFAULT_MAX_SIZE_MB,
         default_ttl_hours: int = DEFAULT_TTL_HOURS,
+        backend: str = DEFAULT_BACKEND,
     ) -> None:
         """
         Initialize cache manager.
@@ -45,7 +65,14 @@ class CacheManager:
             cache_dir: Cache directory path (default: ~/.aigenflow/cache)
             max_size_mb: Maximum cache size in megabytes
             default_ttl_hours: Default TTL for cache entries
+            backend: Storage backend name ("sqlite" or "json")
+
+        Raises:
+            ValueError: If backend is unknown
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown cache backend: {backend}. Choose from {sorted(self.BACKENDS)}")
+
         # Set default cache directory
         if cache_dir is None:
             home = Path.home()
@@ -57,7 +84,87 @@ class CacheManager:
 
         # Initialize components
         self.key_generator = CacheKeyGenerator()
-        self.storage = CacheStorage(cache_dir=cache_dir, max_size_mb=max_size_mb)
+        self.backend = backend
+        self.storage: CacheBackend = self.BACKENDS[backend](cache_dir=cache_dir, max_size_mb=max_size_mb)
+        self.similarity_index: SimilarityIndex | None = None
+        self.similarity_tasks: frozenset[str] = frozenset()
+
+    def enable_similarity(
+        self,
+        tasks: Iterable[str],
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        """
+        Enable near-duplicate lookups for some tasks.
+
+        Args:
+            tasks: Task names (PhaseTask values) allowed to reuse similar prompts
+            threshold: Minimum estimated prompt similarity (0.0-1.0)
+        """
+        self.similarity_tasks = frozenset(tasks)
+        if self.similarity_index is None:
+            self.similarity_index = SimilarityIndex(self.cache_dir / self.SIMILARITY_INDEX_FILE, threshold=threshold)
+        else:
+            self.similarity_index.threshold = threshold
+
+    def similarity_enabled(self, task: str) -> bool:
+        """
+        Check whether a task may reuse responses to similar prompts.
+
+        Args:
+            task: Task name
+
+        Returns:
+            True if near-duplicate lookups are enabled for the task
+        """
+        return self.similarity_index is not None and task in self.similarity_tasks
+
+    async def find_similar(self, scope: str, prompt: str) -> GatewayResponse | None:
+        """
+        Get the cached response of the most similar prompt in a scope.
+
+        The match is reported in the response metadata (``cache_match``,
+        ``similarity``, ``matched_key``).
+
+        Args:
+            scope: Lookup scope (agent, phase, task, document type)
+            prompt: Prompt to match
+
+        Returns:
+            Cached response or None if nothing is similar enough
+        """
+        if self.similarity_index is None:
+            return None
+
+        match = self.similarity_index.find(scope, prompt)
+        if match is None:
+            return None
+
+        cached = self.storage.get(match.key)
+        if cached is None:
+            # Expired or evicted since it was indexed
+            self.similarity_index.remove(scope, match.key)
+            return None
+
+        metadata = {
+            **cached.metadata,
+            "cache_match": "similar",
+            "similarity": round(match.score, 3),
+            "matched_key": match.key,
+        }
+        return cached.model_copy(update={"metadata": metadata})
+
+    def index_prompt(self, scope: str, key: str, prompt: str) -> None:
+        """
+        Make a cached response findable by similar prompts.
+
+        Args:
+            scope: Lookup scope (agent, phase, task, document type)
+            key: Cache key the response is stored under
+            prompt: Prompt the response answered
+        """
+        if self.similarity_index is not None:
+            self.similarity_index.add(scope, key, prompt)
 
     async def get(self, key: str) -> GatewayResponse | None:
         """
@@ -139,14 +246,25 @@ class CacheManager:
         Returns:
             Number of entries deleted
         """
+        if self.similarity_index is not None:
+            self.similarity_index.clear()
         return self.storage.clear()
 
-    def list_entries(self) -> list[str]:
+    def list_entries(self, limit: int | None = None) -> list[str]:
         """
-        List all cache entry keys.
+        List cache entry keys.
+
+        Args:
+            limit: Maximum number of keys to return (None = all)
 
         Returns:
-            List of cache keys
+            List of cache keys, most recently used first
         """
-        entries = self.storage.list()
+        entries = self.storage.list(limit=limit)
         return [e.key for e in entries]
+
+    def close(self) -> None:
+        """Persist pending statistics and index changes, and release storage resources."""
+        if self.similarity_index is not None:
+            self.similarity_index.close()
+        self.storage.close()
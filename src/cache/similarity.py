@@ -0,0 +1,293 @@
+"""
+Near-duplicate prompt index for the response cache.
+
+Exact cache keys miss whenever a prompt changes slightly (topic wording,
+dates, template tweaks). SimilarityIndex keeps a MinHash signature of each
+cached prompt per (agent, phase, task) scope and answers "close enough"
+lookups through LSH banding, so a lookup touches only a handful of
+candidate signatures.
+
+Signatures use one-permutation MinHash over word 3-gram shingles: each
+shingle is hashed once (CRC32) into one of SIGNATURE_SIZE bins, keeping the
+minimum per bin, with empty bins filled from their neighbour. Similarity is
+the share of equal bins, an estimate of the Jaccard similarity of the
+shingle sets.
+
+The index file is rewritten in batches (every SAVE_EVERY_CHANGES changes or
+SAVE_INTERVAL_SECONDS), on flush()/close() and at interpreter exit, rather
+than on every stored response.
+"""
+
+import atexit
+import json
+import os
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SIGNATURE_SIZE = 128
+BAND_ROWS = 4
+SHINGLE_WORDS = 3
+INDEX_VERSION = 1
+
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_EMPTY = -1
+
+
+def minhash_signature(text: str) -> tuple[int, ...] | None:
+    """
+    Compute the one-permutation MinHash signature of a text.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        Signature of SIGNATURE_SIZE ints, or None if the text has no words
+    """
+    words = text.lower().split()
+    if not words:
+        return None
+
+    shingles = {" ".join(words[i : i + SHINGLE_WORDS]) for i in range(max(1, len(words) - SHINGLE_WORDS + 1))}
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    for shingle in shingles:
+        value = zlib.crc32(shingle.encode())
+        index = value & (SIGNATURE_SIZE - 1)
+        rank = value >> _BIN_BITS
+        if bins[index] == _EMPTY or rank < bins[index]:
+            bins[index] = rank
+
+    # Densify: empty bins borrow the next non-empty bin (circularly)
+    for index in range(SIGNATURE_SIZE):
+        if bins[index] == _EMPTY:
+            step = 1
+            while bins[(index + step) % SIGNATURE_SIZE] == _EMPTY:
+                step += 1
+            bins[index] = bins[(index + step) % SIGNATURE_SIZE]
+    return tuple(bins)
+
+
+def signature_similarity(first: tuple[int, ...], second: tuple[int, ...]) -> float:
+    """
+    Estimate the Jaccard similarity of two signatures.
+
+    Args:
+        first: MinHash signature
+        second: MinHash signature
+
+    Returns:
+        Share of equal bins (0.0-1.0)
+    """
+    return sum(a == b for a, b in zip(first, second, strict=True)) / SIGNATURE_SIZE
+
+
+_open_indexes: "weakref.WeakSet[SimilarityIndex]" = weakref.WeakSet()
+
+
+def flush_all_indexes() -> None:
+    """Write every index with pending changes (also run at interpreter exit)."""
+    for index in list(_open_indexes):
+        index.flush()
+
+
+atexit.register(flush_all_indexes)
+
+
+@dataclass
+class SimilarMatch:
+    """A cached prompt close to the looked-up one."""
+
+    key: str
+    score: float
+
+
+class SimilarityIndex:
+    """
+    MinHash/LSH index of cached prompts, persisted as a JSON file.
+
+    Each scope keeps at most ``max_entries_per_scope`` prompts; the oldest
+    are forgotten first.
+    """
+
+    DEFAULT_MAX_ENTRIES_PER_SCOPE = 500
+
+    # Batched persistence
+    SAVE_EVERY_CHANGES = 50
+    SAVE_INTERVAL_SECONDS = 30.0
+
+    def __init__(
+        self,
+        index_file: Path | None = None,
+        threshold: float = 0.9,
+        max_entries_per_scope: int = DEFAULT_MAX_ENTRIES_PER_SCOPE,
+    ) -> None:
+        """
+        Initialize index.
+
+        Args:
+            index_file: JSON file the index is persisted to (None = in-memory only)
+            threshold: Minimum similarity for a match (0.0-1.0)
+            max_entries_per_scope: Prompts remembered per scope
+        """
+        self.index_file = index_file
+        self.threshold = threshold
+        self.max_entries_per_scope = max_entries_per_scope
+        self._signatures: dict[str, OrderedDict[str, tuple[int, ...]]] = {}
+        self._bands: dict[str, dict[tuple[int, ...], set[str]]] = {}
+        self._pending_changes = 0
+        self._last_save = time.monotonic()
+        self._load()
+        self._pending_changes = 0
+        if index_file is not None:
+            _open_indexes.add(self)
+
+    def add(self, scope: str, key: str, prompt: str) -> None:
+        """
+        Remember the prompt of a cache entry.
+
+        Args:
+            scope: Lookup scope (agent, phase and task)
+            key: Cache key of the stored response
+            prompt: Prompt the response answered
+        """
+        signature = minhash_signature(prompt)
+        if signature is None:
+            return
+        self._insert(scope, key, signature)
+
+        entries = self._signatures[scope]
+        while len(entries) > self.max_entries_per_scope:
+            self.remove(scope, next(iter(entries)))
+        self._pending_changes += 1
+        if (
+            self._pending_changes >= self.SAVE_EVERY_CHANGES
+            or time.monotonic() - self._last_save >= self.SAVE_INTERVAL_SECONDS
+        ):
+            self._save()
+
+    def find(self, scope: str, prompt: str) -> SimilarMatch | None:
+        """
+        Find the most similar remembered prompt.
+
+        Args:
+            scope: Lookup scope
+            prompt: Prompt to match
+
+        Returns:
+            Best match at or above the threshold, or None
+        """
+        entries = self._signatures.get(scope)
+        signature = minhash_signature(prompt)
+        if not entries or signature is None:
+            return None
+
+        bands = self._bands[scope]
+        candidates: set[str] = set()
+        for band in self._band_keys(signature):
+            candidates |= bands.get(band, set())
+
+        best: SimilarMatch | None = None
+        for key in candidates:
+            score = signature_similarity(signature, entries[key])
+            if score >= self.threshold and (best is None or score > best.score):
+                best = SimilarMatch(key=key, score=score)
+        return best
+
+    def remove(self, scope: str, key: str) -> None:
+        """
+        Forget a cache entry (e.g. after it expired).
+
+        Args:
+            scope: Lookup scope
+            key: Cache key
+        """
+        signature = self._signatures.get(scope, {}).pop(key, None)
+        if signature is None:
+            return
+        self._pending_changes += 1
+        bands = self._bands[scope]
+        for band in self._band_keys(signature):
+            keys = bands.get(band)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del bands[band]
+
+    def clear(self) -> None:
+        """Forget every prompt."""
+        self._signatures.clear()
+        self._bands.clear()
+        self._save()
+
+    def flush(self) -> None:
+        """Persist pending changes."""
+        if self._pending_changes:
+            self._save()
+
+    def close(self) -> None:
+        """Persist pending changes and stop tracking the index for exit-time flushing."""
+        self.flush()
+        _open_indexes.discard(self)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._signatures.values())
+
+    @staticmethod
+    def _band_keys(signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        """Split a signature into LSH band keys (band index first)."""
+        return [
+            (start, *signature[start : start + BAND_ROWS]) for start in range(0, SIGNATURE_SIZE, BAND_ROWS)
+        ]
+
+    def _insert(self, scope: str, key: str, signature: tuple[int, ...]) -> None:
+        self.remove(scope, key)
+        self._signatures.setdefault(scope, OrderedDict())[key] = signature
+        bands = self._bands.setdefault(scope, {})
+        for band in self._band_keys(signature):
+            bands.setdefault(band, set()).add(key)
+
+    def _load(self) -> None:
+        """Load the persisted index, ignoring unreadable or outdated files."""
+        if self.index_file is None or not self.index_file.exists():
+            return
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION or data.get("signature_size") != SIGNATURE_SIZE:
+                return
+            for scope, entries in data.get("scopes", {}).items():
+                for key, signature in entries.items():
+                    if len(signature) == SIGNATURE_SIZE:
+                        self._insert(scope, key, tuple(int(value) for value in signature))
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logger.warning(f"Ignoring unreadable similarity index {self.index_file}: {exc}")
+            self._signatures.clear()
+            self._bands.clear()
+
+    def _save(self) -> None:
+        """Persist the index atomically."""
+        self._pending_changes = 0
+        self._last_save = time.monotonic()
+        if self.index_file is None:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "signature_size": SIGNATURE_SIZE,
+            "scopes": {
+                scope: {key: list(signature) for key, signature in entries.items()}
+                for scope, entries in self._signatures.items()
+            },
+        }
+        temp_file = self.index_file.with_suffix(".tmp")
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.index_file)
+        except OSError as exc:
+            logger.warning(f"Failed to save similarity index {self.index_file}: {exc}")
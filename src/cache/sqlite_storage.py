@@ -0,0 +1,357 @@
+"""
+SQLite cache storage backend.
+
+Stores every cache entry in a single SQLite database instead of one JSON
+file per entry:
+- Indexed expires_at / lru_at columns for O(log N) expiry and LRU eviction
+- Hits update two columns in place instead of rewriting the whole entry
+- Running size/entry totals, so saves never rescan the store
+- Hit/miss counters persisted in batches rather than on every lookup
+
+Reference: SPEC-ENHANCE-004 FR-2
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from cache.storage import CacheBackend, CacheEntry, CacheStats
+from gateway.models import GatewayResponse
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    last_accessed REAL,
+    lru_at REAL NOT NULL,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries(expires_at);
+CREATE INDEX IF NOT EXISTS idx_entries_lru_at ON entries(lru_at);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+class SQLiteCacheStorage(CacheBackend):
+    """
+    SQLite based cache storage with indexed LRU eviction.
+
+    Storage structure:
+    cache_dir/
+    └── cache.db
+    """
+
+    DEFAULT_MAX_SIZE_MB = 500
+    DB_FILENAME = "cache.db"
+    STATS_FLUSH_OPS = 100
+    STATS_FLUSH_SECONDS = 5.0
+    EVICTION_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_mb: int = DEFAULT_MAX_SIZE_MB,
+    ) -> None:
+        """
+        Initialize SQLite cache storage.
+
+        Args:
+            cache_dir: Root cache directory
+            max_size_mb: Maximum cache size in megabytes
+        """
+        self.cache_dir = cache_dir
+        self.db_path = cache_dir / self.DB_FILENAME
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        # Running totals (avoid aggregate scans on every save)
+        row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()
+        self._total_entries = row[0]
+        self._total_size_bytes = row[1]
+
+        # Batched hit/miss counters
+        counters = dict(self._conn.execute("SELECT name, value FROM stats").fetchall())
+        self._hit_count = counters.get("hit_count", 0)
+        self._miss_count = counters.get("miss_count", 0)
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+
+    def save(
+        self,
+        key: str,
+        response: GatewayResponse,
+        ttl_hours: int = 24,
+    ) -> None:
+        """
+        Save response to cache.
+
+        Args:
+            key: Cache key
+            response: Response to cache
+            ttl_hours: Time-to-live in hours
+        """
+        now = datetime.now()
+        expires_at = now + timedelta(hours=ttl_hours)
+        payload = json.dumps(response.model_dump(mode="json"))
+        size_bytes = len(payload.encode())
+
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size_bytes FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, response, created_at, expires_at, access_count, last_accessed, lru_at, size_bytes) "
+                "VALUES (?, ?, ?, ?, 0, NULL, ?, ?)",
+                (key, payload, now.timestamp(), expires_at.timestamp(), now.timestamp(), size_bytes),
+            )
+
+            if previous is None:
+                self._total_entries += 1
+            else:
+                self._total_size_bytes -= previous[0]
+            self._total_size_bytes += size_bytes
+
+            self._evict_if_needed()
+
+    def get(self, key: str) -> GatewayResponse | None:
+        """
+        Get response from cache if exists and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response or None if not found/expired
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._record_lookup(hit=False)
+                return None
+
+            if now > row[1]:
+                self._delete_locked(key)
+                self._record_lookup(hit=False)
+                return None
+
+            try:
+                response = GatewayResponse(**json.loads(row[0]))
+            except (json.JSONDecodeError, TypeError, ValueError):
+                # Corrupted entry, delete it
+                self._delete_locked(key)
+                self._record_lookup(hit=False)
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET access_count = access_count + 1, last_accessed = ?, lru_at = ? "
+                "WHERE key = ?",
+                (now, now, key),
+            )
+            self._record_lookup(hit=True)
+            return response
+
+    def delete(self, key: str) -> None:
+        """
+        Delete entry from cache.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._delete_locked(key)
+
+    def clear(self) -> int:
+        """
+        Clear all cache entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            count = self._conn.execute("DELETE FROM entries").rowcount
+            self._total_entries = 0
+            self._total_size_bytes = 0
+            self._hit_count = 0
+            self._miss_count = 0
+            self._flush_stats_locked()
+        return count
+
+    def list(self, limit: int | None = None) -> list[CacheEntry]:
+        """
+        List cache entries.
+
+        Args:
+            limit: Maximum number of entries to return (None = all)
+
+        Returns:
+            Non-expired entries, most recently used first
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, response, created_at, expires_at, access_count, last_accessed, size_bytes "
+                "FROM entries WHERE expires_at >= ? ORDER BY lru_at DESC LIMIT ?",
+                (time.time(), -1 if limit is None else limit),
+            ).fetchall()
+
+        entries: list[CacheEntry] = []
+        for key, payload, created_at, expires_at, access_count, last_accessed, size_bytes in rows:
+            try:
+                response = json.loads(payload)
+            except json.JSONDecodeError:
+                # Skip corrupted entries
+                continue
+            entries.append(
+                CacheEntry(
+                    key=key,
+                    response=response,
+                    created_at=datetime.fromtimestamp(created_at),
+                    expires_at=datetime.fromtimestamp(expires_at),
+                    access_count=access_count,
+                    last_accessed=datetime.fromtimestamp(last_accessed) if last_accessed else None,
+                    size_bytes=size_bytes,
+                )
+            )
+        return entries
+
+    def count(self) -> int:
+        """
+        Count non-expired entries.
+
+        Returns:
+            Number of live cache entries
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()
+        return row[0]
+
+    def get_stats(self) -> CacheStats:
+        """
+        Get current cache statistics.
+
+        Expired entries are excluded and pending counters are persisted.
+
+        Returns:
+            Cache statistics
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries WHERE expires_at >= ?",
+                (time.time(),),
+            ).fetchone()
+            self._flush_stats_locked()
+
+            total = self._hit_count + self._miss_count
+            return CacheStats(
+                total_entries=row[0],
+                total_size_bytes=row[1],
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                hit_rate=self._hit_count / total if total > 0 else 0.0,
+            )
+
+    def flush_stats(self) -> None:
+        """Persist pending hit/miss counters."""
+        with self._lock:
+            self._flush_stats_locked()
+
+    def close(self) -> None:
+        """Persist pending counters and close the database connection."""
+        with self._lock:
+            try:
+                self._flush_stats_locked()
+            finally:
+                self._conn.close()
+
+    def _record_lookup(self, hit: bool) -> None:
+        """Count a lookup and flush counters once a batch has accumulated."""
+        if hit:
+            self._hit_count += 1
+        else:
+            self._miss_count += 1
+        self._pending_ops += 1
+
+        if (
+            self._pending_ops >= self.STATS_FLUSH_OPS
+            or time.monotonic() - self._last_flush >= self.STATS_FLUSH_SECONDS
+        ):
+            self._flush_stats_locked()
+
+    def _flush_stats_locked(self) -> None:
+        """Write hit/miss counters in a single statement (caller holds the lock)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO stats (name, value) VALUES ('hit_count', ?), ('miss_count', ?)",
+            (self._hit_count, self._miss_count),
+        )
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+
+    def _delete_locked(self, key: str) -> None:
+        """Delete an entry and update running totals (caller holds the lock)."""
+        row = self._conn.execute("SELECT size_bytes FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._total_entries -= 1
+        self._total_size_bytes -= row[0]
+
+    def _evict_if_needed(self) -> None:
+        """
+        Evict expired, then least recently used entries if over size limit.
+
+        Both passes walk an index, so each evicted entry costs O(log N).
+        """
+        if self._total_size_bytes <= self.max_size_bytes:
+            return
+
+        # Expired entries go first
+        now = time.time()
+        expired = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries WHERE expires_at < ?",
+            (now,),
+        ).fetchone()
+        if expired[0]:
+            self._conn.execute("DELETE FROM entries WHERE expires_at < ?", (now,))
+            self._total_entries -= expired[0]
+            self._total_size_bytes -= expired[1]
+
+        while self._total_size_bytes > self.max_size_bytes:
+            victims = self._conn.execute(
+                "SELECT key, size_bytes FROM entries ORDER BY lru_at ASC LIMIT ?",
+                (self.EVICTION_BATCH_SIZE,),
+            ).fetchall()
+            if not victims:
+                break
+
+            evicted: list[str] = []
+            for key, size_bytes in victims:
+                if self._total_size_bytes <= self.max_size_bytes:
+                    break
+                evicted.append(key)
+                self._total_entries -= 1
+                self._total_size_bytes -= size_bytes
+
+            self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in evicted])
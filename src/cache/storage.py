@@ -11,6 +11,7 @@ Reference: SPEC-ENHANCE-004 FR-2
 """
 
 import json
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -57,7 +58,62 @@ class CacheStats(BaseModel):
         return self.total_size_bytes / (1024 * 1024)
 
 
-class CacheStorage:
+class CacheBackend(ABC):
+    """
+    Abstract interface for cache storage backends.
+
+    CacheManager talks only to this interface, so backends (per-entry JSON
+    files, SQLite) can be swapped without touching callers.
+    """
+
+    cache_dir: Path
+    max_size_bytes: int
+
+    @abstractmethod
+    def save(self, key: str, response: GatewayResponse, ttl_hours: int = 24) -> None:
+        """Save response to cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, key: str) -> GatewayResponse | None:
+        """Get response from cache if exists and not expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete entry from cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Clear all cache entries and return the number deleted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(self, limit: int | None = None) -> list[CacheEntry]:
+        """List non-expired entries, most recently used first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_stats(self) -> CacheStats:
+        """Get current cache statistics."""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        """
+        Count non-expired entries.
+
+        Returns:
+            Number of live cache entries
+        """
+        return len(self.list())
+
+    def close(self) -> None:
+        """Persist pending state and release resources."""
+        return None
+
+
+class CacheStorage(CacheBackend):
     """
     File system based cache storage with LRU eviction.
 
@@ -257,10 +313,13 @@ class CacheStorage:
 
         return count
 
-    def list(self) -> list[CacheEntry]:
+    def list(self, limit: int | None = None) -> list[CacheEntry]:
         """
         List all cache entries.
 
+        Args:
+            limit: Maximum number of entries to return (None = all)
+
         Returns:
             List of cache entries (excluding expired)
         """
@@ -285,7 +344,7 @@ class CacheStorage:
         # Sort by last accessed (most recently used first)
         entries.sort(key=lambda e: e.last_accessed or e.created_at, reverse=True)
 
-        return entries
+        return entries if limit is None else entries[:limit]
 
     def get_stats(self) -> CacheStats:
         """
@@ -318,17 +377,11 @@ class CacheStorage:
 
         Implements LRU eviction policy.
         """
-        while self._stats.total_size_bytes > self.max_size_bytes:
-            # Get all entries sorted by LRU
-            entries = self.list()
-
-            if not entries:
-                break
+        if self._stats.total_size_bytes <= self.max_size_bytes:
+            return
 
-            # Evict least recently used (last in list)
-            lru_entry = entries[-1]
+        # Scan the directory once, then evict from the LRU end
+        entries = self.list()
+        while self._stats.total_size_bytes > self.max_size_bytes and entries:
+            lru_entry = entries.pop()
             self.delete(lru_entry.key)
-
-            # Update stats
-            self._stats.total_entries = len(entries) - 1
-            self._stats.total_size_bytes -= lru_entry.size_bytes
@@ -1,7 +1,7 @@
 """
 CLI commands module for AigenFlow.
 
-Provides all CLI commands including check, setup, relogin, status, resume, config, cache, stats.
+Provides all CLI commands including check, setup, relogin, status, resume, sessions, config, cache, stats.
 """
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "relogin_app",
     "status_app",
     "resume_app",
+    "sessions_app",
     "config_app",
     "stats_app",
 ]
@@ -0,0 +1,235 @@
+"""
+Batch CLI commands.
+
+Provides commands for:
+- aigenflow batch run: Run every topic in a JSONL file concurrently
+- aigenflow batch status: Show per-topic progress from the batch ledger
+
+Each line of the topics file is a JSON object, e.g.
+{"topic": "AI-powered sustainable agriculture", "doc_type": "bizplan", "language": "ko"}
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from batch.runner import BatchLedger, BatchRunner, BatchTopic, LedgerEntry, TopicStatus, load_topics
+from core import get_settings
+from core.exceptions import PipelineException
+from core.logger import get_logger
+
+app = typer.Typer(help="Run many topics in one batch")
+console = Console()
+logger = get_logger(__name__)
+
+STATUS_STYLES = {
+    TopicStatus.RUNNING: "yellow",
+    TopicStatus.COMPLETED: "green",
+    TopicStatus.FAILED: "red",
+}
+
+
+def _load_topics_or_exit(topics_file: Path, output_dir: Path) -> list[BatchTopic]:
+    """Load topics, exiting with a readable error on invalid input."""
+    if not topics_file.exists():
+        console.print(f"[red]Topics file not found: {topics_file}[/red]")
+        raise typer.Exit(code=1)
+    try:
+        return load_topics(topics_file, output_dir)
+    except PipelineException as exc:
+        console.print(f"[red]{exc.message}[/red]")
+        raise typer.Exit(code=1)
+
+
+def _build_orchestrator_factory(settings, headless: bool, per_provider: int, max_in_flight: int, use_cache: bool):
+    """
+    Build a factory for per-topic orchestrators.
+
+    Agents, the response cache and the task scheduler are created once and
+    shared, so provider limits hold across every pipeline in the batch.
+    """
+    from agents.chatgpt_agent import ChatGPTAgent
+    from agents.claude_agent import ClaudeAgent
+    from agents.gemini_agent import GeminiAgent
+    from agents.perplexity_agent import PerplexityAgent
+    from cache.manager import CacheManager
+    from core.models import AgentType
+    from gateway.session import SessionManager
+    from pipeline.orchestrator import PipelineOrchestrator
+    from pipeline.scheduler import TaskScheduler
+    from templates.manager import TemplateManager
+
+    profiles_dir = settings.profiles_dir
+    agents = {
+        AgentType.CHATGPT: ChatGPTAgent(profile_dir=profiles_dir / "chatgpt", headless=headless),
+        AgentType.CLAUDE: ClaudeAgent(profile_dir=profiles_dir / "claude", headless=headless),
+        AgentType.GEMINI: GeminiAgent(profile_dir=profiles_dir / "gemini", headless=headless),
+        AgentType.PERPLEXITY: PerplexityAgent(profile_dir=profiles_dir / "perplexity", headless=headless),
+    }
+    scheduler = TaskScheduler(default_limit=per_provider, max_concurrency=max_in_flight)
+    template_manager = TemplateManager()
+    session_manager = SessionManager(settings)
+    cache_manager = (
+        CacheManager(default_ttl_hours=settings.cache_ttl_hours)
+        if use_cache and settings.enable_response_cache
+        else None
+    )
+    if cache_manager is not None and settings.cache_similarity_tasks:
+        cache_manager.enable_similarity(settings.cache_similarity_tasks, threshold=settings.cache_similarity_threshold)
+
+    def factory() -> PipelineOrchestrator:
+        orchestrator = PipelineOrchestrator(
+            settings=settings,
+            template_manager=template_manager,
+            session_manager=session_manager,
+            enable_ui=False,
+            enable_summarization=settings.enable_summarization,
+            summarization_threshold=settings.summarization_threshold,
+            scheduler=scheduler,
+            manage_browser_pool=False,
+        )
+        for agent_type, agent in agents.items():
+            orchestrator.agent_router.register_agent(agent_type, agent)
+        if cache_manager is not None:
+            orchestrator.agent_router.enable_cache(cache_manager, ttl_hours=settings.cache_ttl_hours)
+        return orchestrator
+
+    return factory
+
+
+def _print_update(topic: BatchTopic, entry: LedgerEntry) -> None:
+    """Print one line per topic status change."""
+    style = STATUS_STYLES[entry.status]
+    line = f"[{style}]{entry.status.value:>9}[/{style}]  {topic.topic_id}  [dim]{topic.config.topic[:50]}[/dim]"
+    if entry.error:
+        line += f"  [red]{entry.error}[/red]"
+    console.print(line)
+
+
+@app.command("run")
+def run_batch(
+    topics_file: Annotated[Path, typer.Argument(help="JSONL file with one topic per line")],
+    output: Annotated[
+        str | None,
+        typer.Option("--output", "-o", help="Batch output directory", show_default="output/batch")
+    ] = None,
+    parallel: Annotated[
+        int | None,
+        typer.Option("--parallel", "-p", help="Pipelines running at once", show_default="AC_BATCH_MAX_PARALLEL_TOPICS")
+    ] = None,
+    per_provider: Annotated[
+        int | None,
+        typer.Option("--per-provider", help="Concurrent requests per provider", show_default="AC_MAX_CONCURRENT_PER_PROVIDER")
+    ] = None,
+    max_in_flight: Annotated[
+        int | None,
+        typer.Option("--max-in-flight", help="Concurrent requests across providers", show_default="AC_BATCH_MAX_IN_FLIGHT")
+    ] = None,
+    retry_failed: Annotated[
+        bool,
+        typer.Option("--retry-failed/--skip-failed", help="Rerun topics that failed in a previous run")
+    ] = True,
+    headed: Annotated[
+        bool,
+        typer.Option("--headed/--headless", help="Show browser window for debugging")
+    ] = False,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="Reuse cached AI responses for identical prompts")
+    ] = True,
+) -> None:
+    """
+    Run every topic in a JSONL file over one shared browser.
+
+    Topics already completed according to the batch ledger are skipped, so an
+    interrupted batch can simply be started again.
+
+    Examples:
+        aigenflow batch run topics.jsonl
+        aigenflow batch run topics.jsonl --parallel 4 --per-provider 2 -o ./weekly
+    """
+    settings = get_settings()
+    output_dir = Path(output) if output else Path(settings.output_dir) / "batch"
+    topics = _load_topics_or_exit(topics_file, output_dir)
+
+    ledger = BatchLedger(output_dir)
+    runner = BatchRunner(
+        orchestrator_factory=_build_orchestrator_factory(
+            settings,
+            headless=not headed,
+            per_provider=max(1, per_provider or settings.max_concurrent_per_provider),
+            max_in_flight=max(1, max_in_flight or settings.batch_max_in_flight),
+            use_cache=use_cache,
+        ),
+        ledger=ledger,
+        max_parallel_topics=max(1, parallel or settings.batch_max_parallel_topics),
+        headless=not headed,
+        on_update=_print_update,
+    )
+
+    pending = runner.pending_topics(topics, retry_failed=retry_failed)
+    skipped = len(topics) - len(pending)
+    console.print(
+        f"[bold cyan]Batch:[/bold cyan] {len(pending)} to run, {skipped} already done "
+        f"[dim](ledger: {ledger.path})[/dim]"
+    )
+    if not pending:
+        raise typer.Exit()
+
+    try:
+        results = asyncio.run(runner.run(pending))
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Batch interrupted. Rerun the same command to continue.[/yellow]")
+        raise typer.Exit(code=130)
+
+    failed = [entry for entry in results if entry.status != TopicStatus.COMPLETED]
+    console.print(
+        f"\n[bold]Batch finished:[/bold] [green]{len(results) - len(failed)} completed[/green], "
+        f"[red]{len(failed)} failed[/red]"
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("status")
+def batch_status(
+    topics_file: Annotated[Path, typer.Argument(help="JSONL file with one topic per line")],
+    output: Annotated[
+        str | None,
+        typer.Option("--output", "-o", help="Batch output directory", show_default="output/batch")
+    ] = None,
+) -> None:
+    """
+    Show per-topic progress of a batch.
+    """
+    settings = get_settings()
+    output_dir = Path(output) if output else Path(settings.output_dir) / "batch"
+    topics = _load_topics_or_exit(topics_file, output_dir)
+    latest = BatchLedger(output_dir).load()
+
+    table = Table(title=f"Batch - {topics_file.name}")
+
+    table.add_column("Topic ID", style="cyan")
+    table.add_column("Topic")
+    table.add_column("Status")
+    table.add_column("Output", style="dim")
+
+    for topic in topics:
+        entry = latest.get(topic.topic_id)
+        if entry is None:
+            status = "[dim]pending[/dim]"
+        else:
+            style = STATUS_STYLES[entry.status]
+            status = f"[{style}]{entry.status.value}[/{style}]"
+        table.add_row(
+            topic.topic_id,
+            topic.config.topic[:40],
+            status,
+            (entry.output_dir or entry.error or "") if entry else "",
+        )
+
+    console.print(table)
@@ -0,0 +1,81 @@
+"""
+Browser daemon CLI commands.
+
+Provides commands for:
+- aigenflow browserd start: Start the warm browser daemon
+- aigenflow browserd stop: Stop the daemon
+- aigenflow browserd status: Show daemon status
+
+While the daemon runs, pipeline commands attach to it over CDP instead of
+launching a new browser, and provider sessions stay logged in between runs.
+"""
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from gateway.browser_daemon import BrowserDaemon
+
+app = typer.Typer(help="Manage the warm browser daemon")
+console = Console()
+
+
+@app.command("start")
+def start_daemon(
+    headed: bool = typer.Option(False, "--headed/--headless", help="Show the browser window"),
+) -> None:
+    """
+    Start the browser daemon.
+
+    Launches a detached Chromium with a persistent profile and a CDP port.
+    """
+    daemon = BrowserDaemon.from_settings()
+
+    try:
+        state = daemon.start(headless=not headed)
+    except Exception as exc:
+        console.print(f"[red]Failed to start browser daemon: {exc}[/red]")
+        raise typer.Exit(code=1)
+
+    console.print(f"[green]Browser daemon running[/green] (pid {state.pid}, {state.endpoint})")
+
+
+@app.command("stop")
+def stop_daemon() -> None:
+    """
+    Stop the browser daemon.
+    """
+    daemon = BrowserDaemon.from_settings()
+
+    if daemon.stop():
+        console.print("[green]Browser daemon stopped.[/green]")
+    else:
+        console.print("[yellow]Browser daemon is not running.[/yellow]")
+
+
+@app.command("status")
+def show_status() -> None:
+    """
+    Show browser daemon status.
+    """
+    daemon = BrowserDaemon.from_settings()
+    status = daemon.status()
+
+    if status is None:
+        console.print("[yellow]Browser daemon is not running.[/yellow]")
+        console.print("[dim]Start it with: aigenflow browserd start[/dim]")
+        raise typer.Exit()
+
+    table = Table(title="Browser Daemon")
+
+    table.add_column("Property", style="cyan")
+    table.add_column("Value", style="green")
+
+    table.add_row("PID", str(status["pid"]))
+    table.add_row("Endpoint", status["endpoint"])
+    table.add_row("Browser", status["browser"])
+    table.add_row("Mode", "headless" if status["headless"] else "headed")
+    table.add_row("Open Pages", str(status["pages"]))
+    table.add_row("Uptime", f"{status['uptime_seconds'] / 60:.1f} min")
+
+    console.print(table)
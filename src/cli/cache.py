@@ -31,14 +31,16 @@ def list_cache(
     """
     manager = CacheManager()
 
-    entries = manager.storage.list()
+    entries = manager.storage.list(limit=limit)
 
     if not entries:
         console.print("[yellow]No cached entries found.[/yellow]")
         raise typer.Exit()
 
+    total = manager.storage.count()
+
     # Create table
-    table = Table(title=f"Cache Entries (showing {min(limit, len(entries))} of {len(entries)})")
+    table = Table(title=f"Cache Entries (showing {len(entries)} of {total})")
 
     table.add_column("Key", style="cyan", no_wrap=False, max_width=40)
     table.add_column("Created", style="green")
@@ -46,7 +48,7 @@ def list_cache(
     table.add_column("Access Count", style="magenta")
     table.add_column("Size", style="blue")
 
-    for entry in entries[:limit]:
+    for entry in entries:
         # Truncate key for display
         display_key = entry.key[:16] + "..." if len(entry.key) > 16 else entry.key
 
@@ -5,11 +5,10 @@ Resume interrupted pipeline execution.
 """
 
 import asyncio
-import json
 import sys
 import warnings
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 from rich.console import Console
@@ -20,16 +19,16 @@ from agents.claude_agent import ClaudeAgent
 from agents.gemini_agent import GeminiAgent
 from agents.perplexity_agent import PerplexityAgent
 from core import get_settings
+from core.catalog import open_catalog
 from core.logger import get_logger
 from core.models import (
     AgentType,
-    DocumentType,
     PipelineConfig,
     PipelineSession,
     PipelineState,
-    TemplateType,
 )
 from gateway.session import SessionManager
+from pipeline.journal import has_session_state, replay_session
 from pipeline.orchestrator import TOTAL_PHASES, PipelineOrchestrator
 from templates.manager import TemplateManager
 
@@ -56,41 +55,38 @@ def _find_session_dir(session_id: str) -> Path | None:
         Path to session directory if found, None otherwise
     """
     session_dir = OUTPUT_DIR / session_id
-    if session_dir.exists() and (session_dir / "pipeline_state.json").exists():
+    if session_dir.exists() and has_session_state(session_dir):
         return session_dir
     return None
 
 
-def _list_available_sessions() -> list[dict[str, any]]:
+def _list_available_sessions(limit: int = 10) -> list[dict[str, Any]]:
     """
-    List all available sessions in output directory.
+    List the most recently updated sessions from the session catalog.
+
+    Args:
+        limit: Maximum number of sessions
 
     Returns:
         List of session info dictionaries
     """
-    sessions = []
     if not OUTPUT_DIR.exists():
-        return sessions
-
-    for session_dir in OUTPUT_DIR.iterdir():
-        if not session_dir.is_dir():
-            continue
-        state_file = session_dir / "pipeline_state.json"
-        if state_file.exists():
-            try:
-                with open(state_file) as f:
-                    state_data = json.load(f)
-                    sessions.append({
-                        "id": state_data.get("session_id", session_dir.name),
-                        "topic": state_data.get("config", {}).get("topic", "Unknown"),
-                        "state": state_data.get("state", "unknown"),
-                        "current_phase": state_data.get("current_phase", 0),
-                    })
-            except (OSError, json.JSONDecodeError):
-                continue
+        return []
 
-    # Sort by updated_at (most recent first)
-    return sorted(sessions, key=lambda x: x["id"], reverse=True)
+    catalog = open_catalog(OUTPUT_DIR)
+    try:
+        entries = catalog.query(limit=limit)
+    finally:
+        catalog.close()
+    return [
+        {
+            "id": entry.session_id,
+            "topic": entry.topic,
+            "state": entry.state,
+            "current_phase": entry.current_phase,
+        }
+        for entry in entries
+    ]
 
 
 def _get_resume_phase(session: PipelineSession) -> int:
@@ -210,7 +206,7 @@ def resume(
 
         sessions = _list_available_sessions()
         if sessions:
-            for s in sessions[:10]:
+            for s in sessions:
                 status_color = "green" if s["state"] == "completed" else "yellow"
                 console.print(
                     f"  [{status_color}]{s['id']}[/{status_color}] - "
@@ -220,28 +216,14 @@ def resume(
             console.print("  No sessions available")
         sys.exit(1)
 
-    # Load session state
-    state_file = session_dir / "pipeline_state.json"
-    with open(state_file) as f:
-        state_data = json.load(f)
-
-    # Recreate session from saved state
-    config_dict = state_data["config"]
-    config_dict["output_dir"] = Path(config_dict.get("output_dir", "output"))
+    # Rebuild session state from the snapshot and journal
+    session = replay_session(session_dir)
+    if session is None:
+        console.print(f"[red]✗ Session state is unreadable: {session_id}[/red]")
+        sys.exit(1)
 
     # Recreate PipelineConfig
-    config = PipelineConfig(
-        topic=config_dict["topic"],
-        doc_type=DocumentType(config_dict.get("doc_type", "bizplan")),
-        template=TemplateType(config_dict.get("template", "default")),
-        language=config_dict.get("language", "ko"),
-        output_dir=config_dict["output_dir"],
-        max_retries=config_dict.get("max_retries", 2),
-        timeout_seconds=config_dict.get("timeout_seconds", 120),
-    )
-
-    # Recreate PipelineSession
-    session = PipelineSession(**state_data)
+    config = PipelineConfig(**session.config.model_dump())
 
     # Determine resume phase
     resume_phase = _get_resume_phase(session)
@@ -17,6 +17,7 @@ from agents.chatgpt_agent import ChatGPTAgent
 from agents.claude_agent import ClaudeAgent
 from agents.gemini_agent import GeminiAgent
 from agents.perplexity_agent import PerplexityAgent
+from cache.manager import CacheManager, CacheMode
 from core import get_settings
 from core.logger import get_logger
 from core.models import AgentType, DocumentType, PipelineConfig, TemplateType
@@ -185,6 +186,24 @@ def _map_doc_type_to_template(doc_type: DocumentType) -> TemplateType:
     return TemplateType.DEFAULT
 
 
+def _resolve_cache_mode(use_cache: bool, refresh_cache: bool) -> CacheMode:
+    """
+    Resolve response cache mode from CLI flags.
+
+    Args:
+        use_cache: Whether caching is enabled (--cache/--no-cache)
+        refresh_cache: Whether to overwrite cached entries (--refresh-cache)
+
+    Returns:
+        CacheMode for the agent router
+    """
+    if not use_cache:
+        return CacheMode.BYPASS
+    if refresh_cache:
+        return CacheMode.REFRESH
+    return CacheMode.USE
+
+
 @app.command()
 def run(
     topic: Annotated[str, typer.Option("--topic", "-t", help="Document topic (minimum 10 characters)", show_default=False)] = None,
@@ -208,6 +227,18 @@ def run(
         bool,
         typer.Option("--headed/--headless", help="Show browser window for debugging (default: headless)")
     ] = False,  # Changed: Always headless by default for background execution
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="Reuse cached AI responses for identical prompts")
+    ] = True,
+    refresh_cache: Annotated[
+        bool,
+        typer.Option("--refresh-cache", help="Ignore cached responses and overwrite them with fresh ones")
+    ] = False,
+    cache_ttl: Annotated[
+        int | None,
+        typer.Option("--cache-ttl", help="Cache entry lifetime in hours", show_default="AC_CACHE_TTL_HOURS")
+    ] = None,
 ) -> None:
     """
     Execute pipeline and generate business plan or R&D proposal document.
@@ -216,6 +247,7 @@ def run(
         aigenflow run --topic "AI-powered sustainable agriculture" --type bizplan
         aigenflow run -t "Quantum computing for drug discovery" -y rd --language en
         aigenflow run --topic "Your topic" --type bizplan --output ./my_output
+        aigenflow run --topic "Your topic" --refresh-cache --cache-ttl 72
     """
     # Validate topic
     if topic is None:
@@ -326,6 +358,22 @@ def run(
             PerplexityAgent(profile_dir=profiles_dir / "perplexity", headless=headless)
         )
 
+        # Enable read-through response cache
+        cache_mode = _resolve_cache_mode(use_cache and settings.enable_response_cache, refresh_cache)
+        if cache_mode != CacheMode.BYPASS:
+            ttl_hours = cache_ttl if cache_ttl is not None else settings.cache_ttl_hours
+            cache_manager = CacheManager(default_ttl_hours=ttl_hours)
+            if settings.cache_similarity_tasks:
+                cache_manager.enable_similarity(
+                    settings.cache_similarity_tasks, threshold=settings.cache_similarity_threshold
+                )
+            orchestrator.agent_router.enable_cache(
+                cache_manager,
+                mode=cache_mode,
+                ttl_hours=ttl_hours,
+            )
+            logger.debug(f"[run] Response cache enabled (mode={cache_mode.value}, ttl={ttl_hours}h)")
+
         # Run the async pipeline with explicit cleanup
         import asyncio
 
@@ -0,0 +1,83 @@
+"""
+Session catalog CLI commands.
+
+Provides commands for:
+- aigenflow sessions list: Query sessions by state, doc type, topic and date
+- aigenflow sessions reindex: Rebuild the catalog from session directories
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from core import get_settings
+from core.catalog import SessionCatalog, open_catalog
+
+app = typer.Typer(help="Session catalog commands")
+console = Console()
+
+
+@app.command("list")
+def list_sessions(
+    state: str | None = typer.Option(None, help="Only sessions in this state (e.g. completed, failed, phase_3)"),
+    doc_type: str | None = typer.Option(None, "--doc-type", help="Only sessions of this document type"),
+    topic: str | None = typer.Option(None, help="Only topics containing this text"),
+    since: datetime | None = typer.Option(None, formats=["%Y-%m-%d"], help="Only sessions updated on or after this date"),
+    limit: int = typer.Option(20, min=1, help="Sessions per page"),
+    page: int = typer.Option(1, min=1, help="Page number"),
+) -> None:
+    """
+    List sessions, most recently updated first.
+    """
+    catalog = open_catalog(Path(get_settings().output_dir))
+    try:
+        total = catalog.count(state=state, doc_type=doc_type, topic=topic, since=since)
+        entries = catalog.query(
+            state=state, doc_type=doc_type, topic=topic, since=since, limit=limit, offset=(page - 1) * limit
+        )
+    finally:
+        catalog.close()
+
+    if not entries:
+        console.print("[yellow]No sessions found.[/yellow]")
+        raise typer.Exit()
+
+    pages = (total + limit - 1) // limit
+    table = Table(title=f"Sessions (page {page} of {pages}, {total} total)")
+    table.add_column("Session ID", style="cyan", no_wrap=True)
+    table.add_column("Topic", max_width=40)
+    table.add_column("Doc Type", style="magenta")
+    table.add_column("State", style="green")
+    table.add_column("Phase", justify="right")
+    table.add_column("Updated", style="blue")
+
+    for entry in entries:
+        table.add_row(
+            entry.session_id,
+            entry.topic,
+            entry.doc_type,
+            entry.state,
+            f"{entry.current_phase}/5",
+            entry.updated_at.strftime("%Y-%m-%d %H:%M"),
+        )
+
+    console.print(table)
+
+
+@app.command("reindex")
+def reindex() -> None:
+    """
+    Rebuild the session catalog from the output directory.
+
+    Use after copying or deleting session directories by hand.
+    """
+    output_dir = Path(get_settings().output_dir)
+    catalog = SessionCatalog.for_output_dir(output_dir)
+    try:
+        count = catalog.reindex(output_dir)
+    finally:
+        catalog.close()
+    console.print(f"[green]✓ Indexed {count} sessions[/green]")
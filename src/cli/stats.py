@@ -7,6 +7,7 @@ Provides:
 - Cost estimation
 - Budget alerts
 - Cache statistics integration
+- Provider health (latency, success rate, circuit state)
 
 Reference: SPEC-ENHANCE-004 US-3, US-4
 """
@@ -19,6 +20,9 @@ from rich.panel import Panel
 from rich.table import Table
 
 from cache import CacheManager
+from core import get_settings
+from monitoring.health import CircuitState, ProviderHealth
+from monitoring.ledger import get_usage_ledger
 from monitoring.stats import Period, StatsCollector
 
 app = typer.Typer(help="Show usage statistics and costs")
@@ -63,21 +67,29 @@ def show_stats(
     - Breakdown by provider (Claude, ChatGPT, Gemini, Perplexity)
     - Breakdown by pipeline phase
     - Budget alerts if applicable
+    - Provider health used for routing
     - Cache statistics (optional)
+
+    Usage and provider health are read from the persistent usage ledger
+    (every agent response is recorded there), so they cover all previous runs.
     """
-    collector = StatsCollector()
+    ledger = get_usage_ledger(get_settings())
+    collector = StatsCollector(ledger=ledger)
     summary = collector.get_summary(period=period)
+    health = ledger.load_health() if ledger is not None else []
 
     # Output based on format
     if format == StatsFormat.JSON:
-        _output_json(summary, include_cache)
+        _output_json(summary, include_cache, health)
     elif format == StatsFormat.CSV:
-        _output_csv(summary, include_cache)
+        _output_csv(summary, include_cache, health)
     else:  # TABLE
-        _output_table(summary, period, include_cache)
+        _output_table(summary, period, include_cache, health)
 
 
-def _output_table(summary, period: Period, include_cache: bool) -> None:
+def _output_table(
+    summary, period: Period, include_cache: bool, health: list[ProviderHealth] | None = None
+) -> None:
     """Output statistics as a formatted table."""
     # Header
     console.print()
@@ -121,19 +133,7 @@ def _output_table(summary, period: Period, include_cache: bool) -> None:
         for provider, tokens in sorted(
             summary.by_provider.items(), key=lambda x: x[1], reverse=True
         ):
-            # Estimate cost (rough approximation)
-            if provider == "claude":
-                cost_per_m = 10.0  # Average
-            elif provider == "chatgpt":
-                cost_per_m = 20.0
-            elif provider == "gemini":
-                cost_per_m = 3.0
-            elif provider == "perplexity":
-                cost_per_m = 1.0
-            else:
-                cost_per_m = 5.0
-
-            cost = (tokens / 1_000_000) * cost_per_m
+            cost = summary.cost_by_provider.get(provider, 0.0)
             share = (tokens / summary.total_tokens) * 100 if summary.total_tokens > 0 else 0
 
             provider_table.add_row(
@@ -161,6 +161,10 @@ def _output_table(summary, period: Period, include_cache: bool) -> None:
         console.print(phase_table)
         console.print()
 
+    # Provider health
+    if health:
+        _show_provider_health(health)
+
     # Budget alerts
     _show_budget_alerts(summary.total_cost)
 
@@ -169,7 +173,7 @@ def _output_table(summary, period: Period, include_cache: bool) -> None:
         _show_cache_stats()
 
 
-def _output_json(summary, include_cache: bool) -> None:
+def _output_json(summary, include_cache: bool, health: list[ProviderHealth] | None = None) -> None:
     """Output statistics as JSON."""
     import json
 
@@ -182,6 +186,16 @@ def _output_json(summary, include_cache: bool) -> None:
         "request_count": summary.request_count,
         "by_provider": summary.by_provider,
         "by_phase": summary.by_phase,
+        "provider_health": {
+            entry.provider: {
+                "latency_seconds": entry.latency,
+                "success_rate": entry.success_rate,
+                "requests": entry.requests,
+                "failures": entry.failures,
+                "circuit": entry.state.value,
+            }
+            for entry in health or []
+        },
     }
 
     if include_cache:
@@ -198,7 +212,7 @@ def _output_json(summary, include_cache: bool) -> None:
     console.print(json.dumps(data, indent=2))
 
 
-def _output_csv(summary, include_cache: bool) -> None:
+def _output_csv(summary, include_cache: bool, health: list[ProviderHealth] | None = None) -> None:
     """Output statistics as CSV."""
     import csv
     import io
@@ -227,6 +241,16 @@ def _output_csv(summary, include_cache: bool) -> None:
     for phase, tokens in sorted(summary.by_phase.items()):
         writer.writerow([phase, tokens])
 
+    # Provider health section
+    if health:
+        writer.writerow([])
+        writer.writerow(["Provider", "Latency (s)", "Success Rate", "Requests", "Failures", "Circuit"])
+        for entry in health:
+            latency = f"{entry.latency:.2f}" if entry.latency is not None else ""
+            writer.writerow(
+                [entry.provider, latency, f"{entry.success_rate:.3f}", entry.requests, entry.failures, entry.state.value]
+            )
+
     console.print(output.getvalue())
 
 
@@ -258,6 +282,35 @@ def _show_budget_alerts(total_cost: float) -> None:
         console.print()
 
 
+def _show_provider_health(health: list[ProviderHealth]) -> None:
+    """Show provider latency, success rate and circuit state."""
+    health_table = Table(title="Provider Health")
+    health_table.add_column("Provider", style="cyan")
+    health_table.add_column("Latency (EWMA)", style="green", justify="right")
+    health_table.add_column("Success Rate", style="green", justify="right")
+    health_table.add_column("Requests", style="magenta", justify="right")
+    health_table.add_column("Circuit")
+
+    circuit_styles = {
+        CircuitState.CLOSED: "green",
+        CircuitState.HALF_OPEN: "yellow",
+        CircuitState.OPEN: "red",
+    }
+    for entry in health:
+        latency = f"{entry.latency:.1f}s" if entry.latency is not None else "-"
+        style = circuit_styles[entry.state]
+        health_table.add_row(
+            entry.provider.capitalize(),
+            latency,
+            f"{entry.success_rate:.1%}",
+            f"{entry.requests:,}",
+            f"[{style}]{entry.state.value}[/{style}]",
+        )
+
+    console.print(health_table)
+    console.print()
+
+
 def _show_cache_stats() -> None:
     """Show cache statistics."""
     try:
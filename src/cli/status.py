@@ -12,9 +12,11 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from core.catalog import CATALOG_FILENAME, CatalogEntry, SessionCatalog
+
 console = Console()
 
-# Sessions directory
+# Sessions directory (session catalog and legacy session files)
 SESSIONS_DIR = Path("output") / "sessions"
 
 
@@ -41,12 +43,50 @@ def _format_phase(phase: str) -> str:
     return phase_map.get(phase, phase)
 
 
+def _show_catalog_entry(entry: CatalogEntry) -> None:
+    """Display one catalogued session."""
+    console.print(Panel.fit(
+        f"[bold]Session:[/bold] {entry.session_id}\n"
+        f"[bold]Topic:[/bold] {entry.topic}\n"
+        f"[bold]Phase:[/bold] {entry.current_phase}/5\n"
+        f"[bold]Status:[/bold] {_format_status(entry.state)}\n"
+        f"[bold]Created:[/bold] {entry.created_at.isoformat(timespec='seconds')}\n"
+        f"[bold]Updated:[/bold] {entry.updated_at.isoformat(timespec='seconds')}",
+        title="[bold]Pipeline Session[/bold]",
+        border_style="cyan"
+    ))
+
+
+def _show_catalog_entries(entries: list[CatalogEntry], total: int) -> None:
+    """Display the most recently updated catalogued sessions."""
+    table = Table(title=f"Pipeline Sessions ({len(entries)} of {total})", show_header=True, header_style="bold magenta")
+    table.add_column("Session ID", style="cyan", no_wrap=True)
+    table.add_column("Topic", max_width=40)
+    table.add_column("Phase", style="green", justify="right")
+    table.add_column("Status", width=15)
+    table.add_column("Updated", style="blue", width=20)
+
+    for entry in entries:
+        table.add_row(
+            entry.session_id,
+            entry.topic,
+            f"{entry.current_phase}/5",
+            _format_status(entry.state),
+            entry.updated_at.strftime("%Y-%m-%d %H:%M"),
+        )
+
+    console.print(table)
+    if total > len(entries):
+        console.print("[dim]More sessions: aigenflow sessions list --page 2[/dim]")
+
+
 app = typer.Typer(help="Pipeline status")
 
 
 @app.command()
 def status(
     session_id: str | None = typer.Argument(None, help="Pipeline session ID"),
+    limit: int = typer.Option(20, min=1, help="Maximum number of sessions to show"),
 ) -> None:
     """
     Display pipeline execution status.
@@ -55,6 +95,25 @@ def status(
         aigenflow status
         aigenflow status abc-123-def
     """
+    # Sessions recorded by the orchestrator are looked up in the catalog
+    catalog_file = SESSIONS_DIR / CATALOG_FILENAME
+    if catalog_file.exists():
+        catalog = SessionCatalog(catalog_file)
+        try:
+            if session_id:
+                entry = catalog.get(session_id)
+                entries, total = ([entry], 1) if entry else ([], 0)
+            else:
+                entries, total = catalog.query(limit=limit), catalog.count()
+        finally:
+            catalog.close()
+        if session_id and entries:
+            _show_catalog_entry(entries[0])
+            return
+        if not session_id and entries:
+            _show_catalog_entries(entries, total)
+            return
+
     # Ensure sessions directory exists
     SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
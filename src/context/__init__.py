@@ -1,13 +1,22 @@
 """Context optimization modules."""
 
+from .extractive import ExtractiveSummarizer
+from .ledger import TokenLedger
+from .packer import ContextPacker, ContextSlot, PackedContext
 from .summarizer import ContextSummary, SummaryConfig, SummaryResult
-from .tokenizer import ModelLimits, TokenCounter, TokenCountResult
+from .tokenizer import ModelLimits, TokenCounter, TokenCountResult, get_token_counter
 
 __all__ = [
+    "ContextPacker",
+    "ContextSlot",
+    "PackedContext",
     "ContextSummary",
+    "ExtractiveSummarizer",
     "SummaryConfig",
     "SummaryResult",
     "ModelLimits",
     "TokenCounter",
     "TokenCountResult",
+    "TokenLedger",
+    "get_token_counter",
 ]
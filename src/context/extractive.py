@@ -0,0 +1,269 @@
+"""
+Local extractive summarization.
+
+Ranks sentences with TextRank over TF-IDF vectors and keeps the
+top-ranked ones within a token budget. Headings are always kept, and
+sentences carrying numbers, citations or decisions are kept when
+listed in ``SummaryConfig.preserve_sections``. Runs in-process without
+calling a provider (in a worker thread, off the event loop), so the AI
+summarization tier is only needed when this cannot reach the target
+reduction.
+
+Terms shared by more than MAX_TERM_POSTINGS sentences are left out of the
+similarity graph: they carry little weight after IDF, and pairing every
+sentence that contains them grows quadratically with the input.
+"""
+
+import asyncio
+import math
+import re
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from context.summarizer import SummaryConfig, SummaryTier
+from context.tokenizer import TokenCounter, get_token_counter
+from core.logger import get_logger
+from core.models import PhaseResult
+
+logger = get_logger(__name__)
+
+# Lines kept verbatim: Markdown headings and the section labels of extracted phase context
+STRUCTURE_PATTERN = re.compile(r"^(#{1,6}\s|Status:|Task \d+ \(|Phase Summary:)")
+SEPARATOR_PATTERN = re.compile(r"^[-=_*]{3,}$")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?。])\s+")
+WORD_PATTERN = re.compile(r"\w{2,}", re.UNICODE)
+
+# Sentences preserved per SummaryConfig.preserve_sections entry
+PRESERVE_PATTERNS: dict[str, re.Pattern[str]] = {
+    "data_points": re.compile(r"\d"),
+    "citations": re.compile(r"https?://|\[\d+\]|\(\w[^()]*,\s*\d{4}\)|출처|source:", re.IGNORECASE),
+    "key_decisions": re.compile(
+        r"\b(decid\w*|decision|recommend\w*|conclu\w*|must|priority)\b|결정|권장|결론|핵심|우선",
+        re.IGNORECASE,
+    ),
+}
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 30
+TEXTRANK_TOLERANCE = 1e-4
+# Terms in more sentences than this do not link sentences (bounds the pair count)
+MAX_TERM_POSTINGS = 64
+
+
+@dataclass
+class _Unit:
+    """A sentence or structural line of the input."""
+
+    line: int
+    text: str
+    structural: bool
+    tokens: int = 0
+    score: float = 0.0
+    required: bool = False
+
+
+class ExtractiveSummarizer:
+    """
+    TextRank sentence extraction within a token budget.
+    """
+
+    def __init__(
+        self,
+        preserve_sections: list[str] | None = None,
+        token_counter: TokenCounter | None = None,
+    ) -> None:
+        """
+        Initialize extractive summarizer.
+
+        Args:
+            preserve_sections: Kinds of sentences always kept
+                (data_points, citations, key_decisions)
+            token_counter: Token counter (default: process-wide shared counter)
+        """
+        sections = preserve_sections if preserve_sections is not None else list(PRESERVE_PATTERNS)
+        self.preserve_patterns = [PRESERVE_PATTERNS[name] for name in sections if name in PRESERVE_PATTERNS]
+        self.token_counter = token_counter or get_token_counter()
+
+    def summarize(self, text: str, target_reduction_ratio: float) -> str | None:
+        """
+        Extract the most central sentences of text.
+
+        Args:
+            text: Text to summarize
+            target_reduction_ratio: Share of tokens to remove (0.5 = keep half)
+
+        Returns:
+            Summary, or None if the preserved content alone exceeds the budget
+        """
+        units = self._split_units(text)
+        if not units:
+            return None
+
+        counts = self.token_counter.count_many([unit.text for unit in units])
+        for unit, count in zip(units, counts, strict=True):
+            unit.tokens = count.total_tokens
+        original_tokens = self.token_counter.count(text).total_tokens
+        budget = int(original_tokens * (1 - target_reduction_ratio))
+
+        # Repeated sentences are kept (and ranked) once
+        seen: set[str] = set()
+        sentences: list[_Unit] = []
+        selected: list[_Unit] = []
+        for unit in units:
+            if not unit.structural:
+                key = " ".join(unit.text.lower().split())
+                if key in seen:
+                    continue
+                seen.add(key)
+                sentences.append(unit)
+            if unit.structural or any(pattern.search(unit.text) for pattern in self.preserve_patterns):
+                unit.required = True
+                selected.append(unit)
+
+        used = sum(unit.tokens for unit in selected)
+        if used > budget:
+            logger.debug(f"Extractive summary cannot meet target: preserved {used} > budget {budget} tokens")
+            return None
+
+        self._rank(sentences)
+        for unit in sorted(sentences, key=lambda unit: unit.score, reverse=True):
+            if not unit.required and used + unit.tokens <= budget:
+                unit.required = True
+                used += unit.tokens
+
+        if sentences and not any(unit.required for unit in sentences):
+            # Only headings would remain; not a useful summary
+            return None
+
+        return self._join([unit for unit in units if unit.required])
+
+    @staticmethod
+    def _split_units(text: str) -> list[_Unit]:
+        """Split text into structural lines and sentences, keeping line numbers."""
+        units: list[_Unit] = []
+        for line_number, raw_line in enumerate(text.splitlines()):
+            line = raw_line.strip()
+            if not line or SEPARATOR_PATTERN.match(line):
+                continue
+            if STRUCTURE_PATTERN.match(line):
+                units.append(_Unit(line_number, line, structural=True))
+                continue
+            for sentence in SENTENCE_SPLIT_PATTERN.split(line):
+                if sentence.strip():
+                    units.append(_Unit(line_number, sentence.strip(), structural=False))
+        return units
+
+    @staticmethod
+    def _rank(sentences: list[_Unit]) -> None:
+        """Score sentences with TextRank over TF-IDF cosine similarity."""
+        if not sentences:
+            return
+
+        term_counts = [Counter(word.lower() for word in WORD_PATTERN.findall(unit.text)) for unit in sentences]
+        document_frequency: Counter[str] = Counter()
+        for counts in term_counts:
+            document_frequency.update(counts.keys())
+        total = len(sentences)
+
+        vectors: list[dict[str, float]] = []
+        for counts in term_counts:
+            vector = {
+                term: count * (math.log((1 + total) / (1 + document_frequency[term])) + 1)
+                for term, count in counts.items()
+            }
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            vectors.append({term: weight / norm for term, weight in vector.items()})
+
+        # Sparse cosine similarity through an inverted index (sentences sharing a term)
+        postings: dict[str, list[tuple[int, float]]] = {}
+        for index, vector in enumerate(vectors):
+            for term, weight in vector.items():
+                postings.setdefault(term, []).append((index, weight))
+        similarity: list[dict[int, float]] = [{} for _ in range(total)]
+        for entries in postings.values():
+            if len(entries) > MAX_TERM_POSTINGS:
+                continue
+            for a, (i, weight_i) in enumerate(entries):
+                for j, weight_j in entries[a + 1 :]:
+                    value = weight_i * weight_j
+                    similarity[i][j] = similarity[i].get(j, 0.0) + value
+                    similarity[j][i] = similarity[j].get(i, 0.0) + value
+
+        out_weight = [sum(row.values()) for row in similarity]
+        scores = [1.0 / total] * total
+        for _ in range(TEXTRANK_ITERATIONS):
+            new_scores = [
+                (1 - TEXTRANK_DAMPING) / total
+                + TEXTRANK_DAMPING * sum(weight / out_weight[j] * scores[j] for j, weight in similarity[i].items())
+                for i in range(total)
+            ]
+            converged = max(abs(a - b) for a, b in zip(new_scores, scores, strict=True)) < TEXTRANK_TOLERANCE
+            scores = new_scores
+            if converged:
+                break
+
+        for unit, score in zip(sentences, scores, strict=True):
+            unit.score = score
+
+    @staticmethod
+    def _join(units: list[_Unit]) -> str:
+        """Rebuild text from selected units, one output line per input line."""
+        lines: list[str] = []
+        current_line = None
+        for unit in units:
+            if unit.line == current_line:
+                lines[-1] += " " + unit.text
+            else:
+                if unit.structural and lines:
+                    lines.append("")
+                lines.append(unit.text)
+                current_line = unit.line
+        return "\n".join(lines)
+
+
+class ExtractiveTier(SummaryTier):
+    """
+    Summarization tier running ExtractiveSummarizer in-process.
+
+    Works on the full phase outputs (no preview truncation), since nothing
+    is sent to a provider.
+    """
+
+    name = "extractive"
+
+    def __init__(
+        self,
+        config: SummaryConfig,
+        render_context: Callable[[list[PhaseResult]], str],
+        token_counter: TokenCounter | None = None,
+    ) -> None:
+        """
+        Initialize tier.
+
+        Args:
+            config: Summary configuration (target ratio, preserved sections)
+            render_context: Builds the full context text of phase results
+            token_counter: Token counter (default: process-wide shared counter)
+        """
+        self.config = config
+        self.render_context = render_context
+        self.summarizer = ExtractiveSummarizer(config.preserve_sections, token_counter)
+
+    async def summarize(self, results: list[PhaseResult], phase_number: int) -> tuple[str, str] | None:
+        """
+        Summarize phase results extractively.
+
+        Args:
+            results: Phase results to summarize
+            phase_number: Phase the summary is for
+
+        Returns:
+            Tuple of (original context, summary), or None if the target cannot be met
+        """
+        context = self.render_context(results)
+        # CPU-bound; keep the event loop free for phases streaming meanwhile
+        summary = await asyncio.to_thread(self.summarizer.summarize, context, self.config.target_reduction_ratio)
+        if summary is None:
+            return None
+        return context, summary
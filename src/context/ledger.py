@@ -0,0 +1,172 @@
+"""
+Session-scoped token accounting.
+
+TokenLedger counts every phase result once: the tokens of each response
+and of the result's section of the summarization context. Context totals
+are then sums of stored counts instead of re-tokenizing the growing
+context before every phase. Counts are persisted in the session artifacts,
+so resumed sessions do not recount earlier phases.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from context.tokenizer import TokenCounter, get_token_counter
+from core.logger import get_logger
+from core.models import PhaseResult
+
+logger = get_logger(__name__)
+
+
+def _default_section(result: PhaseResult) -> str:
+    """Context section of a result: its successful response contents."""
+    return "\n".join(response.content for response in result.ai_responses if response.success)
+
+
+@dataclass
+class _PhaseEntry:
+    started_at: str
+    section_tokens: int
+    response_tokens: dict[str, int] = field(default_factory=dict)
+
+
+class TokenLedger:
+    """
+    Incremental token counts of a session's phase results.
+
+    Results are keyed by phase number; a result with a different start time
+    (a rerun phase) replaces the earlier entry.
+    """
+
+    def __init__(
+        self,
+        token_counter: TokenCounter | None = None,
+        render_section: Callable[[PhaseResult], str] | None = None,
+    ) -> None:
+        """
+        Initialize ledger.
+
+        Args:
+            token_counter: Counter to use (default: process-wide shared counter)
+            render_section: Builds the context text a result contributes
+                (default: its successful response contents)
+        """
+        self.token_counter = token_counter or get_token_counter()
+        self.render_section = render_section or _default_section
+        self.encoding = self.token_counter.encoding_name
+        self._entries: dict[int, _PhaseEntry] = {}
+
+    def is_recorded(self, result: PhaseResult) -> bool:
+        """
+        Check whether a result is already counted.
+
+        Args:
+            result: Phase result
+
+        Returns:
+            True if the ledger holds counts for this exact result
+        """
+        entry = self._entries.get(result.phase_number)
+        return entry is not None and entry.started_at == result.started_at.isoformat()
+
+    def sync(self, results: list[PhaseResult]) -> int:
+        """
+        Count results not yet in the ledger, batch-encoding their texts.
+
+        Blocking (tokenization is CPU-bound); call through asyncio.to_thread
+        from the event loop.
+
+        Args:
+            results: Session phase results
+
+        Returns:
+            Number of newly counted results
+        """
+        pending = [result for result in results if not self.is_recorded(result)]
+        if not pending:
+            return 0
+
+        texts: list[str] = []
+        for result in pending:
+            texts.append(self.render_section(result))
+            texts.extend(response.content for response in result.ai_responses)
+        counts = iter(count.total_tokens for count in self.token_counter.count_many(texts))
+
+        for result in pending:
+            entry = _PhaseEntry(started_at=result.started_at.isoformat(), section_tokens=next(counts))
+            for response in result.ai_responses:
+                entry.response_tokens[response.task_name] = next(counts)
+            self._entries[result.phase_number] = entry
+
+        logger.debug(
+            "Token ledger updated",
+            phases=[result.phase_number for result in pending],
+            context_tokens=self.context_tokens(),
+        )
+        return len(pending)
+
+    def context_tokens(self, before_phase: int | None = None) -> int:
+        """
+        Total context tokens of the recorded phases.
+
+        Args:
+            before_phase: Only count phases before this one (None = all)
+
+        Returns:
+            Token total
+        """
+        return sum(
+            entry.section_tokens
+            for phase, entry in self._entries.items()
+            if before_phase is None or phase < before_phase
+        )
+
+    def response_tokens(self, phase_number: int, task_name: str) -> int | None:
+        """
+        Tokens of one response.
+
+        Args:
+            phase_number: Phase number
+            task_name: Task name of the response
+
+        Returns:
+            Token count, or None if not recorded
+        """
+        entry = self._entries.get(phase_number)
+        return entry.response_tokens.get(task_name) if entry else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (for session artifacts)."""
+        return {
+            "encoding": self.encoding,
+            "phases": {
+                str(phase): {
+                    "started_at": entry.started_at,
+                    "section_tokens": entry.section_tokens,
+                    "responses": dict(entry.response_tokens),
+                }
+                for phase, entry in sorted(self._entries.items())
+            },
+        }
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """
+        Restore counts saved by to_dict().
+
+        Counts made with a different encoding are ignored and recounted on sync().
+
+        Args:
+            data: Saved ledger
+        """
+        if not isinstance(data, dict) or data.get("encoding") != self.encoding:
+            return
+        for phase, entry in (data.get("phases") or {}).items():
+            try:
+                self._entries[int(phase)] = _PhaseEntry(
+                    started_at=str(entry["started_at"]),
+                    section_tokens=int(entry["section_tokens"]),
+                    response_tokens={str(task): int(tokens) for task, tokens in entry.get("responses", {}).items()},
+                )
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Ignoring invalid token ledger entry for phase {phase}")
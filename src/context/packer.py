@@ -0,0 +1,467 @@
+"""
+Token-budgeted context packing for prompt templates.
+
+Later phase templates reference upstream results (e.g. ``{{ swot_results }}``).
+ContextPacker maps each template variable to the task outputs it is built
+from and fits them into a per-provider token budget:
+
+1. Everything fits: upstream outputs are used verbatim
+2. Over budget: lowest-priority variables are replaced by summaries
+   (extractive summaries of the outputs when built from settings)
+3. Still over: lowest-priority variables are truncated down to a floor
+4. Still over: lowest-priority variables are dropped
+
+Every decision is recorded so a session shows what each prompt actually saw.
+"""
+
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from agents.router import PhaseTask
+from context.extractive import ExtractiveSummarizer
+from context.tokenizer import ModelLimits, TokenCounter, get_token_counter
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TRUNCATION_MARKER = "\n...(truncated to fit the context budget)"
+DROPPED_PLACEHOLDER = "(omitted to fit the context budget)"
+SOURCE_SEPARATOR = "\n\n---\n\n"
+
+
+@dataclass(frozen=True)
+class ContextSlot:
+    """
+    A template variable filled from upstream task outputs.
+
+    Attributes:
+        variable: Template variable name
+        sources: Tasks whose outputs are joined into the variable, most important first
+        priority: Higher priorities are degraded last
+        min_tokens: Truncation floor before the variable is dropped entirely
+    """
+
+    variable: str
+    sources: tuple[PhaseTask, ...]
+    priority: int = 1
+    min_tokens: int = 500
+
+
+# Template variables of each task. Sources must be a subset of the task's
+# dependencies in AgentMapping.get_task_dependencies(), otherwise the
+# scheduler could start the task before its context exists.
+DEFAULT_CONTEXT_SLOTS: dict[PhaseTask, tuple[ContextSlot, ...]] = {
+    PhaseTask.VALIDATE_CLAUDE: (
+        ContextSlot("brainstormed_results", (PhaseTask.BRAINSTORM_CHATGPT,)),
+    ),
+    PhaseTask.FACT_CHECK_PERPLEXITY: (
+        ContextSlot("research_results", (PhaseTask.VALIDATE_CLAUDE, PhaseTask.BRAINSTORM_CHATGPT)),
+    ),
+    PhaseTask.SWOT_CHATGPT: (
+        ContextSlot("validated_ideas", (PhaseTask.VALIDATE_CLAUDE,)),
+    ),
+    PhaseTask.NARRATIVE_CLAUDE: (
+        ContextSlot("swot_results", (PhaseTask.SWOT_CHATGPT,)),
+    ),
+    PhaseTask.BUSINESS_PLAN_CLAUDE: (
+        ContextSlot("narrative_results", (PhaseTask.NARRATIVE_CLAUDE,), priority=2),
+        ContextSlot("swot_results", (PhaseTask.SWOT_CHATGPT,), priority=1),
+    ),
+    PhaseTask.OUTLINE_CHATGPT: (
+        ContextSlot("business_plan_content", (PhaseTask.BUSINESS_PLAN_CLAUDE,)),
+    ),
+    PhaseTask.CHARTS_GEMINI: (
+        ContextSlot("business_plan_content", (PhaseTask.BUSINESS_PLAN_CLAUDE,)),
+    ),
+    PhaseTask.VERIFY_PERPLEXITY: (
+        ContextSlot("document_draft", (PhaseTask.BUSINESS_PLAN_CLAUDE,)),
+    ),
+    PhaseTask.FINAL_REVIEW_CLAUDE: (
+        ContextSlot("document_draft", (PhaseTask.BUSINESS_PLAN_CLAUDE,), priority=2),
+        ContextSlot("fact_check_results", (PhaseTask.FACT_CHECK_PERPLEXITY,), priority=1),
+    ),
+    PhaseTask.POLISH_CLAUDE: (
+        ContextSlot("document_draft", (PhaseTask.BUSINESS_PLAN_CLAUDE,), priority=2),
+        ContextSlot("review_feedback", (PhaseTask.FINAL_REVIEW_CLAUDE,), priority=1),
+    ),
+}
+
+
+class PackAction(StrEnum):
+    """How a variable was filled."""
+
+    FULL = "full"
+    SUMMARY = "summary"
+    TRUNCATED = "truncated"
+    DROPPED = "dropped"
+    MISSING = "missing"
+
+
+@dataclass
+class SlotDecision:
+    """
+    Packing outcome of one variable.
+
+    Attributes:
+        variable: Template variable name
+        action: How the variable was filled
+        original_tokens: Tokens of the verbatim upstream outputs
+        packed_tokens: Tokens placed into the prompt
+    """
+
+    variable: str
+    action: PackAction
+    original_tokens: int = 0
+    packed_tokens: int = 0
+
+
+@dataclass
+class PackedContext:
+    """
+    Result of packing a task's context.
+
+    Attributes:
+        variables: Template variables to render with
+        provider: Provider the budget was computed for
+        budget_tokens: Tokens available for upstream context
+        used_tokens: Tokens of the packed variables
+        decisions: Per-variable outcomes
+    """
+
+    variables: dict[str, str] = field(default_factory=dict)
+    provider: str = ""
+    budget_tokens: int = 0
+    used_tokens: int = 0
+    decisions: list[SlotDecision] = field(default_factory=list)
+
+    @property
+    def degraded(self) -> list[SlotDecision]:
+        """Decisions that did not keep the upstream output verbatim."""
+        return [
+            decision
+            for decision in self.decisions
+            if decision.action in {PackAction.SUMMARY, PackAction.TRUNCATED, PackAction.DROPPED}
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (for session artifacts)."""
+        return {
+            "provider": self.provider,
+            "budget_tokens": self.budget_tokens,
+            "used_tokens": self.used_tokens,
+            "variables": {
+                decision.variable: {
+                    "action": decision.action.value,
+                    "original_tokens": decision.original_tokens,
+                    "packed_tokens": decision.packed_tokens,
+                }
+                for decision in self.decisions
+            },
+        }
+
+
+@dataclass
+class _SlotState:
+    slot: ContextSlot
+    parts: list[tuple[PhaseTask, str]]
+    text: str
+    tokens: int
+    decision: SlotDecision
+
+
+class ExtractiveSummaries:
+    """
+    Summary lookup condensing task outputs with ExtractiveSummarizer.
+
+    Summaries are cached per output, since one upstream output is often
+    packed into several prompts. Phases pack in worker threads, so the
+    cache is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        target_reduction_ratio: float = 0.5,
+        token_counter: TokenCounter | None = None,
+        max_entries: int = 64,
+    ) -> None:
+        """
+        Initialize lookup.
+
+        Args:
+            target_reduction_ratio: Share of tokens each summary removes
+            token_counter: Token counter (default: process-wide shared counter)
+            max_entries: Summaries kept before the oldest is evicted
+        """
+        self.target_reduction_ratio = target_reduction_ratio
+        self.summarizer = ExtractiveSummarizer(token_counter=token_counter)
+        self.max_entries = max_entries
+        self._cache: dict[tuple[PhaseTask, str], str | None] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, task: PhaseTask, text: str) -> str | None:
+        """
+        Summarize a task output.
+
+        Args:
+            task: Task that produced the output
+            text: Task output
+
+        Returns:
+            Summary, or None if the output cannot be condensed extractively
+        """
+        key = (task, text)
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+        summary = self.summarizer.summarize(text, self.target_reduction_ratio)
+        with self._lock:
+            if key not in self._cache and len(self._cache) >= self.max_entries:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = summary
+        return summary
+
+
+class ContextPacker:
+    """
+    Packs upstream task outputs into template variables within a token budget.
+
+    The budget for a prompt is the smaller of ``max_prompt_tokens`` and
+    ``input_ratio`` of the provider's context window (ModelLimits), minus the
+    tokens of the template itself.
+    """
+
+    def __init__(
+        self,
+        max_prompt_tokens: int = 12000,
+        input_ratio: float = 0.5,
+        model_limits: ModelLimits | None = None,
+        token_counter: TokenCounter | None = None,
+        slots: Mapping[PhaseTask, tuple[ContextSlot, ...]] | None = None,
+        summaries: Callable[[PhaseTask, str], str | None] | None = None,
+    ) -> None:
+        """
+        Initialize packer.
+
+        Args:
+            max_prompt_tokens: Practical prompt size limit of the chat UIs
+            input_ratio: Share of the model context window usable for the prompt
+            model_limits: Context window per provider
+            token_counter: Token counter (default: process-wide shared counter)
+            slots: Template variables per task (default: DEFAULT_CONTEXT_SLOTS)
+            summaries: Lookup returning a summary of a task output, or None
+        """
+        self.max_prompt_tokens = max_prompt_tokens
+        self.input_ratio = input_ratio
+        self.model_limits = model_limits or ModelLimits()
+        self.token_counter = token_counter or get_token_counter()
+        self.slots = dict(slots if slots is not None else DEFAULT_CONTEXT_SLOTS)
+        self.summaries = summaries
+
+    @classmethod
+    def from_settings(cls, settings: Any, token_counter: TokenCounter | None = None) -> "ContextPacker":
+        """
+        Build a packer from AigenFlowSettings.
+
+        Over-budget outputs are replaced by extractive summaries before
+        anything is truncated.
+
+        Args:
+            settings: Application settings
+            token_counter: Token counter to share (created if None)
+
+        Returns:
+            ContextPacker
+        """
+        return cls(
+            max_prompt_tokens=settings.context_max_prompt_tokens,
+            token_counter=token_counter,
+            summaries=ExtractiveSummaries(token_counter=token_counter),
+        )
+
+    def get_slots(self, task: PhaseTask) -> tuple[ContextSlot, ...]:
+        """
+        Get the context variables of a task.
+
+        Args:
+            task: PhaseTask enum value
+
+        Returns:
+            Slots (empty if the task has no upstream context)
+        """
+        return self.slots.get(task, ())
+
+    def get_budget(self, provider: str, template_tokens: int = 0) -> int:
+        """
+        Get the tokens available for upstream context.
+
+        Args:
+            provider: Provider name (claude, gemini, chatgpt, perplexity)
+            template_tokens: Tokens of the prompt without upstream context
+
+        Returns:
+            Token budget (>= 0)
+        """
+        limit = min(self.max_prompt_tokens, int(self.model_limits.get_limit(provider) * self.input_ratio))
+        return max(0, limit - template_tokens)
+
+    def count(self, text: str, provider: str) -> int:
+        """Count tokens of text."""
+        return self.token_counter.count(text, model_name=provider).total_tokens
+
+    def pack(
+        self,
+        task: PhaseTask,
+        outputs: Mapping[PhaseTask, str],
+        provider: str,
+        template_tokens: int = 0,
+        summaries: Callable[[PhaseTask, str], str | None] | None = None,
+    ) -> PackedContext:
+        """
+        Fill a task's template variables from upstream outputs.
+
+        Args:
+            task: Task whose prompt is being rendered
+            outputs: Successful upstream outputs by task
+            provider: Provider receiving the prompt
+            template_tokens: Tokens of the prompt without upstream context
+            summaries: Summary lookup tried before the packer's own (e.g.
+                summaries already made for this session)
+
+        Returns:
+            PackedContext with variables and per-variable decisions
+        """
+        budget = self.get_budget(provider, template_tokens)
+        packed = PackedContext(provider=provider, budget_tokens=budget)
+
+        states: list[_SlotState] = []
+        for slot in self.get_slots(task):
+            parts = [(source, outputs[source]) for source in slot.sources if outputs.get(source)]
+            if not parts:
+                packed.variables[slot.variable] = ""
+                packed.decisions.append(SlotDecision(slot.variable, PackAction.MISSING))
+                continue
+            text = SOURCE_SEPARATOR.join(part for _, part in parts)
+            tokens = self.count(text, provider)
+            state = _SlotState(slot, parts, text, tokens, SlotDecision(slot.variable, PackAction.FULL, tokens, tokens))
+            states.append(state)
+            packed.decisions.append(state.decision)
+
+        overflow = sum(state.tokens for state in states) - budget
+        # Stable sort keeps declaration order among equal priorities; degrade later variables first
+        degrade_order = sorted(reversed(states), key=lambda state: state.slot.priority)
+
+        if overflow > 0:
+            overflow = self._substitute_summaries(degrade_order, overflow, provider, summaries)
+        if overflow > 0:
+            overflow = self._truncate(degrade_order, overflow, provider)
+        if overflow > 0:
+            self._drop(degrade_order, overflow)
+
+        for state in states:
+            packed.variables[state.slot.variable] = state.text
+            state.decision.packed_tokens = state.tokens
+        packed.used_tokens = sum(state.tokens for state in states)
+
+        if packed.degraded:
+            logger.info(
+                "Packed prompt context over budget",
+                task=task.value,
+                provider=provider,
+                budget_tokens=budget,
+                used_tokens=packed.used_tokens,
+                degraded={decision.variable: decision.action.value for decision in packed.degraded},
+            )
+        return packed
+
+    def _substitute_summaries(
+        self,
+        states: list[_SlotState],
+        overflow: int,
+        provider: str,
+        summaries: Callable[[PhaseTask, str], str | None] | None = None,
+    ) -> int:
+        """
+        Replace outputs with their summaries, lowest priority first.
+
+        Lookups are tried in order and the first one that shrinks a variable
+        wins. A summary shared by several sources (e.g. one summary of all
+        earlier phases) is placed in the prompt only once.
+        """
+        lookups = [lookup for lookup in (summaries, self.summaries) if lookup is not None]
+        used: set[str] = set()
+
+        for state in states:
+            if overflow <= 0:
+                break
+            for lookup in lookups:
+                found = [lookup(source, text) for source, text in state.parts]
+                if any(summary in used for summary in found if summary):
+                    continue
+                parts = [summary or text for summary, (_, text) in zip(found, state.parts, strict=True)]
+                summary = SOURCE_SEPARATOR.join(dict.fromkeys(parts))
+                summary_tokens = self.count(summary, provider)
+                if summary_tokens < state.tokens:
+                    overflow -= state.tokens - summary_tokens
+                    state.text, state.tokens = summary, summary_tokens
+                    state.decision.action = PackAction.SUMMARY
+                    used.update(summary for summary in found if summary)
+                    break
+        return overflow
+
+    def _truncate(self, states: list[_SlotState], overflow: int, provider: str) -> int:
+        """Cut outputs down towards their floors, lowest priority first."""
+        for state in states:
+            if overflow <= 0:
+                break
+            cut = min(overflow, state.tokens - min(state.slot.min_tokens, state.tokens))
+            if cut <= 0:
+                continue
+            text, tokens = self._truncate_text(state.text, state.tokens - cut, provider)
+            overflow -= state.tokens - tokens
+            state.text, state.tokens = text, tokens
+            state.decision.action = PackAction.TRUNCATED
+        return overflow
+
+    @staticmethod
+    def _drop(states: list[_SlotState], overflow: int) -> None:
+        """Remove outputs entirely, lowest priority first."""
+        for state in states:
+            if overflow <= 0:
+                break
+            overflow -= state.tokens
+            state.text, state.tokens = DROPPED_PLACEHOLDER, 0
+            state.decision.action = PackAction.DROPPED
+
+    def _truncate_text(self, text: str, max_tokens: int, provider: str) -> tuple[str, int]:
+        """
+        Truncate text to at most max_tokens, preferring paragraph or line boundaries.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token limit including the truncation marker
+            provider: Provider name for counting
+
+        Returns:
+            Tuple of (truncated text, token count)
+        """
+        tokens = self.count(text, provider)
+        if tokens <= max_tokens:
+            return text, tokens
+
+        chars = int(len(text) * max_tokens / tokens)
+        while chars > 0:
+            cut = text[:chars]
+            for boundary in ("\n\n", "\n"):
+                position = cut.rfind(boundary)
+                if position > chars // 2:
+                    cut = cut[:position]
+                    break
+            truncated = cut.rstrip() + TRUNCATION_MARKER
+            truncated_tokens = self.count(truncated, provider)
+            if truncated_tokens <= max_tokens:
+                return truncated, truncated_tokens
+            chars = int(chars * 0.9)
+        return "", 0
@@ -0,0 +1,172 @@
+"""
+Speculative background context summarization.
+
+Summarizing before a phase costs an extra browser round-trip. Instead of
+awaiting it on the critical path, SpeculativeSummarizer starts it as soon
+as a phase's results land and caches it per (session, phase set)
+fingerprint. The next phase takes the summary only if it is ready in time
+(by default it waits up to two seconds, enough for the extractive tier);
+otherwise it proceeds with the raw context while the summary finishes in
+the background.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+from collections.abc import Callable
+
+from context.summarizer import ContextSummary, SummaryResult
+from core.logger import get_logger
+from core.models import PhaseResult, PipelineSession
+
+logger = get_logger(__name__)
+
+# Called with (session, phase_number, result) when a summary completes after its phase started
+LateSummaryCallback = Callable[[PipelineSession, int, SummaryResult], None]
+
+
+def context_fingerprint(session: PipelineSession, before_phase: int) -> str:
+    """
+    Fingerprint the context summarized before a phase.
+
+    Args:
+        session: Pipeline session
+        before_phase: Phase the summary is for (earlier results are summarized)
+
+    Returns:
+        Hex digest over the session ID and the identity of each earlier result
+    """
+    digest = hashlib.sha256(session.session_id.encode())
+    for result in session.results:
+        if result.phase_number < before_phase:
+            digest.update(f"|{result.phase_number}:{result.started_at.isoformat()}:{result.status.value}".encode())
+    return digest.hexdigest()[:16]
+
+
+class SpeculativeSummarizer:
+    """
+    Runs ContextSummary in background tasks, one per context fingerprint.
+    """
+
+    def __init__(
+        self,
+        context_summary: ContextSummary,
+        wait_seconds: float = 2.0,
+        on_late_summary: LateSummaryCallback | None = None,
+    ) -> None:
+        """
+        Initialize speculative summarizer.
+
+        Args:
+            context_summary: Summarizer doing the actual work
+            wait_seconds: How long a phase waits for an unfinished summary
+            on_late_summary: Receives summaries that finish after their phase started
+        """
+        self.context_summary = context_summary
+        self.wait_seconds = wait_seconds
+        self.on_late_summary = on_late_summary
+        self._tasks: dict[str, asyncio.Task[SummaryResult]] = {}
+        self._phases: dict[str, tuple[str, int]] = {}
+        self._missed: set[str] = set()
+
+    def start(self, session: PipelineSession, before_phase: int) -> asyncio.Task[SummaryResult]:
+        """
+        Start summarizing the context of a phase, unless already started.
+
+        Pending summaries of the same session for other phase sets are
+        superseded and cancelled.
+
+        Args:
+            session: Pipeline session
+            before_phase: Phase the summary is for
+
+        Returns:
+            Background task producing the SummaryResult
+        """
+        fingerprint = context_fingerprint(session, before_phase)
+        task = self._tasks.get(fingerprint)
+        if task is not None:
+            return task
+
+        for other, (session_id, _) in list(self._phases.items()):
+            if session_id == session.session_id and not self._tasks[other].done():
+                logger.debug(f"Cancelling superseded context summary {other}")
+                self._tasks[other].cancel()
+                self._forget(other)
+
+        results: list[PhaseResult] = list(session.results)
+        task = asyncio.create_task(
+            self.context_summary.summarize_phase_context(session_results=results, current_phase=before_phase),
+            name=f"context-summary-{fingerprint}",
+        )
+        self._tasks[fingerprint] = task
+        self._phases[fingerprint] = (session.session_id, before_phase)
+        task.add_done_callback(lambda done: self._on_done(session, fingerprint, done))
+        logger.info(f"Started background context summarization before Phase {before_phase}")
+        return task
+
+    def is_started(self, session: PipelineSession, before_phase: int) -> bool:
+        """Check whether a summary for this context exists (running or finished)."""
+        return context_fingerprint(session, before_phase) in self._tasks
+
+    async def take(self, session: PipelineSession, before_phase: int) -> SummaryResult | None:
+        """
+        Get the summary for a phase if it is ready within ``wait_seconds``.
+
+        An unfinished summary keeps running; once done it is passed to
+        ``on_late_summary`` instead.
+
+        Args:
+            session: Pipeline session
+            before_phase: Phase about to execute
+
+        Returns:
+            SummaryResult, or None to proceed with the raw context
+        """
+        fingerprint = context_fingerprint(session, before_phase)
+        task = self._tasks.get(fingerprint)
+        if task is None:
+            return None
+
+        if not task.done() and self.wait_seconds > 0:
+            await asyncio.wait({task}, timeout=self.wait_seconds)
+        if not task.done():
+            self._missed.add(fingerprint)
+            logger.info(f"Context summary for Phase {before_phase} not ready, continuing with raw context")
+            return None
+        if task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    async def discard(self, session_id: str) -> None:
+        """
+        Cancel and forget every summary of a session.
+
+        Args:
+            session_id: Session whose summaries are dropped
+        """
+        fingerprints = [fp for fp, (owner, _) in self._phases.items() if owner == session_id]
+        tasks = [self._tasks[fp] for fp in fingerprints if not self._tasks[fp].done()]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        for fingerprint in fingerprints:
+            self._forget(fingerprint)
+
+    def _forget(self, fingerprint: str) -> None:
+        self._tasks.pop(fingerprint, None)
+        self._phases.pop(fingerprint, None)
+        self._missed.discard(fingerprint)
+
+    def _on_done(self, session: PipelineSession, fingerprint: str, task: asyncio.Task[SummaryResult]) -> None:
+        """Hand summaries that missed their phase to the late-summary callback."""
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning(f"Background context summarization failed: {task.exception()}")
+            return
+        if fingerprint in self._missed and self.on_late_summary is not None:
+            _, before_phase = self._phases.get(fingerprint, ("", 0))
+            self.on_late_summary(session, before_phase, task.result())
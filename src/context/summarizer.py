@@ -1,18 +1,21 @@
 """
 Context summarizer for reducing token usage while preserving critical information.
 
-Uses AI agents to summarize accumulated context from previous phases,
-preserving key decisions, data points, and citation sources.
+Summarizes accumulated context from previous phases through a chain of
+tiers (local extractive extraction, then an AI agent), preserving key
+decisions, data points, and citation sources.
 """
 
 import asyncio
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
 from agents.router import AgentRouter, PhaseTask
+from context.tokenizer import ESTIMATE_ENCODING, TokenCounter, TokenCountResult, get_token_counter
 from core.logger import get_logger
 from core.models import AgentType, DocumentType, PhaseResult
 
@@ -33,6 +36,7 @@ class SummaryResult:
         timestamp: When summarization occurred
         success: Whether summarization succeeded
         error: Error message if failed
+        tier: Name of the tier that produced the summary
     """
 
     original_text: str
@@ -43,6 +47,7 @@ class SummaryResult:
     timestamp: datetime = field(default_factory=datetime.now)
     success: bool = True
     error: str | None = None
+    tier: str = ""
 
     def get_summary_dict(self) -> dict[str, Any]:
         """Convert summary result to dictionary for serialization."""
@@ -55,6 +60,7 @@ class SummaryResult:
             "timestamp": self.timestamp.isoformat(),
             "success": self.success,
             "error": self.error,
+            "tier": self.tier,
         }
 
 
@@ -68,6 +74,7 @@ class SummaryConfig(BaseModel):
         agent_type: Which AI agent to use for summarization
         max_retries: Number of retry attempts on failure
         preserve_sections: List of section names to preserve verbatim
+        tiers: Summarization tiers tried in order until one meets the target
     """
 
     enabled: bool = True
@@ -77,6 +84,58 @@ class SummaryConfig(BaseModel):
     preserve_sections: list[str] = field(
         default_factory=lambda: ["key_decisions", "data_points", "citations"]
     )
+    tiers: list[Literal["extractive", "agent"]] = field(default_factory=lambda: ["agent"])
+
+
+class SummaryTier(ABC):
+    """
+    One way of producing a context summary.
+
+    Tiers are tried cheapest first; returning None escalates to the next tier.
+    """
+
+    name: str
+
+    @abstractmethod
+    async def summarize(self, results: list[PhaseResult], phase_number: int) -> tuple[str, str] | None:
+        """
+        Summarize phase results.
+
+        Args:
+            results: Phase results to summarize
+            phase_number: Phase the summary is for
+
+        Returns:
+            Tuple of (original context, summary), or None to escalate
+        """
+
+
+class AgentTier(SummaryTier):
+    """
+    Summarization tier asking an AI agent through the router.
+    """
+
+    name = "agent"
+
+    def __init__(self, context_summary: "ContextSummary") -> None:
+        """
+        Initialize tier.
+
+        Args:
+            context_summary: Summarizer providing the context and agent call
+        """
+        self.context_summary = context_summary
+
+    async def summarize(self, results: list[PhaseResult], phase_number: int) -> tuple[str, str] | None:
+        """
+        Summarize phase results with the configured agent.
+
+        Raises:
+            Exception: If summarization fails after retries
+        """
+        context = self.context_summary._extract_context_from_results(results)
+        summary_text, _, _ = await self.context_summary._summarize_with_agent(context, phase_number)
+        return context, summary_text
 
 
 class ContextSummary:
@@ -113,6 +172,8 @@ Provide a concise summary that captures the essential information."""
         self,
         agent_router: AgentRouter,
         config: SummaryConfig | None = None,
+        token_counter: TokenCounter | None = None,
+        tiers: list[SummaryTier] | None = None,
     ) -> None:
         """
         Initialize context summarizer.
@@ -120,11 +181,33 @@ Provide a concise summary that captures the essential information."""
         Args:
             agent_router: AgentRouter for accessing AI agents
             config: Optional summary configuration
+            token_counter: Token counter (default: process-wide shared counter)
+            tiers: Summarization tiers (default: built from config.tiers)
         """
         self.agent_router = agent_router
         self.config = config or SummaryConfig()
+        self.token_counter = token_counter or get_token_counter()
+        self.tiers = tiers if tiers is not None else self._build_tiers()
         self._summaries: dict[int, SummaryResult] = {}
 
+    def _build_tiers(self) -> list[SummaryTier]:
+        """Create the tiers named in the configuration."""
+        tiers: list[SummaryTier] = []
+        for name in self.config.tiers:
+            if name == "extractive":
+                from context.extractive import ExtractiveTier
+
+                tiers.append(
+                    ExtractiveTier(
+                        self.config,
+                        render_context=lambda results: self._extract_context_from_results(results, preview_chars=None),
+                        token_counter=self.token_counter,
+                    )
+                )
+            elif name == "agent":
+                tiers.append(AgentTier(self))
+        return tiers
+
     def _build_summary_prompt(
         self,
         context: str,
@@ -146,12 +229,17 @@ Provide a concise summary that captures the essential information."""
             context=context,
         )
 
-    def _extract_context_from_results(self, results: list[PhaseResult]) -> str:
+    def _extract_context_from_results(
+        self,
+        results: list[PhaseResult],
+        preview_chars: int | None = 500,
+    ) -> str:
         """
         Extract and format context from phase results.
 
         Args:
             results: List of PhaseResult objects
+            preview_chars: Characters kept per response (None = full content)
 
         Returns:
             Formatted context string
@@ -173,9 +261,9 @@ Provide a concise summary that captures the essential information."""
                         f"\nTask {idx + 1} ({response.agent_name.value}): {response.task_name}"
                     )
                     # Include key content (limit to prevent double summarization)
-                    content_preview = response.content[:500]
-                    if len(response.content) > 500:
-                        content_preview += "\n...(truncated for summary input)"
+                    content_preview = response.content
+                    if preview_chars is not None and len(response.content) > preview_chars:
+                        content_preview = response.content[:preview_chars] + "\n...(truncated for summary input)"
                     sections.append(content_preview)
 
             # Add phase summary if available
@@ -204,10 +292,8 @@ Provide a concise summary that captures the essential information."""
         Raises:
             Exception: If summarization fails after retries
         """
-        from context.tokenizer import TokenCounter
-
         # Count original tokens
-        token_counter = TokenCounter()
+        token_counter = self.token_counter
         original_result = token_counter.count(context, model_name="claude")
         original_tokens = original_result.total_tokens
 
@@ -319,9 +405,20 @@ Provide a concise summary that captures the essential information."""
                     success=True,
                 )
 
-            # Perform summarization
-            summary_text, original_tokens, summary_tokens = await self._summarize_with_agent(
-                context, current_phase
+            # Try tiers cheapest first
+            tier_name = ""
+            for tier in self.tiers:
+                outcome = await tier.summarize(previous_results, current_phase)
+                if outcome is not None:
+                    context, summary_text = outcome
+                    tier_name = tier.name
+                    break
+                logger.info(f"Summary tier '{tier.name}' could not meet the target, escalating")
+            else:
+                raise Exception("No summarization tier met the target reduction")
+
+            original_tokens, summary_tokens = (
+                count.total_tokens for count in self.token_counter.count_many([context, summary_text], "claude")
             )
 
             # Calculate reduction ratio
@@ -334,6 +431,7 @@ Provide a concise summary that captures the essential information."""
                 tokens_summary=summary_tokens,
                 reduction_ratio=reduction_ratio,
                 success=True,
+                tier=tier_name,
             )
 
             # Store summary for later retrieval
@@ -385,6 +483,7 @@ Provide a concise summary that captures the essential information."""
         current_phase: int,
         provider: str = "claude",
         threshold: float = 0.8,
+        token_ledger: Any = None,
     ) -> bool:
         """
         Determine if summarization should be triggered before a phase.
@@ -394,22 +493,29 @@ Provide a concise summary that captures the essential information."""
             current_phase: Current phase number
             provider: AI provider name for token limit
             threshold: Threshold percentage (default 0.8 = 80%)
+            token_ledger: Synced TokenLedger of the session; its stored counts
+                are used instead of re-tokenizing the context
 
         Returns:
             True if summarization is recommended
         """
-        from context.tokenizer import TokenCounter
-
         # Filter results from phases before current phase
         previous_results = [r for r in session_results if r.phase_number < current_phase]
 
         if not previous_results:
             return False
 
+        if token_ledger is not None:
+            result = TokenCountResult(
+                total_tokens=token_ledger.context_tokens(before_phase=current_phase),
+                estimated=token_ledger.encoding == ESTIMATE_ENCODING,
+                model_name=provider,
+            )
+            return result.is_near_limit(provider, threshold)
+
         # Extract context and count tokens
         context = self._extract_context_from_results(previous_results)
-        token_counter = TokenCounter()
-        result = token_counter.count(context, model_name=provider)
+        result = self.token_counter.count(context, model_name=provider)
 
         # Check if near limit
         return result.is_near_limit(provider, threshold)
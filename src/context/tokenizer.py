@@ -3,10 +3,18 @@ Token counter for context size estimation.
 
 Provides token counting and limit checking for AI provider context windows.
 Uses tiktoken when available, falls back to character-based estimation.
+
+The tiktoken encoding is loaded once per process and recent counts are
+memoized, so repeated counting of the same outputs is a dictionary lookup.
 """
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -94,6 +102,18 @@ class TokenCountResult:
         return self.get_percentage_used(provider) >= (threshold * 100)
 
 
+ENCODING_NAME = "cl100k_base"
+ESTIMATE_ENCODING = "estimate"
+
+
+@lru_cache(maxsize=4)
+def _load_encoding(name: str) -> Any:
+    """Load a tiktoken encoding once per process (loading parses the BPE ranks)."""
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
+
+
 class TokenCounter:
     """
     Counts tokens in text for context management.
@@ -105,21 +125,30 @@ class TokenCounter:
     # Character-based estimation: ~4 characters per token
     CHARS_PER_TOKEN = 4
 
+    # Memoized counts kept per counter (LRU), keyed by a text digest so
+    # the memo does not keep whole documents alive
+    MEMO_SIZE = 2048
+
+    # Worker threads for batch encoding (tiktoken releases the GIL)
+    BATCH_THREADS = 4
+
     def __init__(self) -> None:
         """Initialize token counter."""
+        self._memo: OrderedDict[tuple[bytes, bool], tuple[int, bool]] = OrderedDict()
+        self._memo_lock = threading.Lock()
         self._tiktoken_available = self._check_tiktoken()
         if self._tiktoken_available:
             try:
-                import importlib.util
-
-                if importlib.util.find_spec("tiktoken") is not None:
-                    import tiktoken
-
-                    self._encoding = tiktoken.get_encoding("cl100k_base")
+                self._encoding = _load_encoding(ENCODING_NAME)
             except Exception as exc:
                 logger.warning(f"tiktoken initialization failed: {exc}")
                 self._tiktoken_available = False
 
+    @property
+    def encoding_name(self) -> str:
+        """Name of the encoding used for exact counts ("estimate" without tiktoken)."""
+        return ENCODING_NAME if self._tiktoken_available else ESTIMATE_ENCODING
+
     def _check_tiktoken(self) -> bool:
         """Check if tiktoken is available."""
         try:
@@ -153,24 +182,86 @@ class TokenCounter:
                 model_name=model_name,
             )
 
-        if self._tiktoken_available and not estimate_only:
+        cached = self._memo_get(text, estimate_only)
+        if cached is None:
+            cached = self._count_uncached(text, estimate_only)
+            self._memo_put(text, estimate_only, cached)
+
+        total_tokens, estimated = cached
+        return TokenCountResult(
+            total_tokens=total_tokens,
+            estimated=estimated,
+            model_name=model_name,
+        )
+
+    def count_many(
+        self,
+        texts: Sequence[str],
+        model_name: str = "claude",
+    ) -> list[TokenCountResult]:
+        """
+        Count tokens of many texts, batch-encoding uncached ones across threads.
+
+        Args:
+            texts: Texts to count
+            model_name: Model name for counting
+
+        Returns:
+            TokenCountResult per text, in input order
+        """
+        counts: list[tuple[int, bool] | None] = [
+            (0, True) if not text else self._memo_get(text, False) for text in texts
+        ]
+        pending = [index for index, count in enumerate(counts) if count is None]
+
+        if pending and self._tiktoken_available:
             try:
-                tokens = self._encoding.encode(text)
-                return TokenCountResult(
-                    total_tokens=len(tokens),
-                    estimated=False,
-                    model_name=model_name,
+                encoded = self._encoding.encode_batch(
+                    [texts[index] for index in pending],
+                    num_threads=self.BATCH_THREADS,
                 )
+                for index, tokens in zip(pending, encoded, strict=True):
+                    counts[index] = (len(tokens), False)
+                    self._memo_put(texts[index], False, counts[index])
+            except Exception as exc:
+                logger.warning(f"tiktoken batch encoding failed: {exc}, counting individually")
+
+        return [
+            TokenCountResult(total_tokens=count[0], estimated=count[1], model_name=model_name)
+            if count is not None
+            else self.count(text, model_name)
+            for text, count in zip(texts, counts, strict=True)
+        ]
+
+    def _count_uncached(self, text: str, estimate_only: bool) -> tuple[int, bool]:
+        """Count tokens without the memo. Returns (tokens, estimated)."""
+        if self._tiktoken_available and not estimate_only:
+            try:
+                return len(self._encoding.encode(text)), False
             except Exception as exc:
                 logger.warning(f"tiktoken encoding failed: {exc}, falling back to estimation")
 
         # Character-based estimation
-        estimated_tokens = max(1, len(text) // self.CHARS_PER_TOKEN)
-        return TokenCountResult(
-            total_tokens=estimated_tokens,
-            estimated=True,
-            model_name=model_name,
-        )
+        return max(1, len(text) // self.CHARS_PER_TOKEN), True
+
+    @staticmethod
+    def _memo_key(text: str, estimate_only: bool) -> tuple[bytes, bool]:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest(), estimate_only
+
+    def _memo_get(self, text: str, estimate_only: bool) -> tuple[int, bool] | None:
+        key = self._memo_key(text, estimate_only)
+        with self._memo_lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+            return cached
+
+    def _memo_put(self, text: str, estimate_only: bool, value: tuple[int, bool]) -> None:
+        key = self._memo_key(text, estimate_only)
+        with self._memo_lock:
+            self._memo[key] = value
+            while len(self._memo) > self.MEMO_SIZE:
+                self._memo.popitem(last=False)
 
     def count_dict(
         self,
@@ -208,3 +299,21 @@ class TokenCounter:
             True if summarization is recommended
         """
         return result.is_near_limit(provider, threshold)
+
+
+_shared_counter: TokenCounter | None = None
+_shared_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """
+    Get the process-wide TokenCounter, so its memo is shared by all users.
+
+    Returns:
+        Shared TokenCounter
+    """
+    global _shared_counter
+    with _shared_counter_lock:
+        if _shared_counter is None:
+            _shared_counter = TokenCounter()
+        return _shared_counter
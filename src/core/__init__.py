@@ -2,44 +2,106 @@
 Core modules for AigenFlow pipeline.
 """
 
-from .config import AigenFlowSettings, get_output_dir, get_settings
-from .events import (
-    AgentCalledEvent,
-    AgentRespondedEvent,
-    BaseEvent,
-    EventBus,
-    EventHandler,
-    EventType,
-    PhaseCompletedEvent,
-    PhaseStartedEvent,
-    PipelineCompletedEvent,
-    PipelineFailedEvent,
-    PipelineStartedEvent,
-    StateSavedEvent,
-    get_event_bus,
-)
-from .exceptions import (
-    AgentException,
-    AigenFlowException,
-    ConfigurationException,
-    ErrorCode,
-    GatewayException,
-    PipelineException,
-    TemplateException,
-)
-from .logger import LogContext, get_logger, setup_logging
-from .models import (
-    AgentResponse,
-    AgentType,
-    DocumentType,
-    PhaseResult,
-    PhaseStatus,
-    PipelineConfig,
-    PipelineSession,
-    PipelineState,
-    TemplateType,
-    create_phase_result,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import AigenFlowSettings, get_output_dir, get_settings
+    from .events import (
+        AgentCalledEvent,
+        AgentRespondedEvent,
+        BaseEvent,
+        EventBus,
+        EventHandler,
+        EventType,
+        PhaseCompletedEvent,
+        PhaseStartedEvent,
+        PipelineCompletedEvent,
+        PipelineFailedEvent,
+        PipelineStartedEvent,
+        StateSavedEvent,
+        get_event_bus,
+    )
+    from .exceptions import (
+        AgentException,
+        AigenFlowException,
+        ConfigurationException,
+        ErrorCode,
+        GatewayException,
+        PipelineException,
+        TemplateException,
+    )
+    from .logger import LogContext, get_logger, setup_logging
+    from .models import (
+        AgentResponse,
+        AgentType,
+        DocumentType,
+        PhaseResult,
+        PhaseStatus,
+        PipelineConfig,
+        PipelineSession,
+        PipelineState,
+        TemplateType,
+        create_phase_result,
+    )
+
+# Exports are resolved on first access so that importing one submodule
+# (e.g. core.models) does not pull in pydantic-settings and structlog.
+_EXPORTS = {
+    "config": ("AigenFlowSettings", "get_output_dir", "get_settings"),
+    "events": (
+        "AgentCalledEvent",
+        "AgentRespondedEvent",
+        "BaseEvent",
+        "EventBus",
+        "EventHandler",
+        "EventType",
+        "PhaseCompletedEvent",
+        "PhaseStartedEvent",
+        "PipelineCompletedEvent",
+        "PipelineFailedEvent",
+        "PipelineStartedEvent",
+        "StateSavedEvent",
+        "get_event_bus",
+    ),
+    "exceptions": (
+        "AgentException",
+        "AigenFlowException",
+        "ConfigurationException",
+        "ErrorCode",
+        "GatewayException",
+        "PipelineException",
+        "TemplateException",
+    ),
+    "logger": ("LogContext", "get_logger", "setup_logging"),
+    "models": (
+        "AgentResponse",
+        "AgentType",
+        "DocumentType",
+        "PhaseResult",
+        "PhaseStatus",
+        "PipelineConfig",
+        "PipelineSession",
+        "PipelineState",
+        "TemplateType",
+        "create_phase_result",
+    ),
+}
+_MODULE_BY_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODULE_BY_NAME])
+
 
 __all__ = [
     "AigenFlowSettings",
@@ -0,0 +1,313 @@
+"""
+Indexed catalog of pipeline sessions.
+
+Listing sessions used to parse every pipeline_state.json under the output
+directory, response bodies included. The catalog keeps one small row per
+session in SQLite (output/sessions/catalog.db), updated by the
+orchestrator on every state transition, so status, resume and
+``aigenflow sessions`` queries are index lookups:
+- Filters by state, doc type, topic substring and update time
+- Newest-first ordering with LIMIT/OFFSET pagination
+- reindex() rebuilds rows from session directories when the catalog is
+  missing or stale
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from core.models import PipelineSession
+
+logger = get_logger(__name__)
+
+CATALOG_DIRNAME = "sessions"
+CATALOG_FILENAME = "catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    doc_type TEXT NOT NULL,
+    state TEXT NOT NULL,
+    current_phase INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    session_dir TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_state ON sessions(state, updated_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_doc_type ON sessions(doc_type, updated_at);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO sessions "
+    "(session_id, topic, doc_type, state, current_phase, created_at, updated_at, session_dir) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def catalog_path(output_dir: Path) -> Path:
+    """
+    Get the catalog database of an output directory.
+
+    Args:
+        output_dir: Root output directory (holds one directory per session)
+
+    Returns:
+        Path of the catalog database
+    """
+    return output_dir / CATALOG_DIRNAME / CATALOG_FILENAME
+
+
+@dataclass
+class CatalogEntry:
+    """Catalog row of one session."""
+
+    session_id: str
+    topic: str
+    doc_type: str
+    state: str
+    current_phase: int
+    created_at: datetime
+    updated_at: datetime
+    session_dir: Path
+
+
+class SessionCatalog:
+    """
+    SQLite index of session metadata.
+
+    Storage structure:
+    output_dir/
+    └── sessions/
+        └── catalog.db
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Open (and create if needed) a catalog database.
+
+        Args:
+            db_path: Catalog database file
+        """
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_output_dir(cls, output_dir: Path) -> "SessionCatalog":
+        """
+        Open the catalog of an output directory.
+
+        Args:
+            output_dir: Root output directory
+
+        Returns:
+            Catalog stored under output_dir/sessions
+        """
+        return cls(catalog_path(output_dir))
+
+    def upsert(self, session: PipelineSession, session_dir: Path) -> None:
+        """
+        Insert or update a session's row.
+
+        Args:
+            session: Session to record
+            session_dir: Directory holding the session's files
+        """
+        with self._lock:
+            self._conn.execute(_UPSERT, self._to_row(session, session_dir))
+
+    def get(self, session_id: str) -> CatalogEntry | None:
+        """
+        Look up one session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Entry, or None if the session is not catalogued
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return self._to_entry(row) if row else None
+
+    def query(
+        self,
+        state: str | None = None,
+        doc_type: str | None = None,
+        topic: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[CatalogEntry]:
+        """
+        List sessions, most recently updated first.
+
+        Args:
+            state: Only sessions in this state
+            doc_type: Only sessions of this document type
+            topic: Only topics containing this text (case-insensitive)
+            since: Only sessions updated at or after this time
+            until: Only sessions updated before this time
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            Matching entries
+        """
+        where, params = self._filters(state, doc_type, topic, since, until)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM sessions{where} ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        return [self._to_entry(row) for row in rows]
+
+    def count(
+        self,
+        state: str | None = None,
+        doc_type: str | None = None,
+        topic: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        """
+        Count sessions matching the query() filters.
+
+        Returns:
+            Number of matching sessions
+        """
+        where, params = self._filters(state, doc_type, topic, since, until)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM sessions{where}", params).fetchone()[0]
+
+    def reindex(self, output_dir: Path) -> int:
+        """
+        Rebuild the catalog from the session directories of output_dir.
+
+        Rows of sessions whose directories are gone are removed.
+
+        Args:
+            output_dir: Root output directory
+
+        Returns:
+            Number of sessions catalogued
+        """
+        # Replaying sessions needs the pipeline package, which listing does not
+        from pipeline.journal import has_session_state, replay_session
+
+        sessions: list[tuple[PipelineSession, Path]] = []
+        if output_dir.exists():
+            for session_dir in output_dir.iterdir():
+                if not session_dir.is_dir() or not has_session_state(session_dir):
+                    continue
+                try:
+                    session = replay_session(session_dir)
+                except (OSError, ValueError, KeyError) as exc:
+                    logger.warning(f"Skipping unreadable session {session_dir}: {exc}")
+                    continue
+                if session is not None:
+                    sessions.append((session, session_dir))
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM sessions")
+                self._conn.executemany(
+                    _UPSERT, [self._to_row(session, session_dir) for session, session_dir in sessions]
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        logger.info(f"Reindexed {len(sessions)} sessions into {self.db_path}")
+        return len(sessions)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _filters(
+        state: str | None,
+        doc_type: str | None,
+        topic: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Build the WHERE clause for query() and count()."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if state:
+            clauses.append("state = ?")
+            params.append(state)
+        if doc_type:
+            clauses.append("doc_type = ?")
+            params.append(doc_type)
+        if topic:
+            clauses.append("topic LIKE ? ESCAPE '\\'")
+            escaped = topic.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        if since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            clauses.append("updated_at < ?")
+            params.append(until.timestamp())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    @staticmethod
+    def _to_row(session: PipelineSession, session_dir: Path) -> tuple[Any, ...]:
+        return (
+            session.session_id,
+            session.config.topic,
+            str(session.config.doc_type),
+            str(session.state),
+            session.current_phase,
+            session.created_at.timestamp(),
+            session.updated_at.timestamp(),
+            str(session_dir),
+        )
+
+    @staticmethod
+    def _to_entry(row: tuple[Any, ...]) -> CatalogEntry:
+        return CatalogEntry(
+            session_id=row[0],
+            topic=row[1],
+            doc_type=row[2],
+            state=row[3],
+            current_phase=row[4],
+            created_at=datetime.fromtimestamp(row[5]),
+            updated_at=datetime.fromtimestamp(row[6]),
+            session_dir=Path(row[7]),
+        )
+
+
+def open_catalog(output_dir: Path) -> SessionCatalog:
+    """
+    Open the catalog of an output directory, building it on first use.
+
+    Args:
+        output_dir: Root output directory
+
+    Returns:
+        Session catalog
+    """
+    is_new = not catalog_path(output_dir).exists()
+    catalog = SessionCatalog.for_output_dir(output_dir)
+    if is_new:
+        catalog.reindex(output_dir)
+    return catalog
@@ -24,15 +24,54 @@ class AigenFlowSettings(BaseSettings):
     max_retries: int = 2
     timeout_seconds: int = 120
     enable_auto_save: bool = True
+    journal_flush_interval: float = 0.2
 
     gateway_timeout: int = 120
     gateway_headless: bool = False
+    session_check_ttl_minutes: float = 30.0
+    session_check_timeout: float = 60.0
     gateway_user_data_dir: Path | None = None
     gateway_ignore_https_errors: bool = False
+    use_browser_daemon: bool = True
+    browserd_port: int = 9333
+    browserd_dir: Path = Field(default_factory=lambda: Path("~/.aigenflow/browserd").expanduser())
+
+    enable_streaming: bool = True
+    stream_idle_timeout: int = 30
 
     enable_parallel_phases: bool = True
+    max_concurrent_per_provider: int = 1
+    enable_rate_governor: bool = True
+    provider_requests_per_minute: float = Field(default=6.0, gt=0)
+    provider_burst: int = Field(default=2, ge=1)
+    provider_max_concurrency: int = 2
+    provider_backoff_factor: float = 0.5
+    provider_requests_per_minute_overrides: dict[str, float] = Field(default_factory=dict)
+    batch_max_parallel_topics: int = 3
+    batch_max_in_flight: int = 4
     enable_event_tracking: bool = True
+    enable_usage_ledger: bool = True
+    usage_ledger_path: Path = Field(default_factory=lambda: Path("~/.aigenflow/usage/usage.db").expanduser())
+    enable_budget_guard: bool = False
+    budget_daily_usd: float = 10.0
+    budget_weekly_usd: float = 50.0
+    budget_monthly_usd: float = 200.0
+    budget_max_defer_seconds: float = 300.0
+    enable_health_routing: bool = True
+    health_ewma_alpha: float = 0.2
+    health_circuit_threshold: int = 3
+    health_circuit_timeout_seconds: float = 300.0
     enable_summarization: bool = True
+    enable_speculative_summarization: bool = True
+    summary_wait_seconds: float = 2.0
+    summarization_tiers: list[str] = Field(default_factory=lambda: ["extractive", "agent"])
+    enable_context_packing: bool = True
+    context_max_prompt_tokens: int = 12000
+    export_formats: list[str] = Field(default_factory=list)
+    enable_response_cache: bool = True
+    cache_ttl_hours: int = 24
+    cache_similarity_tasks: list[str] = Field(default_factory=list)
+    cache_similarity_threshold: float = 0.9
     summarization_threshold: float = 0.8
 
     # API/session secrets from environment variables
@@ -59,6 +98,14 @@ class AigenFlowSettings(BaseSettings):
         v.mkdir(parents=True, exist_ok=True)
         return v
 
+    @field_validator("provider_requests_per_minute_overrides")
+    @classmethod
+    def check_rate_overrides(cls, v: dict[str, float]) -> dict[str, float]:
+        for name, rpm in v.items():
+            if rpm <= 0:
+                raise ValueError(f"requests per minute for {name} must be positive, got {rpm}")
+        return v
+
     @field_validator("log_level")
     @classmethod
     def normalize_log_level(cls, v: str) -> str:
@@ -39,6 +39,11 @@ class ConfigurationException(AigenFlowException):
     pass
 
 
+class BudgetException(AigenFlowException):
+    """Exceptions related to cost budgets."""
+    pass
+
+
 class ErrorCode(StrEnum):
     """Standardized error codes for tracking and debugging."""
 
@@ -65,3 +70,5 @@ class ErrorCode(StrEnum):
     CONFIG_INVALID = "C5001"
     CONFIG_MISSING = "C5002"
     CONFIG_VALIDATION_FAILED = "C5003"
+
+    BUDGET_EXCEEDED = "B6001"
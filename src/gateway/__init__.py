@@ -2,14 +2,51 @@
 Playwright gateway modules.
 """
 
-from .base import BaseProvider
-from .chatgpt_provider import ChatGPTProvider
-from .claude_provider import ClaudeProvider
-from .gemini_provider import GeminiProvider
-from .models import GatewayRequest, GatewayResponse
-from .perplexity_provider import PerplexityProvider
-from .selector_loader import SelectorConfig, SelectorLoader, SelectorValidationError
-from .session import SessionManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseProvider
+    from .chatgpt_provider import ChatGPTProvider
+    from .claude_provider import ClaudeProvider
+    from .gemini_provider import GeminiProvider
+    from .models import GatewayRequest, GatewayResponse
+    from .perplexity_provider import PerplexityProvider
+    from .rate_limiter import ProviderGovernor, RateGovernor
+    from .selector_loader import SelectorConfig, SelectorLoader, SelectorValidationError
+    from .session import SessionManager
+
+# Exports are resolved on first access: importing gateway.models (e.g. from the
+# cache) must not load Playwright and every provider.
+_MODULE_BY_NAME = {
+    "BaseProvider": "base",
+    "ChatGPTProvider": "chatgpt_provider",
+    "ClaudeProvider": "claude_provider",
+    "GeminiProvider": "gemini_provider",
+    "PerplexityProvider": "perplexity_provider",
+    "SessionManager": "session",
+    "RateGovernor": "rate_limiter",
+    "ProviderGovernor": "rate_limiter",
+    "GatewayRequest": "models",
+    "GatewayResponse": "models",
+    "SelectorLoader": "selector_loader",
+    "SelectorConfig": "selector_loader",
+    "SelectorValidationError": "selector_loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULE_BY_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODULE_BY_NAME])
+
 
 __all__ = [
     "BaseProvider",
@@ -18,6 +55,8 @@ __all__ = [
     "GeminiProvider",
     "PerplexityProvider",
     "SessionManager",
+    "RateGovernor",
+    "ProviderGovernor",
     "GatewayRequest",
     "GatewayResponse",
     "SelectorLoader",
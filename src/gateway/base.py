@@ -4,18 +4,85 @@ Base provider for AI gateway.
 Defines BaseProvider interface and common functionality for all AI providers.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
 
+from core.exceptions import ErrorCode, GatewayException
 from core.logger import get_logger
 from core.models import AgentType
 from gateway.selector_loader import SelectorConfig, SelectorLoader
 
 logger = get_logger(__name__)
 
+# Resolves once the last response element has new text that stayed unchanged
+# for stableMs while no busy element (stop button, streaming marker) is
+# visible, or with completed=false at the deadline. Driven by a
+# MutationObserver, so it returns as soon as the answer settles.
+_COMPLETION_SCRIPT = """
+([responseSelector, busySelector, stableMs, timeoutMs]) => new Promise((resolve) => {
+    const lastResponse = () => {
+        const nodes = document.querySelectorAll(responseSelector);
+        return nodes.length ? nodes[nodes.length - 1] : null;
+    };
+    const isBusy = () => !!busySelector && Array.from(document.querySelectorAll(busySelector))
+        .some((node) => node.getClientRects().length > 0);
+    const readText = () => {
+        const node = lastResponse();
+        return node ? node.innerText : null;
+    };
+
+    const initialText = readText();
+    let lastText = initialText;
+    let lastBusy = isBusy();
+    let stableTimer = null;
+    let finished = false;
+
+    const finish = (completed) => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(stableTimer);
+        clearTimeout(deadline);
+        resolve({ completed, text: readText() || "" });
+    };
+
+    const check = () => {
+        const text = readText();
+        const busy = isBusy();
+        if (stableTimer !== null && text === lastText && busy === lastBusy) return;
+        lastText = text;
+        lastBusy = busy;
+        clearTimeout(stableTimer);
+        stableTimer = null;
+        if (text && text.trim() && text !== initialText && !busy) {
+            stableTimer = setTimeout(() => finish(true), stableMs);
+        }
+    };
+
+    const observer = new MutationObserver(check);
+    observer.observe(document.body, { subtree: true, childList: true, characterData: true, attributes: true });
+    const deadline = setTimeout(() => finish(false), timeoutMs);
+    check();
+})
+"""
+
+# Current text of the last response element and whether a busy marker is visible
+_SNAPSHOT_SCRIPT = """
+([responseSelector, busySelector]) => {
+    const nodes = document.querySelectorAll(responseSelector);
+    const last = nodes.length ? nodes[nodes.length - 1] : null;
+    const busy = !!busySelector && Array.from(document.querySelectorAll(busySelector))
+        .some((node) => node.getClientRects().length > 0);
+    return { text: last ? last.innerText : null, busy };
+}
+"""
+
 
 class GatewayRequest(BaseModel):
     """Request to send to AI provider."""
@@ -37,6 +104,20 @@ class GatewayResponse(BaseModel):
     metadata: dict[str, Any] = {}
 
 
+class StreamChunk(BaseModel):
+    """
+    Incremental piece of a streamed provider response.
+
+    Deltas are best-effort; the final chunk (done=True) carries the
+    authoritative GatewayResponse.
+    """
+
+    delta: str = ""
+    text: str = ""
+    done: bool = False
+    response: GatewayResponse | None = None
+
+
 class BaseProvider(ABC):
     """
     Abstract base class for all AI providers.
@@ -54,6 +135,17 @@ class BaseProvider(ABC):
 
     agent_type: AgentType = None  # To be overridden by subclasses
     provider_name: str = None  # To be overridden by subclasses
+    base_url: str = None  # To be overridden by subclasses
+
+    # Fallback selectors when selector_loader is not set (overridden by subclasses)
+    DEFAULT_AUTH_SELECTOR: str | None = None
+    DEFAULT_NEW_CHAT_SELECTOR: str | None = None
+    DEFAULT_RESPONSE_SELECTOR: str | None = None
+    DEFAULT_BUSY_SELECTOR: str | None = None
+    DEFAULT_STABLE_MS = 1500
+    RECYCLE_TIMEOUT_MS = 10000
+    STREAM_POLL_INTERVAL = 0.25  # seconds between DOM snapshots while streaming
+    DEFAULT_STREAM_IDLE_TIMEOUT = 30.0  # max seconds between text changes once streaming
 
     def __init__(
         self,
@@ -202,6 +294,319 @@ class BaseProvider(ABC):
         """
         return self.get_selector("base_url", optional=True)
 
+    async def acquire_chat_page(self) -> Any:
+        """
+        Get a page showing a fresh chat, ready for input.
+
+        With BrowserPool, stored cookies are injected once per context and
+        pages come from the provider's page pool: a used page is recycled with
+        start_new_chat() instead of a full navigation. The legacy
+        BrowserManager path starts the browser and navigates every time.
+
+        Returns:
+            Page instance
+
+        Raises:
+            FileNotFoundError: If no stored session exists
+        """
+        browser_manager = await self.get_browser_manager()
+        base_url = self.get_base_url() or self.base_url
+
+        if not hasattr(browser_manager, "acquire_page"):
+            cookies = self._storage.load_cookies()
+            await browser_manager.start_browser()
+            await browser_manager.create_context()
+            await browser_manager.inject_cookies(cookies)
+            page = await browser_manager.get_page()
+            await page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+            return page
+
+        if not await browser_manager.has_cookies():
+            await browser_manager.inject_cookies(self._storage.load_cookies())
+
+        return await browser_manager.acquire_page(base_url, reset=self.start_new_chat)
+
+    async def release_chat_page(self, page: Any, reusable: bool = True) -> None:
+        """
+        Hand a page from acquire_chat_page() back after a request.
+
+        Args:
+            page: Page to release
+            reusable: False to discard the page (e.g. after an error)
+        """
+        browser_manager = self._browser_manager
+        if browser_manager is None:
+            return
+
+        try:
+            if hasattr(browser_manager, "release_page"):
+                await browser_manager.release_page(page, reusable=reusable)
+            else:
+                await browser_manager.close()
+        except Exception as e:
+            logger.debug(f"Failed to release page for {self.provider_name}: {e}")
+
+    async def start_new_chat(self, page: Any) -> bool:
+        """
+        Reset a used page to an empty chat without reloading it.
+
+        Clicks the provider's new-chat control and waits for the previous
+        conversation to disappear and the input to become usable.
+
+        Args:
+            page: Page that has completed a conversation
+
+        Returns:
+            True if the page shows a fresh chat, False if it should be discarded
+        """
+        new_chat_selector = self.get_selector("new_chat_button", optional=True) or self.DEFAULT_NEW_CHAT_SELECTOR
+        if not new_chat_selector:
+            return False
+
+        chat_input_selector = self.get_selector("chat_input", optional=True) or self.DEFAULT_AUTH_SELECTOR
+        response_selector = self.get_selector("response_container", optional=True)
+
+        try:
+            await page.locator(new_chat_selector).first.click(timeout=self.RECYCLE_TIMEOUT_MS)
+            if response_selector:
+                await page.wait_for_selector(
+                    response_selector, state="detached", timeout=self.RECYCLE_TIMEOUT_MS
+                )
+            if chat_input_selector:
+                await page.wait_for_selector(
+                    chat_input_selector, state="visible", timeout=self.RECYCLE_TIMEOUT_MS
+                )
+            return True
+        except Exception as e:
+            logger.debug(f"New chat failed for {self.provider_name}: {e}")
+            return False
+
+    def get_completion_signals(self) -> tuple[str | None, str | None, int]:
+        """
+        Get the DOM signals used to detect a finished response.
+
+        Returns:
+            Tuple of (response selector, busy selector, stable milliseconds).
+            The busy selector joins stop_button and streaming_indicator.
+        """
+        response_selector = (
+            self.get_selector("response_container", optional=True) or self.DEFAULT_RESPONSE_SELECTOR
+        )
+
+        busy_parts = [
+            self.get_selector(key, optional=True) for key in ("stop_button", "streaming_indicator")
+        ]
+        busy_selector = ", ".join(part for part in busy_parts if part) or self.DEFAULT_BUSY_SELECTOR
+
+        stable_ms = self.DEFAULT_STABLE_MS
+        configured = self.get_selector("completion_stable_ms", optional=True)
+        if configured:
+            try:
+                stable_ms = int(configured)
+            except ValueError:
+                logger.warning(f"Invalid completion_stable_ms for {self.provider_name}: {configured}")
+
+        return response_selector, busy_selector, stable_ms
+
+    async def wait_for_response(self, page: Any, timeout_ms: int) -> tuple[str, bool]:
+        """
+        Wait until the provider has finished streaming its answer.
+
+        Completion means: the last response element has new, non-empty text,
+        no busy element is visible, and the text stayed unchanged for the
+        provider's stable window. Replaces fixed post-send sleeps, so short
+        answers return early and long answers are not cut off.
+
+        Args:
+            page: Page the prompt was sent on
+            timeout_ms: Maximum time to wait
+
+        Returns:
+            Tuple of (response text, completed). On timeout, completed is
+            False and the text is whatever had streamed so far.
+
+        Raises:
+            ValueError: If no response selector is configured
+        """
+        response_selector, busy_selector, stable_ms = self.get_completion_signals()
+        if not response_selector:
+            raise ValueError(f"No response_container selector for {self.provider_name}")
+
+        result = await page.evaluate(
+            _COMPLETION_SCRIPT,
+            [response_selector, busy_selector, stable_ms, timeout_ms],
+        )
+        return (result.get("text") or "").strip(), bool(result.get("completed"))
+
+    @abstractmethod
+    async def submit_prompt(self, page: Any, request: GatewayRequest) -> str | None:
+        """
+        Type the prompt into a fresh chat page and send it.
+
+        Used by send_message_stream() before the answer is streamed.
+
+        Args:
+            page: Page from acquire_chat_page()
+            request: GatewayRequest with the prompt
+
+        Returns:
+            Error message, or None if the prompt was sent
+        """
+        raise NotImplementedError
+
+    async def stream_response(
+        self,
+        page: Any,
+        timeout_ms: int,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[tuple[str, bool]]:
+        """
+        Follow a response while it streams.
+
+        Yields (text, False) whenever the response text changes and a final
+        (text, True) once it is complete (same rule as wait_for_response).
+        Before the first text appears the whole timeout applies; afterwards a
+        stream is considered hung when the text stops changing for
+        idle_timeout seconds, so long answers are not cut at a flat limit.
+
+        Args:
+            page: Page the prompt was sent on
+            timeout_ms: Maximum wait for the first text
+            idle_timeout: Maximum gap between text changes (seconds)
+
+        Yields:
+            Tuples of (response text so far, completed)
+
+        Raises:
+            GatewayException: If no text arrives in time or the stream stalls
+        """
+        response_selector, busy_selector, stable_ms = self.get_completion_signals()
+        if not response_selector:
+            raise ValueError(f"No response_container selector for {self.provider_name}")
+        idle_timeout = idle_timeout or self.DEFAULT_STREAM_IDLE_TIMEOUT
+
+        started_at = time.monotonic()
+        snapshot = await page.evaluate(_SNAPSHOT_SCRIPT, [response_selector, busy_selector])
+        initial_text = snapshot.get("text")
+        last_text = initial_text
+        last_change = started_at
+        streaming = False
+
+        while True:
+            await asyncio.sleep(self.STREAM_POLL_INTERVAL)
+            snapshot = await page.evaluate(_SNAPSHOT_SCRIPT, [response_selector, busy_selector])
+            text = snapshot.get("text")
+            now = time.monotonic()
+
+            if text != last_text:
+                last_text = text
+                last_change = now
+                if text and text.strip() and text != initial_text:
+                    streaming = True
+                    yield text, False
+                continue
+
+            if not streaming:
+                if (now - started_at) * 1000 > timeout_ms:
+                    raise GatewayException(
+                        message=f"No response from {self.provider_name} within {timeout_ms // 1000}s",
+                        details={"error_code": ErrorCode.GATEWAY_RESPONSE_DETECTION_FAILED},
+                    )
+                continue
+
+            idle = now - last_change
+            if not snapshot.get("busy") and idle * 1000 >= stable_ms:
+                yield last_text, True
+                return
+            if idle > idle_timeout:
+                raise GatewayException(
+                    message=f"{self.provider_name} stream stalled for {idle:.0f}s",
+                    details={"error_code": ErrorCode.GATEWAY_RESPONSE_DETECTION_FAILED, "partial": last_text},
+                )
+
+    async def send_message_stream(
+        self,
+        request: GatewayRequest,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Send a message and yield the answer incrementally.
+
+        Providers without submit_prompt() fall back to send_message() and
+        yield the whole answer as a single chunk.
+
+        Args:
+            request: GatewayRequest with task_name and prompt
+            idle_timeout: Maximum gap between text changes (seconds)
+
+        Yields:
+            StreamChunk deltas, then a final chunk with done=True and the
+            assembled GatewayResponse
+        """
+        start_time = time.time()
+        page = None
+        reusable = False
+        text = ""
+
+        def _final(response: GatewayResponse) -> StreamChunk:
+            return StreamChunk(text=response.content, done=True, response=response)
+
+        try:
+            page = await self.acquire_chat_page()
+            error = await self.submit_prompt(page, request)
+
+            if error:
+                yield _final(GatewayResponse(
+                    content="", success=False, error=error, response_time=time.time() - start_time
+                ))
+                return
+
+            async for snapshot, completed in self.stream_response(
+                page, timeout_ms=request.timeout * 1000, idle_timeout=idle_timeout
+            ):
+                if completed:
+                    reusable = True
+                    break
+                delta = snapshot[len(text):] if snapshot.startswith(text) else ""
+                text = snapshot
+                if delta:
+                    yield StreamChunk(delta=delta, text=text)
+
+            content = snapshot.strip()
+            yield _final(GatewayResponse(
+                content=content,
+                success=True,
+                tokens_used=len(content) // 4,
+                response_time=time.time() - start_time,
+                metadata={"provider": self.provider_name, "task_name": request.task_name, "streamed": True},
+            ))
+
+        except FileNotFoundError:
+            yield _final(GatewayResponse(
+                content="",
+                success=False,
+                error="No session found. Please run login first.",
+                response_time=time.time() - start_time,
+            ))
+        except GatewayException as exc:
+            yield _final(GatewayResponse(
+                content="",
+                success=False,
+                error=exc.message,
+                response_time=time.time() - start_time,
+                metadata={"partial": text},
+            ))
+        except Exception as exc:
+            yield _final(GatewayResponse(
+                content="",
+                success=False,
+                error=f"Failed to send message: {exc}",
+                response_time=time.time() - start_time,
+            ))
+        finally:
+            if page is not None:
+                await self.release_chat_page(page, reusable=reusable)
+
     @abstractmethod
     async def send_message(self, request: GatewayRequest) -> GatewayResponse:
         """
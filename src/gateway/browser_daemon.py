@@ -0,0 +1,311 @@
+"""
+Warm browser daemon for AigenFlow.
+
+Keeps one Chromium process alive between CLI invocations so that runs can
+attach to it over CDP instead of launching Playwright and a fresh browser:
+- Chromium runs detached with a persistent user data dir and a CDP port
+- Provider cookies live in its default context and stay logged in across runs
+- A small state file (pid, port, headless) lets BrowserPool discover it
+
+Commands: aigenflow browserd start / stop / status
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Same anti-detection flags BrowserPool uses for locally launched browsers
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-infobars",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-background-networking",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+
+@dataclass
+class BrowserDaemonState:
+    """
+    Persisted daemon state.
+
+    Attributes:
+        pid: Chromium process ID
+        port: CDP remote debugging port
+        headless: Whether the browser runs headless
+        started_at: Start time (epoch seconds)
+    """
+
+    pid: int
+    port: int
+    headless: bool
+    started_at: float
+
+    @property
+    def endpoint(self) -> str:
+        """CDP HTTP endpoint accepted by connect_over_cdp()."""
+        return f"http://127.0.0.1:{self.port}"
+
+
+class BrowserDaemon:
+    """
+    Manage the long-lived Chromium process.
+
+    Storage structure:
+    state_dir/
+    ├── browserd.json
+    └── user-data/
+    """
+
+    DEFAULT_PORT = 9333
+    STATE_FILENAME = "browserd.json"
+    START_TIMEOUT_SECONDS = 15.0
+    PROBE_TIMEOUT_SECONDS = 1.0
+
+    def __init__(self, state_dir: Path, port: int = DEFAULT_PORT) -> None:
+        """
+        Initialize daemon manager.
+
+        Args:
+            state_dir: Directory for the state file and browser user data
+            port: CDP port used when starting the daemon
+        """
+        self.state_dir = state_dir
+        self.port = port
+        self.state_file = state_dir / self.STATE_FILENAME
+        self.user_data_dir = state_dir / "user-data"
+
+    @classmethod
+    def from_settings(cls, settings: Any = None) -> BrowserDaemon:
+        """
+        Create daemon manager from application settings.
+
+        Args:
+            settings: AigenFlowSettings (loaded if None)
+
+        Returns:
+            BrowserDaemon instance
+        """
+        if settings is None:
+            from core.config import get_settings
+
+            settings = get_settings()
+        return cls(state_dir=settings.browserd_dir, port=settings.browserd_port)
+
+    def load_state(self) -> BrowserDaemonState | None:
+        """
+        Load persisted state.
+
+        Returns:
+            Daemon state or None if missing/corrupted
+        """
+        if not self.state_file.exists():
+            return None
+        try:
+            return BrowserDaemonState(**json.loads(self.state_file.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError, TypeError):
+            return None
+
+    def _save_state(self, state: BrowserDaemonState) -> None:
+        """Persist state atomically."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(asdict(state)), encoding="utf-8")
+        tmp_file.replace(self.state_file)
+
+    def _clear_state(self) -> None:
+        """Remove the state file."""
+        self.state_file.unlink(missing_ok=True)
+
+    def probe(self, state: BrowserDaemonState) -> dict[str, Any] | None:
+        """
+        Query the CDP version endpoint.
+
+        Args:
+            state: Daemon state to probe
+
+        Returns:
+            Browser version info or None if unreachable
+        """
+        try:
+            with urllib.request.urlopen(
+                f"{state.endpoint}/json/version", timeout=self.PROBE_TIMEOUT_SECONDS
+            ) as response:
+                return json.loads(response.read().decode())
+        except (urllib.error.URLError, OSError, ValueError):
+            return None
+
+    def get_endpoint(self) -> str | None:
+        """
+        Get the CDP endpoint of a running daemon.
+
+        Stale state files (daemon no longer reachable) are removed.
+
+        Returns:
+            Endpoint URL or None if no daemon is running
+        """
+        state = self.load_state()
+        if state is None:
+            return None
+        if self.probe(state) is None:
+            self._clear_state()
+            return None
+        return state.endpoint
+
+    def status(self) -> dict[str, Any] | None:
+        """
+        Get daemon status.
+
+        Returns:
+            Status dictionary or None if no daemon is running
+        """
+        state = self.load_state()
+        if state is None:
+            return None
+        version = self.probe(state)
+        if version is None:
+            self._clear_state()
+            return None
+
+        pages = 0
+        try:
+            with urllib.request.urlopen(
+                f"{state.endpoint}/json/list", timeout=self.PROBE_TIMEOUT_SECONDS
+            ) as response:
+                pages = sum(1 for target in json.loads(response.read().decode()) if target.get("type") == "page")
+        except (urllib.error.URLError, OSError, ValueError):
+            pass
+
+        return {
+            **asdict(state),
+            "endpoint": state.endpoint,
+            "browser": version.get("Browser", "unknown"),
+            "pages": pages,
+            "uptime_seconds": time.time() - state.started_at,
+        }
+
+    @staticmethod
+    def find_executable() -> str:
+        """
+        Locate the Playwright-managed Chromium executable.
+
+        Returns:
+            Path to the Chromium binary
+
+        Raises:
+            RuntimeError: If Playwright's Chromium is not installed
+        """
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            executable = playwright.chromium.executable_path
+
+        if not executable or not Path(executable).exists():
+            raise RuntimeError("Chromium not found. Run 'playwright install chromium' first.")
+        return executable
+
+    def start(self, headless: bool = True) -> BrowserDaemonState:
+        """
+        Start the daemon if it is not already running.
+
+        Args:
+            headless: Run Chromium headless
+
+        Returns:
+            State of the running daemon
+
+        Raises:
+            RuntimeError: If Chromium fails to start or expose CDP in time
+        """
+        state = self.load_state()
+        if state is not None and self.probe(state) is not None:
+            logger.info("Browser daemon already running", pid=state.pid, port=state.port)
+            return state
+
+        self.user_data_dir.mkdir(parents=True, exist_ok=True)
+        args = [
+            self.find_executable(),
+            f"--remote-debugging-port={self.port}",
+            "--remote-debugging-address=127.0.0.1",
+            f"--user-data-dir={self.user_data_dir}",
+            *CHROMIUM_ARGS,
+        ]
+        if headless:
+            args.append("--headless=new")
+
+        # Detach so the browser outlives the CLI process
+        popen_kwargs: dict[str, Any] = {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.DEVNULL,
+        }
+        if sys.platform == "win32":
+            popen_kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            popen_kwargs["start_new_session"] = True
+
+        process = subprocess.Popen(args, **popen_kwargs)
+        state = BrowserDaemonState(
+            pid=process.pid,
+            port=self.port,
+            headless=headless,
+            started_at=time.time(),
+        )
+
+        deadline = time.monotonic() + self.START_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Chromium exited during startup (code {process.returncode})")
+            if self.probe(state) is not None:
+                self._save_state(state)
+                logger.info("Browser daemon started", pid=state.pid, port=state.port, headless=headless)
+                return state
+            time.sleep(0.2)
+
+        process.terminate()
+        raise RuntimeError(f"Chromium did not expose CDP on port {self.port} within {self.START_TIMEOUT_SECONDS:.0f}s")
+
+    def stop(self) -> bool:
+        """
+        Stop the daemon.
+
+        Returns:
+            True if a daemon was stopped, False if none was running
+        """
+        state = self.load_state()
+        if state is None:
+            return False
+
+        running = self.probe(state) is not None
+        if running:
+            try:
+                os.kill(state.pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError, OSError) as e:
+                logger.warning(f"Failed to signal browser daemon (pid={state.pid}): {e}")
+
+        self._clear_state()
+        logger.info("Browser daemon stopped", pid=state.pid)
+        return running
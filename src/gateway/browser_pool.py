@@ -3,12 +3,16 @@ Browser Pool for Aigenflow - Single browser instance with multiple contexts.
 
 This module implements a singleton pattern for managing a single browser instance
 across all AI provider agents, reducing memory usage and startup time.
+
+When a browser daemon is running (aigenflow browserd start), the pool attaches
+to it over CDP instead of launching Chromium, and detaches on close_all().
 """
 
 from __future__ import annotations
 
 import asyncio
 import signal
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from playwright.async_api import Browser, BrowserContext
@@ -42,6 +46,8 @@ class BrowserPool:
     _instance: BrowserPool | None = None
     _lock = asyncio.Lock()
 
+    DEFAULT_PAGE_POOL_SIZE = 2  # Idle pages kept per provider
+
     def __init__(self) -> None:
         """Private constructor - use get_instance() instead."""
         self._browser: Browser | None = None
@@ -51,6 +57,12 @@ class BrowserPool:
         self._playwright = None
         self.headless: bool = True
         self._initialized = False
+        self._remote_endpoint: str | None = None  # Set when attached to browserd
+        self._cookie_providers: set[str] = set()  # Contexts that already hold session cookies
+        self._idle_pages: dict[str, list[tuple[Any, bool]]] = {}  # provider -> [(page, fresh)]
+        self._prewarm_tasks: dict[str, asyncio.Task] = {}
+        self._owned_pages: set[Any] = set()  # Open pages created by this pool
+        self.page_pool_size: int = self.DEFAULT_PAGE_POOL_SIZE
 
     @classmethod
     async def get_instance(cls, headless: bool = True) -> BrowserPool:
@@ -87,6 +99,18 @@ class BrowserPool:
 
             self._playwright = await async_playwright().start()
 
+            # Attach to a warm browser daemon if one is running
+            endpoint = self._discover_daemon_endpoint()
+            if endpoint:
+                try:
+                    self._browser = await self._playwright.chromium.connect_over_cdp(endpoint)
+                    self._remote_endpoint = endpoint
+                    self._initialized = True
+                    logger.info("BrowserPool attached to browser daemon", endpoint=endpoint)
+                    return
+                except Exception as exc:
+                    logger.warning(f"Browser daemon unreachable, launching local browser: {exc}")
+
             # Launch single browser instance with anti-detection
             self._browser = await self._playwright.chromium.launch(
                 headless=headless,
@@ -119,6 +143,26 @@ class BrowserPool:
             await self.close()  # Cleanup on failure
             raise RuntimeError(f"Failed to initialize BrowserPool: {exc}") from exc
 
+    @staticmethod
+    def _discover_daemon_endpoint() -> str | None:
+        """
+        Find the CDP endpoint of a running browser daemon.
+
+        Returns:
+            Endpoint URL or None if disabled or not running
+        """
+        try:
+            from core.config import get_settings
+            from gateway.browser_daemon import BrowserDaemon
+
+            settings = get_settings()
+            if not settings.use_browser_daemon:
+                return None
+            return BrowserDaemon.from_settings(settings).get_endpoint()
+        except Exception as exc:
+            logger.debug(f"Browser daemon discovery skipped: {exc}")
+            return None
+
     async def get_context(
         self,
         provider_name: str,
@@ -168,18 +212,28 @@ class BrowserPool:
                 except Exception:
                     self._valid_contexts.discard(provider_name)
 
-            # Create new context
-            viewport_config = viewport or {"width": 1280, "height": 720}
-            context = await self._browser.new_context(
-                viewport=viewport_config,
-                locale=locale,
-            )
+            if self._remote_endpoint and self._browser.contexts:
+                # Daemon's persistent context outlives this process and keeps
+                # provider logins warm; contexts created over CDP would be
+                # disposed on disconnect. Providers are isolated by domain.
+                context = self._browser.contexts[0]
+            else:
+                # Create new context
+                viewport_config = viewport or {"width": 1280, "height": 720}
+                context = await self._browser.new_context(
+                    viewport=viewport_config,
+                    locale=locale,
+                )
 
             # NOTE: Stealth is applied per-page, not per-context
             # This avoids page crashes from creating/closing pages during context init
 
             self._contexts[provider_name] = context
             self._valid_contexts.add(provider_name)  # Mark as valid
+            # Pages and cookies of a previous context are gone with it
+            self._idle_pages.pop(provider_name, None)
+            if not self._remote_endpoint:
+                self._cookie_providers.discard(provider_name)
             logger.info(f"Created new context for {provider_name}")
 
             return context
@@ -202,9 +256,13 @@ class BrowserPool:
             Tuple of (BrowserContext, Page)
         """
         context = await self.get_context(provider_name, viewport, locale)
+        page = await self._new_page(context)
+        return context, page
 
-        # Create new page for this request
+    async def _new_page(self, context: BrowserContext) -> Any:
+        """Create a page with anti-detection applied."""
         page = await context.new_page()
+        self._owned_pages.add(page)
 
         # Apply anti-detection to page
         if STEALTH_AVAILABLE:
@@ -213,7 +271,128 @@ class BrowserPool:
             except Exception:
                 pass  # Continue without stealth
 
-        return context, page
+        return page
+
+    def has_cookies(self, provider_name: str) -> bool:
+        """Check whether the provider's current context already holds its session cookies."""
+        return provider_name in self._cookie_providers and provider_name in self._valid_contexts
+
+    def mark_cookies_injected(self, provider_name: str) -> None:
+        """Record that session cookies were injected into the provider's context."""
+        self._cookie_providers.add(provider_name)
+
+    async def acquire_page(
+        self,
+        provider_name: str,
+        url: str,
+        reset: Callable[[Any], Awaitable[bool]] | None = None,
+        timeout: int = 60000,
+    ) -> Any:
+        """
+        Get a ready-to-type page for the provider.
+
+        Idle pages are reused: pages that were never used are returned as-is,
+        used pages are passed to ``reset`` (e.g. start a new chat) instead of
+        being reloaded. A new page navigated to ``url`` is created only when
+        no idle page can be recycled.
+
+        Args:
+            provider_name: Provider identifier
+            url: URL to navigate new pages to
+            reset: Coroutine returning True if a used page is ready again
+            timeout: Navigation timeout in ms
+
+        Returns:
+            Page instance
+        """
+        prewarm = self._prewarm_tasks.get(provider_name)
+        if prewarm is not None and not prewarm.done():
+            await asyncio.gather(prewarm, return_exceptions=True)
+
+        idle = self._idle_pages.get(provider_name, [])
+        while idle:
+            page, fresh = idle.pop()
+            if page.is_closed():
+                continue
+            if fresh:
+                logger.debug(f"Using pre-navigated page for {provider_name}")
+                return page
+            try:
+                if reset is not None and await reset(page):
+                    logger.debug(f"Recycled page for {provider_name}")
+                    return page
+            except Exception as e:
+                logger.debug(f"Page recycle failed for {provider_name}: {e}")
+            await self._close_page(page)
+
+        context = await self.get_context(provider_name)
+        page = await self._new_page(context)
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        except Exception:
+            await self._close_page(page)
+            raise
+        return page
+
+    async def release_page(self, provider_name: str, page: Any, reusable: bool = True) -> None:
+        """
+        Return a page to the provider's idle pool.
+
+        Args:
+            provider_name: Provider identifier
+            page: Page previously returned by acquire_page()
+            reusable: False to close the page (e.g. after an error)
+        """
+        idle = self._idle_pages.setdefault(provider_name, [])
+        if reusable and not page.is_closed() and len(idle) < self.page_pool_size:
+            idle.append((page, False))
+            return
+        await self._close_page(page)
+
+    def prewarm(self, provider_name: str, url: str, count: int = 1) -> None:
+        """
+        Open and navigate pages for the provider in the background.
+
+        Args:
+            provider_name: Provider identifier
+            url: URL to navigate to
+            count: Number of pages to prepare (capped by page_pool_size)
+        """
+        existing = self._prewarm_tasks.get(provider_name)
+        if existing is not None and not existing.done():
+            return
+
+        async def _prewarm() -> None:
+            context = await self.get_context(provider_name)
+            idle = self._idle_pages.setdefault(provider_name, [])
+            missing = min(count, self.page_pool_size) - len(idle)
+            pages = [await self._new_page(context) for _ in range(max(0, missing))]
+            results = await asyncio.gather(
+                *(page.goto(url, wait_until="domcontentloaded", timeout=60000) for page in pages),
+                return_exceptions=True,
+            )
+            for page, result in zip(pages, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.debug(f"Prewarm navigation failed for {provider_name}: {result}")
+                    await self._close_page(page)
+                else:
+                    idle.append((page, True))
+            logger.debug(f"Prewarmed {len(idle)} page(s) for {provider_name}")
+
+        self._prewarm_tasks[provider_name] = asyncio.create_task(_prewarm())
+
+    @property
+    def idle_page_count(self) -> int:
+        """Get number of idle pooled pages across providers."""
+        return sum(len(pages) for pages in self._idle_pages.values())
+
+    async def _close_page(self, page: Any) -> None:
+        """Close a page, ignoring errors."""
+        self._owned_pages.discard(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
 
     async def preload_context(
         self,
@@ -231,13 +410,34 @@ class BrowserPool:
             BrowserContext with injected cookies
         """
         context = await self.get_context(provider_name)
+
+        # A warm daemon context already holds the (possibly refreshed) session;
+        # re-injecting stored cookies would overwrite it with older values.
+        if self._remote_endpoint and await self._has_cookies_for(context, cookies):
+            self.mark_cookies_injected(provider_name)
+            logger.info(f"Reusing warm daemon session for {provider_name}")
+            return context
+
         await context.add_cookies(cookies)
+        self.mark_cookies_injected(provider_name)
         logger.info(f"Preloaded context for {provider_name}", cookie_count=len(cookies))
         return context
 
+    @staticmethod
+    async def _has_cookies_for(context: BrowserContext, cookies: list[dict[str, Any]]) -> bool:
+        """Check whether the context already has cookies for the given cookies' domains."""
+        domains = {cookie.get("domain", "").lstrip(".") for cookie in cookies if cookie.get("domain")}
+        if not domains:
+            return False
+        existing = await context.cookies()
+        return any(cookie.get("domain", "").lstrip(".") in domains for cookie in existing)
+
     async def close_context(self, provider_name: str) -> None:
         """Close specific provider context."""
-        if provider_name in self._contexts:
+        if self._remote_endpoint:
+            # Daemon context is shared and must stay alive; just forget it
+            self._contexts.pop(provider_name, None)
+        elif provider_name in self._contexts:
             context = self._contexts[provider_name]
             if context:
                 try:
@@ -249,6 +449,10 @@ class BrowserPool:
 
         # FIX: Remove from valid contexts and clean up lock
         self._valid_contexts.discard(provider_name)
+        self._cookie_providers.discard(provider_name)
+        self._cancel_prewarm(provider_name)
+        for page, _ in self._idle_pages.pop(provider_name, []):
+            await self._close_page(page)
         if provider_name in self._context_locks:
             del self._context_locks[provider_name]
 
@@ -261,6 +465,16 @@ class BrowserPool:
         logger.debug("[BrowserPool] Starting close_all() cleanup")
         cleanup_errors = []
 
+        for provider_name in list(self._prewarm_tasks):
+            self._cancel_prewarm(provider_name)
+        self._idle_pages.clear()
+        self._cookie_providers.clear()
+
+        if self._remote_endpoint:
+            await self._detach_from_daemon(cleanup_errors)
+        # Local pages close with their contexts below
+        self._owned_pages.clear()
+
         # Close all contexts first
         logger.debug(f"[BrowserPool] Closing {len(self._contexts)} contexts")
         for provider_name, context in self._contexts.items():
@@ -333,6 +547,38 @@ class BrowserPool:
 
         logger.debug("[BrowserPool] close_all() completed")
 
+    def _cancel_prewarm(self, provider_name: str) -> None:
+        """Cancel an in-flight prewarm task for the provider."""
+        task = self._prewarm_tasks.pop(provider_name, None)
+        if task is not None and not task.done():
+            task.cancel()
+
+    async def _detach_from_daemon(self, cleanup_errors: list[str]) -> None:
+        """
+        Disconnect from the browser daemon, leaving its browser and context running.
+
+        Only pages opened by this pool are closed; pages of other processes
+        attached to the daemon, the daemon's own tab, the shared context and
+        its cookies stay open for the next run.
+        """
+        for page in list(self._owned_pages):
+            try:
+                if not page.is_closed():
+                    await page.close()
+            except Exception as e:
+                cleanup_errors.append(f"page: {e}")
+        self._owned_pages.clear()
+
+        self._contexts.clear()
+        self._valid_contexts.clear()
+        self._context_locks.clear()
+
+        # Stopping Playwright drops the CDP connection without closing the
+        # daemon's persistent context (browser.close() is not called).
+        self._browser = None
+        self._remote_endpoint = None
+        logger.debug("[BrowserPool] Detached from browser daemon")
+
     async def _terminate_browser_subprocesses(self) -> None:
         """
         Forcefully terminate any remaining browser subprocesses.
@@ -408,6 +654,11 @@ class BrowserPool:
         """Check if pool is initialized."""
         return self._initialized
 
+    @property
+    def is_remote(self) -> bool:
+        """Check if pool is attached to the browser daemon."""
+        return self._remote_endpoint is not None
+
     @property
     def context_count(self) -> int:
         """Get number of active contexts."""
@@ -5,6 +5,7 @@ Uses Playwright to interact with chat.openai.com.
 """
 
 from pathlib import Path
+from typing import Any
 
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
@@ -25,6 +26,11 @@ class ChatGPTProvider(BaseProvider):
 
     # Default authentication selector (fallback if selector_loader not available)
     DEFAULT_AUTH_SELECTOR = '#prompt-textarea, [contenteditable="true"], textarea'
+    DEFAULT_NEW_CHAT_SELECTOR = "button[aria-label='New chat'], a[href*='/c/new']"
+    DEFAULT_RESPONSE_SELECTOR = "[data-message-author-role='assistant'], .markdown-prose"
+    DEFAULT_BUSY_SELECTOR = (
+        "button[data-testid='stop-button'], .result-streaming, [data-testid='loading'], span.animate-pulse"
+    )
     LOGIN_TIMEOUT = 300  # 5 minutes
 
     def __init__(
@@ -50,160 +56,66 @@ class ChatGPTProvider(BaseProvider):
         import time
 
         start_time = time.time()
+        page = None
+        reusable = False
 
         try:
-            # Load cookies from storage
-            cookies = self._storage.load_cookies()
-
-            # Get browser manager
-            browser_manager = await self.get_browser_manager()
-
-            # Start browser and create context with cookies
-            await browser_manager.start_browser()
-            await browser_manager.create_context()
-            await browser_manager.inject_cookies(cookies)
-
-            # Get page and navigate to ChatGPT
-            page = await browser_manager.get_page()
+            # Fresh chat page from the pool (cookies injected once per context)
+            page = await self.acquire_chat_page()
 
-            # Use base URL from selector or fall back to configured URL
-            base_url = self.get_selector("base_url", optional=True) or self.base_url
-            await page.goto(
-                base_url,
-                wait_until="domcontentloaded",
-                timeout=30000,
-            )
+            # Type and send the prompt
+            error = await self.submit_prompt(page, request)
+            if error:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=error,
+                    response_time=time.time() - start_time,
+                )
 
-            # Step 1: Click new chat button first to ensure we're on a fresh chat
-            new_chat_selector = self.get_selector("new_chat_button", optional=True)
-            if new_chat_selector:
-                try:
-                    # Wait a bit for page to stabilize
-                    await page.wait_for_timeout(500)
-                    # Try to click new chat button
-                    await page.click(new_chat_selector, timeout=5000)
-                    # Wait for new chat page to load
-                    await page.wait_for_timeout(1000)
-                except Exception:
-                    # If new chat button fails, continue (might already be on new chat)
-                    pass
-
-            # Get selectors from configuration
-            chat_input_selector = self.get_selector("chat_input", optional=True)
-            if chat_input_selector is None:
-                chat_input_selector = self.DEFAULT_AUTH_SELECTOR
-
-            send_button_selector = self.get_selector("send_button", optional=True)
-            response_container_selector = self.get_selector("response_container", optional=True)
-
-            # Wait for chat input to be available
+            # Wait for the answer to finish streaming
             try:
-                await page.wait_for_selector(
-                    chat_input_selector,
-                    timeout=20000,
+                response_text, completed = await self.wait_for_response(
+                    page, timeout_ms=request.timeout * 1000
                 )
             except Exception as exc:
                 return GatewayResponse(
                     content="",
                     success=False,
-                    error=f"Chat input not found. Session may be invalid: {exc}",
+                    error=f"Failed to extract response: {exc}",
                     response_time=time.time() - start_time,
                 )
 
-            # Find and interact with the chat input
-            chat_input = page.locator(chat_input_selector).first
-            await chat_input.click()
-            await chat_input.fill(request.prompt)
-
-            # Send message - either click send button or press Enter
-            message_sent = False
-            if send_button_selector:
-                try:
-                    send_button = page.locator(send_button_selector).first
-                    if await send_button.is_visible(timeout=2000):
-                        await send_button.click()
-                        message_sent = True
-                except Exception:
-                    pass
-
-            # Fallback to Enter key if button click didn't work
-            if not message_sent:
-                await page.keyboard.press("Enter")
-
-            # Wait for response
-            timeout_ms = request.timeout * 1000
-            response_received = False
-
-            if response_container_selector:
-                try:
-                    # Wait for at least one response element to appear
-                    await page.wait_for_selector(
-                        response_container_selector,
-                        timeout=timeout_ms,
-                        state="visible",
-                    )
-                    response_received = True
-
-                    # Additional wait for streaming to complete
-                    # ChatGPT shows a loading indicator while generating
-                    await page.wait_for_timeout(2000)
-
-                    # Wait for any loading indicators to disappear
-                    # Common patterns for ChatGPT loading states
-                    loading_selectors = [
-                        ".result-streaming",
-                        "[data-testid='loading']",
-                        ".cursor-blink",
-                        "span.animate-pulse",
-                    ]
-
-                    for loading_selector in loading_selectors:
-                        try:
-                            await page.wait_for_selector(
-                                loading_selector,
-                                timeout=3000,
-                                state="hidden",
-                            )
-                        except Exception:
-                            pass
-
-                except Exception as exc:
-                    return GatewayResponse(
-                        content="",
-                        success=False,
-                        error=f"Timeout waiting for response: {exc}",
-                        response_time=time.time() - start_time,
-                    )
-            else:
-                # Fallback: wait a fixed time if no response selector
-                await page.wait_for_timeout(min(timeout_ms, 10000))
-                response_received = True
-
-            # Extract response content
-            response_text = ""
-            if response_received and response_container_selector:
-                try:
-                    # Get all response elements
-                    response_elements = await page.locator(response_container_selector).all()
-
-                    if response_elements:
-                        # Get the last response (most recent)
-                        last_response = response_elements[-1]
-                        response_text = await last_response.inner_text()
-                    else:
-                        response_text = "Response received but content could not be extracted"
-
-                except Exception as exc:
-                    response_text = f"Response received but extraction failed: {exc}"
+            if not response_text:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response after {request.timeout}s",
+                    response_time=time.time() - start_time,
+                )
+
+            if not completed:
+                # Cut off at the deadline: a truncated answer is not a success,
+                # so it is neither cached nor counted as healthy
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response to complete after {request.timeout}s",
+                    response_time=time.time() - start_time,
+                    metadata={"completed": False, "partial": response_text},
+                )
 
             # Estimate token count (rough approximation: ~4 chars per token)
             estimated_tokens = len(response_text) // 4 if response_text else 0
+            # A page that is still streaming cannot start a new chat cleanly
+            reusable = completed
 
             return GatewayResponse(
                 content=response_text,
-                success=bool(response_text),
+                success=True,
                 tokens_used=estimated_tokens,
                 response_time=time.time() - start_time,
+                metadata={"completed": completed},
             )
 
         except FileNotFoundError:
@@ -221,10 +133,58 @@ class ChatGPTProvider(BaseProvider):
                 response_time=time.time() - start_time,
             )
         finally:
-            # Clean up browser resources
-            if self._browser_manager:
-                await self._browser_manager.close()
-                self._browser_manager = None
+            # Return the page to the pool (discarded if the request failed)
+            if page is not None:
+                await self.release_chat_page(page, reusable=reusable)
+
+    async def submit_prompt(self, page: Any, request: GatewayRequest) -> str | None:
+        """
+        Type the prompt into ChatGPT and send it.
+
+        Args:
+            page: Page showing a fresh chat
+            request: GatewayRequest with the prompt
+
+        Returns:
+            Error message, or None if the prompt was sent
+        """
+        # Get selectors from configuration
+        chat_input_selector = self.get_selector("chat_input", optional=True)
+        if chat_input_selector is None:
+            chat_input_selector = self.DEFAULT_AUTH_SELECTOR
+
+        send_button_selector = self.get_selector("send_button", optional=True)
+
+        # Wait for chat input to be available
+        try:
+            await page.wait_for_selector(
+                chat_input_selector,
+                timeout=20000,
+            )
+        except Exception as exc:
+            return f"Chat input not found. Session may be invalid: {exc}"
+
+        # Find and interact with the chat input
+        chat_input = page.locator(chat_input_selector).first
+        await chat_input.click()
+        await chat_input.fill(request.prompt)
+
+        # Send message - either click send button or press Enter
+        message_sent = False
+        if send_button_selector:
+            try:
+                send_button = page.locator(send_button_selector).first
+                if await send_button.is_visible(timeout=2000):
+                    await send_button.click()
+                    message_sent = True
+            except Exception:
+                pass
+
+        # Fallback to Enter key if button click didn't work
+        if not message_sent:
+            await page.keyboard.press("Enter")
+
+        return None
 
     async def check_session(self) -> bool:
         """
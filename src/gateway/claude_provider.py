@@ -7,6 +7,7 @@ Uses Playwright to interact with claude.ai.
 import asyncio
 from pathlib import Path
 from time import time
+from typing import Any
 
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
@@ -27,6 +28,9 @@ class ClaudeProvider(BaseProvider):
 
     # Default authentication selector (fallback if selector_loader not available)
     DEFAULT_AUTH_SELECTOR = 'div[contenteditable="true"], [contenteditable="true"]'
+    DEFAULT_NEW_CHAT_SELECTOR = "button[aria-label='New chat'], a[href*='/new']"
+    DEFAULT_RESPONSE_SELECTOR = "[data-testid='conversation-turn'], div[class*='conversation']"
+    DEFAULT_BUSY_SELECTOR = "button[aria-label='Stop response'], [data-is-streaming='true']"
     LOGIN_TIMEOUT = 300  # 5 minutes
 
     def __init__(
@@ -44,12 +48,12 @@ class ClaudeProvider(BaseProvider):
         Send message to Claude using Playwright.
 
         Process:
-        1. Load stored cookies
-        2. Navigate to claude.ai
-        3. Find and fill chat input
-        4. Send message
-        5. Wait for response
-        6. Extract response content
+        1. Get a fresh chat page from the page pool (cookies injected once)
+        2. Find and fill chat input
+        3. Send message
+        4. Wait for response
+        5. Extract response content
+        6. Return the page to the pool for the next request
 
         Args:
             request: GatewayRequest with task_name and prompt
@@ -58,144 +62,57 @@ class ClaudeProvider(BaseProvider):
             GatewayResponse with content and metadata
         """
         start_time = time()
+        page = None
+        reusable = False
 
         try:
-            # Load cookies from storage
-            cookies = self._storage.load_cookies()
-
-            # Get browser manager
-            browser_manager = await self.get_browser_manager()
-
-            # Start browser and create context
-            await browser_manager.start_browser()
-            await browser_manager.create_context()
-
-            # Inject cookies
-            await browser_manager.inject_cookies(cookies)
-
-            # Get page and navigate to Claude
-            page = await browser_manager.get_page()
-            await page.goto(
-                self.base_url,
-                wait_until="domcontentloaded",
-                timeout=60000,
-            )
-
-            # Step 1: Click new chat button first to ensure we're on a fresh chat
-            new_chat_selector = self.get_selector("new_chat_button", optional=True)
-            if new_chat_selector:
-                try:
-                    # Wait a bit for page to stabilize
-                    await asyncio.sleep(1)
-                    # Try to click new chat button
-                    await page.click(new_chat_selector, timeout=5000)
-                    # Wait for new chat page to load
-                    await asyncio.sleep(1)
-                except Exception:
-                    # If new chat button fails, continue (might already be on new chat)
-                    pass
-
-            # Get selectors from selector_loader
-            chat_input_selector = self.get_selector("chat_input", optional=True)
-            if chat_input_selector is None:
-                chat_input_selector = self.DEFAULT_AUTH_SELECTOR
-
-            send_button_selector = self.get_selector("send_button", optional=True)
-            response_selector = self.get_selector("response_container", optional=True)
-
-            # Wait for chat input to be available
-            await page.wait_for_selector(
-                chat_input_selector,
-                timeout=30000,
-            )
+            # Fresh chat page (pre-navigated or recycled via new chat)
+            page = await self.acquire_chat_page()
 
-            # Find the chat input element
-            chat_input = await page.query_selector(chat_input_selector)
-            if not chat_input:
+            # Type and send the prompt
+            error = await self.submit_prompt(page, request)
+            if error:
                 return GatewayResponse(
                     content="",
                     success=False,
-                    error="Chat input element not found",
+                    error=error,
                 )
 
-            # Click on input to focus
-            await chat_input.click()
-
-            # Type the prompt
-            await page.keyboard.type(request.prompt, delay=10)
-
-            # Small delay to ensure input is registered
-            await asyncio.sleep(0.5)
-
-            # Send the message - try multiple methods
-            message_sent = False
-
-            # Method 1: Click send button if available
-            if send_button_selector:
-                try:
-                    send_button = await page.query_selector(send_button_selector)
-                    if send_button:
-                        await send_button.click()
-                        message_sent = True
-                except Exception:
-                    pass
-
-            # Method 2: Press Enter if button click failed
-            if not message_sent:
-                # Use modifier key combination for Claude (Cmd+Enter on Mac, Ctrl+Enter on Windows)
-                # For web interface, often just Enter works, or Cmd/Ctrl+Enter
-                try:
-                    await page.keyboard.press("Enter")
-                    message_sent = True
-                except Exception:
-                    pass
+            # Wait for the answer to finish streaming
+            try:
+                response_content, completed = await self.wait_for_response(
+                    page, timeout_ms=request.timeout * 1000
+                )
+            except Exception as exc:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Failed to extract response: {exc}",
+                )
 
-            if not message_sent:
+            if not response_content:
                 return GatewayResponse(
                     content="",
                     success=False,
-                    error="Failed to send message",
+                    error=f"Timeout waiting for response after {request.timeout}s",
+                    response_time=time() - start_time,
                 )
 
-            # Wait for response with timeout
-            timeout_ms = request.timeout * 1000
-            response_content = ""
-
-            # Wait for response container to appear
-            if response_selector:
-                try:
-                    # Wait for any response element to appear
-                    await page.wait_for_selector(
-                        response_selector,
-                        timeout=timeout_ms,
-                    )
-
-                    # Additional wait to ensure content is loaded
-                    await asyncio.sleep(2)
-
-                    # Extract text content from response
-                    response_elements = await page.query_selector_all(response_selector)
-                    if response_elements:
-                        # Get the last response element (most recent)
-                        last_response = response_elements[-1]
-                        response_content = await last_response.inner_text()
-
-                except Exception as exc:
-                    return GatewayResponse(
-                        content="",
-                        success=False,
-                        error=f"Failed to extract response: {exc}",
-                    )
-            else:
-                # Fallback: wait and get all text content
-                await asyncio.sleep(min(10, request.timeout))
-                response_content = await page.inner_text("body")
+            if not completed:
+                # Cut off at the deadline: a truncated answer is not a success,
+                # so it is neither cached nor counted as healthy
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response to complete after {request.timeout}s",
+                    response_time=time() - start_time,
+                    metadata={"completed": False, "partial": response_content},
+                )
 
             # Calculate response time
             response_time = time() - start_time
-
-            # Clean up
-            await browser_manager.close()
+            # A page that is still streaming cannot start a new chat cleanly
+            reusable = completed
 
             return GatewayResponse(
                 content=response_content.strip(),
@@ -204,17 +121,11 @@ class ClaudeProvider(BaseProvider):
                 metadata={
                     "provider": self.provider_name,
                     "task_name": request.task_name,
+                    "completed": completed,
                 },
             )
 
         except Exception as exc:
-            # Clean up on error
-            if self._browser_manager:
-                try:
-                    await self._browser_manager.close()
-                except Exception:
-                    pass
-
             return GatewayResponse(
                 content="",
                 success=False,
@@ -222,6 +133,77 @@ class ClaudeProvider(BaseProvider):
                 response_time=time() - start_time,
             )
 
+        finally:
+            # Keep the page for the next request unless it may be in a bad state
+            if page is not None:
+                await self.release_chat_page(page, reusable=reusable)
+
+    async def submit_prompt(self, page: Any, request: GatewayRequest) -> str | None:
+        """
+        Type the prompt into Claude and send it.
+
+        Args:
+            page: Page showing a fresh chat
+            request: GatewayRequest with the prompt
+
+        Returns:
+            Error message, or None if the prompt was sent
+        """
+        # Get selectors from selector_loader
+        chat_input_selector = self.get_selector("chat_input", optional=True)
+        if chat_input_selector is None:
+            chat_input_selector = self.DEFAULT_AUTH_SELECTOR
+
+        send_button_selector = self.get_selector("send_button", optional=True)
+
+        # Wait for chat input to be available
+        await page.wait_for_selector(
+            chat_input_selector,
+            timeout=30000,
+        )
+
+        # Find the chat input element
+        chat_input = await page.query_selector(chat_input_selector)
+        if not chat_input:
+            return "Chat input element not found"
+
+        # Click on input to focus
+        await chat_input.click()
+
+        # Type the prompt
+        await page.keyboard.type(request.prompt, delay=10)
+
+        # Small delay to ensure input is registered
+        await asyncio.sleep(0.5)
+
+        # Send the message - try multiple methods
+        message_sent = False
+
+        # Method 1: Click send button if available
+        if send_button_selector:
+            try:
+                send_button = await page.query_selector(send_button_selector)
+                if send_button:
+                    await send_button.click()
+                    message_sent = True
+            except Exception:
+                pass
+
+        # Method 2: Press Enter if button click failed
+        if not message_sent:
+            # Use modifier key combination for Claude (Cmd+Enter on Mac, Ctrl+Enter on Windows)
+            # For web interface, often just Enter works, or Cmd/Ctrl+Enter
+            try:
+                await page.keyboard.press("Enter")
+                message_sent = True
+            except Exception:
+                pass
+
+        if not message_sent:
+            return "Failed to send message"
+
+        return None
+
     async def check_session(self) -> bool:
         """
         Check if Claude session is valid.
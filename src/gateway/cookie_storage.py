@@ -2,17 +2,35 @@
 Cookie storage manager for encrypted session persistence.
 
 Handles saving, loading, and validation of encrypted cookies with metadata.
+
+Decrypted cookies and metadata are cached process-wide per profile
+directory and revalidated against the file's mtime, so files are read and
+decrypted once per change instead of once per request. The encryption key
+is revalidated the same way, so a key replaced on disk is picked up. Validation
+timestamps (mark_validated) are written in debounced batches.
 """
 
+import atexit
 import json
+import threading
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from core.logger import get_logger
 from gateway.cookie_encryption import CookieEncryption, InvalidToken
 
+logger = get_logger(__name__)
+
+# Seconds a mark_validated() update waits before being written, batching bursts
+METADATA_FLUSH_DELAY = 2.0
+
+# (mtime_ns, size) of a file, or None if it does not exist
+FileStamp = tuple[int, int] | None
+
 
 class SessionMetadata(BaseModel):
     """Session metadata for tracking session lifecycle."""
@@ -38,6 +56,52 @@ class SessionMetadata(BaseModel):
         self.is_valid = False
 
 
+def _stamp(path: Path) -> FileStamp:
+    """Get the change stamp of a file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class _ProfileCache:
+    """Decrypted state of one profile directory, shared by every CookieStorage."""
+
+    encryption: CookieEncryption
+    key_stamp: FileStamp = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    cookies: list[dict[str, Any]] | None = None
+    cookies_stamp: FileStamp = None
+    metadata: SessionMetadata | None = None
+    metadata_stamp: FileStamp = None
+    metadata_dirty: bool = False
+    flush_timer: threading.Timer | None = None
+
+
+_profile_caches: dict[Path, _ProfileCache] = {}
+_profile_caches_lock = threading.Lock()
+
+
+def flush_all_metadata() -> None:
+    """Write every pending metadata update (also run at interpreter exit)."""
+    with _profile_caches_lock:
+        profiles = list(_profile_caches)
+    for profile_dir in profiles:
+        CookieStorage(profile_dir).flush()
+
+
+def clear_profile_caches() -> None:
+    """Flush pending writes and drop every cached profile."""
+    flush_all_metadata()
+    with _profile_caches_lock:
+        _profile_caches.clear()
+
+
+atexit.register(flush_all_metadata)
+
+
 class CookieStorage:
     """
     Manages encrypted cookie storage with metadata tracking.
@@ -63,8 +127,40 @@ class CookieStorage:
         self.profile_dir = Path(profile_dir)
         self.profile_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize encryption
-        self.encryption = CookieEncryption(self.key_path)
+        # Share decrypted state (and the loaded key) with other instances
+        cache_key = self.profile_dir.resolve()
+        with _profile_caches_lock:
+            cache = _profile_caches.get(cache_key)
+            if cache is None:
+                cache = _ProfileCache(encryption=CookieEncryption(self.key_path), key_stamp=_stamp(self.key_path))
+                _profile_caches[cache_key] = cache
+        self._cache = cache
+
+    @property
+    def encryption(self) -> CookieEncryption:
+        """
+        Get the profile's cookie encryption (shared by all instances).
+
+        Rebuilt when the key file changed on disk, e.g. when another process
+        deleted the session and logged in again.
+        """
+        with self._cache.lock:
+            self._check_key()
+            return self._cache.encryption
+
+    def _check_key(self) -> None:
+        """Rebuild the encryption if the key file changed (caller holds the lock)."""
+        cache = self._cache
+        stamp = _stamp(self.key_path)
+        if stamp == cache.key_stamp:
+            return
+        if cache.key_stamp is not None:
+            # State decrypted with the old key must be read again
+            logger.info(f"Encryption key changed: {self.key_path}")
+            cache.cookies_stamp = None
+            cache.metadata_stamp = None
+        cache.encryption = CookieEncryption(self.key_path)
+        cache.key_stamp = stamp
 
     @property
     def cookies_path(self) -> Path:
@@ -113,7 +209,10 @@ class CookieStorage:
         encrypted_data = self.encryption.encrypt_cookies(cookies)
 
         # Write encrypted cookies to file
-        self.cookies_path.write_text(encrypted_data)
+        with self._cache.lock:
+            self.cookies_path.write_text(encrypted_data)
+            self._cache.cookies = [dict(cookie) for cookie in cookies]
+            self._cache.cookies_stamp = _stamp(self.cookies_path)
 
         # Write encrypted metadata
         self.save_metadata(metadata)
@@ -130,14 +229,22 @@ class CookieStorage:
             InvalidToken: If decryption fails (corrupted or wrong key)
             ValueError: If data is invalid
         """
-        if not self.cookies_path.exists():
-            raise FileNotFoundError(f"Cookies file not found: {self.cookies_path}")
-
-        # Read encrypted data
-        encrypted_data = self.cookies_path.read_text()
-
-        # Decrypt and return
-        return self.encryption.decrypt_cookies(encrypted_data)
+        cache = self._cache
+        with cache.lock:
+            self._check_key()
+            stamp = _stamp(self.cookies_path)
+            if stamp is None:
+                cache.cookies, cache.cookies_stamp = None, None
+                raise FileNotFoundError(f"Cookies file not found: {self.cookies_path}")
+
+            if cache.cookies is None or cache.cookies_stamp != stamp:
+                # Read and decrypt only when the file changed
+                encrypted_data = self.cookies_path.read_text()
+                cache.cookies = self.encryption.decrypt_cookies(encrypted_data)
+                cache.cookies_stamp = stamp
+
+            # Copies, so callers cannot alter the cached cookies
+            return [dict(cookie) for cookie in cache.cookies]
 
     def save_metadata(self, metadata: SessionMetadata) -> None:
         """
@@ -146,11 +253,45 @@ class CookieStorage:
         Args:
             metadata: SessionMetadata instance
         """
+        with self._cache.lock:
+            self._cache.metadata = metadata.model_copy()
+            self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        """Encrypt and write the cached metadata (caller holds the lock)."""
+        cache = self._cache
+        if cache.flush_timer is not None:
+            cache.flush_timer.cancel()
+            cache.flush_timer = None
+        if cache.metadata is None:
+            return
+
         # Encrypt metadata
-        encrypted_metadata = self.encryption.encrypt_data(metadata.model_dump())
+        encrypted_metadata = self.encryption.encrypt_data(cache.metadata.model_dump())
 
         # Write encrypted metadata to file
         self.metadata_path.write_text(encrypted_metadata)
+        cache.metadata_stamp = _stamp(self.metadata_path)
+        cache.metadata_dirty = False
+
+    def flush(self) -> None:
+        """Write a pending debounced metadata update now."""
+        with self._cache.lock:
+            if not self._cache.metadata_dirty:
+                return
+            try:
+                self._write_metadata()
+            except OSError as exc:
+                logger.warning(f"Failed to write session metadata {self.metadata_path}: {exc}")
+
+    def _schedule_flush(self) -> None:
+        """Mark metadata dirty and write it after METADATA_FLUSH_DELAY (caller holds the lock)."""
+        cache = self._cache
+        cache.metadata_dirty = True
+        if cache.flush_timer is None:
+            cache.flush_timer = threading.Timer(METADATA_FLUSH_DELAY, self.flush)
+            cache.flush_timer.daemon = True
+            cache.flush_timer.start()
 
     def load_metadata(self) -> SessionMetadata | None:
         """
@@ -163,6 +304,24 @@ class CookieStorage:
             InvalidToken: If metadata decryption fails
             ValueError: If decrypted metadata is invalid
         """
+        cache = self._cache
+        with cache.lock:
+            if cache.metadata_dirty:
+                # The pending update is newer than the file
+                return cache.metadata.model_copy()
+
+            self._check_key()
+            stamp = _stamp(self.metadata_path)
+            if stamp is not None and stamp == cache.metadata_stamp and cache.metadata is not None:
+                return cache.metadata.model_copy()
+
+            metadata = self._read_metadata()
+            cache.metadata = metadata
+            cache.metadata_stamp = stamp if metadata is not None else None
+            return metadata.model_copy() if metadata is not None else None
+
+    def _read_metadata(self) -> SessionMetadata | None:
+        """Read and decrypt metadata from disk."""
         if not self.metadata_path.exists():
             return None
 
@@ -193,29 +352,61 @@ class CookieStorage:
         Args:
             **updates: Field names and values to update
         """
-        metadata = self.load_metadata()
-        if metadata is None:
-            metadata = SessionMetadata(provider_name=self.profile_dir.name)
+        with self._cache.lock:
+            metadata = self.load_metadata()
+            if metadata is None:
+                metadata = SessionMetadata(provider_name=self.profile_dir.name)
 
-        for field, value in updates.items():
-            if hasattr(metadata, field):
-                setattr(metadata, field, value)
+            for name, value in updates.items():
+                if hasattr(metadata, name):
+                    setattr(metadata, name, value)
 
-        self.save_metadata(metadata)
+            self.save_metadata(metadata)
 
     def mark_validated(self) -> None:
-        """Mark session as validated (update timestamp)."""
-        metadata = self.load_metadata()
-        if metadata:
-            metadata.mark_validated()
-            self.save_metadata(metadata)
+        """
+        Mark session as validated (update timestamp).
+
+        The write is debounced; load_metadata() sees the update immediately.
+        """
+        with self._cache.lock:
+            metadata = self.load_metadata()
+            if metadata:
+                metadata.mark_validated()
+                self._cache.metadata = metadata
+                self._schedule_flush()
 
     def mark_invalid(self) -> None:
-        """Mark session as invalid."""
-        metadata = self.load_metadata()
-        if metadata:
-            metadata.mark_invalid()
-            self.save_metadata(metadata)
+        """Mark session as invalid (written immediately)."""
+        with self._cache.lock:
+            metadata = self.load_metadata()
+            if metadata:
+                metadata.mark_invalid()
+                self.save_metadata(metadata)
+
+    def has_unexpired_cookies(self, now: float | None = None) -> bool:
+        """
+        Check the stored cookies' ``expires`` fields without opening a browser.
+
+        Cookies without an expiry (session cookies, ``expires`` <= 0) count
+        as unexpired.
+
+        Args:
+            now: Unix timestamp to compare against (default: current time)
+
+        Returns:
+            True if at least one stored cookie has not expired
+
+        Raises:
+            FileNotFoundError: If cookies file doesn't exist
+            InvalidToken: If decryption fails
+        """
+        now = datetime.now(UTC).timestamp() if now is None else now
+        for cookie in self.load_cookies():
+            expires = cookie.get("expires", -1)
+            if not isinstance(expires, int | float) or expires <= 0 or expires > now:
+                return True
+        return False
 
     def session_exists(self) -> bool:
         """Check if session files exist."""
@@ -226,6 +417,18 @@ class CookieStorage:
 
     def delete_session(self) -> None:
         """Delete all session files (cookies, key, metadata)."""
+        cache = self._cache
+        with cache.lock:
+            if cache.flush_timer is not None:
+                cache.flush_timer.cancel()
+            cache.flush_timer = None
+            cache.cookies, cache.cookies_stamp = None, None
+            cache.metadata, cache.metadata_stamp = None, None
+            cache.metadata_dirty = False
+            # The key is deleted too; a new one is generated on next use
+            cache.encryption = CookieEncryption(self.key_path)
+            cache.key_stamp = None
+
         if self.cookies_path.exists():
             self.cookies_path.unlink()
 
@@ -7,6 +7,7 @@ Uses Playwright to interact with gemini.google.com.
 import asyncio
 import time
 from pathlib import Path
+from typing import Any
 
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
@@ -27,6 +28,12 @@ class GeminiProvider(BaseProvider):
 
     # Default authentication selector (fallback if selector_loader not available)
     DEFAULT_AUTH_SELECTOR = '.ql-editor, .rich-textarea, div[contenteditable="true"], textarea'
+    DEFAULT_NEW_CHAT_SELECTOR = "button[aria-label='New chat'], .new-chat-button"
+    DEFAULT_RESPONSE_SELECTOR = (
+        ".model-response, .response-container, .conversation-turn, [data-testid*='response']"
+    )
+    DEFAULT_BUSY_SELECTOR = "button[aria-label='Stop response'], .stop-button"
+    DEFAULT_STABLE_MS = 2000
     LOGIN_TIMEOUT = 300  # 5 minutes
 
     def __init__(
@@ -50,114 +57,64 @@ class GeminiProvider(BaseProvider):
             GatewayResponse with AI response content
         """
         start_time = time.time()
-        browser_manager = None
+        page = None
+        reusable = False
 
         try:
-            # Load stored cookies
-            cookies = self._storage.load_cookies()
-
-            # Get browser manager
-            browser_manager = await self.get_browser_manager()
-
-            # Start browser and create context
-            await browser_manager.start_browser()
-            await browser_manager.create_context()
-
-            # Inject stored cookies
-            await browser_manager.inject_cookies(cookies)
-
-            # Get page and navigate to Gemini
-            page = await browser_manager.get_page()
-            await page.goto(
-                self.base_url,
-                wait_until="domcontentloaded",
-                timeout=60000,
-            )
+            # Fresh chat page from the pool (cookies injected once per context)
+            page = await self.acquire_chat_page()
 
-            # Wait for page to load
-            await asyncio.sleep(2)
-
-            # Get selectors for Gemini
-            chat_input_selector = self.get_selector("chat_input", optional=True)
-            if chat_input_selector is None:
-                chat_input_selector = self.DEFAULT_AUTH_SELECTOR
-
-            send_button_selector = self.get_selector("send_button", optional=True)
-            if send_button_selector is None:
-                send_button_selector = "button[aria-label='Send'], button[aria-label='send']"
-
-            response_container_selector = self.get_selector("response_container", optional=True)
-            if response_container_selector is None:
-                response_container_selector = ".model-response, .response-container, .conversation-turn, [data-testid*='response']"
+            # Type and send the prompt
+            error = await self.submit_prompt(page, request)
+            if error:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=error,
+                    response_time=time.time() - start_time,
+                )
 
-            # Find and click the chat input
+            # Wait for the answer to finish streaming
             try:
-                input_element = await page.wait_for_selector(
-                    chat_input_selector,
-                    timeout=15000,
+                response_content, completed = await self.wait_for_response(
+                    page, timeout_ms=request.timeout * 1000
                 )
-                await input_element.click()
             except Exception as e:
                 return GatewayResponse(
                     content="",
                     success=False,
-                    error=f"Could not find chat input element: {e}",
+                    error=f"Failed to extract response: {e}",
                     response_time=time.time() - start_time,
                 )
 
-            # Type the prompt
-            await input_element.fill(request.prompt)
-            await asyncio.sleep(0.5)
-
-            # Click send button or press Enter
-            try:
-                send_button = await page.query_selector(send_button_selector)
-                if send_button:
-                    await send_button.click()
-                else:
-                    await page.keyboard.press("Enter")
-            except Exception:
-                await page.keyboard.press("Enter")
-
-            # Wait for response
-            await asyncio.sleep(1)
-
-            # Wait for response to appear with timeout
-            timeout_ms = request.timeout * 1000
-            response_content = ""
-
-            try:
-                await page.wait_for_selector(
-                    response_container_selector,
-                    timeout=timeout_ms,
+            if not response_content:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response after {request.timeout}s",
+                    response_time=time.time() - start_time,
                 )
 
-                # Extract response content
-                await asyncio.sleep(2)
-
-                response_elements = await page.query_selector_all(response_container_selector)
-                if response_elements:
-                    # Get the last response element (most recent)
-                    last_response = response_elements[-1]
-                    response_content = await last_response.inner_text()
-                else:
-                    response_content = await page.inner_text("body")
-
-            except Exception as e:
+            if not completed:
+                # Cut off at the deadline: a truncated answer is not a success,
+                # so it is neither cached nor counted as healthy
                 return GatewayResponse(
                     content="",
                     success=False,
-                    error=f"Timeout waiting for response: {e}",
+                    error=f"Timeout waiting for response to complete after {request.timeout}s",
                     response_time=time.time() - start_time,
+                    metadata={"completed": False, "partial": response_content},
                 )
 
             response_time = time.time() - start_time
+            # A page that is still streaming cannot start a new chat cleanly
+            reusable = completed
 
             return GatewayResponse(
                 content=response_content,
                 success=True,
                 response_time=response_time,
-                metadata={"provider": "gemini"},
+                metadata={"provider": "gemini", "completed": completed},
             )
 
         except FileNotFoundError:
@@ -175,8 +132,54 @@ class GeminiProvider(BaseProvider):
                 response_time=time.time() - start_time,
             )
         finally:
-            if browser_manager:
-                await browser_manager.close()
+            if page is not None:
+                await self.release_chat_page(page, reusable=reusable)
+
+    async def submit_prompt(self, page: Any, request: GatewayRequest) -> str | None:
+        """
+        Type the prompt into Gemini and send it.
+
+        Args:
+            page: Page showing a fresh chat
+            request: GatewayRequest with the prompt
+
+        Returns:
+            Error message, or None if the prompt was sent
+        """
+        # Get selectors for Gemini
+        chat_input_selector = self.get_selector("chat_input", optional=True)
+        if chat_input_selector is None:
+            chat_input_selector = self.DEFAULT_AUTH_SELECTOR
+
+        send_button_selector = self.get_selector("send_button", optional=True)
+        if send_button_selector is None:
+            send_button_selector = "button[aria-label='Send'], button[aria-label='send']"
+
+        # Find and click the chat input
+        try:
+            input_element = await page.wait_for_selector(
+                chat_input_selector,
+                timeout=15000,
+            )
+            await input_element.click()
+        except Exception as e:
+            return f"Could not find chat input element: {e}"
+
+        # Type the prompt
+        await input_element.fill(request.prompt)
+        await asyncio.sleep(0.5)
+
+        # Click send button or press Enter
+        try:
+            send_button = await page.query_selector(send_button_selector)
+            if send_button:
+                await send_button.click()
+            else:
+                await page.keyboard.press("Enter")
+        except Exception:
+            await page.keyboard.press("Enter")
+
+        return None
 
     async def check_session(self) -> bool:
         """
@@ -7,6 +7,7 @@ Uses Playwright to interact with perplexity.ai.
 import asyncio
 import time
 from pathlib import Path
+from typing import Any
 
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
@@ -27,6 +28,10 @@ class PerplexityProvider(BaseProvider):
 
     # Default authentication selector (fallback if selector_loader not available)
     DEFAULT_AUTH_SELECTOR = '[role="textbox"], textarea, div[contenteditable="true"]'
+    DEFAULT_NEW_CHAT_SELECTOR = "button[aria-label='New thread'], a[href*='/new']"
+    DEFAULT_RESPONSE_SELECTOR = "[class*='answer'], .answer-container, .thread-result"
+    DEFAULT_BUSY_SELECTOR = "button[aria-label='Stop'], button[aria-label*='Stop generating']"
+    DEFAULT_STABLE_MS = 2000
     LOGIN_TIMEOUT = 300  # 5 minutes
 
     def __init__(
@@ -50,97 +55,52 @@ class PerplexityProvider(BaseProvider):
             GatewayResponse with AI response content
         """
         start_time = time.time()
+        page = None
+        reusable = False
 
         try:
-            # Load cookies from storage
-            cookies = self._storage.load_cookies()
-
-            # Get browser manager
-            browser_manager = await self.get_browser_manager()
-
-            # Start browser and create context
-            await browser_manager.start_browser()
-            await browser_manager.create_context()
-
-            # Inject stored cookies
-            await browser_manager.inject_cookies(cookies)
-
-            # Get page and navigate to Perplexity
-            page = await browser_manager.get_page()
-            await page.goto(
-                self.base_url,
-                wait_until="domcontentloaded",
-                timeout=60000,
-            )
-
-            # Get selectors from selector_loader
-            chat_input_selector = self.get_selector("chat_input")
-            send_button_selector = self.get_selector("send_button", optional=True)
-            response_container_selector = self.get_selector("response_container")
-
-            # Wait for chat input to be available
-            await page.wait_for_selector(
-                chat_input_selector,
-                timeout=30000,
-            )
-
-            # Check if there's a "new thread" or "new chat" button to click first
-            new_chat_selector = self.get_selector("new_chat_button", optional=True)
-            if new_chat_selector:
-                try:
-                    new_chat_button = page.locator(new_chat_selector).first
-                    if await new_chat_button.is_visible():
-                        await new_chat_button.click()
-                        await asyncio.sleep(1)
-                except Exception:
-                    # New chat button may not exist or be clickable, continue
-                    pass
-
-            # Input the query
-            chat_input = page.locator(chat_input_selector)
-            await chat_input.fill(request.prompt)
-            await asyncio.sleep(0.5)
-
-            # Click send button if available, otherwise press Enter
-            if send_button_selector:
-                try:
-                    send_button = page.locator(send_button_selector)
-                    if await send_button.is_visible():
-                        await send_button.click()
-                    else:
-                        await page.keyboard.press("Enter")
-                except Exception:
-                    await page.keyboard.press("Enter")
-            else:
-                await page.keyboard.press("Enter")
-
-            # Wait for response to appear
-            timeout_ms = request.timeout * 1000
-            await page.wait_for_selector(
-                response_container_selector,
-                timeout=timeout_ms,
-            )
-
-            # Extract response content
-            response_element = page.locator(response_container_selector).first
+            # Fresh thread page from the pool (cookies injected once per context)
+            page = await self.acquire_chat_page()
+
+            # Type and send the prompt
+            error = await self.submit_prompt(page, request)
+            if error:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=error,
+                )
 
-            # Wait a bit for content to fully load
-            await asyncio.sleep(2)
+            # Wait for the answer to finish streaming
+            content, completed = await self.wait_for_response(page, timeout_ms=request.timeout * 1000)
+            if not content:
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response after {request.timeout}s",
+                )
 
-            # Get text content from response
-            content = await response_element.inner_text()
+            if not completed:
+                # Cut off at the deadline: a truncated answer is not a success,
+                # so it is neither cached nor counted as healthy
+                return GatewayResponse(
+                    content="",
+                    success=False,
+                    error=f"Timeout waiting for response to complete after {request.timeout}s",
+                    response_time=time.time() - start_time,
+                    metadata={"completed": False, "partial": content},
+                )
 
             # Calculate response time
             response_time = time.time() - start_time
-
-            # Close browser
-            await browser_manager.close()
+            # A page that is still streaming cannot start a new thread cleanly
+            reusable = completed
 
             return GatewayResponse(
                 content=content,
                 success=True,
                 response_time=response_time,
-                metadata={"provider": "perplexity"},
+                metadata={"provider": "perplexity", "completed": completed},
             )
 
         except FileNotFoundError:
@@ -152,19 +112,57 @@ class PerplexityProvider(BaseProvider):
             )
 
         except Exception as exc:
-            # Close browser on error
-            try:
-                browser_manager = await self.get_browser_manager()
-                await browser_manager.close()
-            except Exception:
-                pass
-
             return GatewayResponse(
                 content="",
                 success=False,
                 error=f"Failed to send message: {exc}",
             )
 
+        finally:
+            if page is not None:
+                await self.release_chat_page(page, reusable=reusable)
+
+    async def submit_prompt(self, page: Any, request: GatewayRequest) -> str | None:
+        """
+        Type the prompt into Perplexity and send it.
+
+        Args:
+            page: Page showing a fresh chat
+            request: GatewayRequest with the prompt
+
+        Returns:
+            Error message, or None if the prompt was sent
+        """
+        # Get selectors from selector_loader
+        chat_input_selector = self.get_selector("chat_input")
+        send_button_selector = self.get_selector("send_button", optional=True)
+
+        # Wait for chat input to be available
+        await page.wait_for_selector(
+            chat_input_selector,
+            timeout=30000,
+        )
+
+        # Input the query
+        chat_input = page.locator(chat_input_selector)
+        await chat_input.fill(request.prompt)
+        await asyncio.sleep(0.5)
+
+        # Click send button if available, otherwise press Enter
+        if send_button_selector:
+            try:
+                send_button = page.locator(send_button_selector)
+                if await send_button.is_visible():
+                    await send_button.click()
+                else:
+                    await page.keyboard.press("Enter")
+            except Exception:
+                await page.keyboard.press("Enter")
+        else:
+            await page.keyboard.press("Enter")
+
+        return None
+
     async def check_session(self) -> bool:
         """
         Check if Perplexity session is valid.
@@ -7,6 +7,7 @@ handling cookie injection/extraction and page management with anti-detection mea
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
 from playwright.async_api import BrowserContext, Page
@@ -160,8 +161,52 @@ class ProviderContext:
         """
         context = await self.get_context()
         await context.add_cookies(cookies)
+        self._pool.mark_cookies_injected(self.provider_name)
         logger.debug(f"Injected {len(cookies)} cookies for {self.provider_name}")
 
+    async def has_cookies(self) -> bool:
+        """
+        Check whether session cookies are already in this provider's context.
+
+        Cookies survive for the context's lifetime, so they only need to be
+        injected once per context rather than once per request.
+
+        Returns:
+            True if cookies were injected (or preloaded) into the current context
+        """
+        await self.get_context()
+        return self._pool.has_cookies(self.provider_name)
+
+    async def acquire_page(
+        self,
+        url: str,
+        reset: Callable[[Page], Awaitable[bool]] | None = None,
+    ) -> Page:
+        """
+        Get a ready-to-type page from the provider's page pool.
+
+        Args:
+            url: URL to navigate new pages to
+            reset: Coroutine returning True if a used page is ready again
+
+        Returns:
+            Page instance
+        """
+        await self.get_context()
+        return await self._pool.acquire_page(self.provider_name, url, reset=reset)
+
+    async def release_page(self, page: Page, reusable: bool = True) -> None:
+        """
+        Return a page to the provider's page pool.
+
+        Args:
+            page: Page returned by acquire_page()
+            reusable: False to close the page instead of pooling it
+        """
+        if self._pool is None:
+            return
+        await self._pool.release_page(self.provider_name, page, reusable=reusable)
+
     async def extract_cookies(self) -> list[dict[str, Any]]:
         """
         Extract cookies from provider context.
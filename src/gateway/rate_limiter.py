@@ -0,0 +1,404 @@
+"""
+Per-provider adaptive rate limiting.
+
+Each AgentType gets a ProviderGovernor combining:
+- A token bucket limiting how fast requests start (requests per minute, with burst)
+- An AIMD concurrency limit: +1/limit per success, multiplied by a decrease
+  factor on rate-limit or timeout signals
+
+Both shrink as soon as a provider pushes back and creep back to their
+configured ceilings while requests succeed, so parallelism can be raised
+without hammering the web UIs into blocking the session.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from core.logger import get_logger
+from core.models import AgentType
+
+logger = get_logger(__name__)
+
+# Lower-cased fragments of provider error messages that mean "slow down"
+RATE_LIMIT_MARKERS = (
+    "rate limit",
+    "rate-limit",
+    "too many requests",
+    "429",
+    "usage limit",
+    "limit reached",
+    "try again later",
+)
+
+
+def is_rate_limit_message(message: str | None) -> bool:
+    """
+    Check whether an error message signals provider throttling.
+
+    Args:
+        message: Error message (may be None)
+
+    Returns:
+        True if the message matches a known rate-limit marker
+    """
+    if not message:
+        return False
+    lowered = message.lower()
+    return any(marker in lowered for marker in RATE_LIMIT_MARKERS)
+
+
+class RequestOutcome(StrEnum):
+    """Outcome of a governed request, as far as rate control is concerned."""
+
+    SUCCESS = "success"
+    RATE_LIMITED = "rate_limited"
+    TIMEOUT = "timeout"
+    ERROR = "error"
+
+
+def classify_outcome(response: Any = None, error: BaseException | None = None) -> RequestOutcome:
+    """
+    Classify a response or exception for the governor.
+
+    Args:
+        response: Object with success/error attributes (GatewayResponse, AgentResponse)
+        error: Exception raised instead of a response
+
+    Returns:
+        RequestOutcome
+    """
+    if error is not None:
+        if isinstance(error, TimeoutError | asyncio.TimeoutError):
+            return RequestOutcome.TIMEOUT
+        message = str(getattr(error, "message", error))
+    elif response is not None and getattr(response, "success", False):
+        return RequestOutcome.SUCCESS
+    else:
+        message = getattr(response, "error", None) or ""
+
+    if is_rate_limit_message(message):
+        return RequestOutcome.RATE_LIMITED
+    if "timeout" in message.lower() or "timed out" in message.lower():
+        return RequestOutcome.TIMEOUT
+    return RequestOutcome.ERROR
+
+
+@dataclass
+class GovernorConfig:
+    """
+    Limits for one provider.
+
+    Attributes:
+        requests_per_minute: Token bucket refill rate ceiling
+        burst: Token bucket capacity
+        min_concurrency: Floor of the AIMD concurrency limit
+        max_concurrency: Ceiling of the AIMD concurrency limit
+        decrease_factor: Multiplier applied to rate and concurrency on throttling
+    """
+
+    requests_per_minute: float = 6.0
+    burst: int = 2
+    min_concurrency: int = 1
+    max_concurrency: int = 4
+    decrease_factor: float = 0.5
+
+    def __post_init__(self):
+        """Reject limits that would never admit a request."""
+        if self.requests_per_minute <= 0:
+            raise ValueError(f"requests_per_minute must be positive, got {self.requests_per_minute}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+
+@dataclass
+class GovernorStats:
+    """Counters exposed as metrics."""
+
+    successes: int = 0
+    rate_limited: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+    last_throttle_at: float | None = field(default=None)
+
+
+class ProviderGovernor:
+    """
+    Token bucket plus AIMD concurrency limit for one provider.
+
+    Usage:
+        async with governor.slot() as slot:
+            response = await agent.execute(request)
+            slot.record(classify_outcome(response))
+    """
+
+    def __init__(self, name: str, config: GovernorConfig | None = None) -> None:
+        """
+        Initialize governor.
+
+        Args:
+            name: Provider name (for logs and metrics)
+            config: Limits (defaults if None)
+        """
+        self.name = name
+        self.config = config or GovernorConfig()
+        self.stats = GovernorStats()
+
+        self.rate_per_second = self.config.requests_per_minute / 60.0
+        self.concurrency_limit = float(self.config.min_concurrency)
+        self.in_flight = 0
+        self._tokens = float(self.config.burst)
+        self._last_refill = time.monotonic()
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def _max_rate(self) -> float:
+        return self.config.requests_per_minute / 60.0
+
+    @property
+    def _min_rate(self) -> float:
+        # Never throttle below one request per ten minutes
+        return min(self._max_rate, 1 / 600)
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Get the condition of the running loop (governors outlive event loops)."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.config.burst), self._tokens + (now - self._last_refill) * self.rate_per_second)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a rate token."""
+        condition = self._get_condition()
+        started = time.monotonic()
+
+        async with condition:
+            while True:
+                self._refill()
+                if self.in_flight < int(self.concurrency_limit) and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    break
+
+                if self.in_flight >= int(self.concurrency_limit):
+                    # Woken by release()
+                    await condition.wait()
+                else:
+                    delay = (1 - self._tokens) / self.rate_per_second
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=delay)
+                    except TimeoutError:
+                        pass
+
+        self.stats.wait_seconds += time.monotonic() - started
+
+    async def release(self, outcome: RequestOutcome) -> None:
+        """
+        Free a slot and adapt the limits to the outcome.
+
+        Args:
+            outcome: Classified result of the request
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._adapt(outcome)
+            condition.notify_all()
+
+    def _adapt(self, outcome: RequestOutcome) -> None:
+        """Apply AIMD to concurrency and rate."""
+        if outcome == RequestOutcome.SUCCESS:
+            self.stats.successes += 1
+            self.concurrency_limit = min(
+                float(self.config.max_concurrency),
+                self.concurrency_limit + 1 / self.concurrency_limit,
+            )
+            self.rate_per_second = min(self._max_rate, self.rate_per_second + self._max_rate * 0.1)
+            return
+
+        if outcome in {RequestOutcome.RATE_LIMITED, RequestOutcome.TIMEOUT}:
+            if outcome == RequestOutcome.RATE_LIMITED:
+                self.stats.rate_limited += 1
+            else:
+                self.stats.timeouts += 1
+            self.stats.last_throttle_at = time.time()
+            self.concurrency_limit = max(
+                float(self.config.min_concurrency),
+                self.concurrency_limit * self.config.decrease_factor,
+            )
+            self.rate_per_second = max(self._min_rate, self.rate_per_second * self.config.decrease_factor)
+            # Drop saved-up burst so the back-off takes effect immediately
+            self._tokens = min(self._tokens, 0.0)
+            logger.warning(
+                "Provider throttled, backing off",
+                provider=self.name,
+                outcome=outcome.value,
+                concurrency_limit=round(self.concurrency_limit, 2),
+                requests_per_minute=round(self.rate_per_second * 60, 2),
+            )
+            return
+
+        # Other errors say nothing about load
+        self.stats.errors += 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator["_Slot"]:
+        """
+        Hold a request slot for the duration of the block.
+
+        The outcome defaults to ERROR (or TIMEOUT for timeouts) if the block
+        raises, and to SUCCESS if it completes without calling record().
+        """
+        await self.acquire()
+        slot = _Slot()
+        try:
+            yield slot
+        except BaseException as exc:
+            await self.release(classify_outcome(error=exc) if slot.outcome is None else slot.outcome)
+            raise
+        await self.release(slot.outcome or RequestOutcome.SUCCESS)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Current limits and counters.
+
+        Returns:
+            Metrics dictionary
+        """
+        return {
+            "concurrency_limit": round(self.concurrency_limit, 2),
+            "in_flight": self.in_flight,
+            "requests_per_minute": round(self.rate_per_second * 60, 2),
+            "max_concurrency": self.config.max_concurrency,
+            "max_requests_per_minute": self.config.requests_per_minute,
+            "successes": self.stats.successes,
+            "rate_limited": self.stats.rate_limited,
+            "timeouts": self.stats.timeouts,
+            "errors": self.stats.errors,
+            "wait_seconds": round(self.stats.wait_seconds, 2),
+        }
+
+
+class _Slot:
+    """Handle yielded by ProviderGovernor.slot() to report the outcome."""
+
+    def __init__(self) -> None:
+        self.outcome: RequestOutcome | None = None
+
+    def record(self, outcome: RequestOutcome) -> None:
+        self.outcome = outcome
+
+
+class RateGovernor:
+    """
+    Registry of ProviderGovernors keyed by AgentType.
+    """
+
+    def __init__(
+        self,
+        default_config: GovernorConfig | None = None,
+        overrides: dict[AgentType, GovernorConfig] | None = None,
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            default_config: Limits for providers without an override
+            overrides: Per-provider limits
+        """
+        self.default_config = default_config or GovernorConfig()
+        self.overrides = dict(overrides or {})
+        self._governors: dict[AgentType, ProviderGovernor] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "RateGovernor":
+        """
+        Build limits from AigenFlowSettings.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            RateGovernor
+        """
+        default_config = GovernorConfig(
+            requests_per_minute=settings.provider_requests_per_minute,
+            burst=settings.provider_burst,
+            min_concurrency=1,
+            max_concurrency=max(1, settings.provider_max_concurrency),
+            decrease_factor=settings.provider_backoff_factor,
+        )
+        overrides: dict[AgentType, GovernorConfig] = {}
+        for name, rpm in (settings.provider_requests_per_minute_overrides or {}).items():
+            try:
+                agent_type = AgentType(name)
+            except ValueError:
+                logger.warning(f"Ignoring rate limit override for unknown provider: {name}")
+                continue
+            overrides[agent_type] = GovernorConfig(
+                requests_per_minute=rpm,
+                burst=default_config.burst,
+                min_concurrency=default_config.min_concurrency,
+                max_concurrency=default_config.max_concurrency,
+                decrease_factor=default_config.decrease_factor,
+            )
+        return cls(default_config=default_config, overrides=overrides)
+
+    def get(self, agent_type: AgentType) -> ProviderGovernor:
+        """
+        Get (or create) the governor of a provider.
+
+        Args:
+            agent_type: Provider
+
+        Returns:
+            ProviderGovernor
+        """
+        if agent_type not in self._governors:
+            self._governors[agent_type] = ProviderGovernor(
+                name=agent_type.value,
+                config=self.overrides.get(agent_type, self.default_config),
+            )
+        return self._governors[agent_type]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Metrics of every provider used so far.
+
+        Returns:
+            Mapping of provider name to metrics
+        """
+        return {agent_type.value: governor.snapshot() for agent_type, governor in self._governors.items()}
+
+
+_shared_governor: RateGovernor | None = None
+
+
+def get_rate_governor(settings: Any) -> RateGovernor | None:
+    """
+    Get the process-wide governor, so limits hold across routers (e.g. in batch runs).
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared RateGovernor, or None if disabled in settings
+    """
+    global _shared_governor
+    if getattr(settings, "enable_rate_governor", False) is not True:
+        return None
+    if _shared_governor is None:
+        _shared_governor = RateGovernor.from_settings(settings)
+    return _shared_governor
@@ -44,6 +44,9 @@ class ProviderSelectors(BaseModel):
     logout_button: str | None = None
     new_chat_button: str | None = None
     username_indicator: str | None = None
+    stop_button: str | None = None
+    streaming_indicator: str | None = None
+    completion_stable_ms: int | None = None
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get selector value by key, with default fallback."""
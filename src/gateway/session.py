@@ -4,6 +4,8 @@ Session manager for Playwright gateway.
 Implements 4-stage auto-recovery chain for session management.
 """
 
+import asyncio
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,7 @@ from pydantic import BaseModel
 
 from core.logger import get_logger, redact_secrets
 from gateway.base import BaseProvider
+from gateway.cookie_storage import CookieStorage
 
 logger = get_logger(__name__)
 
@@ -36,11 +39,23 @@ class SessionManager:
     4. Claude verify - Final verification with Claude
     """
 
+    DEFAULT_CHECK_TTL_MINUTES = 30.0
+    DEFAULT_CHECK_TIMEOUT = 60.0
+
     def __init__(self, settings: Any | None = None) -> None:
         """Initialize session manager with settings."""
         self.settings = settings
         self.providers: dict[str, BaseProvider] = {}
         self.sessions: dict[str, SessionInfo] = {}
+        self.check_ttl = timedelta(
+            minutes=self._setting("session_check_ttl_minutes", self.DEFAULT_CHECK_TTL_MINUTES)
+        )
+        self.check_timeout = self._setting("session_check_timeout", self.DEFAULT_CHECK_TIMEOUT)
+
+    def _setting(self, name: str, default: float) -> float:
+        """Read a numeric setting, falling back to default when unset."""
+        value = getattr(self.settings, name, None)
+        return float(value) if isinstance(value, int | float) and not isinstance(value, bool) else default
 
     def register_provider(self, name: str, provider: BaseProvider) -> None:
         """Register a provider with session manager."""
@@ -59,22 +74,82 @@ class SessionManager:
             error=redact_secrets(str(exc), key_hint="error"),
         )
 
-    async def check_all_sessions(self) -> dict[str, bool]:
+    def _precheck(self, name: str, provider: BaseProvider) -> bool | None:
         """
-        Check all provider sessions.
+        Decide a session's validity from stored state, without a browser.
+
+        Args:
+            name: Provider name
+            provider: Provider instance
+
+        Returns:
+            False if cookies are missing or all expired, True if the session
+            was validated within the TTL, None if a browser probe is needed
+        """
+        storage = getattr(provider, "_storage", None)
+        if not isinstance(storage, CookieStorage):
+            return None
+
+        try:
+            if not storage.session_exists() or not storage.has_unexpired_cookies():
+                logger.info(f"Session for {name} has no unexpired cookies, skipping browser check")
+                return False
+
+            metadata = storage.load_metadata()
+            if metadata is None or not metadata.is_valid or self.check_ttl <= timedelta(0):
+                return None
+            last_validated = datetime.fromisoformat(metadata.last_validated)
+            if last_validated.tzinfo is None:
+                last_validated = last_validated.replace(tzinfo=UTC)
+        except Exception as exc:
+            self._log_provider_error("precheck_session", name, exc)
+            return None
+
+        if datetime.now(UTC) - last_validated <= self.check_ttl:
+            logger.debug(f"Session for {name} validated at {metadata.last_validated}, skipping browser check")
+            return True
+        return None
+
+    async def check_session(self, name: str, force: bool = False) -> bool:
+        """
+        Check one provider session.
+
+        Stored cookie expiry and a recent validation are checked first; the
+        browser probe only runs when they are inconclusive, and is bounded
+        by the check timeout.
+
+        Args:
+            name: Registered provider name
+            force: Always run the browser probe
+
+        Returns:
+            True if the session is valid
+        """
+        provider = self.providers[name]
+        if not force:
+            cached = self._precheck(name, provider)
+            if cached is not None:
+                return cached
+
+        try:
+            return bool(await asyncio.wait_for(provider.check_session(), timeout=self.check_timeout))
+        except Exception as exc:
+            self._log_provider_error("check_session", name, exc)
+            return False
+
+    async def check_all_sessions(self, force: bool = False) -> dict[str, bool]:
+        """
+        Check all provider sessions concurrently.
+
+        Args:
+            force: Always run browser probes, ignoring recent validations
 
         Returns:
             Dict mapping provider name to session validity
         """
-        results = {}
-        for name, provider in self.providers.items():
-            try:
-                is_valid = await provider.check_session()
-                results[name] = is_valid
-            except Exception as exc:
-                self._log_provider_error("check_session", name, exc)
-                results[name] = False
-        return results
+        names = list(self.providers)
+        results = await asyncio.gather(*(self.check_session(name, force) for name in names))
+        return dict(zip(names, results, strict=True))
 
     async def login_all_expired(self) -> None:
         """
@@ -119,14 +194,11 @@ class SessionManager:
         if preferred_order is None:
             preferred_order = list(self.providers.keys())
 
-        for name in preferred_order:
-            if name in self.providers:
-                provider = self.providers[name]
-                try:
-                    is_valid = await provider.check_session()
-                except Exception as exc:
-                    self._log_provider_error("check_session", name, exc)
-                    continue
-                if is_valid:
-                    return provider
+        # Probe all candidates at once (probes are not cancelled mid-browser),
+        # then take the first valid one in preference order
+        names = [name for name in dict.fromkeys(preferred_order) if name in self.providers]
+        results = await asyncio.gather(*(self.check_session(name) for name in names))
+        for name, is_valid in zip(names, results, strict=True):
+            if is_valid:
+                return self.providers[name]
         return None
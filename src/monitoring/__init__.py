@@ -6,11 +6,22 @@ This module provides:
 - FR-5: Cost calculation with provider pricing
 - US-3: Real-time token monitoring
 - US-4: Budget alerts
+- Persistent usage ledger with hourly/daily rollups
+- Sliding-window budget admission control
+- Provider health (latency, success rate, circuit state) for routing
 """
 
+from monitoring.budget import AdmissionAction, AdmissionDecision, BudgetGuard, get_budget_guard
 from monitoring.calculator import CostCalculator, PricingConfig
+from monitoring.health import (
+    CircuitState,
+    ProviderHealth,
+    ProviderHealthTracker,
+    get_provider_health,
+)
+from monitoring.ledger import UsageLedger, get_usage_ledger
 from monitoring.stats import StatsCollector, UsageSummary
-from monitoring.tracker import TokenTracker, TokenUsage
+from monitoring.tracker import TokenTracker, TokenUsage, UsageColumns, UsageTotals
 
 __all__ = [
     "TokenTracker",
@@ -19,4 +30,16 @@ __all__ = [
     "PricingConfig",
     "StatsCollector",
     "UsageSummary",
+    "UsageLedger",
+    "UsageTotals",
+    "UsageColumns",
+    "get_usage_ledger",
+    "BudgetGuard",
+    "AdmissionAction",
+    "AdmissionDecision",
+    "get_budget_guard",
+    "ProviderHealth",
+    "ProviderHealthTracker",
+    "CircuitState",
+    "get_provider_health",
 ]
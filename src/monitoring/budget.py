@@ -0,0 +1,317 @@
+"""
+Sliding-window budget enforcement.
+
+A BudgetGuard keeps one RollingWindow per budget period (last 1, 7 and 30
+days). Each window holds a fixed number of spending buckets plus a running
+sum, so checking a budget is O(1): buckets that fall out of the window are
+dropped from the front as time moves on.
+
+Before a request runs, admit() estimates its cost from the prompt's tokens
+and the average output size seen for that provider and task, then:
+- allows it, reserving the estimate until settle() records the real cost
+- defers it when enough spending ages out of the window within max_defer
+- rejects it otherwise
+
+Reservations count against every window, so concurrent batch workers
+cannot collectively overshoot a budget.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+from core.models import AgentType
+from monitoring.calculator import CostCalculator
+from monitoring.tracker import BudgetConfig, TokenTracker, TokenUsage
+
+DAY = 86400.0
+WINDOW_BUCKETS = 24
+DEFAULT_OUTPUT_TOKENS = 1000
+
+
+class AdmissionAction(StrEnum):
+    """What to do with a request before it runs."""
+
+    ALLOW = "allow"
+    DEFER = "defer"
+    REJECT = "reject"
+
+
+@dataclass
+class AdmissionDecision:
+    """
+    Result of a budget admission check.
+
+    Attributes:
+        action: Allow, defer or reject
+        estimated_cost: Estimated request cost in USD (reserved when allowed)
+        period: Budget period that blocked the request
+        retry_after: Seconds to wait before retrying a deferred request
+    """
+
+    action: AdmissionAction
+    estimated_cost: float
+    period: str | None = None
+    retry_after: float = 0.0
+
+
+class RollingWindow:
+    """
+    Spending over the last ``seconds`` seconds, in fixed-size buckets.
+
+    Bucket boundaries are aligned to the epoch, and a bucket leaves the
+    window only once all of it is older than the window, so spending is
+    never under-counted.
+    """
+
+    def __init__(self, period: str, seconds: float, limit: float, buckets: int = WINDOW_BUCKETS) -> None:
+        """
+        Initialize window.
+
+        Args:
+            period: Budget period name (daily, weekly, monthly)
+            seconds: Window length
+            limit: Budget in USD
+            buckets: Number of buckets the window is divided into
+        """
+        self.period = period
+        self.seconds = seconds
+        self.limit = limit
+        self.bucket_seconds = seconds / buckets
+        self.spent = 0.0
+        self.reserved = 0.0
+        self._buckets: deque[list[float]] = deque()
+
+    def bucket_start(self, moment: float) -> float:
+        """Get the start of the bucket holding a moment."""
+        return moment - moment % self.bucket_seconds
+
+    def add(self, cost: float, moment: float) -> None:
+        """
+        Add spending at a moment (at or after the last added moment).
+
+        Args:
+            cost: Cost in USD
+            moment: Epoch seconds
+        """
+        start = self.bucket_start(moment)
+        if self._buckets and self._buckets[-1][0] == start:
+            self._buckets[-1][1] += cost
+        else:
+            self._buckets.append([start, cost])
+        self.spent += cost
+
+    def expire(self, now: float) -> None:
+        """Drop buckets that lie entirely outside the window."""
+        while self._buckets and self._buckets[0][0] + self.bucket_seconds <= now - self.seconds:
+            self.spent -= self._buckets.popleft()[1]
+        if not self._buckets:
+            self.spent = 0.0
+
+    def wait_for(self, amount: float, now: float) -> float | None:
+        """
+        Get how long until ``amount`` more fits under the limit.
+
+        Args:
+            amount: Additional spending in USD
+            now: Epoch seconds
+
+        Returns:
+            0.0 if it fits now, seconds until old spending ages out enough,
+            or None if it cannot fit even in an empty window
+        """
+        excess = self.spent + self.reserved + amount - self.limit
+        if excess <= 0:
+            return 0.0
+        if self.reserved + amount > self.limit:
+            return None
+        for start, cost in self._buckets:
+            excess -= cost
+            if excess <= 0:
+                return max(0.0, start + self.bucket_seconds + self.seconds - now)
+        return None
+
+
+class BudgetGuard:
+    """
+    Admission control against daily, weekly and monthly budgets.
+
+    Periods with a budget of zero or less are not enforced.
+    """
+
+    def __init__(
+        self,
+        config: BudgetConfig | None = None,
+        max_defer: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize guard.
+
+        Args:
+            config: Budget limits
+            max_defer: Longest wait (seconds) before a request is rejected instead
+            clock: Source of epoch seconds
+        """
+        self.config = config or BudgetConfig()
+        self.max_defer = max_defer
+        self.clock = clock
+        self.calculator = CostCalculator()
+        self.windows = [
+            RollingWindow(period, days * DAY, limit)
+            for period, days, limit in (
+                ("daily", 1, self.config.daily_budget),
+                ("weekly", 7, self.config.weekly_budget),
+                ("monthly", 30, self.config.monthly_budget),
+            )
+            if limit > 0
+        ]
+        self._lock = threading.Lock()
+        # Running (output tokens, responses) per (provider, task) and per provider
+        self._task_outputs: dict[tuple[str, str], list[int]] = {}
+        self._provider_outputs: dict[str, list[int]] = {}
+
+    @classmethod
+    def from_tracker(
+        cls,
+        tracker: TokenTracker,
+        config: BudgetConfig | None = None,
+        max_defer: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> "BudgetGuard":
+        """
+        Build a guard seeded with a tracker's spending and output sizes.
+
+        Args:
+            tracker: Tracker (usually ledger-backed) holding past usage
+            config: Budget limits (default: the tracker's)
+            max_defer: Longest wait (seconds) before a request is rejected instead
+            clock: Source of epoch seconds
+
+        Returns:
+            BudgetGuard
+        """
+        guard = cls(config or tracker.budget_config, max_defer=max_defer, clock=clock)
+        now = clock()
+        for window in guard.windows:
+            start = window.bucket_start(now - window.seconds)
+            while start <= now:
+                end = start + window.bucket_seconds
+                cost = tracker.cost(since=datetime.fromtimestamp(start), until=datetime.fromtimestamp(end))
+                if cost:
+                    window.add(cost, start)
+                start = end
+        for entry in tracker.totals():
+            outputs = guard._provider_outputs.setdefault(entry.provider, [0, 0])
+            outputs[0] += entry.output_tokens
+            outputs[1] += entry.requests
+        return guard
+
+    def estimate(self, provider: AgentType, task: str, prompt_tokens: int) -> float:
+        """
+        Estimate a request's cost.
+
+        Output size is the average seen for the provider and task, else for
+        the provider, else DEFAULT_OUTPUT_TOKENS.
+
+        Args:
+            provider: Provider the request goes to
+            task: Task identifier
+            prompt_tokens: Input token count
+
+        Returns:
+            Estimated cost in USD
+        """
+        history = self._task_outputs.get((str(provider), task)) or self._provider_outputs.get(str(provider))
+        output_tokens = history[0] / history[1] if history and history[1] else DEFAULT_OUTPUT_TOKENS
+        return self.calculator.calculate_cost(prompt_tokens, int(output_tokens), provider)
+
+    def admit(self, provider: AgentType, task: str, prompt_tokens: int) -> AdmissionDecision:
+        """
+        Decide whether a request may run now.
+
+        An allowed request's estimated cost is reserved until settle().
+
+        Args:
+            provider: Provider the request goes to
+            task: Task identifier
+            prompt_tokens: Input token count
+
+        Returns:
+            AdmissionDecision
+        """
+        cost = self.estimate(provider, task, prompt_tokens)
+        now = self.clock()
+        with self._lock:
+            longest_wait = 0.0
+            blocking: str | None = None
+            for window in self.windows:
+                window.expire(now)
+                wait = window.wait_for(cost, now)
+                if wait is None or wait > self.max_defer:
+                    return AdmissionDecision(AdmissionAction.REJECT, cost, period=window.period)
+                if wait > longest_wait:
+                    longest_wait, blocking = wait, window.period
+            if blocking is not None:
+                return AdmissionDecision(AdmissionAction.DEFER, cost, period=blocking, retry_after=longest_wait)
+            for window in self.windows:
+                window.reserved += cost
+        return AdmissionDecision(AdmissionAction.ALLOW, cost)
+
+    def settle(self, decision: AdmissionDecision | None, usage: TokenUsage | None = None) -> None:
+        """
+        Release a reservation and record the request's actual usage.
+
+        Args:
+            decision: Decision returned by admit() (None if none was made)
+            usage: Actual usage, or None if the request did not run
+        """
+        now = self.clock()
+        with self._lock:
+            for window in self.windows:
+                if decision is not None and decision.action == AdmissionAction.ALLOW:
+                    window.reserved = max(0.0, window.reserved - decision.estimated_cost)
+                if usage is not None:
+                    window.expire(now)
+                    window.add(usage.estimated_cost, now)
+            if usage is not None:
+                for outputs in (
+                    self._task_outputs.setdefault((str(usage.provider), usage.task), [0, 0]),
+                    self._provider_outputs.setdefault(str(usage.provider), [0, 0]),
+                ):
+                    outputs[0] += usage.output_tokens
+                    outputs[1] += 1
+
+
+_shared_guard: BudgetGuard | None = None
+
+
+def get_budget_guard(settings: Any, tracker: TokenTracker | None = None) -> BudgetGuard | None:
+    """
+    Get the process-wide guard, so budgets hold across routers (e.g. in batch runs).
+
+    Args:
+        settings: Application settings
+        tracker: Tracker to seed past spending from (usually ledger-backed)
+
+    Returns:
+        Shared BudgetGuard, or None if disabled in settings
+    """
+    global _shared_guard
+    if getattr(settings, "enable_budget_guard", False) is not True:
+        return None
+    if _shared_guard is None:
+        config = BudgetConfig(
+            daily_budget=settings.budget_daily_usd,
+            weekly_budget=settings.budget_weekly_usd,
+            monthly_budget=settings.budget_monthly_usd,
+        )
+        _shared_guard = BudgetGuard.from_tracker(
+            tracker or TokenTracker(), config=config, max_defer=settings.budget_max_defer_seconds
+        )
+    return _shared_guard
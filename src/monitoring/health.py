@@ -0,0 +1,301 @@
+"""
+Provider health for latency-aware routing.
+
+A ProviderHealthTracker keeps, per provider:
+- an EWMA of response time and of success (1 per success, 0 per failure)
+- the number of requests in flight
+- a circuit that opens after consecutive failures and, once its timeout
+  has passed, lets a single probe through (half-open)
+
+For provider-flexible tasks the router asks choose() for the candidate
+with the lowest expected completion time: EWMA latency times the requests
+queued ahead, divided by the success rate (failed attempts are retried).
+The mapped provider keeps a task unless another candidate is clearly
+faster, so similar providers do not flap.
+
+When a ledger is given, health is loaded from it and saved after every
+update, so it survives restarts and `aigenflow stats` can show it.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from core.logger import get_logger
+from core.models import AgentType
+
+if TYPE_CHECKING:
+    from monitoring.ledger import UsageLedger
+
+logger = get_logger(__name__)
+
+# Latency assumed for providers without samples
+DEFAULT_LATENCY = 60.0
+# Floor for the success rate so a failing provider's expected time stays finite
+MIN_SUCCESS_RATE = 0.05
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state of a provider."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProviderHealth:
+    """
+    Health of one provider.
+
+    Attributes:
+        provider: Provider name
+        latency: EWMA response time in seconds (None until the first response)
+        success_rate: EWMA of successful responses (0.0 - 1.0)
+        requests: Responses observed
+        failures: Failed responses observed
+        consecutive_failures: Failures since the last success
+        state: Circuit state
+        opened_at: Epoch seconds the circuit last opened
+        in_flight: Requests currently running (not persisted)
+    """
+
+    provider: str
+    latency: float | None = None
+    success_rate: float = 1.0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    state: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    in_flight: int = 0
+
+    def expected_completion(self, default_latency: float = DEFAULT_LATENCY) -> float:
+        """
+        Estimate seconds until a new request would complete successfully.
+
+        Args:
+            default_latency: Latency assumed while there are no samples
+
+        Returns:
+            Expected completion time in seconds
+        """
+        latency = self.latency if self.latency is not None else default_latency
+        return latency * (self.in_flight + 1) / max(self.success_rate, MIN_SUCCESS_RATE)
+
+
+class HealthProbe:
+    """Handle yielded by ProviderHealthTracker.observe() to report the response."""
+
+    def __init__(self) -> None:
+        self.success: bool | None = None
+
+    def record(self, response: Any) -> None:
+        self.success = bool(getattr(response, "success", True))
+
+
+class ProviderHealthTracker:
+    """
+    Per-provider latency, success rate and circuit state.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        circuit_threshold: int = 3,
+        circuit_timeout: float = 300.0,
+        switch_margin: float = 0.8,
+        default_latency: float = DEFAULT_LATENCY,
+        ledger: "UsageLedger | None" = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            alpha: EWMA weight of the newest observation
+            circuit_threshold: Consecutive failures before the circuit opens
+            circuit_timeout: Seconds an open circuit waits before a probe
+            switch_margin: Fraction of the mapped provider's expected time
+                another candidate must beat to take the task
+            default_latency: Latency assumed for providers without samples
+            ledger: Ledger health is loaded from and saved to
+            clock: Source of epoch seconds
+        """
+        self.alpha = alpha
+        self.circuit_threshold = circuit_threshold
+        self.circuit_timeout = circuit_timeout
+        self.switch_margin = switch_margin
+        self.default_latency = default_latency
+        self.ledger = ledger
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._health: dict[str, ProviderHealth] = {}
+        if ledger is not None:
+            self._health = {health.provider: health for health in ledger.load_health()}
+
+    def _get(self, provider: AgentType | str) -> ProviderHealth:
+        health = self._health.get(str(provider))
+        if health is None:
+            health = self._health[str(provider)] = ProviderHealth(provider=str(provider))
+        return health
+
+    def _available(self, health: ProviderHealth) -> bool:
+        if health.state == CircuitState.OPEN and self.clock() - health.opened_at >= self.circuit_timeout:
+            health.state = CircuitState.HALF_OPEN
+        if health.state == CircuitState.HALF_OPEN:
+            # One probe at a time
+            return health.in_flight == 0
+        return health.state == CircuitState.CLOSED
+
+    def is_available(self, provider: AgentType | str) -> bool:
+        """
+        Check whether a provider's circuit lets a request through.
+
+        Args:
+            provider: Provider to check
+
+        Returns:
+            True if closed, or half-open with no probe running
+        """
+        with self._lock:
+            return self._available(self._get(provider))
+
+    def record(self, provider: AgentType | str, latency: float, success: bool) -> None:
+        """
+        Record a provider response.
+
+        Args:
+            provider: Provider that responded
+            latency: Response time in seconds
+            success: Whether the response succeeded
+        """
+        with self._lock:
+            health = self._get(provider)
+            health.requests += 1
+            health.latency = latency if health.latency is None else (
+                self.alpha * latency + (1 - self.alpha) * health.latency
+            )
+            health.success_rate = self.alpha * float(success) + (1 - self.alpha) * health.success_rate
+            if success:
+                health.consecutive_failures = 0
+                if health.state != CircuitState.CLOSED:
+                    logger.info(f"Circuit closed for {health.provider}")
+                health.state = CircuitState.CLOSED
+            else:
+                health.failures += 1
+                health.consecutive_failures += 1
+                if health.state == CircuitState.HALF_OPEN or (
+                    health.state == CircuitState.CLOSED
+                    and health.consecutive_failures >= self.circuit_threshold
+                ):
+                    health.state = CircuitState.OPEN
+                    health.opened_at = self.clock()
+                    logger.warning(
+                        f"Circuit opened for {health.provider} "
+                        f"after {health.consecutive_failures} consecutive failures"
+                    )
+            saved = replace(health)
+
+        if self.ledger is None:
+            return
+        try:
+            self.ledger.save_health(saved)
+        except sqlite3.Error as exc:
+            logger.warning(f"Failed to save health for {saved.provider}: {exc}")
+
+    @contextmanager
+    def observe(self, provider: AgentType | str) -> Iterator[HealthProbe]:
+        """
+        Count a request as in flight and record its latency and outcome.
+
+        The outcome is a failure if the block raises or ends without
+        calling record(). Cancelled requests are recorded only if their
+        response was already reported.
+        """
+        with self._lock:
+            self._get(provider).in_flight += 1
+        probe = HealthProbe()
+        started = time.monotonic()
+        try:
+            yield probe
+        except (asyncio.CancelledError, GeneratorExit):
+            if probe.success is not None:
+                self.record(provider, time.monotonic() - started, success=probe.success)
+            raise
+        except BaseException:
+            self.record(provider, time.monotonic() - started, success=False)
+            raise
+        else:
+            self.record(provider, time.monotonic() - started, success=probe.success is True)
+        finally:
+            with self._lock:
+                health = self._get(provider)
+                health.in_flight = max(0, health.in_flight - 1)
+
+    def choose(self, candidates: Sequence[AgentType]) -> AgentType:
+        """
+        Pick the candidate with the best expected completion time.
+
+        Args:
+            candidates: Allowed providers, the mapped provider first
+
+        Returns:
+            Chosen provider (the first candidate if every circuit is open)
+        """
+        preferred = candidates[0]
+        with self._lock:
+            available = [candidate for candidate in candidates if self._available(self._get(candidate))]
+            if not available:
+                return preferred
+            expected = {
+                candidate: self._get(candidate).expected_completion(self.default_latency)
+                for candidate in available
+            }
+        best = min(available, key=expected.__getitem__)
+        if preferred in expected and expected[best] > expected[preferred] * self.switch_margin:
+            return preferred
+        return best
+
+    def snapshot(self) -> list[ProviderHealth]:
+        """
+        Current health of every observed provider.
+
+        Returns:
+            Copies of the health records, sorted by provider
+        """
+        with self._lock:
+            return [replace(self._health[name]) for name in sorted(self._health)]
+
+
+_shared_health: ProviderHealthTracker | None = None
+
+
+def get_provider_health(settings: Any, ledger: "UsageLedger | None" = None) -> ProviderHealthTracker | None:
+    """
+    Get the process-wide tracker, so health is shared across routers (e.g. in batch runs).
+
+    Args:
+        settings: Application settings
+        ledger: Ledger to persist health in
+
+    Returns:
+        Shared ProviderHealthTracker, or None if disabled in settings
+    """
+    global _shared_health
+    if getattr(settings, "enable_health_routing", False) is not True:
+        return None
+    if _shared_health is None:
+        _shared_health = ProviderHealthTracker(
+            alpha=settings.health_ewma_alpha,
+            circuit_threshold=settings.health_circuit_threshold,
+            circuit_timeout=settings.health_circuit_timeout_seconds,
+            ledger=ledger,
+        )
+    return _shared_health
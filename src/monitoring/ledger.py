@@ -0,0 +1,314 @@
+"""
+Persistent usage ledger.
+
+Every agent response is recorded as one compact row in SQLite
+(~/.aigenflow/usage/usage.db by default). Hourly and daily rollups keyed by
+provider and phase are updated in the same transaction as the insert, so
+period queries never rescan raw rows:
+- Whole days in the range are read from the daily rollup
+- Whole hours at either edge are read from the hourly rollup
+- Only the partial hours at the very edges touch raw rows
+
+Provider health used for routing is kept in the same database, one row
+per provider.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from monitoring.health import CircuitState, ProviderHealth
+from monitoring.tracker import TokenUsage, UsageTotals
+
+logger = get_logger(__name__)
+
+DEFAULT_LEDGER_PATH = Path("~/.aigenflow/usage/usage.db").expanduser()
+
+HOUR = 3600
+DAY = 86400
+
+# Upper bound for open-ended queries (far beyond any recorded timestamp)
+_FAR_FUTURE = float(2**40)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    ts REAL NOT NULL,
+    provider TEXT NOT NULL,
+    phase INTEGER NOT NULL,
+    task TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_usage_ts ON usage(ts);
+CREATE TABLE IF NOT EXISTS usage_rollup (
+    granularity TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    provider TEXT NOT NULL,
+    phase INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost REAL NOT NULL,
+    requests INTEGER NOT NULL,
+    PRIMARY KEY (granularity, bucket, provider, phase)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS provider_health (
+    provider TEXT PRIMARY KEY,
+    latency REAL,
+    success_rate REAL NOT NULL,
+    requests INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    consecutive_failures INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    opened_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_INSERT = (
+    "INSERT INTO usage (ts, provider, phase, task, input_tokens, output_tokens, cost) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_ROLLUP = (
+    "INSERT INTO usage_rollup "
+    "(granularity, bucket, provider, phase, input_tokens, output_tokens, cost, requests) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, 1) "
+    "ON CONFLICT (granularity, bucket, provider, phase) DO UPDATE SET "
+    "input_tokens = input_tokens + excluded.input_tokens, "
+    "output_tokens = output_tokens + excluded.output_tokens, "
+    "cost = cost + excluded.cost, "
+    "requests = requests + 1"
+)
+
+_HEALTH_COLUMNS = "provider, latency, success_rate, requests, failures, consecutive_failures, state, opened_at"
+
+_SUM_COLUMNS = "provider, phase, SUM(input_tokens), SUM(output_tokens), SUM(cost)"
+
+
+def _floor(value: float, size: int) -> float:
+    return value - value % size
+
+
+def _ceil(value: float, size: int) -> float:
+    return -(-value // size) * size
+
+
+def _segments(start: float, end: float) -> list[tuple[str, float, float]]:
+    """
+    Split [start, end) into raw, hourly and daily pieces.
+
+    Returns:
+        (source, start, end) triples; source is "raw", "hour" or "day"
+    """
+    if end <= start:
+        return []
+    hour_start, hour_end = _ceil(start, HOUR), _floor(end, HOUR)
+    if hour_start >= hour_end:
+        return [("raw", start, end)]
+
+    day_start, day_end = _ceil(start, DAY), _floor(end, DAY)
+    if day_start < day_end:
+        middle = [("hour", hour_start, day_start), ("day", day_start, day_end), ("hour", day_end, hour_end)]
+    else:
+        middle = [("hour", hour_start, hour_end)]
+    pieces = [("raw", start, hour_start), *middle, ("raw", hour_end, end)]
+    return [piece for piece in pieces if piece[1] < piece[2]]
+
+
+class UsageLedger:
+    """
+    SQLite store of token usage with hourly and daily rollups, plus provider health.
+
+    Storage structure:
+    ~/.aigenflow/usage/
+    └── usage.db
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_LEDGER_PATH) -> None:
+        """
+        Open (and create if needed) a ledger database.
+
+        Args:
+            db_path: Ledger database file
+        """
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def record(self, usage: TokenUsage) -> None:
+        """
+        Record one usage row and update its rollups.
+
+        Args:
+            usage: Token usage record
+        """
+        self.record_many([usage])
+
+    def record_many(self, usages: Iterable[TokenUsage]) -> None:
+        """
+        Record usage rows and update their rollups in one transaction.
+
+        Args:
+            usages: Token usage records
+        """
+        rows = [self._to_row(usage) for usage in usages]
+        if not rows:
+            return
+        rollups: list[tuple[Any, ...]] = []
+        for ts, provider, phase, _task, input_tokens, output_tokens, cost in rows:
+            for granularity, size in (("hour", HOUR), ("day", DAY)):
+                bucket = int(_floor(ts, size))
+                rollups.append((granularity, bucket, provider, phase, input_tokens, output_tokens, cost))
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_INSERT, rows)
+                self._conn.executemany(_ROLLUP, rollups)
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def totals(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        provider: str | None = None,
+    ) -> list[UsageTotals]:
+        """
+        Aggregate usage in a time range by provider and phase.
+
+        Args:
+            since: Range start, inclusive (default: beginning of the ledger)
+            until: Range end, exclusive (default: no upper bound)
+            provider: Only this provider
+
+        Returns:
+            One entry per (provider, phase) with usage in the range
+        """
+        start = since.timestamp() if since is not None else 0.0
+        end = until.timestamp() if until is not None else _FAR_FUTURE
+        provider_clause = " AND provider = ?" if provider else ""
+        provider_params: tuple[Any, ...] = (provider,) if provider else ()
+
+        totals: dict[tuple[str, int], UsageTotals] = {}
+        with self._lock:
+            for source, low, high in _segments(start, end):
+                if source == "raw":
+                    rows = self._conn.execute(
+                        f"SELECT {_SUM_COLUMNS}, COUNT(*) FROM usage "
+                        f"WHERE ts >= ? AND ts < ?{provider_clause} GROUP BY provider, phase",
+                        (low, high, *provider_params),
+                    ).fetchall()
+                else:
+                    rows = self._conn.execute(
+                        f"SELECT {_SUM_COLUMNS}, SUM(requests) FROM usage_rollup "
+                        f"WHERE granularity = ? AND bucket >= ? AND bucket < ?{provider_clause} "
+                        "GROUP BY provider, phase",
+                        (source, low, high, *provider_params),
+                    ).fetchall()
+                for name, phase, input_tokens, output_tokens, cost, requests in rows:
+                    entry = totals.setdefault((name, phase), UsageTotals(provider=name, phase=phase))
+                    entry.input_tokens += input_tokens
+                    entry.output_tokens += output_tokens
+                    entry.cost += cost
+                    entry.requests += requests
+        return sorted(totals.values(), key=lambda entry: (entry.provider, entry.phase))
+
+    def save_health(self, health: ProviderHealth) -> None:
+        """
+        Save a provider's health, replacing its previous row.
+
+        Args:
+            health: Provider health
+        """
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO provider_health ({_HEALTH_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    health.provider,
+                    health.latency,
+                    health.success_rate,
+                    health.requests,
+                    health.failures,
+                    health.consecutive_failures,
+                    health.state.value,
+                    health.opened_at,
+                ),
+            )
+
+    def load_health(self) -> list[ProviderHealth]:
+        """
+        Load the saved health of every provider.
+
+        Returns:
+            Provider health records, sorted by provider
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_HEALTH_COLUMNS} FROM provider_health ORDER BY provider"
+            ).fetchall()
+        return [
+            ProviderHealth(
+                provider=provider,
+                latency=latency,
+                success_rate=success_rate,
+                requests=requests,
+                failures=failures,
+                consecutive_failures=consecutive_failures,
+                state=CircuitState(state),
+                opened_at=opened_at,
+            )
+            for provider, latency, success_rate, requests, failures, consecutive_failures, state, opened_at in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_row(usage: TokenUsage) -> tuple[Any, ...]:
+        return (
+            usage.timestamp.timestamp(),
+            str(usage.provider),
+            usage.phase,
+            usage.task,
+            usage.input_tokens,
+            usage.output_tokens,
+            usage.estimated_cost,
+        )
+
+
+_shared_ledger: UsageLedger | None = None
+
+
+def get_usage_ledger(settings: Any) -> UsageLedger | None:
+    """
+    Get the process-wide ledger, so every router records into one database.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Shared UsageLedger, or None if disabled or no ledger path is configured
+    """
+    global _shared_ledger
+    if getattr(settings, "enable_usage_ledger", False) is not True:
+        return None
+    db_path = getattr(settings, "usage_ledger_path", None)
+    if not isinstance(db_path, Path):
+        return None
+    if _shared_ledger is None:
+        _shared_ledger = UsageLedger(db_path)
+    return _shared_ledger
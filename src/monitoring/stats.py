@@ -5,12 +5,14 @@ Provides statistics collection functionality:
 - Period-based summaries (daily, weekly, monthly)
 - Phase-based aggregation
 - CLI-friendly output format
+- Rollup-backed summaries when a persistent UsageLedger is attached
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import StrEnum
 
+from monitoring.ledger import UsageLedger
 from monitoring.tracker import TokenTracker, TokenUsage
 
 
@@ -37,6 +39,7 @@ class UsageSummary:
         by_provider: Token count by provider
         by_phase: Token count by phase
         request_count: Total number of requests
+        cost_by_provider: Cost in USD by provider
     """
 
     period: Period
@@ -47,6 +50,7 @@ class UsageSummary:
     by_provider: dict[str, int]  # provider_name -> token_count
     by_phase: dict[int, int]  # phase_number -> token_count
     request_count: int
+    cost_by_provider: dict[str, float] = field(default_factory=dict)
 
 
 class StatsCollector:
@@ -62,9 +66,16 @@ class StatsCollector:
     Reference: SPEC-ENHANCE-004 US-3
     """
 
-    def __init__(self) -> None:
-        """Initialize stats collector."""
-        self.tracker = TokenTracker()
+    def __init__(self, ledger: UsageLedger | None = None) -> None:
+        """
+        Initialize stats collector.
+
+        Args:
+            ledger: Persistent ledger to record into and summarize from
+                (records are kept in memory if None)
+        """
+        self.ledger = ledger
+        self.tracker = TokenTracker(ledger=ledger)
 
     def track(self, usage: TokenUsage) -> None:
         """
@@ -99,41 +110,27 @@ class StatsCollector:
         else:  # ALL
             start_date = datetime.min
 
-        # Filter records by period
-        filtered_records = [
-            r
-            for r in self.tracker._usage_records
-            if r.timestamp >= start_date
-        ]
-
-        # Aggregate statistics
-        total_tokens = sum(r.total_tokens for r in filtered_records)
-        total_cost = sum(r.estimated_cost for r in filtered_records)
+        # Aggregate by provider and phase (ledger rollups or in-memory columns)
+        totals = self.tracker.totals(since=None if period == Period.ALL else start_date)
 
-        # Group by provider
         by_provider: dict[str, int] = {}
-        for record in filtered_records:
-            provider_name = record.provider.value
-            by_provider[provider_name] = (
-                by_provider.get(provider_name, 0) + record.total_tokens
-            )
-
-        # Group by phase
+        cost_by_provider: dict[str, float] = {}
         by_phase: dict[int, int] = {}
-        for record in filtered_records:
-            by_phase[record.phase] = (
-                by_phase.get(record.phase, 0) + record.total_tokens
-            )
+        for entry in totals:
+            by_provider[entry.provider] = by_provider.get(entry.provider, 0) + entry.total_tokens
+            cost_by_provider[entry.provider] = cost_by_provider.get(entry.provider, 0.0) + entry.cost
+            by_phase[entry.phase] = by_phase.get(entry.phase, 0) + entry.total_tokens
 
         return UsageSummary(
             period=period,
             start_date=start_date,
             end_date=now,
-            total_tokens=total_tokens,
-            total_cost=total_cost,
+            total_tokens=sum(entry.total_tokens for entry in totals),
+            total_cost=sum(entry.cost for entry in totals),
             by_provider=by_provider,
             by_phase=by_phase,
-            request_count=len(filtered_records),
+            request_count=sum(entry.requests for entry in totals),
+            cost_by_provider=cost_by_provider,
         )
 
     def get_formatted_stats(self, period: Period = Period.ALL) -> str:
@@ -5,15 +5,28 @@ Provides token usage tracking functionality:
 - Real-time token tracking by provider
 - Session/phase-based aggregation
 - Budget alerts at thresholds (50%, 75%, 90%, 100%)
+- Columnar in-memory records, or a persistent UsageLedger
 """
 
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from core.models import AgentType
 from monitoring.calculator import CostCalculator
 
+if TYPE_CHECKING:
+    from monitoring.ledger import UsageLedger
+
+# Default pricing is read-only, so one calculator serves every record
+_default_calculator = CostCalculator()
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 @dataclass
 class TokenUsage:
@@ -45,14 +58,226 @@ class TokenUsage:
         self.total_tokens = self.input_tokens + self.output_tokens
 
         # Calculate estimated cost
-        calculator = CostCalculator()
-        self.estimated_cost = calculator.calculate_cost(
+        self.estimated_cost = _default_calculator.calculate_cost(
             input_tokens=self.input_tokens,
             output_tokens=self.output_tokens,
             provider=self.provider,
         )
 
 
+@dataclass
+class UsageTotals:
+    """Aggregated usage of one provider in one phase."""
+
+    provider: str
+    phase: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    requests: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+def _to_micros(moment: datetime) -> int:
+    """Convert a (naive, local) datetime to exact microseconds since 1970-01-01."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+class UsageColumns:
+    """
+    Column-wise store of TokenUsage records.
+
+    Each field is an ``array.array``; provider, phase and task are small-int
+    codes. totals() sums tokens per (provider, phase) in a single pass and
+    prices each group once, which equals per-record pricing because cost is
+    linear in tokens. While records arrive in time order, range queries
+    bisect the timestamp column and scan only the rows in range, cost()
+    is two lookups in a running-cost column, and unfiltered queries read
+    running totals without scanning at all.
+
+    Records are rebuilt as TokenUsage objects on indexing and iteration.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty columns."""
+        self._timestamps = array("q")
+        self._providers = array("H")
+        self._phases = array("i")
+        self._tasks = array("I")
+        self._input_tokens = array("q")
+        self._output_tokens = array("q")
+        self._cumulative_cost = array("d")
+        self._provider_values: list[Any] = []
+        self._provider_codes: dict[Any, int] = {}
+        self._task_values: list[str] = []
+        self._task_codes: dict[str, int] = {}
+        self._ordered = True
+        # Running (input_tokens, output_tokens, requests) per (provider code, phase)
+        self._running: dict[tuple[int, int], list[int]] = {}
+
+    def append(self, usage: TokenUsage) -> None:
+        """
+        Add a record.
+
+        Args:
+            usage: Token usage record
+        """
+        timestamp = _to_micros(usage.timestamp)
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            self._ordered = False
+        provider = self._code(usage.provider, self._provider_codes, self._provider_values)
+        self._timestamps.append(timestamp)
+        self._providers.append(provider)
+        self._phases.append(usage.phase)
+        self._tasks.append(self._code(usage.task, self._task_codes, self._task_values))
+        self._input_tokens.append(usage.input_tokens)
+        self._output_tokens.append(usage.output_tokens)
+        previous = self._cumulative_cost[-1] if self._cumulative_cost else 0.0
+        self._cumulative_cost.append(previous + usage.estimated_cost)
+
+        group = self._running.setdefault((provider, usage.phase), [0, 0, 0])
+        group[0] += usage.input_tokens
+        group[1] += usage.output_tokens
+        group[2] += 1
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __getitem__(self, index: int) -> TokenUsage:
+        index = range(len(self))[index]
+        return TokenUsage(
+            provider=self._provider_values[self._providers[index]],
+            input_tokens=self._input_tokens[index],
+            output_tokens=self._output_tokens[index],
+            timestamp=_EPOCH + self._timestamps[index] * _MICROSECOND,
+            phase=self._phases[index],
+            task=self._task_values[self._tasks[index]],
+        )
+
+    def __iter__(self) -> Iterator[TokenUsage]:
+        return (self[index] for index in range(len(self)))
+
+    def totals(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        provider: str | None = None,
+    ) -> list[UsageTotals]:
+        """
+        Aggregate records by provider and phase.
+
+        Args:
+            since: Range start, inclusive
+            until: Range end, exclusive
+            provider: Only this provider
+
+        Returns:
+            One entry per (provider, phase) with usage in the range
+        """
+        provider_code: int | None = None
+        if provider is not None:
+            codes = [code for code, value in enumerate(self._provider_values) if str(value) == provider]
+            if not codes:
+                return []
+            provider_code = codes[0]
+
+        if since is None and until is None:
+            groups = self._running
+        else:
+            groups = self._scan(
+                _to_micros(since) if since is not None else None,
+                _to_micros(until) if until is not None else None,
+            )
+
+        totals = [
+            UsageTotals(
+                provider=str(self._provider_values[code]),
+                phase=phase,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost=_default_calculator.calculate_cost(input_tokens, output_tokens, self._provider_values[code]),
+                requests=requests,
+            )
+            for (code, phase), (input_tokens, output_tokens, requests) in groups.items()
+            if provider_code is None or code == provider_code
+        ]
+        return sorted(totals, key=lambda entry: (entry.provider, entry.phase))
+
+    def cost(self, since: datetime | None = None, until: datetime | None = None) -> float:
+        """
+        Total cost of records in a time range.
+
+        Args:
+            since: Range start, inclusive
+            until: Range end, exclusive
+
+        Returns:
+            Cost in USD
+        """
+        if not self._ordered:
+            return sum(entry.cost for entry in self.totals(since=since, until=until))
+        low = bisect_left(self._timestamps, _to_micros(since)) if since is not None else 0
+        high = bisect_left(self._timestamps, _to_micros(until)) if until is not None else len(self)
+        if high <= low:
+            return 0.0
+        return self._cumulative_cost[high - 1] - (self._cumulative_cost[low - 1] if low else 0.0)
+
+    def _scan(self, start: int | None, end: int | None) -> dict[tuple[int, int], list[int]]:
+        """Sum (input, output, requests) per group over rows in [start, end)."""
+        low, high = 0, len(self)
+        rows: Iterator[tuple[int, int, int, int]]
+        if self._ordered:
+            if start is not None:
+                low = bisect_left(self._timestamps, start)
+            if end is not None:
+                high = bisect_left(self._timestamps, end)
+            rows = zip(
+                self._providers[low:high],
+                self._phases[low:high],
+                self._input_tokens[low:high],
+                self._output_tokens[low:high],
+                strict=True,
+            )
+        else:
+            start = start if start is not None else -(2**63)
+            end = end if end is not None else 2**63
+            rows = (
+                (code, phase, input_tokens, output_tokens)
+                for timestamp, code, phase, input_tokens, output_tokens in zip(
+                    self._timestamps,
+                    self._providers,
+                    self._phases,
+                    self._input_tokens,
+                    self._output_tokens,
+                    strict=True,
+                )
+                if start <= timestamp < end
+            )
+
+        groups: dict[tuple[int, int], list[int]] = {}
+        for code, phase, input_tokens, output_tokens in rows:
+            group = groups.get((code, phase))
+            if group is None:
+                group = groups[(code, phase)] = [0, 0, 0]
+            group[0] += input_tokens
+            group[1] += output_tokens
+            group[2] += 1
+        return groups
+
+    @staticmethod
+    def _code(value: Any, codes: dict[Any, int], values: list[Any]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+
 @dataclass
 class BudgetConfig:
     """
@@ -104,15 +329,20 @@ class TokenTracker:
     Reference: SPEC-ENHANCE-004 FR-4, US-4
     """
 
-    def __init__(self, budget_config: BudgetConfig | None = None) -> None:
+    def __init__(self, budget_config: BudgetConfig | None = None, ledger: "UsageLedger | None" = None) -> None:
         """
         Initialize token tracker.
 
         Args:
             budget_config: Budget configuration for alerts
+            ledger: Persistent ledger to record into and summarize from
+                (records are kept in memory, column-wise, if None)
         """
         self.budget_config = budget_config or BudgetConfig()
-        self._usage_records: list[TokenUsage] = []
+        self.ledger = ledger
+        self._usage_records = UsageColumns()
+        # Thresholds already alerted, per period
+        self._alerted: dict[str, set[int]] = {}
 
     def track(self, usage: TokenUsage) -> None:
         """
@@ -121,7 +351,46 @@ class TokenTracker:
         Args:
             usage: Token usage record
         """
-        self._usage_records.append(usage)
+        if self.ledger is not None:
+            self.ledger.record(usage)
+        else:
+            self._usage_records.append(usage)
+
+    def totals(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        provider: str | None = None,
+    ) -> list["UsageTotals"]:
+        """
+        Aggregate usage by provider and phase.
+
+        Args:
+            since: Range start, inclusive (default: all records)
+            until: Range end, exclusive (default: no upper bound)
+            provider: Only this provider
+
+        Returns:
+            One entry per (provider, phase) with usage in the range
+        """
+        if self.ledger is not None:
+            return self.ledger.totals(since=since, until=until, provider=provider)
+        return self._usage_records.totals(since=since, until=until, provider=provider)
+
+    def cost(self, since: datetime | None = None, until: datetime | None = None) -> float:
+        """
+        Get total cost in a time range.
+
+        Args:
+            since: Range start, inclusive (default: all records)
+            until: Range end, exclusive (default: no upper bound)
+
+        Returns:
+            Cost in USD
+        """
+        if self.ledger is not None:
+            return sum(entry.cost for entry in self.ledger.totals(since=since, until=until))
+        return self._usage_records.cost(since=since, until=until)
 
     def get_summary(self, provider: AgentType | None = None) -> dict[str, Any]:
         """
@@ -133,54 +402,27 @@ class TokenTracker:
         Returns:
             Dictionary with usage statistics
         """
-        # Filter by provider if specified
-        records = self._usage_records
-        if provider:
-            records = [r for r in records if r.provider == provider]
-
-        if not records:
-            return {
-                "total_input_tokens": 0,
-                "total_output_tokens": 0,
-                "total_tokens": 0,
-                "total_cost": 0.0,
-                "request_count": 0,
-                "by_provider": {},
-                "by_phase": {},
-            }
-
-        # Aggregate statistics
-        total_input = sum(r.input_tokens for r in records)
-        total_output = sum(r.output_tokens for r in records)
-        total_cost = sum(r.estimated_cost for r in records)
-
-        # Group by provider
-        by_provider: dict[AgentType, dict[str, Any]] = {}
-        for record in records:
-            if record.provider not in by_provider:
-                by_provider[record.provider] = {
-                    "total_tokens": 0,
-                    "total_cost": 0.0,
-                    "request_count": 0,
-                }
-            by_provider[record.provider]["total_tokens"] += record.total_tokens
-            by_provider[record.provider]["total_cost"] += record.estimated_cost
-            by_provider[record.provider]["request_count"] += 1
-
-        # Group by phase
-        by_phase: dict[int, int] = {}
-        for record in records:
-            by_phase[record.phase] = by_phase.get(record.phase, 0) + record.total_tokens
+        totals = self.totals(provider=provider.value if provider else None)
 
+        # Group by provider and phase
+        by_provider: dict[str, dict[str, Any]] = {}
+        by_phase: dict[int, int] = {}
+        for entry in totals:
+            stats = by_provider.setdefault(entry.provider, {"total_tokens": 0, "total_cost": 0.0, "request_count": 0})
+            stats["total_tokens"] += entry.total_tokens
+            stats["total_cost"] += entry.cost
+            stats["request_count"] += entry.requests
+            by_phase[entry.phase] = by_phase.get(entry.phase, 0) + entry.total_tokens
+
+        total_input = sum(entry.input_tokens for entry in totals)
+        total_output = sum(entry.output_tokens for entry in totals)
         return {
             "total_input_tokens": total_input,
             "total_output_tokens": total_output,
             "total_tokens": total_input + total_output,
-            "total_cost": total_cost,
-            "request_count": len(records),
-            "by_provider": {
-                p.value: stats for p, stats in by_provider.items()
-            },
+            "total_cost": sum(entry.cost for entry in totals),
+            "request_count": sum(entry.requests for entry in totals),
+            "by_provider": by_provider,
             "by_phase": by_phase,
         }
 
@@ -188,41 +430,29 @@ class TokenTracker:
         """
         Check budget limits and generate alerts.
 
+        Spending of each period is the usage of the last 1, 7 and 30 days.
+        Each threshold alerts once, and again only after spending has fallen
+        back below it.
+
         Returns:
-            List of budget alerts for triggered thresholds
+            List of budget alerts for newly crossed thresholds
         """
         alerts: list[BudgetAlert] = []
-
-        # Get current spending
-        summary = self.get_summary()
-        current_cost = summary["total_cost"]
-
-        # Check daily budget
-        alerts.extend(
-            self._check_budget_thresholds(
-                current_cost=current_cost,
-                budget_limit=self.budget_config.daily_budget,
-                period="daily",
-            )
+        budgets = (
+            ("daily", 1, self.budget_config.daily_budget),
+            ("weekly", 7, self.budget_config.weekly_budget),
+            ("monthly", 30, self.budget_config.monthly_budget),
         )
-
-        # Check weekly budget (simplified - uses same current cost)
-        alerts.extend(
-            self._check_budget_thresholds(
-                current_cost=current_cost,
-                budget_limit=self.budget_config.weekly_budget,
-                period="weekly",
-            )
-        )
-
-        # Check monthly budget (simplified - uses same current cost)
-        alerts.extend(
-            self._check_budget_thresholds(
-                current_cost=current_cost,
-                budget_limit=self.budget_config.monthly_budget,
-                period="monthly",
+        now = datetime.now()
+        for period, days, budget_limit in budgets:
+            spending = self.cost(since=now - timedelta(days=days))
+            alerts.extend(
+                self._check_budget_thresholds(
+                    current_cost=spending,
+                    budget_limit=budget_limit,
+                    period=period,
+                )
             )
-        )
 
         return alerts
 
@@ -241,7 +471,7 @@ class TokenTracker:
             period: Period name (daily, weekly, monthly)
 
         Returns:
-            List of alerts for triggered thresholds
+            List of alerts for thresholds crossed since the last check
         """
         alerts: list[BudgetAlert] = []
 
@@ -250,12 +480,13 @@ class TokenTracker:
 
         usage_percentage = (current_cost / budget_limit) * 100
 
-        # Check each threshold
+        # Thresholds alerted before stay quiet until spending drops below them
+        alerted = self._alerted.setdefault(period, set())
         for threshold in self.budget_config.alert_thresholds:
-            # Check if we've crossed this threshold
-            if usage_percentage >= threshold:
-                # Check if we haven't already alerted for this threshold
-                # (In production, you'd track alerted thresholds)
+            if usage_percentage < threshold:
+                alerted.discard(threshold)
+            elif threshold not in alerted:
+                alerted.add(threshold)
                 alerts.append(
                     BudgetAlert(
                         threshold=threshold,
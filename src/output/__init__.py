@@ -2,7 +2,8 @@
 Output modules.
 """
 
-from .formatter import FileExporter, MarkdownFormatter
+from .export import DocumentExporter
+from .formatter import FileExporter, MarkdownFormatter, PartialOutputWriter
 from .formatters import (
     DocxFormatter,
     OutputFormat,
@@ -10,13 +11,18 @@ from .formatters import (
     PdfFormatter,
     get_formatter,
 )
+from .markdown_ir import MarkdownDocument, parse_markdown
 
 __all__ = [
     "MarkdownFormatter",
     "FileExporter",
+    "PartialOutputWriter",
     "OutputFormatter",
     "OutputFormat",
     "DocxFormatter",
     "PdfFormatter",
     "get_formatter",
+    "DocumentExporter",
+    "MarkdownDocument",
+    "parse_markdown",
 ]
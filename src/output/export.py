@@ -0,0 +1,191 @@
+"""
+Parallel multi-format document export.
+
+The final document is parsed once into the Markdown IR. DOCX and PDF are
+rendered from it in a shared process pool, so reportlab's CPU time does not
+block the event loop, while the Markdown file is written concurrently.
+Every file is written to a temporary name and renamed into place, so
+readers never see a partially written document.
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from output.formatters import MarkdownFormatter, OutputFormat, get_formatter
+from output.markdown_ir import MarkdownDocument, parse_markdown
+
+logger = get_logger(__name__)
+
+DEFAULT_RENDER_WORKERS = 2
+
+_render_pool: Executor | None = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> Executor:
+    """
+    Get the process-wide renderer pool.
+
+    Falls back to a thread pool where worker processes cannot be started.
+
+    Returns:
+        Shared executor for document rendering
+    """
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            try:
+                _render_pool = ProcessPoolExecutor(max_workers=DEFAULT_RENDER_WORKERS)
+            except (OSError, NotImplementedError) as exc:
+                logger.warning(f"Process pool unavailable, rendering documents in threads: {exc}")
+                _render_pool = ThreadPoolExecutor(max_workers=DEFAULT_RENDER_WORKERS)
+        return _render_pool
+
+
+def write_atomic(path: Path, data: str | bytes) -> Path:
+    """
+    Write a file through a temporary file and rename.
+
+    Args:
+        path: Destination path
+        data: Text (UTF-8) or bytes
+
+    Returns:
+        Destination path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if isinstance(data, bytes):
+            temp_path.write_bytes(data)
+        else:
+            temp_path.write_text(data, encoding="utf-8")
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return path
+
+
+def expand_formats(formats: Iterable[OutputFormat | str]) -> list[OutputFormat]:
+    """
+    Resolve requested formats, expanding ALL.
+
+    Args:
+        formats: OutputFormat values or strings
+
+    Returns:
+        Distinct concrete formats in a stable order
+
+    Raises:
+        ValueError: If a format is unknown
+    """
+    resolved: list[OutputFormat] = []
+    for value in formats:
+        try:
+            output_format = OutputFormat(value)
+        except ValueError:
+            raise ValueError(f"Unknown output format: {value}") from None
+        targets = [OutputFormat.MARKDOWN, OutputFormat.DOCX, OutputFormat.PDF] if output_format == OutputFormat.ALL else [output_format]
+        for target in targets:
+            if target not in resolved:
+                resolved.append(target)
+    return resolved
+
+
+def render_document(output_format: OutputFormat, document: MarkdownDocument, metadata: dict[str, Any] | None) -> bytes:
+    """
+    Render a parsed document (runs in a renderer process).
+
+    Args:
+        output_format: DOCX or PDF
+        document: Parsed Markdown document
+        metadata: Optional metadata (title, author, date)
+
+    Returns:
+        Rendered file content
+    """
+    return get_formatter(output_format).render(document, metadata)
+
+
+class DocumentExporter:
+    """
+    Exports one Markdown document to several formats concurrently.
+    """
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        """
+        Initialize exporter.
+
+        Args:
+            executor: Executor running renderers (default: shared process pool)
+        """
+        self.executor = executor
+
+    async def export(
+        self,
+        content: str,
+        output_dir: Path,
+        filename: str,
+        formats: Iterable[OutputFormat | str],
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[OutputFormat, Path]:
+        """
+        Write the document in every requested format.
+
+        A format that fails to render is logged and left out of the result.
+
+        Args:
+            content: Markdown document
+            output_dir: Directory to write into
+            filename: File stem
+            formats: Requested formats (ALL expands to md, docx and pdf)
+            metadata: Optional metadata passed to the DOCX/PDF renderers
+
+        Returns:
+            Paths written, by format
+        """
+        targets = expand_formats(formats)
+        jobs: dict[OutputFormat, asyncio.Future[Path]] = {}
+
+        if OutputFormat.MARKDOWN in targets:
+            markdown = MarkdownFormatter().format_document(content)
+            path = output_dir / f"{filename}.{OutputFormat.MARKDOWN.value}"
+            jobs[OutputFormat.MARKDOWN] = asyncio.ensure_future(asyncio.to_thread(write_atomic, path, markdown))
+
+        binary_targets = [target for target in targets if target != OutputFormat.MARKDOWN]
+        if binary_targets:
+            document = parse_markdown(content)
+            executor = self.executor or get_render_pool()
+            for target in binary_targets:
+                path = output_dir / f"{filename}.{target.value}"
+                jobs[target] = asyncio.ensure_future(self._render_and_write(executor, target, document, metadata, path))
+
+        written: dict[OutputFormat, Path] = {}
+        results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+        for output_format, result in zip(jobs, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to export {output_format.value}: {result}")
+            else:
+                written[output_format] = result
+                logger.info(f"Exported {output_format.value}: {result}")
+        return written
+
+    async def _render_and_write(
+        self,
+        executor: Executor,
+        output_format: OutputFormat,
+        document: MarkdownDocument,
+        metadata: dict[str, Any] | None,
+        path: Path,
+    ) -> Path:
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(executor, render_document, output_format, document, metadata)
+        if not data:
+            raise RuntimeError(f"{output_format.value} renderer is not installed")
+        return await asyncio.to_thread(write_atomic, path, data)
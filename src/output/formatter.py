@@ -3,6 +3,7 @@ Output formatting and export modules.
 """
 
 import json
+import time
 from pathlib import Path
 from typing import Any
 
@@ -46,3 +47,62 @@ class FileExporter:
             f.write(content)
         logger.info(f"Saved Markdown: {file_path}")
         return file_path
+
+
+class PartialOutputWriter:
+    """
+    Mirrors streamed responses to disk while they are generated.
+
+    Files live in output_dir/partial/<name>.md and are rewritten at most once
+    per interval, so an interrupted run still leaves the text received so far.
+    """
+
+    def __init__(self, output_dir: Path, interval: float = 1.0) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            output_dir: Session output directory
+            interval: Minimum seconds between rewrites of the same file
+        """
+        self.partial_dir = output_dir / "partial"
+        self.interval = interval
+        self._last_write: dict[str, float] = {}
+
+    def write(self, name: str, text: str, force: bool = False) -> Path | None:
+        """
+        Write the text received so far.
+
+        Args:
+            name: File stem (e.g. phase1_brainstorm_chatgpt)
+            text: Full response text so far
+            force: Ignore the write interval
+
+        Returns:
+            Path written, or None if throttled
+        """
+        now = time.monotonic()
+        if not force and now - self._last_write.get(name, float("-inf")) < self.interval:
+            return None
+
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        file_path = self.partial_dir / f"{name}.md"
+        tmp_path = file_path.with_suffix(".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(file_path)
+        self._last_write[name] = now
+        return file_path
+
+    def discard(self, name: str) -> None:
+        """
+        Remove a partial file once the complete response is stored.
+
+        Args:
+            name: File stem passed to write()
+        """
+        self._last_write.pop(name, None)
+        (self.partial_dir / f"{name}.md").unlink(missing_ok=True)
+        try:
+            self.partial_dir.rmdir()
+        except OSError:
+            pass
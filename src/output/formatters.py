@@ -1,7 +1,8 @@
 """
 Output formatters for document export.
 
-Provides formatters for Markdown, DOCX, and PDF output formats.
+Provides formatters for Markdown, DOCX, and PDF output formats. DOCX and
+PDF render from the shared Markdown IR (output.markdown_ir).
 """
 
 import io
@@ -10,6 +11,7 @@ from enum import StrEnum
 from typing import Any
 
 from core.logger import get_logger
+from output.markdown_ir import BlockType, MarkdownDocument, Run, parse_markdown, plain_text
 
 logger = get_logger(__name__)
 
@@ -128,6 +130,23 @@ class DocxFormatter(OutputFormatter):
             content: Document content in Markdown
             metadata: Optional metadata (title, author, date, etc.)
 
+        Returns:
+            DOCX file content as bytes
+        """
+        return self.render(parse_markdown(content), metadata)
+
+    def render(
+        self,
+        document: MarkdownDocument,
+        metadata: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Render a parsed document as DOCX.
+
+        Args:
+            document: Parsed Markdown document
+            metadata: Optional metadata (title, author, date, etc.)
+
         Returns:
             DOCX file content as bytes
         """
@@ -151,8 +170,7 @@ class DocxFormatter(OutputFormatter):
                 doc.add_paragraph(f"Date: {metadata['date']}")
             doc.add_paragraph()  # Empty line separator
 
-        # Parse and add content
-        self._add_markdown_content(doc, content)
+        self._add_blocks(doc, document)
 
         # Write to bytes buffer
         buffer = io.BytesIO()
@@ -163,121 +181,64 @@ class DocxFormatter(OutputFormatter):
         """Get the output format."""
         return OutputFormat.DOCX
 
-    def _add_markdown_content(self, doc: Any, content: str) -> None:
+    def _add_blocks(self, doc: Any, document: MarkdownDocument) -> None:
         """
-        Parse Markdown and add to document.
+        Add parsed blocks to the document.
 
         Args:
             doc: python-docx Document object
-            content: Markdown content string
+            document: Parsed Markdown document
         """
+        from docx.shared import Pt
 
-        lines = content.split("\n")
-        in_list = False
-
-        for line in lines:
-            line = line.rstrip()
-
-            # Handle headings
-            if line.startswith("#"):
-                in_list = False
-                level = min(len(line) - len(line.lstrip("#")), 6)
-                text = line.lstrip("#").strip()
-                doc.add_heading(text, level=level)
-
-            # Handle horizontal rules
-            elif line.strip() == "---":
-                in_list = False
-                pass  # DOCX doesn't have horizontal rules
-
-            # Handle lists
-            elif line.strip().startswith(("- ", "* ", "+ ")):
-                if not in_list:
-                    in_list = True
-                text = line.strip()[2:]
-                doc.add_paragraph(text, style="List Bullet")
-
-            # Handle numbered lists
-            elif line.strip().startswith(tuple(f"{i}. " for i in range(1, 10))):
-                if not in_list:
-                    in_list = True
-                text = line.strip().split(".", 1)[1].strip()
-                doc.add_paragraph(text, style="List Number")
-
-            # Handle empty lines
-            elif not line.strip():
-                in_list = False
-                doc.add_paragraph()
-
-            # Regular paragraph
-            else:
-                in_list = False
-                # Parse inline formatting (bold, italic)
-                paragraph = doc.add_paragraph()
-                self._add_formatted_text(paragraph, line)
+        for block in document.blocks:
+            if block.type == BlockType.HEADING:
+                doc.add_heading(plain_text(block.runs), level=block.level)
+
+            elif block.type == BlockType.PARAGRAPH:
+                self._add_runs(doc.add_paragraph(), block.runs)
+
+            elif block.type in (BlockType.BULLET_LIST, BlockType.NUMBERED_LIST):
+                style = "List Bullet" if block.type == BlockType.BULLET_LIST else "List Number"
+                for item in block.items:
+                    self._add_runs(doc.add_paragraph(style=style), item)
+
+            elif block.type == BlockType.TABLE:
+                columns = max(len(row) for row in block.rows)
+                table = doc.add_table(rows=len(block.rows), cols=columns)
+                table.style = "Table Grid"
+                for row_index, row in enumerate(block.rows):
+                    for column_index, cell in enumerate(row):
+                        paragraph = table.cell(row_index, column_index).paragraphs[0]
+                        self._add_runs(paragraph, cell, bold=row_index == 0)
+
+            elif block.type == BlockType.CODE:
+                run = doc.add_paragraph().add_run(block.text)
+                run.font.name = "Courier New"
+                run.font.size = Pt(9)
 
-    def _add_formatted_text(self, paragraph: Any, text: str) -> None:
+            # Horizontal rules have no DOCX equivalent
+
+    def _add_runs(self, paragraph: Any, runs: list[Run], bold: bool = False) -> None:
         """
-        Add text with inline formatting to a paragraph.
+        Add formatted runs to a paragraph.
 
         Args:
             paragraph: python-docx Paragraph object
-            text: Text with potential inline formatting
+            runs: Inline runs
+            bold: Force bold (table headers)
         """
         from docx.shared import Pt
 
-        # Simple parsing for **bold** and *italic*
-        parts = []
-        current = ""
-        i = 0
-
-        while i < len(text):
-            # Check for bold **text**
-            if text[i:i + 2] == "**":
-                if current:
-                    parts.append(("text", current))
-                current = ""
-                i += 2
-                end = text.find("**", i)
-                if end != -1:
-                    bold_text = text[i:end]
-                    parts.append(("bold", bold_text))
-                    i = end + 2
-                else:
-                    current = "**" + text[i:]
-                    i = len(text)
-
-            # Check for italic *text*
-            elif text[i] == "*":
-                if current:
-                    parts.append(("text", current))
-                current = ""
-                i += 1
-                end = text.find("*", i)
-                if end != -1:
-                    italic_text = text[i:end]
-                    parts.append(("italic", italic_text))
-                    i = end + 1
-                else:
-                    current = "*" + text[i:]
-                    i = len(text)
-
-            else:
-                current += text[i]
-                i += 1
-
-        if current:
-            parts.append(("text", current))
-
-        # Add runs to paragraph
-        for style, content in parts:
-            if content:
-                run = paragraph.add_run(content)
-                run.font.size = Pt(11)
-                if style == "bold":
-                    run.bold = True
-                elif style == "italic":
-                    run.italic = True
+        for part in runs:
+            if not part.text:
+                continue
+            run = paragraph.add_run(part.text)
+            run.font.size = Pt(11)
+            run.bold = part.bold or bold or None
+            run.italic = part.italic or None
+            if part.code:
+                run.font.name = "Courier New"
 
 
 class PdfFormatter(OutputFormatter):
@@ -299,6 +260,23 @@ class PdfFormatter(OutputFormatter):
             content: Document content in Markdown
             metadata: Optional metadata (title, author, date, etc.)
 
+        Returns:
+            PDF file content as bytes
+        """
+        return self.render(parse_markdown(content), metadata)
+
+    def render(
+        self,
+        document: MarkdownDocument,
+        metadata: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Render a parsed document as PDF.
+
+        Args:
+            document: Parsed Markdown document
+            metadata: Optional metadata (title, author, date, etc.)
+
         Returns:
             PDF file content as bytes
         """
@@ -347,19 +325,18 @@ class PdfFormatter(OutputFormatter):
 
         # Add title
         title = metadata.get("title", "Document") if metadata else "Document"
-        story.append(Paragraph(title, title_style))
+        story.append(Paragraph(self._escape(title), title_style))
         story.append(Spacer(1, 0.2 * inch))
 
         # Add metadata
         if metadata:
             if "author" in metadata:
-                story.append(Paragraph(f"<b>Author:</b> {metadata['author']}", body_style))
+                story.append(Paragraph(f"<b>Author:</b> {self._escape(str(metadata['author']))}", body_style))
             if "date" in metadata:
-                story.append(Paragraph(f"<b>Date:</b> {metadata['date']}", body_style))
+                story.append(Paragraph(f"<b>Date:</b> {self._escape(str(metadata['date']))}", body_style))
             story.append(Spacer(1, 0.2 * inch))
 
-        # Parse and add content
-        self._add_markdown_to_story(story, content, styles, body_style, heading_style)
+        self._add_blocks_to_story(story, document, styles, body_style, heading_style)
 
         # Build PDF
         doc.build(story)
@@ -369,94 +346,83 @@ class PdfFormatter(OutputFormatter):
         """Get the output format."""
         return OutputFormat.PDF
 
-    def _add_markdown_to_story(
+    def _add_blocks_to_story(
         self,
         story: list,
-        content: str,
+        document: MarkdownDocument,
         styles: Any,
         body_style: Any,
         heading_style: Any,
     ) -> None:
-        """Parse Markdown and add to PDF story."""
+        """Add parsed blocks to the PDF story."""
+        from reportlab.lib import colors
         from reportlab.lib.units import inch
-        from reportlab.platypus import Paragraph, Spacer
-
-        lines = content.split("\n")
-        in_list = False
-        list_items = []
-
-        for line in lines:
-            line = line.rstrip()
-
-            # Handle headings
-            if line.startswith("#"):
-                if in_list and list_items:
-                    self._add_list_to_story(story, list_items, body_style)
-                    list_items = []
-                    in_list = False
-
-                level = min(len(line) - len(line.lstrip("#")), 6)
-                text = self._clean_markdown(line.lstrip("#").strip())
-                if level == 1:
-                    story.append(Paragraph(text, heading_style))
-                else:
-                    style = getattr(styles, f"Heading{level}", body_style)
-                    story.append(Paragraph(text, style))
-
-            # Handle list items
-            elif line.strip().startswith(("- ", "* ", "+ ")):
-                in_list = True
-                text = self._clean_markdown(line.strip()[2:])
-                list_items.append(text)
-
-            # Handle numbered lists
-            elif line.strip().split(".")[0].isdigit() and len(line.strip()) > 2:
-                parts = line.strip().split(".", 1)
-                if len(parts) == 2:
-                    in_list = True
-                    text = self._clean_markdown(parts[1].strip())
-                    list_items.append(text)
-
-            # Handle empty lines or end of list
-            elif not line.strip():
-                if in_list and list_items:
-                    self._add_list_to_story(story, list_items, body_style)
-                    list_items = []
-                    in_list = False
+        from reportlab.platypus import (
+            HRFlowable,
+            Paragraph,
+            Preformatted,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+
+        for block in document.blocks:
+            if block.type == BlockType.HEADING:
+                style = heading_style if block.level == 1 else styles[f"Heading{block.level}"]
+                story.append(Paragraph(self._markup(block.runs), style))
+
+            elif block.type == BlockType.PARAGRAPH:
+                story.append(Paragraph(self._markup(block.runs), body_style))
+
+            elif block.type in (BlockType.BULLET_LIST, BlockType.NUMBERED_LIST):
+                for number, item in enumerate(block.items, start=1):
+                    bullet = "&#8226;" if block.type == BlockType.BULLET_LIST else f"{number}."
+                    story.append(Paragraph(f"{bullet} {self._markup(item)}", body_style))
                 story.append(Spacer(1, 0.1 * inch))
 
-            # Regular paragraph
-            else:
-                if in_list and list_items:
-                    self._add_list_to_story(story, list_items, body_style)
-                    list_items = []
-                    in_list = False
-
-                text = self._clean_markdown(line)
-                if text:
-                    story.append(Paragraph(text, body_style))
-
-        # Add remaining list items
-        if in_list and list_items:
-            self._add_list_to_story(story, list_items, body_style)
-
-    def _clean_markdown(self, text: str) -> str:
-        """Clean Markdown syntax for PDF."""
-        # Remove bold/italic markers
-        text = text.replace("**", "").replace("__", "")
-        text = text.replace("*", "").replace("_", "")
-        # Escape special characters
-        text = text.replace("<", "&lt;").replace(">", "&gt;")
-        return text
-
-    def _add_list_to_story(self, story: list, items: list[str], style: Any) -> None:
-        """Add list items to story."""
-        from reportlab.lib.units import inch
-        from reportlab.platypus import Paragraph, Spacer
+            elif block.type == BlockType.TABLE:
+                columns = max(len(row) for row in block.rows)
+                data = [
+                    [Paragraph(self._markup(cell), body_style) for cell in row] + [""] * (columns - len(row))
+                    for row in block.rows
+                ]
+                table = Table(data, repeatRows=1)
+                table.setStyle(
+                    TableStyle(
+                        [
+                            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                            ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
+                            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                        ]
+                    )
+                )
+                story.append(table)
+                story.append(Spacer(1, 0.1 * inch))
+
+            elif block.type == BlockType.CODE:
+                story.append(Preformatted(block.text, styles["Code"]))
 
-        for item in items:
-            story.append(Paragraph(f"&#8226; {item}", style))
-        story.append(Spacer(1, 0.1 * inch))
+            elif block.type == BlockType.RULE:
+                story.append(HRFlowable(width="100%", color=colors.lightgrey))
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Escape reportlab paragraph markup characters."""
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    def _markup(self, runs: list[Run]) -> str:
+        """Convert inline runs to reportlab paragraph markup."""
+        parts = []
+        for run in runs:
+            text = self._escape(run.text)
+            if run.code:
+                text = f'<font name="Courier">{text}</font>'
+            if run.italic:
+                text = f"<i>{text}</i>"
+            if run.bold:
+                text = f"<b>{text}</b>"
+            parts.append(text)
+        return "".join(parts)
 
 
 def get_formatter(format_type: OutputFormat | str) -> OutputFormatter:
@@ -0,0 +1,214 @@
+"""
+Single-pass Markdown intermediate representation for document export.
+
+parse_markdown() turns a Markdown document into a flat list of blocks
+(headings, paragraphs, lists, tables, code, rules) holding inline runs.
+DOCX and PDF renderers consume the same representation instead of each
+re-parsing the Markdown with its own rules. The IR is made of plain
+dataclasses, so it can be sent to renderer processes.
+"""
+
+import re
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class BlockType(StrEnum):
+    """Kinds of document blocks."""
+
+    HEADING = "heading"
+    PARAGRAPH = "paragraph"
+    BULLET_LIST = "bullet_list"
+    NUMBERED_LIST = "numbered_list"
+    TABLE = "table"
+    CODE = "code"
+    RULE = "rule"
+
+
+@dataclass(frozen=True, slots=True)
+class Run:
+    """A piece of text with uniform inline formatting."""
+
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+
+
+@dataclass(slots=True)
+class Block:
+    """
+    A document block.
+
+    Attributes:
+        type: Block kind
+        level: Heading level (1-6)
+        runs: Inline content of headings and paragraphs
+        items: List items (BULLET_LIST, NUMBERED_LIST)
+        rows: Table rows of cells; the first row is the header
+        text: Verbatim content of code blocks
+    """
+
+    type: BlockType
+    level: int = 0
+    runs: list[Run] = field(default_factory=list)
+    items: list[list[Run]] = field(default_factory=list)
+    rows: list[list[list[Run]]] = field(default_factory=list)
+    text: str = ""
+
+
+@dataclass(slots=True)
+class MarkdownDocument:
+    """Parsed document."""
+
+    blocks: list[Block] = field(default_factory=list)
+
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s*(.*?)\s*#*$")
+RULE_PATTERN = re.compile(r"^(?:-{3,}|\*{3,}|_{3,})$")
+BULLET_PATTERN = re.compile(r"^[-*+]\s+(.*)$")
+NUMBERED_PATTERN = re.compile(r"^\d+[.)]\s+(.*)$")
+TABLE_SEPARATOR_PATTERN = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
+FENCE = "```"
+
+# Bold (** or __), italic (* or _, not inside words), inline code
+INLINE_PATTERN = re.compile(
+    r"(?P<bold_marker>\*\*|__)(?P<bold>(?:(?!(?P=bold_marker)).)+?)(?P=bold_marker)"
+    r"|(?<![\w*])(?P<italic_marker>[*_])(?!\s)(?P<italic>[^*_]+?)(?<!\s)(?P=italic_marker)(?![\w*])"
+    r"|`(?P<code>[^`]+)`"
+)
+
+
+def parse_inline(text: str, bold: bool = False, italic: bool = False) -> list[Run]:
+    """
+    Split text into formatted runs.
+
+    Unclosed markers are kept as literal text.
+
+    Args:
+        text: Inline Markdown
+        bold: Formatting inherited from an enclosing span
+        italic: Formatting inherited from an enclosing span
+
+    Returns:
+        List of runs (adjacent runs may share formatting)
+    """
+    runs: list[Run] = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        if match.start() > position:
+            runs.append(Run(text[position : match.start()], bold=bold, italic=italic))
+        if match.group("bold") is not None:
+            runs.extend(parse_inline(match.group("bold"), bold=True, italic=italic))
+        elif match.group("italic") is not None:
+            runs.extend(parse_inline(match.group("italic"), bold=bold, italic=True))
+        else:
+            runs.append(Run(match.group("code"), bold=bold, italic=italic, code=True))
+        position = match.end()
+    if position < len(text):
+        runs.append(Run(text[position:], bold=bold, italic=italic))
+    return runs
+
+
+def plain_text(runs: list[Run]) -> str:
+    """Concatenate the text of runs without formatting."""
+    return "".join(run.text for run in runs)
+
+
+def _split_table_row(line: str) -> list[str]:
+    """Split a table row into cell texts."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split("|")]
+
+
+def parse_markdown(content: str) -> MarkdownDocument:
+    """
+    Parse Markdown into blocks in a single pass over its lines.
+
+    Each non-blank text line becomes its own paragraph, matching how phase
+    outputs and the final document header are laid out.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        Parsed document
+    """
+    document = MarkdownDocument()
+    blocks = document.blocks
+    code_lines: list[str] | None = None
+    # List or table that following lines of the same kind extend
+    open_block: Block | None = None
+
+    for raw_line in content.split("\n"):
+        line = raw_line.rstrip()
+        stripped = line.strip()
+
+        # Fenced code is kept verbatim
+        if code_lines is not None:
+            if stripped.startswith(FENCE):
+                blocks.append(Block(BlockType.CODE, text="\n".join(code_lines)))
+                code_lines = None
+            else:
+                code_lines.append(line)
+            continue
+        if stripped.startswith(FENCE):
+            code_lines = []
+            open_block = None
+            continue
+
+        if stripped.startswith("|"):
+            if TABLE_SEPARATOR_PATTERN.match(stripped):
+                continue
+            cells = [parse_inline(cell) for cell in _split_table_row(stripped)]
+            if open_block is not None and open_block.type == BlockType.TABLE:
+                open_block.rows.append(cells)
+            else:
+                open_block = Block(BlockType.TABLE, rows=[cells])
+                blocks.append(open_block)
+            continue
+
+        item_type, item_text = _match_list_item(stripped)
+        if item_type is not None:
+            if open_block is not None and open_block.type == item_type:
+                open_block.items.append(parse_inline(item_text))
+            else:
+                open_block = Block(item_type, items=[parse_inline(item_text)])
+                blocks.append(open_block)
+            continue
+
+        # Anything else (including blank lines) ends lists and tables
+        open_block = None
+        if not stripped:
+            continue
+
+        heading = HEADING_PATTERN.match(stripped)
+        if heading and line.startswith("#"):
+            blocks.append(Block(BlockType.HEADING, level=len(heading.group(1)), runs=parse_inline(heading.group(2))))
+        elif RULE_PATTERN.match(stripped):
+            blocks.append(Block(BlockType.RULE))
+        else:
+            blocks.append(Block(BlockType.PARAGRAPH, runs=parse_inline(stripped)))
+
+    if code_lines is not None:
+        # Unclosed fence: keep what was collected
+        blocks.append(Block(BlockType.CODE, text="\n".join(code_lines)))
+
+    return document
+
+
+def _match_list_item(line: str) -> tuple[BlockType | None, str]:
+    """Recognize a bullet or numbered list item (rules like --- are not items)."""
+    if RULE_PATTERN.match(line):
+        return None, ""
+    bullet = BULLET_PATTERN.match(line)
+    if bullet:
+        return BlockType.BULLET_LIST, bullet.group(1)
+    numbered = NUMBERED_PATTERN.match(line)
+    if numbered:
+        return BlockType.NUMBERED_LIST, numbered.group(1)
+    return None, ""
@@ -2,10 +2,16 @@
 Pipeline orchestration modules.
 """
 
+from .journal import SessionJournal, replay_session
 from .orchestrator import PipelineOrchestrator
+from .scheduler import ScheduledTask, TaskScheduler
 from .state import PipelineState
 
 __all__ = [
     "PipelineOrchestrator",
     "PipelineState",
+    "ScheduledTask",
+    "SessionJournal",
+    "TaskScheduler",
+    "replay_session",
 ]
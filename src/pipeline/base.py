@@ -4,10 +4,19 @@ BasePhase abstract class for pipeline phases.
 Defines the interface that all pipeline phases must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any, TypeVar
 
+from agents.router import AgentMapping, PhaseTask
+from context.packer import ContextPacker
 from core.models import PhaseResult, PipelineConfig, PipelineSession
+from pipeline.journal import SessionJournal
+from pipeline.scheduler import ScheduledTask, TaskScheduler
+
+T = TypeVar("T")
 
 
 class BasePhase(ABC):
@@ -16,8 +25,21 @@ class BasePhase(ABC):
 
     Each phase (Framing, Research, Strategy, Writing, Review) inherits from this
     and implements the abstract methods to define phase-specific behavior.
+
+    Attributes:
+        scheduler: Shared TaskScheduler (set by the orchestrator). When unset,
+            each phase uses a private scheduler with default provider limits.
+        context_packer: Packs upstream outputs into prompt variables (set by
+            the orchestrator). When unset, prompts get only topic, doc_type
+            and language.
+        journal: Session journal recording task events (set by the
+            orchestrator for the duration of a run).
     """
 
+    scheduler: TaskScheduler | None = None
+    context_packer: ContextPacker | None = None
+    journal: SessionJournal | None = None
+
     @abstractmethod
     def get_tasks(self, session: PipelineSession) -> list[Any]:
         """
@@ -67,3 +89,199 @@ class BasePhase(ABC):
         """
         # Default implementation - can be overridden
         return 1
+
+    async def run_task_graph(
+        self,
+        session: PipelineSession,
+        tasks: list[Any],
+        run_task: Callable[[Any], Awaitable[T]],
+        outputs: dict[Any, T] | None = None,
+    ) -> list[T]:
+        """
+        Run phase tasks through the task-graph scheduler.
+
+        Tasks whose upstream outputs are ready run concurrently, subject to
+        the scheduler's per-provider limits. Dependencies on tasks from
+        earlier phases are already satisfied when the phase starts. Tasks
+        that already succeeded before a resume reuse their journaled response.
+
+        Args:
+            session: Current pipeline session
+            tasks: Tasks (PhaseTask enum values) in declaration order
+            run_task: Coroutine function executing one task
+            outputs: Filled with each task's result as soon as it finishes,
+                so downstream tasks of the same phase can use it as context
+
+        Returns:
+            Task results in the same order as ``tasks``
+        """
+        scheduler = self.scheduler or TaskScheduler()
+        dependencies = AgentMapping.get_task_dependencies()
+        journal = self.journal
+        phase_number = self.get_phase_number()
+
+        async def _run_and_record(task: Any) -> T:
+            try:
+                value = journal.replayed_response(phase_number, task) if journal else None
+                if value is None:
+                    if journal:
+                        journal.record_task_started(phase_number, task)
+                    value = await run_task(task)
+                    if journal:
+                        journal.record_task_completed(phase_number, task, value)
+            finally:
+                self._release_task_route(session, task)
+            if outputs is not None:
+                outputs[task] = value
+            return value
+
+        nodes = [
+            ScheduledTask(
+                key=task,
+                run=partial(_run_and_record, task),
+                depends_on=dependencies.get(task, ()),
+                # Resolved when the task is ready, so health-aware routing
+                # picks the provider whose slot the task then holds
+                resource=partial(self._get_task_resource, session, task),
+            )
+            for task in tasks
+        ]
+        results = await scheduler.run(nodes)
+        return [results[task] for task in tasks]
+
+    def _get_task_resource(self, session: PipelineSession, task: Any) -> str | None:
+        """
+        Get the provider key used to limit concurrency for a task.
+
+        Args:
+            session: Current pipeline session
+            task: PhaseTask enum value
+
+        Returns:
+            Provider name, or None if the task has no routing entry
+        """
+        router = getattr(self, "agent_router", None)
+        resolver = getattr(router, "resolve_agent_type", None)
+        if resolver is None:
+            return None
+        agent_type = resolver(self.get_phase_number(), task, session.config.doc_type)
+        return str(agent_type) if isinstance(agent_type, str) else None
+
+    def _release_task_route(self, session: PipelineSession, task: Any) -> None:
+        """Drop the route _get_task_resource() kept for a task, whether or not it ran."""
+        router = getattr(self, "agent_router", None)
+        release = getattr(router, "release_route", None)
+        if release is not None:
+            release(self.get_phase_number(), task, session.config.doc_type)
+
+    async def render_task_prompt(
+        self,
+        session: PipelineSession,
+        task: PhaseTask,
+        outputs: dict[Any, Any] | None = None,
+    ) -> str:
+        """
+        Render a task's prompt with upstream context packed into its token budget.
+
+        Over budget, outputs of earlier phases are replaced by the context
+        summary made for this phase, if one is ready. Packing runs in a
+        worker thread, since extractive condensing ranks every sentence of
+        the outputs it shrinks. Packing decisions are recorded in
+        ``session.artifacts["context_packing"]``.
+
+        Args:
+            session: Current pipeline session
+            task: PhaseTask enum value
+            outputs: Responses of tasks already finished in the current phase
+
+        Returns:
+            Rendered prompt
+        """
+        template_name = f"phase_{self.get_phase_number()}/{task.value}"
+        context: dict[str, Any] = {
+            "topic": session.config.topic,
+            "doc_type": session.config.doc_type.value,
+            "language": session.config.language,
+        }
+
+        packer = self.context_packer
+        if packer is None or not packer.get_slots(task):
+            return self.template_manager.render_prompt(template_name=template_name, context=context)
+
+        provider = self._get_task_resource(session, task) or "default"
+        template_tokens = packer.count(
+            self.template_manager.render_prompt(template_name=template_name, context=context),
+            provider,
+        )
+        packed = await asyncio.to_thread(
+            packer.pack,
+            task,
+            self._collect_task_outputs(session, outputs),
+            provider,
+            template_tokens,
+            summaries=self._get_context_summary(session, outputs),
+        )
+        session.artifacts.setdefault("context_packing", {})[task.value] = packed.to_dict()
+
+        return self.template_manager.render_prompt(
+            template_name=template_name,
+            context={**context, **packed.variables},
+        )
+
+    def _get_context_summary(
+        self,
+        session: PipelineSession,
+        outputs: dict[Any, Any] | None = None,
+    ) -> Callable[[PhaseTask, str], str | None] | None:
+        """
+        Get a summary lookup over the context summary made for this phase.
+
+        The orchestrator stores the summary of all earlier phases in
+        ``session.artifacts["context_summary_phase_N"]``; it stands in for
+        any output that is not from the current phase.
+
+        Args:
+            session: Current pipeline session
+            outputs: Responses of tasks already finished in the current phase
+
+        Returns:
+            Summary lookup for ContextPacker.pack, or None if no summary is ready
+        """
+        record = session.artifacts.get(f"context_summary_phase_{self.get_phase_number()}")
+        summary = record.get("summary") if isinstance(record, dict) else None
+        if not summary:
+            return None
+        current = {getattr(response, "task_name", None) for response in (outputs or {}).values()}
+
+        def lookup(task: PhaseTask, text: str) -> str | None:
+            return None if task.value in current else summary
+
+        return lookup
+
+    @staticmethod
+    def _collect_task_outputs(
+        session: PipelineSession,
+        outputs: dict[Any, Any] | None = None,
+    ) -> dict[PhaseTask, str]:
+        """
+        Collect successful task outputs from earlier phases and the current one.
+
+        Args:
+            session: Current pipeline session
+            outputs: Responses of tasks already finished in the current phase
+
+        Returns:
+            Mapping of task to response content
+        """
+        responses = [response for result in session.results for response in result.ai_responses]
+        responses.extend((outputs or {}).values())
+
+        collected: dict[PhaseTask, str] = {}
+        for response in responses:
+            if not response.success or not response.content:
+                continue
+            try:
+                collected[PhaseTask(response.task_name)] = response.content
+            except ValueError:
+                continue
+        return collected
@@ -0,0 +1,332 @@
+"""
+Append-only session journal.
+
+Each session directory holds journal.ndjson, one JSON event per line:
+session (header), task_started, task_completed, phase and state. A
+background writer appends events in batches with one fsync per batch, so
+recording an event never blocks the event loop and a crash loses at most
+the task in flight.
+
+State events carry only the artifact keys that changed since the
+previous state event of the same journal (plus the keys removed), and
+replay merges them in order.
+
+Compaction writes pipeline_state.json and the per-phase result files from
+the session, then rewrites the journal to the task completions of phases
+that have not finished. replay_session() rebuilds a session from the
+snapshot plus the journal; applying events is idempotent, so a crash
+between the two compaction steps replays safely.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_logger
+from core.models import AgentResponse, PhaseResult, PhaseStatus, PipelineSession, PipelineState
+from output.export import write_atomic
+
+logger = get_logger(__name__)
+
+JOURNAL_FILENAME = "journal.ndjson"
+SNAPSHOT_FILENAME = "pipeline_state.json"
+DEFAULT_FLUSH_INTERVAL = 0.2
+
+FINISHED_PHASE_STATUSES = {PhaseStatus.COMPLETED, PhaseStatus.SKIPPED}
+
+_MISSING = object()
+
+
+class JournalEvent(StrEnum):
+    """Kinds of journal events."""
+
+    SESSION = "session"
+    TASK_STARTED = "task_started"
+    TASK_COMPLETED = "task_completed"
+    PHASE = "phase"
+    STATE = "state"
+
+
+def read_events(path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Read journal events in order.
+
+    A torn line (from a crash mid-write) is skipped with a warning.
+
+    Args:
+        path: Journal file
+
+    Yields:
+        Event dictionaries
+    """
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable journal line {line_number} in {path}")
+
+
+def has_session_state(session_dir: Path) -> bool:
+    """
+    Check whether a directory holds a resumable session.
+
+    Args:
+        session_dir: Session output directory
+
+    Returns:
+        True if a snapshot or journal exists
+    """
+    return (session_dir / SNAPSHOT_FILENAME).exists() or (session_dir / JOURNAL_FILENAME).exists()
+
+
+def replay_session(session_dir: Path) -> PipelineSession | None:
+    """
+    Rebuild a session from its snapshot and journal.
+
+    Args:
+        session_dir: Session output directory
+
+    Returns:
+        Session, or None if neither snapshot nor session header exists
+    """
+    session: PipelineSession | None = None
+    snapshot_file = session_dir / SNAPSHOT_FILENAME
+    if snapshot_file.exists():
+        session = PipelineSession(**json.loads(snapshot_file.read_text(encoding="utf-8")))
+
+    for event in read_events(session_dir / JOURNAL_FILENAME):
+        kind = event.get("event")
+        if kind == JournalEvent.SESSION:
+            if session is None:
+                session = PipelineSession(**event["session"])
+        elif session is None:
+            continue
+        elif kind == JournalEvent.PHASE:
+            result = PhaseResult(**event["result"])
+            session.results = [item for item in session.results if item.phase_number != result.phase_number]
+            session.results.append(result)
+            session.results.sort(key=lambda item: item.phase_number)
+        elif kind == JournalEvent.STATE:
+            session.state = PipelineState(event["state"])
+            session.current_phase = event["current_phase"]
+            session.updated_at = datetime.fromisoformat(event["updated_at"])
+            session.artifacts.update(event.get("artifacts", {}))
+            for key in event.get("removed_artifacts", []):
+                session.artifacts.pop(key, None)
+    return session
+
+
+class SessionJournal:
+    """
+    Batched NDJSON event log of one session.
+
+    Events recorded with the record_* methods are queued and written by a
+    background thread, which collects events for up to ``flush_interval``
+    seconds and fsyncs once per batch.
+
+    Task completions found in an existing journal are kept as replayed
+    responses, so a resumed phase skips the tasks that already succeeded.
+    """
+
+    def __init__(self, session_dir: Path, flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """
+        Open the journal of a session directory.
+
+        Args:
+            session_dir: Session output directory
+            flush_interval: Seconds to collect events before each fsync
+        """
+        self.session_dir = session_dir
+        self.path = session_dir / JOURNAL_FILENAME
+        self.flush_interval = flush_interval
+        self._condition = threading.Condition()
+        self._pending: list[str] = []
+        self._appended = 0
+        self._written = 0
+        self._flush_requested = False
+        self._closing = False
+        self._thread: threading.Thread | None = None
+        self._replayed: dict[tuple[int, str], AgentResponse] = {}
+        # Artifacts as of the last state event, to journal only what changed
+        self._artifacts: dict[str, Any] = {}
+        for event in read_events(self.path):
+            if event.get("event") == JournalEvent.TASK_COMPLETED:
+                response = AgentResponse(**event["response"])
+                if response.success:
+                    self._replayed[(event["phase"], event["task"])] = response
+
+    def record_session(self, session: PipelineSession) -> None:
+        """Record the session header (config and identifiers)."""
+        header = session.model_dump(mode="json", exclude={"results", "artifacts"})
+        self._append(JournalEvent.SESSION, session=header)
+
+    def record_task_started(self, phase_number: int, task: Any) -> None:
+        """Record that a task was sent to its agent."""
+        self._append(JournalEvent.TASK_STARTED, phase=phase_number, task=self._task_key(task))
+
+    def record_task_completed(self, phase_number: int, task: Any, response: Any) -> None:
+        """Record a task's response."""
+        if not isinstance(response, AgentResponse):
+            return
+        self._append(
+            JournalEvent.TASK_COMPLETED,
+            phase=phase_number,
+            task=self._task_key(task),
+            response=response.model_dump(mode="json"),
+        )
+
+    def record_phase(self, result: PhaseResult) -> None:
+        """Record a finished phase result."""
+        self._append(JournalEvent.PHASE, result=result.model_dump(mode="json"))
+
+    def record_state(self, session: PipelineSession) -> None:
+        """Record the session's state, current phase and changed artifacts."""
+        artifacts = session.model_dump(mode="json", include={"artifacts"})["artifacts"]
+        changed = {key: value for key, value in artifacts.items() if self._artifacts.get(key, _MISSING) != value}
+        removed = [key for key in self._artifacts if key not in artifacts]
+        self._artifacts = artifacts
+        data: dict[str, Any] = {"artifacts": changed}
+        if removed:
+            data["removed_artifacts"] = removed
+        self._append(
+            JournalEvent.STATE,
+            state=str(session.state),
+            current_phase=session.current_phase,
+            updated_at=session.updated_at.isoformat(),
+            **data,
+        )
+
+    def replayed_response(self, phase_number: int, task: Any) -> AgentResponse | None:
+        """
+        Get a successful response recorded before the session was resumed.
+
+        Args:
+            phase_number: Phase the task belongs to
+            task: PhaseTask enum value
+
+        Returns:
+            Recorded response, or None if the task must run
+        """
+        return self._replayed.get((phase_number, self._task_key(task)))
+
+    def flush(self) -> None:
+        """Block until every recorded event is on disk."""
+        with self._condition:
+            target = self._appended
+            if self._written >= target:
+                return
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._written < target:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Flush pending events and stop the writer thread."""
+        with self._condition:
+            thread = self._thread
+            self._closing = True
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._closing = False
+
+    def compact(self, session: PipelineSession) -> Path:
+        """
+        Write the session snapshot and shrink the journal.
+
+        Writes pipeline_state.json and phase<N>_results.json, then keeps only
+        the task completions of phases without a finished result.
+
+        Args:
+            session: Session to snapshot
+
+        Returns:
+            Snapshot path
+        """
+        self.close()
+        snapshot_file = self.session_dir / SNAPSHOT_FILENAME
+        snapshot = session.model_dump(mode="json")
+        write_atomic(snapshot_file, self._dump(snapshot))
+        self._artifacts = snapshot["artifacts"]
+        for result in session.results:
+            write_atomic(
+                self.session_dir / f"phase{result.phase_number}_results.json",
+                self._dump(result.model_dump(mode="json")),
+            )
+
+        finished = {result.phase_number for result in session.results if result.status in FINISHED_PHASE_STATUSES}
+        carried = [
+            json.dumps(event, ensure_ascii=False) + "\n"
+            for event in read_events(self.path)
+            if event.get("event") == JournalEvent.TASK_COMPLETED and event.get("phase") not in finished
+        ]
+        if carried:
+            write_atomic(self.path, "".join(carried))
+        else:
+            self.path.unlink(missing_ok=True)
+        logger.info(f"Compacted session journal: {snapshot_file}")
+        return snapshot_file
+
+    @staticmethod
+    def _task_key(task: Any) -> str:
+        return str(getattr(task, "value", task))
+
+    @staticmethod
+    def _dump(data: dict[str, Any]) -> str:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+    def _append(self, event: JournalEvent, **data: Any) -> None:
+        """Queue an event for the writer thread."""
+        line = json.dumps({"event": str(event), "time": time.time(), **data}, ensure_ascii=False) + "\n"
+        with self._condition:
+            self._pending.append(line)
+            self._appended += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run_writer, name="session-journal", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run_writer(self) -> None:
+        """Write queued events in batches, one fsync per batch."""
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as handle:
+            while True:
+                with self._condition:
+                    while not self._pending and not self._closing:
+                        self._condition.wait()
+                    deadline = time.monotonic() + self.flush_interval
+                    while not (self._closing or self._flush_requested):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    lines, self._pending = self._pending, []
+                    self._flush_requested = False
+                    closing = self._closing
+
+                if lines:
+                    try:
+                        handle.write("".join(lines))
+                        handle.flush()
+                        os.fsync(handle.fileno())
+                    except OSError as exc:
+                        logger.warning(f"Failed to write session journal {self.path}: {exc}")
+
+                with self._condition:
+                    self._written += len(lines)
+                    self._condition.notify_all()
+                    if closing and not self._pending:
+                        self._thread = None
+                        return
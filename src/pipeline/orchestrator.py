@@ -1,12 +1,18 @@
 """Pipeline orchestration modules."""
 
+import asyncio
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from agents.router import AgentRouter, PhaseTask
+from context.ledger import TokenLedger
+from context.packer import ContextPacker
+from context.speculative import SpeculativeSummarizer
 from context.summarizer import ContextSummary, SummaryConfig
-from context.tokenizer import TokenCounter
+from context.tokenizer import ModelLimits, get_token_counter
+from core.catalog import SessionCatalog
 from core.logger import get_logger
 from core.models import (
     PhaseResult,
@@ -17,13 +23,18 @@ from core.models import (
     create_phase_result,
 )
 from gateway.session import SessionManager
-from output.formatter import FileExporter, MarkdownFormatter
+from monitoring.ledger import get_usage_ledger
+from output.export import DocumentExporter
+from output.formatter import FileExporter, PartialOutputWriter
+from output.formatters import OutputFormat
 from pipeline.base import BasePhase
+from pipeline.journal import DEFAULT_FLUSH_INTERVAL, SessionJournal
 from pipeline.phase1_framing import Phase1Framing
 from pipeline.phase2_research import Phase2Research
 from pipeline.phase3_strategy import Phase3Strategy
 from pipeline.phase4_writing import Phase4Writing
 from pipeline.phase5_review import Phase5Review
+from pipeline.scheduler import TaskScheduler
 from templates.manager import TemplateManager
 
 logger = get_logger(__name__)
@@ -46,6 +57,8 @@ class PipelineOrchestrator:
         enable_ui: bool = False,
         enable_summarization: bool = True,
         summarization_threshold: float = 0.8,
+        scheduler: TaskScheduler | None = None,
+        manage_browser_pool: bool = True,
     ) -> None:
         """
         Initialize orchestrator with dependencies.
@@ -57,27 +70,53 @@ class PipelineOrchestrator:
             enable_ui: Enable Rich UI components (progress, logging, summary)
             enable_summarization: Enable context summarization (default True)
             summarization_threshold: Token threshold for triggering summarization (default 0.8 = 80%)
+            scheduler: Task scheduler to share with other orchestrators (built from settings if None)
+            manage_browser_pool: Initialize and close the BrowserPool around each run;
+                disable when a caller (e.g. the batch runner) owns the pool
         """
         self.settings = settings
         self.template_manager = template_manager or TemplateManager()
         self.session_manager = session_manager or SessionManager()
-        self.agent_router = AgentRouter(settings)
+        self.agent_router = AgentRouter(settings, usage_ledger=get_usage_ledger(settings))
+        template_version = getattr(self.template_manager, "get_version", None)
+        if callable(template_version):
+            version = template_version()
+            self.agent_router.template_version = version if isinstance(version, str) else None
         self.current_session: PipelineSession | None = None
         self.enable_ui = enable_ui
         self.enable_summarization = enable_summarization
         self.summarization_threshold = summarization_threshold
+        self.manage_browser_pool = manage_browser_pool
 
         # Initialize context optimization components
-        self.token_counter = TokenCounter()
+        self.token_counter = get_token_counter()
+        self._token_ledgers: dict[str, TokenLedger] = {}
+        self._catalogs: dict[Path, SessionCatalog] = {}
         if self.enable_summarization:
-            summary_config = SummaryConfig(enabled=True)
+            tiers = getattr(settings, "summarization_tiers", None)
+            summary_config = SummaryConfig(
+                enabled=True,
+                tiers=tiers if isinstance(tiers, list) else ["extractive", "agent"],
+            )
             self.context_summary = ContextSummary(
                 agent_router=self.agent_router,
                 config=summary_config,
+                token_counter=self.token_counter,
             )
         else:
             self.context_summary = None
 
+        # Summarize in the background while the next phase runs
+        self.speculative_summarizer: SpeculativeSummarizer | None = None
+        if self.context_summary is not None and getattr(settings, "enable_speculative_summarization", False) is True:
+            self.speculative_summarizer = SpeculativeSummarizer(
+                self.context_summary,
+                wait_seconds=settings.summary_wait_seconds,
+                on_late_summary=lambda session, phase, result: self._record_context_summary(
+                    session, phase, result, late=True
+                ),
+            )
+
         # Initialize phase classes
         self._phases: dict[int, BasePhase] = {
             1: Phase1Framing(self.template_manager, self.agent_router),
@@ -87,6 +126,19 @@ class PipelineOrchestrator:
             5: Phase5Review(self.template_manager, self.agent_router),
         }
 
+        # Share one task scheduler so provider limits span all phases
+        self.scheduler = scheduler or self._build_scheduler(settings)
+        for phase in self._phases.values():
+            phase.scheduler = self.scheduler
+
+        # Feed earlier task outputs into later prompts within a token budget
+        if getattr(settings, "enable_context_packing", False) is True:
+            self.context_packer: ContextPacker | None = ContextPacker.from_settings(settings, self.token_counter)
+        else:
+            self.context_packer = None
+        for phase in self._phases.values():
+            phase.context_packer = self.context_packer
+
         # Initialize UI components if enabled
         if self.enable_ui:
             from rich.console import Console
@@ -104,6 +156,27 @@ class PipelineOrchestrator:
             self.ui_logger = None
             self.ui_summary = None
 
+    @staticmethod
+    def _build_scheduler(settings: Any) -> TaskScheduler:
+        """
+        Build the task-graph scheduler from settings.
+
+        Args:
+            settings: Configuration settings (may be None)
+
+        Returns:
+            TaskScheduler limited per provider, or fully sequential when
+            enable_parallel_phases is disabled
+        """
+        per_provider = getattr(settings, "max_concurrent_per_provider", None)
+        if not isinstance(per_provider, int) or per_provider < 1:
+            per_provider = TaskScheduler.DEFAULT_PROVIDER_LIMIT
+
+        parallel = getattr(settings, "enable_parallel_phases", True)
+        max_concurrency = None if parallel is not False else 1
+
+        return TaskScheduler(default_limit=per_provider, max_concurrency=max_concurrency)
+
     def create_session(self, config: PipelineConfig) -> PipelineSession:
         """Create a new pipeline session."""
         return PipelineSession(config=config)
@@ -130,17 +203,88 @@ class PipelineOrchestrator:
         session = PipelineSession(config=config)
         return phase.get_tasks(session)
 
-    def _save_phase_result(self, exporter: FileExporter | None, result: PhaseResult) -> None:
-        if exporter is None:
-            return
-        exporter.save_json(f"phase{result.phase_number}_results", result.model_dump(mode="json"))
+    def _build_stream_listener(self, output_dir: Path) -> Any:
+        """
+        Build the router stream listener for a run.
 
-    def _save_pipeline_state(self, exporter: FileExporter | None, session: PipelineSession) -> None:
-        if exporter is None:
-            return
-        exporter.save_json("pipeline_state", session.model_dump(mode="json"))
+        Streamed text is mirrored to output_dir/partial/ and shown in the
+        progress display; the partial file is removed once a response succeeds.
+
+        Args:
+            output_dir: Session output directory
+
+        Returns:
+            Listener for AgentRouter.stream_listener
+        """
+        writer = PartialOutputWriter(output_dir)
+
+        def listener(phase: int, task: PhaseTask, chunk: Any) -> None:
+            name = f"phase{phase}_{task.value}"
+            if chunk.done:
+                if chunk.response is not None and chunk.response.success:
+                    writer.discard(name)
+                elif chunk.text:
+                    writer.write(name, chunk.text, force=True)
+            elif chunk.text:
+                writer.write(name, chunk.text)
 
-    def _generate_final_document(
+            if self.ui_progress:
+                self.ui_progress.update_stream(task.value, len(chunk.text), done=chunk.done)
+
+        return listener
+
+    async def _open_journal(self, output_dir: Path, session: PipelineSession) -> SessionJournal:
+        """
+        Open the session journal and attach it to every phase.
+
+        Args:
+            output_dir: Session output directory
+            session: Session being run
+
+        Returns:
+            Journal with the responses of tasks finished before a resume
+        """
+        interval = getattr(self.settings, "journal_flush_interval", None)
+        if not isinstance(interval, int | float):
+            interval = DEFAULT_FLUSH_INTERVAL
+        journal = await asyncio.to_thread(SessionJournal, output_dir, float(interval))
+        journal.record_session(session)
+        for phase in self._phases.values():
+            phase.journal = journal
+        return journal
+
+    def _update_catalog(self, session: PipelineSession, output_dir: Path) -> None:
+        """
+        Record a session's current state in the session catalog.
+
+        Every run is catalogued under the configured output root, so runs
+        with a custom output directory still show up in `aigenflow sessions`.
+        Catalog failures are logged; they never stop the pipeline.
+
+        Args:
+            session: Session to record
+            output_dir: Session output directory
+        """
+        configured = getattr(self.settings, "output_dir", None)
+        root = Path(configured) if isinstance(configured, (str, Path)) else output_dir.parent
+        try:
+            catalog = self._catalogs.get(root)
+            if catalog is None:
+                catalog = self._catalogs[root] = SessionCatalog.for_output_dir(root)
+            catalog.upsert(session, output_dir)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(f"Session catalog update failed: {exc}")
+
+    def _close_catalogs(self) -> None:
+        """Close the session catalogs opened during a run."""
+        while self._catalogs:
+            _, catalog = self._catalogs.popitem()
+            try:
+                catalog.close()
+            except sqlite3.Error as exc:
+                logger.warning(f"Session catalog close failed: {exc}")
+
+    async def _generate_final_document(
         self,
         exporter: FileExporter | None,
         session: PipelineSession,
@@ -149,6 +293,8 @@ class PipelineOrchestrator:
         Generate final Markdown document from pipeline results.
 
         Compiles Phase 4 (Writing) content with Phase 5 (Review) refinements.
+        Formats listed in the ``export_formats`` setting (e.g. docx, pdf or
+        all) are rendered concurrently alongside the Markdown file.
 
         Args:
             exporter: File exporter instance
@@ -192,7 +338,6 @@ class PipelineOrchestrator:
                         review_notes.append(f"## {response.task_name}\n\n{response.content}")
 
         # Build final document
-        formatter = MarkdownFormatter()
         doc_type = session.config.doc_type.value
         topic = session.config.topic
 
@@ -223,13 +368,143 @@ class PipelineOrchestrator:
         else:  # rd
             filename = f"rd_proposal_{timestamp}"
 
-        # Use FileExporter to save the markdown
-        final_exporter = FileExporter(final_dir)
-        doc_path = final_exporter.save_markdown(filename, final_doc)
+        # Markdown is always written; other formats render in parallel from one parse
+        formats = getattr(self.settings, "export_formats", None)
+        formats = [OutputFormat.MARKDOWN, *(formats if isinstance(formats, list) else [])]
+        try:
+            written = await DocumentExporter().export(
+                final_doc, final_dir, filename, formats, metadata={"title": topic}
+            )
+        except ValueError as exc:
+            logger.warning(f"Invalid export formats {formats}: {exc}")
+            written = await DocumentExporter().export(final_doc, final_dir, filename, [OutputFormat.MARKDOWN])
 
-        logger.info(f"Generated final document: {doc_path}")
+        doc_path = written.get(OutputFormat.MARKDOWN)
+        if doc_path is not None:
+            logger.info(f"Generated final document: {doc_path}")
         return doc_path
 
+    def get_token_ledger(self, session: PipelineSession) -> TokenLedger:
+        """
+        Get the token ledger of a session, restoring saved counts on first use.
+
+        Args:
+            session: Pipeline session
+
+        Returns:
+            TokenLedger for the session
+        """
+        ledger = self._token_ledgers.get(session.session_id)
+        if ledger is None:
+            render_section = None
+            if self.context_summary is not None:
+                summary = self.context_summary
+
+                def render_section(result: PhaseResult) -> str:
+                    return summary._extract_context_from_results([result])
+
+            ledger = TokenLedger(self.token_counter, render_section=render_section)
+            ledger.load_dict(session.artifacts.get("token_ledger", {}))
+            self._token_ledgers[session.session_id] = ledger
+        return ledger
+
+    async def _should_summarize(self, session: PipelineSession, phase_number: int) -> tuple[bool, str, TokenLedger]:
+        """
+        Check whether the context before a phase exceeds the summarization threshold.
+
+        Args:
+            session: Current pipeline session
+            phase_number: Phase about to execute
+
+        Returns:
+            Tuple of (should summarize, provider checked against, session token ledger)
+        """
+        # Determine provider for token limit check
+        # Use the first agent's type from the previous phase if available
+        provider = "claude"  # Default
+        if session.results:
+            last_result = session.results[-1]
+            if last_result.ai_responses:
+                provider = last_result.ai_responses[0].agent_name.value
+
+        # Count new results off the event loop; earlier ones are already in the ledger
+        ledger = self.get_token_ledger(session)
+        await asyncio.to_thread(ledger.sync, session.results)
+
+        should_summarize = self.context_summary.should_summarize_before_phase(
+            session_results=session.results,
+            current_phase=phase_number,
+            provider=provider,
+            threshold=self.summarization_threshold,
+            token_ledger=ledger,
+        )
+        return should_summarize, provider, ledger
+
+    async def _start_speculative_summary(self, session: PipelineSession, phase_number: int) -> None:
+        """
+        Start summarizing the context of the next phase in the background.
+
+        Called as soon as a phase's results land, so the summary can be
+        ready by the time the phase after it needs it.
+
+        Args:
+            session: Current pipeline session
+            phase_number: Phase the summary is for
+        """
+        if self.speculative_summarizer is None or phase_number > TOTAL_PHASES:
+            return
+        try:
+            should_summarize, _, _ = await self._should_summarize(session, phase_number)
+            if should_summarize:
+                self.speculative_summarizer.start(session, phase_number)
+        except Exception as exc:
+            logger.error(f"Error starting background context summarization: {exc}")
+
+    def _record_context_summary(
+        self,
+        session: PipelineSession,
+        phase_number: int,
+        summary_result: Any,
+        late: bool = False,
+    ) -> None:
+        """
+        Log a summarization outcome and store it in the session artifacts.
+
+        Args:
+            session: Current pipeline session
+            phase_number: Phase the summary was made for
+            summary_result: SummaryResult
+            late: Summary finished in the background after the phase had started
+        """
+        if summary_result.success:
+            logger.info(
+                f"Context summarized: {summary_result.tokens_original} -> "
+                f"{summary_result.tokens_summary} tokens "
+                f"({summary_result.reduction_ratio:.1%} reduction)"
+            )
+
+            # Store summary in session artifacts
+            if not hasattr(session, "artifacts"):
+                session.artifacts = {}
+            # The summary text is what phases pack in place of earlier outputs
+            summary_dict = summary_result.get_summary_dict()
+            summary_dict["summary"] = summary_result.summarized_text
+            if late:
+                summary_dict["ready_before_phase"] = False
+            session.artifacts[f"context_summary_phase_{phase_number}"] = summary_dict
+
+            # Update UI logger if enabled
+            if self.ui_logger:
+                self.ui_logger.info(
+                    f"Context summarized before Phase {phase_number}: "
+                    f"{summary_result.tokens_original} -> {summary_result.tokens_summary} tokens "
+                    f"({summary_result.reduction_ratio:.1%} reduction)"
+                )
+        else:
+            logger.warning(f"Context summarization failed: {summary_result.error}")
+            if self.ui_logger:
+                self.ui_logger.warning(f"Context summarization failed: {summary_result.error}")
+
     async def _check_and_summarize_context(
         self,
         session: PipelineSession,
@@ -238,26 +513,16 @@ class PipelineOrchestrator:
         """
         Check token usage and trigger summarization if threshold exceeded.
 
+        With speculative summarization, the summary started in the background
+        is used only if it is ready; the phase never waits longer than
+        ``summary_wait_seconds`` for it.
+
         Args:
             session: Current pipeline session
             phase_number: Phase about to execute
         """
         try:
-            # Determine provider for token limit check
-            # Use the first agent's type from the previous phase if available
-            provider = "claude"  # Default
-            if session.results:
-                last_result = session.results[-1]
-                if last_result.ai_responses:
-                    provider = last_result.ai_responses[0].agent_name.value
-
-            # Check if summarization is needed
-            should_summarize = self.context_summary.should_summarize_before_phase(
-                session_results=session.results,
-                current_phase=phase_number,
-                provider=provider,
-                threshold=self.summarization_threshold,
-            )
+            should_summarize, provider, ledger = await self._should_summarize(session, phase_number)
 
             if should_summarize:
                 logger.info(
@@ -265,45 +530,28 @@ class PipelineOrchestrator:
                     "triggering context summarization"
                 )
 
-                # Perform summarization
-                summary_result = await self.context_summary.summarize_phase_context(
-                    session_results=session.results,
-                    current_phase=phase_number,
-                )
-
-                if summary_result.success:
-                    logger.info(
-                        f"Context summarized: {summary_result.tokens_original} -> "
-                        f"{summary_result.tokens_summary} tokens "
-                        f"({summary_result.reduction_ratio:.1%} reduction)"
+                if self.speculative_summarizer is not None:
+                    if not self.speculative_summarizer.is_started(session, phase_number):
+                        self.speculative_summarizer.start(session, phase_number)
+                    summary_result = await self.speculative_summarizer.take(session, phase_number)
+                    if summary_result is None:
+                        return
+                else:
+                    # Perform summarization
+                    summary_result = await self.context_summary.summarize_phase_context(
+                        session_results=session.results,
+                        current_phase=phase_number,
                     )
 
-                    # Store summary in session artifacts
-                    if not hasattr(session, "artifacts"):
-                        session.artifacts = {}
-                    session.artifacts[f"context_summary_phase_{phase_number}"] = summary_result.get_summary_dict()
-
-                    # Update UI logger if enabled
-                    if self.ui_logger:
-                        self.ui_logger.info(
-                            f"Context summarized before Phase {phase_number}: "
-                            f"{summary_result.tokens_original} -> {summary_result.tokens_summary} tokens "
-                            f"({summary_result.reduction_ratio:.1%} reduction)"
-                        )
-                else:
-                    logger.warning(f"Context summarization failed: {summary_result.error}")
-                    if self.ui_logger:
-                        self.ui_logger.warning(f"Context summarization failed: {summary_result.error}")
+                self._record_context_summary(session, phase_number, summary_result)
             else:
                 # Log token usage even if not summarizing
-                from context.tokenizer import TokenCounter
-
-                context = self.context_summary._extract_context_from_results(session.results)
-                token_result = TokenCounter().count(context, model_name=provider)
-                percentage_used = token_result.get_percentage_used(provider)
+                context_tokens = ledger.context_tokens()
+                limit = ModelLimits().get_limit(provider)
+                percentage_used = context_tokens / limit * 100 if limit > 0 else 0
 
                 logger.debug(
-                    f"Token usage before Phase {phase_number}: {token_result.total_tokens} tokens "
+                    f"Token usage before Phase {phase_number}: {context_tokens} tokens "
                     f"({percentage_used:.1f}% of {provider} limit)"
                 )
 
@@ -437,6 +685,12 @@ class PipelineOrchestrator:
         output_dir = config.output_dir / session.session_id
         output_dir.mkdir(parents=True, exist_ok=True)
         exporter = FileExporter(output_dir)
+        journal = await self._open_journal(output_dir, session)
+        self._update_catalog(session, output_dir)
+
+        # Stream responses so progress and partial output are visible while agents type
+        if getattr(self.settings, "enable_streaming", False) is True:
+            self.agent_router.stream_listener = self._build_stream_listener(output_dir)
 
         # Initialize context optimization tracking
         if self.enable_summarization and self.context_summary and not session.artifacts:
@@ -463,7 +717,7 @@ class PipelineOrchestrator:
 
             # Initialize BrowserPool if enabled
             browser_pool = None
-            if os.getenv("AIGENFLOW_USE_BROWSER_POOL", "true").lower() == "true":
+            if self.manage_browser_pool and os.getenv("AIGENFLOW_USE_BROWSER_POOL", "true").lower() == "true":
                 from gateway.browser_pool import BrowserPool
 
                 try:
@@ -489,27 +743,38 @@ class PipelineOrchestrator:
                                 cookies = storage.load_cookies()
                                 await browser_pool.preload_context(provider_name, cookies)
                                 logger.info(f"Preloaded context for {provider_name}")
+
+                                # Open a ready chat page in the background
+                                base_url = provider.get_base_url() or provider.base_url
+                                if base_url:
+                                    browser_pool.prewarm(provider_name, base_url)
                     except Exception as e:
                         logger.warning(f"Failed to preload context for {provider_name}: {e}")
 
             for phase_num in range(start_phase, TOTAL_PHASES + 1):
                 result = await self.execute_phase(session, phase_num)
                 session.add_result(result)
-                self._save_phase_result(exporter, result)
+                journal.record_phase(result)
+                if result.status != PhaseStatus.FAILED and self.enable_summarization:
+                    await self._start_speculative_summary(session, phase_num + 1)
 
                 if result.status in {PhaseStatus.COMPLETED, PhaseStatus.SKIPPED}:
                     session.state = PipelineState(f"phase_{phase_num}")
                 elif result.status == PhaseStatus.FAILED:
                     session.state = PipelineState.FAILED
+                    journal.record_state(session)
+                    self._update_catalog(session, output_dir)
                     if self.ui_logger:
                         self.ui_logger.error("Pipeline failed, stopping execution")
                     break
+                journal.record_state(session)
+                self._update_catalog(session, output_dir)
 
             self._finalize_session_state(session)
 
             # Generate final document if pipeline completed successfully
             if session.state == PipelineState.COMPLETED:
-                final_doc_path = self._generate_final_document(exporter, session)
+                final_doc_path = await self._generate_final_document(exporter, session)
                 if final_doc_path and self.ui_logger:
                     self.ui_logger.info(f"Final document generated: {final_doc_path.name}")
                 if final_doc_path and self.ui_progress:
@@ -549,6 +814,26 @@ class PipelineOrchestrator:
                 except Exception as e:
                     logger.warning(f"BrowserPool cleanup failed: {e}")
 
-            self._save_pipeline_state(exporter, session)
+            self.agent_router.stream_listener = None
+            if self.speculative_summarizer is not None:
+                await self.speculative_summarizer.discard(session.session_id)
+            try:
+                ledger = self.get_token_ledger(session)
+                await asyncio.to_thread(ledger.sync, session.results)
+                session.artifacts["token_ledger"] = ledger.to_dict()
+            except Exception as exc:
+                logger.warning(f"Token ledger update failed: {exc}")
+            finally:
+                self._token_ledgers.pop(session.session_id, None)
+            if self.agent_router.rate_governor is not None:
+                session.artifacts["rate_governor"] = self.agent_router.rate_governor.snapshot()
+            for phase in self._phases.values():
+                phase.journal = None
+            try:
+                await asyncio.to_thread(journal.compact, session)
+            except Exception as exc:
+                logger.warning(f"Session journal compaction failed: {exc}")
+            self._update_catalog(session, output_dir)
+            self._close_catalogs()
 
         return session
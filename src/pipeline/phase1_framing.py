@@ -88,20 +88,12 @@ class Phase1Framing(BasePhase):
             result.completed_at = datetime.now()
             return result
 
-        responses: list[AgentResponse] = []
-        failed = False
+        outputs: dict[PhaseTask, AgentResponse] = {}
 
-        for task in tasks:
+        async def _run_task(task: PhaseTask) -> AgentResponse:
             logger.debug(f"[Phase {phase_number}] Executing task: {task.value}")
 
-            prompt = self.template_manager.render_prompt(
-                template_name=self._build_template_name(phase_number, task),
-                context={
-                    "topic": session.config.topic,
-                    "doc_type": session.config.doc_type.value,
-                    "language": session.config.language,
-                },
-            )
+            prompt = await self.render_task_prompt(session, task, outputs)
 
             logger.debug(f"[Phase {phase_number}] Rendered prompt for {task.value}, length: {len(prompt)} chars")
 
@@ -126,23 +118,22 @@ class Phase1Framing(BasePhase):
                     success=response.success,
                     error=response.error,
                 )
-                responses.append(normalized_response)
                 if not normalized_response.success:
                     logger.debug(f"[Phase {phase_number}] Task {task.value} failed: {normalized_response.error}")
-                    failed = True
+                return normalized_response
             except Exception as exc:  # pragma: no cover - covered through error path assertions
                 logger.debug(f"[Phase {phase_number}] Exception during task {task.value}: {exc}")
-                failed = True
-                responses.append(
-                    AgentResponse(
-                        agent_name=AgentType.CHATGPT,
-                        task_name=task.value,
-                        content="",
-                        success=False,
-                        error=str(exc),
-                    )
+                return AgentResponse(
+                    agent_name=AgentType.CHATGPT,
+                    task_name=task.value,
+                    content="",
+                    success=False,
+                    error=str(exc),
                 )
 
+        responses = await self.run_task_graph(session, tasks, _run_task, outputs)
+        failed = any(not response.success for response in responses)
+
         result.ai_responses = responses
         result.status = PhaseStatus.FAILED if failed else PhaseStatus.COMPLETED
         result.completed_at = datetime.now()
@@ -86,7 +86,8 @@ class Phase2Research(BasePhase):
         """
         Execute Phase 2: Research.
 
-        Uses batch processing if enabled for parallel Gemini + Perplexity execution.
+        Uses batch processing if enabled, otherwise the task-graph scheduler
+        runs Gemini and Perplexity concurrently.
 
         Args:
             session: Current pipeline session
@@ -109,7 +110,7 @@ class Phase2Research(BasePhase):
         if self.enable_batching and self.batch_processor:
             responses = await self._execute_with_batching(session, phase_number, tasks)
         else:
-            responses = await self._execute_sequential(session, phase_number, tasks)
+            responses = await self._execute_scheduled(session, phase_number, tasks)
 
         failed = any(not response.success for response in responses)
 
@@ -118,14 +119,17 @@ class Phase2Research(BasePhase):
         result.completed_at = datetime.now()
         return result
 
-    async def _execute_sequential(
+    async def _execute_scheduled(
         self,
         session: PipelineSession,
         phase_number: int,
         tasks: list[PhaseTask],
     ) -> list[AgentResponse]:
         """
-        Execute Phase 2 tasks sequentially (original behavior).
+        Execute Phase 2 tasks through the task-graph scheduler.
+
+        Gemini deep search and Perplexity fact-check share no outputs,
+        so they run concurrently on their own providers.
 
         Args:
             session: Current pipeline session
@@ -133,19 +137,13 @@ class Phase2Research(BasePhase):
             tasks: List of tasks to execute
 
         Returns:
-            List of agent responses
+            List of agent responses in task order
         """
-        responses: list[AgentResponse] = []
 
-        for task in tasks:
-            prompt = self.template_manager.render_prompt(
-                template_name=self._build_template_name(phase_number, task),
-                context={
-                    "topic": session.config.topic,
-                    "doc_type": session.config.doc_type.value,
-                    "language": session.config.language,
-                },
-            )
+        outputs: dict[PhaseTask, AgentResponse] = {}
+
+        async def _run_task(task: PhaseTask) -> AgentResponse:
+            prompt = await self.render_task_prompt(session, task, outputs)
 
             try:
                 response = await self.agent_router.execute(
@@ -154,7 +152,7 @@ class Phase2Research(BasePhase):
                     prompt=prompt,
                     doc_type=session.config.doc_type,
                 )
-                normalized_response = AgentResponse(
+                return AgentResponse(
                     agent_name=AgentType(response.agent_name),
                     task_name=response.task_name,
                     content=response.content,
@@ -163,19 +161,16 @@ class Phase2Research(BasePhase):
                     success=response.success,
                     error=response.error,
                 )
-                responses.append(normalized_response)
             except Exception as exc:  # pragma: no cover - covered through error path assertions
-                responses.append(
-                    AgentResponse(
-                        agent_name=AgentType.GEMINI,
-                        task_name=task.value,
-                        content="",
-                        success=False,
-                        error=str(exc),
-                    )
+                return AgentResponse(
+                    agent_name=AgentType.GEMINI,
+                    task_name=task.value,
+                    content="",
+                    success=False,
+                    error=str(exc),
                 )
 
-        return responses
+        return await self.run_task_graph(session, tasks, _run_task, outputs)
 
     async def _execute_with_batching(
         self,
@@ -202,14 +197,7 @@ class Phase2Research(BasePhase):
 
         # Enqueue all tasks
         for task in tasks:
-            prompt = self.template_manager.render_prompt(
-                template_name=self._build_template_name(phase_number, task),
-                context={
-                    "topic": session.config.topic,
-                    "doc_type": session.config.doc_type.value,
-                    "language": session.config.language,
-                },
-            )
+            prompt = await self.render_task_prompt(session, task)
 
             # Determine agent type from task
             agent_type = self._get_agent_type_for_task(task)
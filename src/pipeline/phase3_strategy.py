@@ -85,18 +85,10 @@ class Phase3Strategy(BasePhase):
             result.completed_at = datetime.now()
             return result
 
-        responses: list[AgentResponse] = []
-        failed = False
-
-        for task in tasks:
-            prompt = self.template_manager.render_prompt(
-                template_name=self._build_template_name(phase_number, task),
-                context={
-                    "topic": session.config.topic,
-                    "doc_type": session.config.doc_type.value,
-                    "language": session.config.language,
-                },
-            )
+        outputs: dict[PhaseTask, AgentResponse] = {}
+
+        async def _run_task(task: PhaseTask) -> AgentResponse:
+            prompt = await self.render_task_prompt(session, task, outputs)
 
             try:
                 response = await self.agent_router.execute(
@@ -114,21 +106,19 @@ class Phase3Strategy(BasePhase):
                     success=response.success,
                     error=response.error,
                 )
-                responses.append(normalized_response)
-                if not normalized_response.success:
-                    failed = True
+                return normalized_response
             except Exception as exc:  # pragma: no cover - covered through error path assertions
-                failed = True
-                responses.append(
-                    AgentResponse(
-                        agent_name=AgentType.CHATGPT,
-                        task_name=task.value,
-                        content="",
-                        success=False,
-                        error=str(exc),
-                    )
+                return AgentResponse(
+                    agent_name=AgentType.CHATGPT,
+                    task_name=task.value,
+                    content="",
+                    success=False,
+                    error=str(exc),
                 )
 
+        responses = await self.run_task_graph(session, tasks, _run_task, outputs)
+        failed = any(not response.success for response in responses)
+
         result.ai_responses = responses
         result.status = PhaseStatus.FAILED if failed else PhaseStatus.COMPLETED
         result.completed_at = datetime.now()
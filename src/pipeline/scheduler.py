@@ -0,0 +1,184 @@
+"""
+Task-graph scheduler for pipeline phases.
+
+Runs a set of tasks as a dependency graph:
+- A task starts as soon as every task it consumes has finished
+- Independent tasks run concurrently on the event loop
+- Per-provider semaphores cap how many requests hit one AI provider at once
+- An optional global limit caps total in-flight tasks (1 = sequential)
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from core.exceptions import PipelineException
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ScheduledTask:
+    """
+    A node in the task graph.
+
+    Attributes:
+        key: Unique task identifier (e.g., PhaseTask value)
+        run: Zero-argument coroutine factory executing the task
+        depends_on: Keys of tasks whose outputs this task consumes
+        resource: Provider key used for per-provider concurrency limits, or a
+            callable returning it once the task's dependencies have finished
+            (for routes chosen at run time)
+    """
+
+    key: Hashable
+    run: Callable[[], Awaitable[Any]]
+    depends_on: tuple[Hashable, ...] = ()
+    resource: str | Callable[[], str | None] | None = None
+
+
+class TaskScheduler:
+    """
+    Dependency-aware asyncio scheduler with per-provider concurrency limits.
+
+    Dependencies on keys that are not part of the submitted graph are treated
+    as already satisfied (e.g., outputs of an earlier, completed phase).
+
+    Semaphores live on the scheduler instance, so sharing one scheduler across
+    phases keeps the per-provider limits global for the whole pipeline.
+    """
+
+    DEFAULT_PROVIDER_LIMIT = 1
+
+    def __init__(
+        self,
+        provider_limits: dict[str, int] | None = None,
+        default_limit: int = DEFAULT_PROVIDER_LIMIT,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            provider_limits: Max concurrent tasks per provider key
+            default_limit: Limit for providers without an explicit entry (default: 1)
+            max_concurrency: Global cap on in-flight tasks (None = unlimited)
+        """
+        if default_limit < 1:
+            raise ValueError("default_limit must be >= 1")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self.provider_limits = dict(provider_limits or {})
+        self.default_limit = default_limit
+        self.max_concurrency = max_concurrency
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._global_semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    def _get_semaphore(self, resource: str) -> asyncio.Semaphore:
+        """Get or create the semaphore guarding a provider."""
+        if resource not in self._semaphores:
+            limit = self.provider_limits.get(resource, self.default_limit)
+            self._semaphores[resource] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[resource]
+
+    @staticmethod
+    def topological_order(tasks: list[ScheduledTask]) -> list[ScheduledTask]:
+        """
+        Order tasks so that every task follows its in-graph dependencies.
+
+        Declaration order is kept wherever dependencies allow it.
+
+        Args:
+            tasks: Task graph nodes
+
+        Returns:
+            Tasks in a valid execution order
+
+        Raises:
+            PipelineException: If keys are duplicated or the graph has a cycle
+        """
+        by_key: dict[Hashable, ScheduledTask] = {}
+        for task in tasks:
+            if task.key in by_key:
+                raise PipelineException(
+                    message=f"Duplicate task in graph: {task.key}",
+                    details={"task": str(task.key)},
+                )
+            by_key[task.key] = task
+
+        ordered: list[ScheduledTask] = []
+        done: set[Hashable] = set()
+        remaining = list(tasks)
+
+        while remaining:
+            ready = [
+                task
+                for task in remaining
+                if all(dep in done or dep not in by_key for dep in task.depends_on)
+            ]
+            if not ready:
+                raise PipelineException(
+                    message="Task graph contains a dependency cycle",
+                    details={"tasks": [str(task.key) for task in remaining]},
+                )
+            for task in ready:
+                ordered.append(task)
+                done.add(task.key)
+            remaining = [task for task in remaining if task.key not in done]
+
+        return ordered
+
+    async def run(self, tasks: list[ScheduledTask]) -> dict[Hashable, Any]:
+        """
+        Execute the task graph.
+
+        Args:
+            tasks: Task graph nodes
+
+        Returns:
+            Mapping of task key to the value returned by its coroutine
+
+        Raises:
+            PipelineException: If the graph is invalid
+            Exception: The first exception raised by a task (others are cancelled)
+        """
+        ordered = self.topological_order(tasks)
+        running: dict[Hashable, asyncio.Task] = {}
+
+        async def _run_node(node: ScheduledTask) -> Any:
+            deps = [running[dep] for dep in node.depends_on if dep in running]
+            if deps:
+                await asyncio.gather(*deps)
+
+            resource = node.resource() if callable(node.resource) else node.resource
+            semaphore = self._get_semaphore(resource) if resource else None
+
+            # Provider slot first, then global slot, so a task never holds a
+            # global slot while queueing behind a busy provider.
+            async with contextlib.AsyncExitStack() as stack:
+                if semaphore is not None:
+                    await stack.enter_async_context(semaphore)
+                if self._global_semaphore is not None:
+                    await stack.enter_async_context(self._global_semaphore)
+                logger.debug(f"[Scheduler] Running task {node.key} (resource={resource})")
+                return await node.run()
+
+        # Tasks are created in topological order so that, with equal readiness,
+        # they acquire provider slots in declaration order.
+        for node in ordered:
+            running[node.key] = asyncio.create_task(_run_node(node))
+
+        try:
+            await asyncio.gather(*running.values())
+        except BaseException:
+            for task in running.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+            raise
+
+        return {key: task.result() for key, task in running.items()}
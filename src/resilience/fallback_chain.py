@@ -3,12 +3,25 @@ Fallback chain for AI provider error recovery.
 
 Implements automatic fallback between AI providers when failures occur.
 Follows the chain: Claude -> Gemini -> ChatGPT -> Perplexity.
+
+With hedging enabled, a request still pending after the provider's recent
+latency percentile is duplicated to the next provider in the chain; the
+first successful response wins and the other request is cancelled. A token
+budget (refilled per request) caps how many requests are hedged.
+
+Circuit state lives in a ProviderHealthTracker, which records every
+completed attempt; pass the router's tracker to share one view of
+provider health between routing and failover.
 """
 
+import asyncio
+import math
 import time
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +29,11 @@ from core.exceptions import GatewayException
 from core.logger import get_logger
 from core.models import AgentType
 from gateway.base import BaseProvider, GatewayRequest, GatewayResponse
+from gateway.rate_limiter import classify_outcome, is_rate_limit_message
+from monitoring.health import ProviderHealthTracker
+
+if TYPE_CHECKING:
+    from gateway.rate_limiter import RateGovernor
 
 logger = get_logger(__name__)
 
@@ -26,8 +44,12 @@ class FallbackConfig(BaseModel):
     max_retries: int = Field(default=2, description="Maximum retries per provider")
     max_fallbacks: int = Field(default=3, description="Maximum number of provider fallbacks")
     enable_circuit_breaker: bool = Field(default=True, description="Enable circuit breaker")
-    circuit_breaker_threshold: int = Field(default=5, description="Failures before circuit opens")
-    circuit_breaker_timeout_ms: int = Field(default=60000, description="Circuit open timeout in ms")
+    circuit_breaker_threshold: int = Field(
+        default=5, description="Failures before circuit opens (when the chain owns its health tracker)"
+    )
+    circuit_breaker_timeout_ms: int = Field(
+        default=60000, description="Circuit open timeout in ms (when the chain owns its health tracker)"
+    )
     fallback_order: list[AgentType] = Field(
         default_factory=lambda: [
             AgentType.CLAUDE,
@@ -37,6 +59,13 @@ class FallbackConfig(BaseModel):
         ],
         description="Order of provider fallback",
     )
+    enable_hedging: bool = Field(default=False, description="Duplicate slow requests to the next provider")
+    hedge_percentile: float = Field(default=95.0, description="Provider latency percentile before hedging")
+    hedge_min_samples: int = Field(default=10, description="Latency samples needed to trust the percentile")
+    hedge_default_delay_ms: int = Field(default=30000, description="Hedge delay until enough samples exist")
+    hedge_budget_ratio: float = Field(default=0.1, description="Hedge tokens earned per request")
+    hedge_budget_burst: float = Field(default=2.0, description="Maximum banked hedge tokens")
+    latency_window: int = Field(default=100, description="Recent response times kept per provider")
 
 
 @dataclass
@@ -66,6 +95,7 @@ class FallbackContext:
     previous_errors: list[Exception] = field(default_factory=list)
     start_time: float = field(default_factory=time.time)
     fallback_count: int = 0
+    fallback_order: list[AgentType] | None = None
 
     def add_error(self, error: Exception) -> None:
         """Add an error to the context."""
@@ -76,11 +106,12 @@ class FallbackContext:
         return self.attempt_number <= config.max_retries
 
     def get_next_provider(self, config: FallbackConfig) -> AgentType | None:
-        """Get the next provider in the fallback chain."""
+        """Get the next provider in the fallback chain (this request's order, else the config's)."""
+        order = self.fallback_order or config.fallback_order
         try:
-            current_index = config.fallback_order.index(self.current_provider)
-            if current_index + 1 < len(config.fallback_order):
-                return config.fallback_order[current_index + 1]
+            current_index = order.index(self.current_provider)
+            if current_index + 1 < len(order):
+                return order[current_index + 1]
         except ValueError:
             pass
         return None
@@ -118,62 +149,148 @@ class FallbackChain:
     Automatically retries failed requests and falls back to alternative providers.
     """
 
-    def __init__(self, config: FallbackConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: FallbackConfig | None = None,
+        provider_health: ProviderHealthTracker | None = None,
+        rate_governor: "RateGovernor | None" = None,
+    ) -> None:
         """
         Initialize fallback chain.
 
         Args:
             config: Fallback configuration (uses defaults if None)
+            provider_health: Tracker holding latency, success rate and circuit
+                state (a private one built from config if None)
+            rate_governor: Per-provider governor whose slot each attempt holds
         """
         self.config = config or FallbackConfig()
-        self._circuit_states: dict[AgentType, dict[str, Any]] = {}
-
-    def _get_circuit_state(self, provider: AgentType) -> dict[str, Any]:
-        """Get circuit state for a provider."""
-        if provider not in self._circuit_states:
-            self._circuit_states[provider] = {
-                "state": "closed",  # closed, open, half_open
-                "failures": 0,
-                "last_failure_time": 0,
-            }
-        return self._circuit_states[provider]
+        self.provider_health = provider_health or ProviderHealthTracker(
+            circuit_threshold=self.config.circuit_breaker_threshold,
+            circuit_timeout=self.config.circuit_breaker_timeout_ms / 1000,
+        )
+        self.rate_governor = rate_governor
+        self._latencies: dict[AgentType, deque[float]] = {}
+        self._hedge_tokens = self.config.hedge_budget_burst
 
     def _is_circuit_open(self, provider: AgentType) -> bool:
         """Check if circuit is open for a provider."""
         if not self.config.enable_circuit_breaker:
             return False
+        return not self.provider_health.is_available(provider)
 
-        state = self._get_circuit_state(provider)
-        if state["state"] == "open":
-            # Check if timeout has passed
-            if time.time() - state["last_failure_time"] > (self.config.circuit_breaker_timeout_ms / 1000):
-                state["state"] = "half_open"
-                return False
-            return True
-        return False
-
-    def _record_success(self, provider: AgentType) -> None:
-        """Record successful request (reset circuit)."""
-        state = self._get_circuit_state(provider)
-        state["state"] = "closed"
-        state["failures"] = 0
-
-    def _record_failure(self, provider: AgentType) -> None:
-        """Record failed request (may open circuit)."""
-        if not self.config.enable_circuit_breaker:
-            return
-
-        state = self._get_circuit_state(provider)
-        state["failures"] += 1
-        state["last_failure_time"] = time.time()
-
-        if state["failures"] >= self.config.circuit_breaker_threshold:
-            state["state"] = "open"
-            logger.warning(
-                "Circuit breaker opened",
-                provider=provider.value,
-                failures=state["failures"],
-            )
+    def _record_latency(self, provider: AgentType, seconds: float) -> None:
+        """Record a provider response time."""
+        samples = self._latencies.get(provider)
+        if samples is None:
+            samples = self._latencies[provider] = deque(maxlen=self.config.latency_window)
+        samples.append(seconds)
+
+    def hedge_delay(self, provider: AgentType) -> float:
+        """
+        Get how long to wait for a provider before hedging.
+
+        Args:
+            provider: Provider handling the request
+
+        Returns:
+            Seconds: the configured percentile of its recent response times,
+            or the default delay while there are too few samples
+        """
+        samples = self._latencies.get(provider)
+        if not samples or len(samples) < self.config.hedge_min_samples:
+            return self.config.hedge_default_delay_ms / 1000
+        ordered = sorted(samples)
+        rank = math.ceil(self.config.hedge_percentile / 100 * len(ordered)) - 1
+        return ordered[min(len(ordered) - 1, max(0, rank))]
+
+    def _get_hedge_provider(
+        self, provider: AgentType, providers: dict[AgentType, BaseProvider]
+    ) -> AgentType | None:
+        """Get the next available provider after ``provider`` in the fallback order."""
+        order = self.config.fallback_order
+        if provider not in order:
+            return None
+        for candidate in order[order.index(provider) + 1 :]:
+            if candidate in providers and not self._is_circuit_open(candidate):
+                return candidate
+        return None
+
+    async def _send(self, provider_type: AgentType, provider: BaseProvider, request: GatewayRequest) -> GatewayResponse:
+        """
+        Send a request, recording the provider's response time and health.
+
+        Only completed requests (success or error) are sampled. A cancelled
+        hedge loser's elapsed time is just a lower bound; sampling it would
+        pull the percentile down and make hedging ever more frequent.
+        """
+        if self.rate_governor is None:
+            return await self._send_observed(provider_type, provider, request)
+        # Health is observed inside the slot so latency is service time, not queueing
+        async with self.rate_governor.get(provider_type).slot() as slot:
+            response = await self._send_observed(provider_type, provider, request)
+            slot.record(classify_outcome(response))
+        return response
+
+    async def _send_observed(
+        self, provider_type: AgentType, provider: BaseProvider, request: GatewayRequest
+    ) -> GatewayResponse:
+        started = time.monotonic()
+        with self.provider_health.observe(provider_type) as probe:
+            try:
+                response = await provider.send_message(request)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._record_latency(provider_type, time.monotonic() - started)
+                raise
+            probe.record(response)
+        self._record_latency(provider_type, time.monotonic() - started)
+        return response
+
+    async def _send_hedged(
+        self,
+        request: GatewayRequest,
+        provider_type: AgentType,
+        providers: dict[AgentType, BaseProvider],
+    ) -> tuple[GatewayResponse, AgentType]:
+        """
+        Send a request, hedging to the next provider if it is slow.
+
+        Args:
+            request: Gateway request
+            provider_type: Provider the request is meant for
+            providers: Available providers
+
+        Returns:
+            (response, provider that produced it); if no request succeeds the
+            primary's response is returned (or its exception raised)
+        """
+        primary = asyncio.create_task(self._send(provider_type, providers[provider_type], request))
+        tasks = {primary: provider_type}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay(provider_type))
+            hedge_type = None if done else self._get_hedge_provider(provider_type, providers)
+            if hedge_type is None or self._hedge_tokens < 1:
+                return await primary, provider_type
+
+            self._hedge_tokens -= 1
+            logger.info("Hedging slow request", provider=provider_type.value, hedge_provider=hedge_type.value)
+            hedge = asyncio.create_task(self._send(hedge_type, providers[hedge_type], request))
+            tasks[hedge] = hedge_type
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None and task.result().success:
+                        return task.result(), tasks[task]
+            return await primary, provider_type
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
 
     def _classify_error(self, error: Exception) -> FallbackReason:
         """Classify error into fallback reason type."""
@@ -184,7 +301,7 @@ class FallbackChain:
             error_type = FallbackReason.Type.TIMEOUT
         elif "connection" in error_message.lower():
             error_type = FallbackReason.Type.CONNECTION_ERROR
-        elif "rate limit" in error_message.lower():
+        elif is_rate_limit_message(error_message):
             error_type = FallbackReason.Type.RATE_LIMIT
         elif isinstance(error, GatewayException):
             error_type = FallbackReason.Type.RESPONSE_ERROR
@@ -240,6 +357,7 @@ class FallbackChain:
         request: GatewayRequest,
         initial_provider: AgentType,
         providers: dict[AgentType, BaseProvider],
+        fallback_order: Sequence[AgentType] | None = None,
     ) -> GatewayResponse:
         """
         Execute request with fallback chain.
@@ -248,6 +366,7 @@ class FallbackChain:
             request: Gateway request to execute
             initial_provider: Starting provider for the request
             providers: Dictionary of available providers
+            fallback_order: Provider order for this request (config order if None)
 
         Returns:
             GatewayResponse from successful provider or error response
@@ -258,8 +377,13 @@ class FallbackChain:
         context = FallbackContext(
             request=request,
             current_provider=initial_provider,
+            fallback_order=list(fallback_order) if fallback_order else None,
         )
         original_provider = initial_provider
+        if self.config.enable_hedging:
+            self._hedge_tokens = min(
+                self.config.hedge_budget_burst, self._hedge_tokens + self.config.hedge_budget_ratio
+            )
 
         while True:
             # Check circuit breaker
@@ -286,16 +410,20 @@ class FallbackChain:
             else:
                 # Execute request
                 try:
-                    response = await provider.send_message(request)
+                    served_by = context.current_provider
+                    if self.config.enable_hedging:
+                        response, served_by = await self._send_hedged(request, context.current_provider, providers)
+                    else:
+                        response = await self._send(context.current_provider, provider, request)
 
                     if response.success:
-                        # Record success and return
-                        self._record_success(context.current_provider)
                         response.metadata = response.metadata or {}
-                        if context.fallback_count > 0:
+                        if context.fallback_count > 0 or served_by != context.current_provider:
                             response.metadata["fallback_used"] = True
                             response.metadata["original_provider"] = original_provider.value
-                            response.metadata["final_provider"] = context.current_provider.value
+                            response.metadata["final_provider"] = served_by.value
+                        if served_by != context.current_provider:
+                            response.metadata["hedged"] = True
                         return response
 
                     # Non-success response
@@ -321,7 +449,6 @@ class FallbackChain:
                 continue
 
             elif decision.action == FallbackDecision.Action.FALLBACK:
-                self._record_failure(context.current_provider)
                 context.current_provider = decision.next_provider
                 context.fallback_count += 1
                 context.attempt_number = 1
@@ -335,7 +462,6 @@ class FallbackChain:
                 continue
 
             else:  # FAIL
-                self._record_failure(context.current_provider)
                 break
 
         # All providers exhausted
@@ -2,6 +2,7 @@
 Template management modules.
 """
 
+import hashlib
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +34,7 @@ class TemplateManager(BaseModel):
 
     template_dir: Path | None = None
     env: Environment = None
+    _version: str | None = None
 
     def __init__(self, **data):
         """Initialize TemplateManager with Jinja2 environment."""
@@ -64,3 +66,22 @@ class TemplateManager(BaseModel):
         """Render prompt template with context."""
         template = self.get_prompt_template(template_name)
         return template.render(**context)
+
+    def get_version(self) -> str:
+        """
+        Get a content hash identifying the current template set.
+
+        Changes to any template file produce a new version, which lets
+        response caches distinguish prompts rendered from edited templates.
+
+        Returns:
+            First 12 hex chars of a SHA-256 over template paths and contents
+        """
+        if self._version is None:
+            digest = hashlib.sha256()
+            if self.template_dir is not None and self.template_dir.exists():
+                for path in sorted(self.template_dir.rglob("*.jinja2")):
+                    digest.update(path.relative_to(self.template_dir).as_posix().encode())
+                    digest.update(path.read_bytes())
+            self._version = digest.hexdigest()[:12]
+        return self._version
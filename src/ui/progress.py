@@ -92,6 +92,27 @@ class PipelineProgress:
             completed=phase_number,
         )
 
+    def update_stream(self, task_name: str, chars_received: int, done: bool = False) -> None:
+        """
+        Show live output of a streaming task.
+
+        Args:
+            task_name: Task currently streaming
+            chars_received: Characters received so far
+            done: Whether the task's response is complete
+        """
+        if self.task_id is None:
+            return
+
+        status = "[green]done[/green]" if done else "[yellow]streaming[/yellow]"
+        self.progress.update(
+            self.task_id,
+            description=(
+                f"[cyan]Phase {self.current_phase}[/cyan] | {task_name} {status} "
+                f"[dim]({chars_received:,} chars)[/dim]"
+            ),
+        )
+
     def complete_phase(self, phase_number: int) -> None:
         """
         Mark a phase as completed.
@@ -6,6 +6,7 @@ import pytest
 
 from agents.base import AgentRequest, AgentResponse, AsyncAgent
 from agents.router import AgentRouter, PhaseTask
+from cache.manager import CacheManager, CacheMode
 from core.exceptions import AgentException as CoreAgentException
 from core.models import AgentType, DocumentType
 from src.core.exceptions import AgentException as SrcAgentException
@@ -16,17 +17,21 @@ class _DummyGateway:
 
 
 class _DummyAgent(AsyncAgent):
-    def __init__(self) -> None:
+    def __init__(self, success: bool = True) -> None:
         super().__init__(gateway_provider=_DummyGateway())
         self.last_request: AgentRequest | None = None
+        self.calls = 0
+        self._success = success
 
     async def execute(self, request: AgentRequest) -> AgentResponse:
         self.last_request = request
+        self.calls += 1
         return AgentResponse(
             agent_name="chatgpt",
             task_name=request.task_name,
-            content="ok",
-            success=True,
+            content=f"ok {self.calls}" if self._success else "",
+            success=self._success,
+            error=None if self._success else "failed",
         )
 
 
@@ -77,3 +82,127 @@ async def test_execute_raises_when_mapping_missing():
             prompt="hello",
             doc_type=DocumentType.BIZPLAN,
         )
+
+
+async def _execute_brainstorm(router: AgentRouter, prompt: str = "hello") -> AgentResponse:
+    return await router.execute(
+        phase=1,
+        task=PhaseTask.BRAINSTORM_CHATGPT,
+        prompt=prompt,
+        doc_type=DocumentType.BIZPLAN,
+    )
+
+
+@pytest.mark.anyio
+async def test_execute_returns_cache_hit_without_calling_agent(tmp_path):
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent()
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(CacheManager(cache_dir=tmp_path))
+
+    first = await _execute_brainstorm(router, "hello   world")
+    second = await _execute_brainstorm(router, "hello world")
+
+    assert agent.calls == 1
+    assert second.content == first.content
+    assert second.task_name == PhaseTask.BRAINSTORM_CHATGPT.value
+    assert second.response_time == 0.0
+
+
+@pytest.mark.anyio
+async def test_execute_does_not_cache_failed_responses(tmp_path):
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent(success=False)
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(CacheManager(cache_dir=tmp_path))
+
+    await _execute_brainstorm(router)
+    await _execute_brainstorm(router)
+
+    assert agent.calls == 2
+
+
+@pytest.mark.anyio
+async def test_execute_refresh_mode_overwrites_cache(tmp_path):
+    manager = CacheManager(cache_dir=tmp_path)
+    agent = _DummyAgent()
+
+    router = AgentRouter(settings=None)
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(manager, mode=CacheMode.REFRESH)
+    await _execute_brainstorm(router)
+    refreshed = await _execute_brainstorm(router)
+
+    router.enable_cache(manager, mode=CacheMode.USE)
+    cached = await _execute_brainstorm(router)
+
+    assert agent.calls == 2
+    assert cached.content == refreshed.content == "ok 2"
+
+
+@pytest.mark.anyio
+async def test_execute_bypass_mode_skips_cache(tmp_path):
+    manager = CacheManager(cache_dir=tmp_path)
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent()
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(manager, mode=CacheMode.BYPASS)
+
+    await _execute_brainstorm(router)
+    await _execute_brainstorm(router)
+
+    assert agent.calls == 2
+    assert manager.list_entries() == []
+
+
+@pytest.mark.anyio
+async def test_cache_key_includes_template_version(tmp_path):
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent()
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(CacheManager(cache_dir=tmp_path))
+
+    router.template_version = "v1"
+    await _execute_brainstorm(router)
+    router.template_version = "v2"
+    await _execute_brainstorm(router)
+
+    assert agent.calls == 2
+
+
+RESEARCH_PROMPT = (
+    "Research the market for {topic}. Cover market size, growth drivers, key competitors, "
+    "regulation, customer segments, pricing benchmarks and distribution channels. "
+    "Cite recent sources for every figure and summarize the main risks for a new entrant."
+)
+
+
+@pytest.mark.anyio
+async def test_execute_reuses_similar_prompt_for_opted_in_task(tmp_path):
+    manager = CacheManager(cache_dir=tmp_path)
+    manager.enable_similarity([PhaseTask.BRAINSTORM_CHATGPT.value], threshold=0.7)
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent()
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(manager)
+
+    first = await _execute_brainstorm(router, RESEARCH_PROMPT.format(topic="AI-powered smart farming in Korea"))
+    second = await _execute_brainstorm(router, RESEARCH_PROMPT.format(topic="AI-powered smart farming in Japan"))
+
+    assert agent.calls == 1
+    assert second.content == first.content
+
+
+@pytest.mark.anyio
+async def test_execute_similar_prompt_ignored_without_opt_in(tmp_path):
+    manager = CacheManager(cache_dir=tmp_path)
+    manager.enable_similarity([PhaseTask.DEEP_SEARCH_GEMINI.value], threshold=0.7)
+    router = AgentRouter(settings=None)
+    agent = _DummyAgent()
+    router.register_agent(AgentType.CHATGPT, agent)
+    router.enable_cache(manager)
+
+    await _execute_brainstorm(router, RESEARCH_PROMPT.format(topic="AI-powered smart farming in Korea"))
+    await _execute_brainstorm(router, RESEARCH_PROMPT.format(topic="AI-powered smart farming in Japan"))
+
+    assert agent.calls == 2
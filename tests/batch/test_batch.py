@@ -14,9 +14,10 @@ from uuid import uuid4
 import pytest
 
 from src.agents.base import AgentRequest, AgentResponse
+from src.agents.router import PhaseTask
 from src.batch.processor import BatchProcessor
 from src.batch.queue import BatchQueue, BatchRequest
-from src.core.models import AgentType
+from src.core.models import AgentType, DocumentType
 
 
 class TestBatchRequest:
@@ -339,3 +340,34 @@ class TestBatchProcessor:
         assert stats["total_processed"] == 0
         assert stats["total_batches"] == 0
         assert stats["total_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_routed_by_task_name(self):
+        """Test queued requests reach the router with a real (phase, task, doc_type) route."""
+        mock_router = AsyncMock()
+        mock_router.execute.return_value = AgentResponse(
+            agent_name=AgentType.PERPLEXITY,
+            task_name="verify_perplexity",
+            content="Test response",
+            success=True,
+        )
+        processor = BatchProcessor(router=mock_router, max_batch_size=5)
+
+        await processor.enqueue(
+            agent_type=AgentType.PERPLEXITY,
+            request=AgentRequest(task_name="verify_perplexity", prompt="Prompt", timeout=120),
+        )
+        await processor.enqueue(
+            agent_type=AgentType.GEMINI,
+            request=AgentRequest(task_name="unknown_task", prompt="Prompt", timeout=120),
+        )
+        await processor.process_batch()
+
+        routes = {
+            (call.kwargs["phase"], call.kwargs["task"], call.kwargs["doc_type"])
+            for call in mock_router.execute.call_args_list
+        }
+        assert routes == {
+            (5, PhaseTask.VERIFY_PERPLEXITY, DocumentType.BIZPLAN),
+            (2, PhaseTask.DEEP_SEARCH_GEMINI, DocumentType.BIZPLAN),
+        }
@@ -0,0 +1,145 @@
+"""
+Tests for the multi-topic batch runner.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from batch.runner import BatchLedger, BatchRunner, LedgerEntry, TopicStatus, load_topics
+from core.exceptions import PipelineException
+from core.models import DocumentType, PipelineSession, PipelineState, TemplateType
+
+
+def _write_topics(path: Path, *entries: dict) -> Path:
+    path.write_text("\n".join(json.dumps(entry) for entry in entries) + "\n", encoding="utf-8")
+    return path
+
+
+class _FakeOrchestrator:
+    """Records concurrency and returns a finished session."""
+
+    running = 0
+    peak = 0
+
+    def __init__(self, fail_topics: set[str] = frozenset()) -> None:
+        self.fail_topics = fail_topics
+
+    async def run_pipeline(self, config):
+        type(self).running += 1
+        type(self).peak = max(type(self).peak, type(self).running)
+        await asyncio.sleep(0.01)
+        type(self).running -= 1
+        if config.topic in self.fail_topics:
+            raise RuntimeError("provider unavailable")
+        session = PipelineSession(config=config)
+        session.state = PipelineState.COMPLETED
+        return session
+
+
+class TestLoadTopics:
+    """Test topics file parsing."""
+
+    def test_parses_configs_and_output_dirs(self, tmp_path: Path):
+        """Test each line becomes a PipelineConfig under its own output directory."""
+        topics_file = _write_topics(
+            tmp_path / "topics.jsonl",
+            {"id": "agri", "topic": "AI-powered sustainable agriculture"},
+            {"topic": "Quantum computing for drug discovery", "doc_type": "rd", "language": "en"},
+        )
+
+        topics = load_topics(topics_file, tmp_path / "out")
+
+        assert topics[0].topic_id == "agri"
+        assert topics[0].config.output_dir == tmp_path / "out" / "agri"
+        assert topics[1].config.doc_type == DocumentType.RD
+        assert topics[1].config.template == TemplateType.RD
+        assert topics[1].topic_id.startswith("topic-")
+
+    def test_derived_ids_are_stable(self, tmp_path: Path):
+        """Test derived IDs do not change between reads."""
+        topics_file = _write_topics(tmp_path / "topics.jsonl", {"topic": "AI-powered sustainable agriculture"})
+
+        first = load_topics(topics_file, tmp_path)
+        second = load_topics(topics_file, tmp_path)
+
+        assert first[0].topic_id == second[0].topic_id
+
+    def test_invalid_line_reports_line_number(self, tmp_path: Path):
+        """Test invalid topics are rejected with their line number."""
+        topics_file = _write_topics(
+            tmp_path / "topics.jsonl",
+            {"topic": "AI-powered sustainable agriculture"},
+            {"topic": "short"},
+        )
+
+        with pytest.raises(PipelineException, match="line 2"):
+            load_topics(topics_file, tmp_path)
+
+
+class TestBatchLedger:
+    """Test the append-only ledger."""
+
+    def test_latest_entry_wins_and_truncated_lines_ignored(self, tmp_path: Path):
+        """Test reading back keeps the last status per topic."""
+        ledger = BatchLedger(tmp_path)
+        ledger.record(LedgerEntry(topic_id="a", status=TopicStatus.RUNNING, timestamp=1.0))
+        ledger.record(LedgerEntry(topic_id="a", status=TopicStatus.COMPLETED, timestamp=2.0, session_id="s1"))
+        with open(ledger.path, "a", encoding="utf-8") as f:
+            f.write('{"topic_id": "b", "sta')
+
+        latest = ledger.load()
+
+        assert list(latest) == ["a"]
+        assert latest["a"].status == TopicStatus.COMPLETED
+        assert latest["a"].session_id == "s1"
+
+
+class TestBatchRunner:
+    """Test BatchRunner scheduling and resumption."""
+
+    @pytest.fixture(autouse=True)
+    def reset_counters(self):
+        _FakeOrchestrator.running = 0
+        _FakeOrchestrator.peak = 0
+
+    @pytest.fixture
+    def topics(self, tmp_path: Path):
+        topics_file = _write_topics(
+            tmp_path / "topics.jsonl",
+            *({"id": f"t{i}", "topic": f"Business plan topic number {i}"} for i in range(5)),
+        )
+        return load_topics(topics_file, tmp_path / "out")
+
+    async def test_runs_topics_with_bounded_parallelism(self, tmp_path: Path, topics):
+        """Test no more than max_parallel_topics pipelines run at once."""
+        runner = BatchRunner(
+            orchestrator_factory=_FakeOrchestrator,
+            ledger=BatchLedger(tmp_path / "out"),
+            max_parallel_topics=2,
+            use_browser_pool=False,
+        )
+
+        results = await runner.run(topics)
+
+        assert [entry.status for entry in results] == [TopicStatus.COMPLETED] * 5
+        assert _FakeOrchestrator.peak == 2
+        assert results[0].output_dir.startswith(str(tmp_path / "out" / "t0"))
+
+    async def test_failures_recorded_and_rerun_skips_completed(self, tmp_path: Path, topics):
+        """Test a failed topic is retried on rerun while completed ones are skipped."""
+        ledger = BatchLedger(tmp_path / "out")
+        runner = BatchRunner(
+            orchestrator_factory=lambda: _FakeOrchestrator(fail_topics={"Business plan topic number 3"}),
+            ledger=ledger,
+            use_browser_pool=False,
+        )
+
+        results = await runner.run(topics)
+
+        assert results[3].status == TopicStatus.FAILED
+        assert "provider unavailable" in results[3].error
+        assert [topic.topic_id for topic in runner.pending_topics(topics)] == ["t3"]
+        assert runner.pending_topics(topics, retry_failed=False) == []
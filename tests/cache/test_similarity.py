@@ -0,0 +1,181 @@
+"""
+Tests for the near-duplicate prompt index.
+"""
+
+from pathlib import Path
+
+from agents.base import AgentRequest, AgentResponse, AsyncAgent
+from agents.router import AgentRouter, PhaseTask
+from cache.manager import CacheManager
+from cache.similarity import SimilarityIndex, minhash_signature, signature_similarity
+from core.models import AgentType, DocumentType
+from gateway.models import GatewayResponse
+
+TEMPLATE = (
+    "Conduct a deep search on {topic}. Report the market size with sources, the growth rate over "
+    "the last five years, the leading companies and their market share, relevant government "
+    "policies, and the technology trends that will shape the next decade."
+)
+SCOPE = "gemini:2:deep_search_gemini:bizplan:"
+
+
+class _CountingAgent(AsyncAgent):
+    def __init__(self) -> None:
+        super().__init__(gateway_provider=None)
+        self.calls = 0
+
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        self.calls += 1
+        return AgentResponse(
+            agent_name=AgentType.GEMINI, task_name=request.task_name, content="Deep search report", success=True
+        )
+
+
+class TestSignatures:
+    """Test MinHash signatures."""
+
+    def test_identical_text_scores_one(self):
+        """Test a text is fully similar to itself."""
+        signature = minhash_signature(TEMPLATE.format(topic="smart farming"))
+
+        assert signature_similarity(signature, signature) == 1.0
+
+    def test_similar_scores_above_unrelated(self):
+        """Test a reworded topic stays closer than an unrelated prompt."""
+        base = minhash_signature(TEMPLATE.format(topic="AI-powered smart farming"))
+        reworded = minhash_signature(TEMPLATE.format(topic="AI-based smart farming"))
+        unrelated = minhash_signature("Write a short poem about autumn leaves falling in a quiet park.")
+
+        assert signature_similarity(base, reworded) > 0.7
+        assert signature_similarity(base, unrelated) < 0.2
+
+    def test_empty_text_has_no_signature(self):
+        """Test whitespace-only prompts are not indexed."""
+        assert minhash_signature("   ") is None
+
+
+class TestSimilarityIndex:
+    """Test lookups and persistence."""
+
+    def test_find_best_match_in_scope(self):
+        """Test the similar prompt is found only in its own scope."""
+        index = SimilarityIndex(threshold=0.7)
+        index.add(SCOPE, "key-1", TEMPLATE.format(topic="AI-powered smart farming"))
+
+        match = index.find(SCOPE, TEMPLATE.format(topic="AI-based smart farming"))
+
+        assert match is not None
+        assert match.key == "key-1"
+        assert 0.7 <= match.score < 1.0
+        assert index.find("claude:2:deep_search_gemini:bizplan:", TEMPLATE.format(topic="AI-based smart farming")) is None
+
+    def test_below_threshold_is_miss(self):
+        """Test unrelated prompts do not match."""
+        index = SimilarityIndex(threshold=0.7)
+        index.add(SCOPE, "key-1", TEMPLATE.format(topic="AI-powered smart farming"))
+
+        assert index.find(SCOPE, "Summarize the quarterly revenue of a bakery chain.") is None
+
+    def test_oldest_entries_forgotten(self):
+        """Test each scope keeps at most max_entries_per_scope prompts."""
+        index = SimilarityIndex(threshold=0.7, max_entries_per_scope=2)
+        for number in range(3):
+            index.add(SCOPE, f"key-{number}", f"Prompt number {number} " + TEMPLATE.format(topic=f"topic {number}"))
+
+        assert len(index) == 2
+        match = index.find(SCOPE, f"Prompt number 0 {TEMPLATE.format(topic='topic 0')}")
+        assert match is None or match.key != "key-0"
+
+    def test_persisted_across_instances(self, tmp_path: Path):
+        """Test the index is reloaded from its file."""
+        index_file = tmp_path / "similarity_index.json"
+        index = SimilarityIndex(index_file, threshold=0.7)
+        index.add(SCOPE, "key-1", TEMPLATE.format(topic="smart farming"))
+        index.close()
+
+        reloaded = SimilarityIndex(index_file, threshold=0.7)
+
+        assert reloaded.find(SCOPE, TEMPLATE.format(topic="smart farming")).key == "key-1"
+
+    def test_writes_are_batched(self, tmp_path: Path):
+        """Test the file is rewritten once per batch of changes, not per stored prompt."""
+        index_file = tmp_path / "similarity_index.json"
+        index = SimilarityIndex(index_file, threshold=0.7)
+        index.SAVE_EVERY_CHANGES = 3
+
+        for number in range(2):
+            index.add(SCOPE, f"key-{number}", TEMPLATE.format(topic=f"topic {number}"))
+        assert not index_file.exists()
+
+        index.add(SCOPE, "key-2", TEMPLATE.format(topic="topic 2"))
+        index.add(SCOPE, "key-3", TEMPLATE.format(topic="topic 3"))
+        assert len(SimilarityIndex(index_file)) == 3
+
+        index.close()
+        assert len(SimilarityIndex(index_file)) == 4
+
+    def test_corrupt_file_ignored(self, tmp_path: Path):
+        """Test an unreadable index file starts an empty index."""
+        index_file = tmp_path / "similarity_index.json"
+        index_file.write_text("{not json")
+
+        assert len(SimilarityIndex(index_file)) == 0
+
+
+class TestCacheManagerSimilarity:
+    """Test near-duplicate lookups through CacheManager."""
+
+    async def test_match_reported_in_metadata(self, tmp_path: Path):
+        """Test the matched response carries the similarity score."""
+        manager = CacheManager(cache_dir=tmp_path)
+        manager.enable_similarity(["deep_search_gemini"], threshold=0.7)
+        await manager.set("key-1", GatewayResponse(content="Deep search report", success=True))
+        manager.index_prompt(SCOPE, "key-1", TEMPLATE.format(topic="AI-powered smart farming"))
+
+        cached = await manager.find_similar(SCOPE, TEMPLATE.format(topic="AI-based smart farming"))
+
+        assert manager.similarity_enabled("deep_search_gemini")
+        assert not manager.similarity_enabled("brainstorm_chatgpt")
+        assert cached.content == "Deep search report"
+        assert cached.metadata["cache_match"] == "similar"
+        assert cached.metadata["matched_key"] == "key-1"
+        assert 0.7 <= cached.metadata["similarity"] < 1.0
+
+    async def test_stale_match_removed(self, tmp_path: Path):
+        """Test an index entry whose response is gone is dropped."""
+        manager = CacheManager(cache_dir=tmp_path)
+        manager.enable_similarity(["deep_search_gemini"], threshold=0.7)
+        manager.index_prompt(SCOPE, "missing", TEMPLATE.format(topic="smart farming"))
+
+        assert await manager.find_similar(SCOPE, TEMPLATE.format(topic="smart farming")) is None
+        assert len(manager.similarity_index) == 0
+
+
+class TestRouterSimilarity:
+    """Test similar-prompt hits reach the router's caller."""
+
+    async def test_match_reported_in_agent_response(self, tmp_path: Path):
+        """Test a response replayed for a similar prompt says how it matched."""
+        manager = CacheManager(cache_dir=tmp_path)
+        manager.enable_similarity(["deep_search_gemini"], threshold=0.7)
+        router = AgentRouter(settings=None)
+        agent = _CountingAgent()
+        router.register_agent(AgentType.GEMINI, agent)
+        router.enable_cache(manager)
+
+        first = await router.execute(
+            2, PhaseTask.DEEP_SEARCH_GEMINI, TEMPLATE.format(topic="AI-powered smart farming"), DocumentType.BIZPLAN
+        )
+        exact = await router.execute(
+            2, PhaseTask.DEEP_SEARCH_GEMINI, TEMPLATE.format(topic="AI-powered smart farming"), DocumentType.BIZPLAN
+        )
+        similar = await router.execute(
+            2, PhaseTask.DEEP_SEARCH_GEMINI, TEMPLATE.format(topic="AI-based smart farming"), DocumentType.BIZPLAN
+        )
+
+        assert agent.calls == 1
+        assert "cache_match" not in first.metadata
+        assert exact.metadata["cache_match"] == "exact"
+        assert similar.content == "Deep search report"
+        assert similar.metadata["cache_match"] == "similar"
+        assert 0.7 <= similar.metadata["similarity"] < 1.0
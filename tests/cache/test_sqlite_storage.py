@@ -0,0 +1,165 @@
+"""
+Tests for the SQLite cache storage backend.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from cache.manager import CacheManager
+from cache.sqlite_storage import SQLiteCacheStorage
+from cache.storage import CacheStorage
+from gateway.models import GatewayResponse
+
+
+@pytest.fixture
+def sample_response() -> GatewayResponse:
+    """Create sample gateway response."""
+    return GatewayResponse(content="Test response content", success=True, tokens_used=10)
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteCacheStorage:
+    """Create SQLite storage in a temporary directory."""
+    store = SQLiteCacheStorage(cache_dir=tmp_path / "cache")
+    yield store
+    store.close()
+
+
+class TestSQLiteCacheStorage:
+    """Test SQLiteCacheStorage behaviour."""
+
+    def test_init_creates_database(self, tmp_path: Path):
+        """Test initialization creates a single database file."""
+        store = SQLiteCacheStorage(cache_dir=tmp_path / "cache")
+        assert (tmp_path / "cache" / "cache.db").exists()
+        assert not (tmp_path / "cache" / "responses").exists()
+        store.close()
+
+    def test_save_and_retrieve(self, storage: SQLiteCacheStorage, sample_response: GatewayResponse):
+        """Test saving and retrieving a response."""
+        storage.save(key="key", response=sample_response, ttl_hours=24)
+
+        retrieved = storage.get("key")
+
+        assert retrieved is not None
+        assert retrieved.content == sample_response.content
+        assert retrieved.tokens_used == 10
+
+    def test_get_nonexistent_key(self, storage: SQLiteCacheStorage):
+        """Test missing keys return None."""
+        assert storage.get("missing") is None
+
+    def test_expired_entry_returns_none(
+        self, storage: SQLiteCacheStorage, sample_response: GatewayResponse
+    ):
+        """Test expired entries are treated as misses and removed."""
+        storage.save(key="expired", response=sample_response, ttl_hours=-1)
+
+        assert storage.get("expired") is None
+        assert storage.get_stats().total_entries == 0
+
+    def test_hit_updates_access_tracking(
+        self, storage: SQLiteCacheStorage, sample_response: GatewayResponse
+    ):
+        """Test hits bump access_count and last_accessed in place."""
+        storage.save(key="key", response=sample_response, ttl_hours=24)
+
+        storage.get("key")
+        storage.get("key")
+        entry = storage.list()[0]
+
+        assert entry.access_count == 2
+        assert entry.last_accessed is not None
+
+    def test_overwrite_keeps_single_entry(
+        self, storage: SQLiteCacheStorage, sample_response: GatewayResponse
+    ):
+        """Test saving the same key twice replaces the entry."""
+        storage.save(key="key", response=sample_response, ttl_hours=24)
+        storage.save(key="key", response=GatewayResponse(content="new", success=True), ttl_hours=24)
+
+        assert storage.count() == 1
+        assert storage.get("key").content == "new"
+
+    def test_list_orders_by_recent_use_and_limits(
+        self, storage: SQLiteCacheStorage, sample_response: GatewayResponse
+    ):
+        """Test list returns most recently used first and honours limit."""
+        for i in range(3):
+            storage.save(key=f"key_{i}", response=sample_response, ttl_hours=24)
+        storage.get("key_0")
+
+        entries = storage.list(limit=2)
+
+        assert [e.key for e in entries][0] == "key_0"
+        assert len(entries) == 2
+        assert storage.count() == 3
+
+    def test_lru_eviction(self, tmp_path: Path):
+        """Test least recently used entries are evicted over the size limit."""
+        store = SQLiteCacheStorage(cache_dir=tmp_path / "cache", max_size_mb=1)
+        large_response = GatewayResponse(content="x" * 200_000, success=True)
+
+        for i in range(10):
+            store.save(key=f"large_key_{i}", response=large_response, ttl_hours=24)
+            if i == 0:
+                store.get("large_key_0")  # keep the first entry hot
+
+        keys = {entry.key for entry in store.list()}
+        stats = store.get_stats()
+
+        assert len(keys) < 10
+        assert "large_key_1" not in keys
+        assert "large_key_9" in keys
+        assert stats.total_size_bytes <= store.max_size_bytes
+        store.close()
+
+    def test_clear(self, storage: SQLiteCacheStorage, sample_response: GatewayResponse):
+        """Test clearing removes every entry and resets counters."""
+        for i in range(3):
+            storage.save(key=f"key_{i}", response=sample_response, ttl_hours=24)
+        storage.get("key_0")
+
+        assert storage.clear() == 3
+        stats = storage.get_stats()
+        assert stats.total_entries == 0
+        assert stats.hit_count == 0
+
+    def test_stats_persist_across_instances(
+        self, tmp_path: Path, sample_response: GatewayResponse
+    ):
+        """Test batched hit/miss counters survive close and reopen."""
+        store = SQLiteCacheStorage(cache_dir=tmp_path / "cache")
+        store.save(key="key", response=sample_response, ttl_hours=24)
+        store.get("key")
+        store.get("missing")
+        store.close()
+
+        reopened = SQLiteCacheStorage(cache_dir=tmp_path / "cache")
+        stats = reopened.get_stats()
+
+        assert stats.total_entries == 1
+        assert stats.hit_count == 1
+        assert stats.miss_count == 1
+        reopened.close()
+
+
+class TestCacheManagerBackends:
+    """Test backend selection in CacheManager."""
+
+    def test_default_backend_is_sqlite(self, tmp_path: Path):
+        """Test CacheManager uses SQLite storage by default."""
+        manager = CacheManager(cache_dir=tmp_path)
+        assert isinstance(manager.storage, SQLiteCacheStorage)
+        manager.close()
+
+    def test_json_backend(self, tmp_path: Path):
+        """Test the per-entry JSON backend remains selectable."""
+        manager = CacheManager(cache_dir=tmp_path, backend="json")
+        assert isinstance(manager.storage, CacheStorage)
+
+    def test_unknown_backend_rejected(self, tmp_path: Path):
+        """Test unknown backend names raise ValueError."""
+        with pytest.raises(ValueError):
+            CacheManager(cache_dir=tmp_path, backend="redis")
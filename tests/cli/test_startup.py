@@ -0,0 +1,106 @@
+"""
+Startup benchmark for the CLI.
+
+Each command runs in a fresh interpreter (like a cron job or shell
+completion would) and must stay within a time budget without importing
+the browser, pipeline or template stacks.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parents[2] / "src"
+
+# Generous wall-clock budget (interpreter start included) so slow CI machines pass;
+# eager imports of Playwright and the pipeline used to exceed it on their own.
+STARTUP_BUDGET_SECONDS = 2.5
+
+HEAVY_MODULES = (
+    "playwright",
+    "jinja2",
+    "cryptography",
+    "pipeline.orchestrator",
+    "gateway.base",
+    "agents.router",
+)
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from aigenflow.main import app
+try:
+    app(sys.argv[1:], standalone_mode=False)
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+heavy = [name for name in json.loads({heavy!r}) if name in sys.modules]
+print("STARTUP " + json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _run_cli(args: list[str], tmp_path: Path) -> tuple[dict, subprocess.CompletedProcess]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "HOME": str(tmp_path)}
+    code = _PROBE.format(heavy=json.dumps(HEAVY_MODULES))
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+        timeout=60,
+    )
+    line = next(line for line in result.stdout.splitlines() if line.startswith("STARTUP "))
+    return json.loads(line.removeprefix("STARTUP ")), result
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["--version"], ["status"], ["cache", "list"]],
+    ids=["version", "status", "cache-list"],
+)
+def test_command_startup_is_light(args: list[str], tmp_path: Path):
+    """Test lightweight commands skip heavy imports and meet the startup budget."""
+    probe, result = _run_cli(args, tmp_path)
+
+    assert probe["heavy"] == [], f"{args} imported {probe['heavy']}\n{result.stderr}"
+    assert probe["elapsed"] < STARTUP_BUDGET_SECONDS, f"{args} took {probe['elapsed']:.2f}s"
+
+
+def test_version_does_not_configure_logging(tmp_path: Path):
+    """Test --version exits before loading settings or structlog."""
+    code = (
+        "import sys\n"
+        "from aigenflow.main import app\n"
+        "try:\n"
+        "    app(['--version'], standalone_mode=False)\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(name for name in ('structlog', 'pydantic_settings') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR), "HOME": str(tmp_path)},
+        timeout=60,
+    )
+
+    assert "aigenflow v0.1.0" in result.stdout
+    assert result.stdout.strip().endswith("[]")
+
+
+def test_default_listing_shows_every_command(tmp_path: Path):
+    """Test the listing shown without a subcommand covers every registered command."""
+    from aigenflow.main import LAZY_COMMANDS
+
+    probe, result = _run_cli(["--log-level", "warning"], tmp_path)
+
+    listed = {line.split()[0] for line in result.stdout.splitlines() if line.startswith("  ") and line.split()}
+    assert set(LAZY_COMMANDS) <= listed
+    assert probe["heavy"] == [], f"listing imported {probe['heavy']}\n{result.stderr}"
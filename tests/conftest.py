@@ -5,9 +5,47 @@ Pytest configuration for AigenFlow project.
 import sys
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 루트 디렉토리 경로
 root_dir = Path(__file__).parent.parent
 src_dir = root_dir / "src"
 
 # src 폴더를 Python 경로에 추가
 sys.path.insert(0, str(src_dir))
+
+
+def _loaded_modules(name: str) -> list:
+    """Get a module under both import roots used by the tests (``x`` and ``src.x``)."""
+    return [sys.modules[alias] for alias in (name, f"src.{name}") if alias in sys.modules]
+
+
+# (module, attribute) of process-wide state built from settings
+_SHARED_STATE = (
+    ("monitoring.ledger", "_shared_ledger"),
+    ("monitoring.health", "_shared_health"),
+    ("monitoring.budget", "_shared_guard"),
+    ("gateway.rate_limiter", "_shared_governor"),
+)
+
+
+def _reset_shared_state() -> None:
+    for module_name, attribute in _SHARED_STATE:
+        for module in _loaded_modules(module_name):
+            if attribute == "_shared_ledger" and module._shared_ledger is not None:
+                module._shared_ledger.close()
+            setattr(module, attribute, None)
+
+
+@pytest.fixture(autouse=True)
+def isolated_shared_state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Give each test fresh process-wide state and a temporary usage ledger.
+
+    Keeps usage and provider health recorded by tests out of the user's
+    ~/.aigenflow ledger, and circuit or budget state out of other tests.
+    """
+    monkeypatch.setenv("AC_USAGE_LEDGER_PATH", str(tmp_path / "usage.db"))
+    _reset_shared_state()
+    yield
+    _reset_shared_state()
@@ -0,0 +1,162 @@
+"""
+Tests for the extractive summarization tier.
+"""
+
+import asyncio
+import random
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from agents.base import AgentResponse
+from context.extractive import ExtractiveSummarizer, ExtractiveTier
+from context.summarizer import ContextSummary, SummaryConfig
+from context.tokenizer import TokenCounter
+from core.models import AgentResponse as PhaseResponse
+from core.models import AgentType, PhaseResult, PhaseStatus
+
+FILLER = [
+    "The platform connects farmers with local buyers through a mobile marketplace.",
+    "Farmers list harvests and buyers reserve produce ahead of delivery.",
+    "The marketplace reduces spoilage by matching supply with nearby demand.",
+    "Buyers value reliable delivery windows and transparent produce quality.",
+    "Local cooperatives help farmers onboard and manage their listings.",
+    "The mobile marketplace also offers weather alerts for registered farmers.",
+]
+
+
+def _document() -> str:
+    body = " ".join(FILLER * 3)
+    return (
+        "## Market Overview\n"
+        f"{body}\n"
+        "The addressable market is 4.2 billion dollars in 2026.\n"
+        "## Strategy\n"
+        f"{body}\n"
+        "We decided to launch in two provinces first.\n"
+    )
+
+
+def _large_document(sentences: int = 4000) -> str:
+    """Build a ~400 KB text whose sentences share many common words."""
+    rng = random.Random(3)
+    common = "the market product customer growth revenue plan team strategy business model cost".split()
+    rare = ["term" + "".join(chr(97 + int(digit)) for digit in str(index)) for index in range(3000)]
+    lines = [
+        " ".join(rng.choice(common) for _ in range(6)).capitalize()
+        + " "
+        + " ".join(rng.choice(rare) for _ in range(8))
+        + "."
+        for _ in range(sentences)
+    ]
+    return "\n".join(" ".join(lines[start : start + 10]) for start in range(0, sentences, 10))
+
+
+def _results() -> list[PhaseResult]:
+    return [
+        PhaseResult(
+            phase_number=1,
+            phase_name="Phase 1: Framing",
+            status=PhaseStatus.COMPLETED,
+            ai_responses=[PhaseResponse(agent_name=AgentType.CLAUDE, task_name="validate_claude", content=_document())],
+        )
+    ]
+
+
+class TestExtractiveSummarizer:
+    """Test sentence extraction."""
+
+    def test_meets_target_reduction(self):
+        """Test the summary fits within the target share of the original tokens."""
+        counter = TokenCounter()
+        text = _document()
+
+        summary = ExtractiveSummarizer(token_counter=counter).summarize(text, 0.5)
+
+        assert summary is not None
+        assert counter.count(summary).total_tokens <= counter.count(text).total_tokens * 0.5
+
+    def test_preserves_headings_numbers_and_decisions(self):
+        """Test structural lines and preserved sentences are always kept."""
+        summary = ExtractiveSummarizer(token_counter=TokenCounter()).summarize(_document(), 0.5)
+
+        assert "## Market Overview" in summary
+        assert "## Strategy" in summary
+        assert "4.2 billion dollars in 2026" in summary
+        assert "We decided to launch in two provinces first." in summary
+        assert summary.index("## Market Overview") < summary.index("## Strategy")
+
+    def test_repeated_sentences_kept_once(self):
+        """Test duplicate sentences do not use the budget twice."""
+        summary = ExtractiveSummarizer(token_counter=TokenCounter()).summarize(_document(), 0.5)
+
+        for sentence in FILLER:
+            assert summary.count(sentence) <= 1
+
+    def test_returns_none_when_preserved_content_exceeds_budget(self):
+        """Test the tier gives up when data points alone exceed the budget."""
+        text = "\n".join(f"Revenue in year {year} reached {year * 3} million." for year in range(2000, 2030))
+
+        assert ExtractiveSummarizer(token_counter=TokenCounter()).summarize(text, 0.5) is None
+
+    def test_large_input_finishes_in_bounded_time(self):
+        """Test common terms do not make ranking quadratic on large contexts."""
+        text = _large_document()
+
+        started = time.perf_counter()
+        summary = ExtractiveSummarizer(token_counter=TokenCounter()).summarize(text, 0.5)
+
+        assert summary is not None
+        assert time.perf_counter() - started < 10
+
+    async def test_tier_does_not_block_event_loop(self):
+        """Test the tier summarizes in a worker thread while other coroutines run."""
+        tier = ExtractiveTier(SummaryConfig(), render_context=lambda results: _large_document(), token_counter=TokenCounter())
+        ticks = 0
+
+        async def _tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(_tick())
+        outcome = await tier.summarize([], phase_number=2)
+        ticker.cancel()
+
+        assert outcome is not None
+        assert ticks > 0
+
+
+class TestTieredContextSummary:
+    """Test tier escalation in ContextSummary."""
+
+    async def test_extractive_tier_skips_agent(self):
+        """Test no agent call is made when the extractive tier meets the target."""
+        router = MagicMock()
+        router.execute = AsyncMock()
+        summary = ContextSummary(router, SummaryConfig(tiers=["extractive", "agent"]), TokenCounter())
+
+        result = await summary.summarize_phase_context(_results(), current_phase=2)
+
+        assert result.success is True
+        assert result.tier == "extractive"
+        assert result.reduction_ratio >= 0.5
+        assert "4.2 billion dollars" in result.summarized_text
+        router.execute.assert_not_called()
+
+    async def test_escalates_to_agent(self):
+        """Test the agent tier runs when extraction cannot meet the target."""
+        router = MagicMock()
+        router.execute = AsyncMock(
+            return_value=AgentResponse(
+                agent_name=AgentType.CLAUDE, task_name="narrative_claude", content="Agent summary", success=True
+            )
+        )
+        config = SummaryConfig(tiers=["extractive", "agent"], target_reduction_ratio=0.99)
+        summary = ContextSummary(router, config, TokenCounter())
+
+        result = await summary.summarize_phase_context(_results(), current_phase=2)
+
+        assert result.tier == "agent"
+        assert result.summarized_text == "Agent summary"
+        router.execute.assert_awaited_once()
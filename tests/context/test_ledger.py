@@ -0,0 +1,92 @@
+"""
+Tests for the session token ledger.
+"""
+
+from datetime import datetime, timedelta
+
+from context.ledger import TokenLedger
+from context.tokenizer import TokenCounter
+from core.models import AgentResponse, AgentType, PhaseResult, PhaseStatus
+
+
+class _CountingCounter(TokenCounter):
+    """Records every text that is actually tokenized."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tokenized: list[str] = []
+
+    def _count_uncached(self, text: str, estimate_only: bool) -> tuple[int, bool]:
+        self.tokenized.append(text)
+        return super()._count_uncached(text, estimate_only)
+
+
+def _result(phase: int, *contents: str, started_at: datetime | None = None) -> PhaseResult:
+    return PhaseResult(
+        phase_number=phase,
+        phase_name=f"Phase {phase}",
+        status=PhaseStatus.COMPLETED,
+        started_at=started_at or datetime(2026, 1, 1, 12, phase),
+        ai_responses=[
+            AgentResponse(agent_name=AgentType.CLAUDE, task_name=f"task_{phase}_{index}", content=content)
+            for index, content in enumerate(contents)
+        ],
+    )
+
+
+class TestTokenLedger:
+    """Test incremental counting."""
+
+    def test_results_counted_once(self):
+        """Test syncing again after a new phase only counts the new result."""
+        counter = _CountingCounter()
+        ledger = TokenLedger(counter)
+        results = [_result(1, "Brainstorm " * 40, "Validation " * 40)]
+
+        assert ledger.sync(results) == 1
+        tokenized = len(counter.tokenized)
+        results.append(_result(2, "Research " * 80))
+        assert ledger.sync(results) == 1
+        assert ledger.sync(results) == 0
+
+        # Phase 2 contributes its section plus one response
+        assert len(counter.tokenized) - tokenized <= 2
+        assert ledger.response_tokens(1, "task_1_0") == counter.count("Brainstorm " * 40).total_tokens
+
+    def test_context_totals_before_phase(self):
+        """Test totals are sums of the stored per-phase counts."""
+        ledger = TokenLedger(TokenCounter())
+        ledger.sync([_result(1, "a " * 400), _result(2, "b " * 800)])
+
+        assert ledger.context_tokens(before_phase=2) < ledger.context_tokens(before_phase=3)
+        assert ledger.context_tokens() == ledger.context_tokens(before_phase=3)
+
+    def test_rerun_phase_replaces_entry(self):
+        """Test a result with a new start time is recounted."""
+        ledger = TokenLedger(TokenCounter())
+        ledger.sync([_result(1, "short")])
+        rerun = _result(1, "much longer content " * 100, started_at=datetime(2026, 1, 1) + timedelta(hours=1))
+
+        assert ledger.sync([rerun]) == 1
+        assert ledger.response_tokens(1, "task_1_0") > 10
+
+    def test_restored_counts_skip_recounting(self):
+        """Test counts saved in session artifacts are reused after a resume."""
+        results = [_result(1, "Brainstorm " * 40)]
+        saved = TokenLedger(TokenCounter())
+        saved.sync(results)
+
+        counter = _CountingCounter()
+        restored = TokenLedger(counter)
+        restored.load_dict(saved.to_dict())
+
+        assert restored.sync(results) == 0
+        assert counter.tokenized == []
+        assert restored.context_tokens() == saved.context_tokens()
+
+    def test_other_encoding_ignored(self):
+        """Test counts made with another encoding are not trusted."""
+        ledger = TokenLedger(TokenCounter())
+        ledger.load_dict({"encoding": "o200k_base", "phases": {"1": {"started_at": "x", "section_tokens": 5}}})
+
+        assert ledger.context_tokens() == 0
@@ -11,6 +11,8 @@ import pytest
 # Import from same paths as orchestrator
 from context.summarizer import ContextSummary
 from context.tokenizer import TokenCounter
+from src.core.config import AigenFlowSettings
+from src.core.models import AgentResponse as PhaseResponse
 from src.core.models import AgentType, DocumentType, PhaseResult, PhaseStatus, PipelineConfig
 from src.pipeline.orchestrator import PipelineOrchestrator
 
@@ -146,6 +148,7 @@ class TestOrchestratorContextIntegration:
             tokens_original=200000,
             tokens_summary=50000,
             reduction_ratio=0.75,
+            summarized_text="Condensed phase 1 context",
             get_summary_dict=MagicMock(return_value={"test": "summary"}),
         )
 
@@ -164,6 +167,9 @@ class TestOrchestratorContextIntegration:
                 # Verify summarization was called
                 orchestrator.context_summary.summarize_phase_context.assert_called_once()
 
+        # The summary text is kept for the phase to pack into its prompts
+        assert session.artifacts["context_summary_phase_2"]["summary"] == "Condensed phase 1 context"
+
     @pytest.mark.asyncio
     async def test_summarization_failure_does_not_break_pipeline(
         self, mock_settings, pipeline_config
@@ -193,6 +199,60 @@ class TestOrchestratorContextIntegration:
                 # Should not raise exception
                 await orchestrator._check_and_summarize_context(session, 2)
 
+    @pytest.mark.asyncio
+    async def test_speculative_summary_not_awaited(self, mock_settings, pipeline_config):
+        """Test an unfinished background summary does not block the phase."""
+        import asyncio
+
+        mock_settings.enable_speculative_summarization = True
+        mock_settings.summary_wait_seconds = 0.0
+        orchestrator = PipelineOrchestrator(settings=mock_settings, enable_summarization=True)
+        session = orchestrator.create_session(pipeline_config)
+        session.add_result(PhaseResult(phase_number=1, phase_name="Phase 1", status=PhaseStatus.COMPLETED))
+        never_done = asyncio.Event()
+
+        async def _slow_summary(**kwargs):
+            await never_done.wait()
+
+        with patch.object(orchestrator.context_summary, "should_summarize_before_phase", return_value=True):
+            with patch.object(orchestrator.context_summary, "summarize_phase_context", new=_slow_summary):
+                await orchestrator._start_speculative_summary(session, 2)
+                await asyncio.wait_for(orchestrator._check_and_summarize_context(session, 2), timeout=1)
+
+        assert "context_summary_phase_2" not in session.artifacts
+        assert orchestrator.speculative_summarizer.is_started(session, 2)
+        await orchestrator.speculative_summarizer.discard(session.session_id)
+
+    @pytest.mark.asyncio
+    async def test_speculative_summary_used_with_default_settings(self, pipeline_config):
+        """Test with default settings the background extractive summary is ready when the next phase starts."""
+        orchestrator = PipelineOrchestrator(settings=AigenFlowSettings(), enable_summarization=True)
+        session = orchestrator.create_session(pipeline_config)
+        topics = ["pricing", "channels", "rivals", "margins", "hiring", "funding", "churn", "regulation"]
+        content = " ".join(
+            f"The review covers {topics[i % 8]} for teams in the {topics[(i * 3) % 8]} market." for i in range(300)
+        )
+        session.add_result(
+            PhaseResult(
+                phase_number=1,
+                phase_name="Phase 1",
+                status=PhaseStatus.COMPLETED,
+                ai_responses=[
+                    PhaseResponse(agent_name=AgentType.CHATGPT, task_name="brainstorm_chatgpt", content=content)
+                ],
+            )
+        )
+
+        with patch.object(orchestrator.context_summary, "should_summarize_before_phase", return_value=True):
+            await orchestrator._start_speculative_summary(session, 2)
+            await orchestrator._check_and_summarize_context(session, 2)
+
+        summary = session.artifacts["context_summary_phase_2"]
+        assert summary["tier"] == "extractive"
+        assert summary["summary"]
+        assert "ready_before_phase" not in summary
+        await orchestrator.speculative_summarizer.discard(session.session_id)
+
     def test_session_artifacts_include_summaries(self, mock_settings, pipeline_config):
         """Test that session artifacts store summary information."""
         orchestrator = PipelineOrchestrator(
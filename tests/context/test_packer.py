@@ -0,0 +1,259 @@
+"""
+Tests for the token-budgeted context packer.
+"""
+
+import threading
+from types import SimpleNamespace
+
+from agents.base import AgentRequest, AgentResponse, AsyncAgent
+from agents.router import AgentMapping, AgentRouter, PhaseTask
+from context.packer import (
+    DEFAULT_CONTEXT_SLOTS,
+    DROPPED_PLACEHOLDER,
+    TRUNCATION_MARKER,
+    ContextPacker,
+    PackAction,
+)
+from core.models import AgentResponse as PhaseResponse
+from core.models import AgentType, PhaseResult, PhaseStatus, PipelineConfig, PipelineSession
+from pipeline.phase1_framing import Phase1Framing
+from pipeline.phase4_writing import Phase4Writing
+from templates.manager import TemplateManager
+
+
+def _paragraphs(label: str, count: int) -> str:
+    return "\n\n".join(f"{label} paragraph {i}: " + "market analysis detail " * 20 for i in range(count))
+
+
+def _sentences(label: str, count: int) -> str:
+    # No digits: the extractive summarizer keeps every sentence with numbers
+    topics = ["pricing", "channels", "rivals", "margins", "hiring", "funding", "churn", "regulation"]
+    return " ".join(
+        f"The {label} review covers {topics[i % len(topics)]} for {label} teams in the {topics[(i * 3) % len(topics)]} market."
+        for i in range(count)
+    )
+
+
+class TestContextSlots:
+    """Test the default variable bindings."""
+
+    def test_sources_are_declared_dependencies(self):
+        """Test every source is a scheduler dependency, so it exists when the task starts."""
+        dependencies = AgentMapping.get_task_dependencies()
+
+        for task, slots in DEFAULT_CONTEXT_SLOTS.items():
+            for slot in slots:
+                assert set(slot.sources) <= set(dependencies[task]), (task, slot.variable)
+
+
+class TestContextPacker:
+    """Test packing decisions."""
+
+    def test_fits_verbatim(self):
+        """Test outputs within budget are used unchanged."""
+        packer = ContextPacker()
+        outputs = {PhaseTask.NARRATIVE_CLAUDE: "Narrative", PhaseTask.SWOT_CHATGPT: "SWOT"}
+
+        packed = packer.pack(PhaseTask.BUSINESS_PLAN_CLAUDE, outputs, "claude")
+
+        assert packed.variables == {"narrative_results": "Narrative", "swot_results": "SWOT"}
+        assert packed.degraded == []
+
+    def test_missing_outputs_render_empty(self):
+        """Test variables without upstream output are recorded as missing."""
+        packed = ContextPacker().pack(PhaseTask.NARRATIVE_CLAUDE, {}, "claude")
+
+        assert packed.variables == {"swot_results": ""}
+        assert packed.decisions[0].action == PackAction.MISSING
+
+    def test_budget_uses_model_limit_and_template(self):
+        """Test the budget is capped by the model window and reduced by the template."""
+        packer = ContextPacker(max_prompt_tokens=50000, input_ratio=0.1)
+
+        assert packer.get_budget("chatgpt") == 12800
+        assert packer.get_budget("claude", template_tokens=1000) == 19000
+        assert packer.get_budget("claude", template_tokens=60000) == 0
+
+    def test_lower_priority_truncated_first(self):
+        """Test the lower-priority variable is truncated while the higher one stays intact."""
+        packer = ContextPacker(max_prompt_tokens=1500)
+        narrative = _paragraphs("Narrative", 3)
+        outputs = {PhaseTask.NARRATIVE_CLAUDE: narrative, PhaseTask.SWOT_CHATGPT: _paragraphs("SWOT", 20)}
+
+        packed = packer.pack(PhaseTask.BUSINESS_PLAN_CLAUDE, outputs, "claude")
+
+        assert packed.variables["narrative_results"] == narrative
+        assert packed.variables["swot_results"].endswith(TRUNCATION_MARKER)
+        assert packed.used_tokens <= packed.budget_tokens
+        actions = {decision.variable: decision.action for decision in packed.decisions}
+        assert actions == {"narrative_results": PackAction.FULL, "swot_results": PackAction.TRUNCATED}
+
+    def test_summary_preferred_over_truncation(self):
+        """Test an available summary replaces the output before anything is cut."""
+        packer = ContextPacker(
+            max_prompt_tokens=1500,
+            summaries=lambda task, text: f"Summary of {task.value}",
+        )
+        outputs = {PhaseTask.NARRATIVE_CLAUDE: _paragraphs("Narrative", 3), PhaseTask.SWOT_CHATGPT: _paragraphs("SWOT", 20)}
+
+        packed = packer.pack(PhaseTask.BUSINESS_PLAN_CLAUDE, outputs, "claude")
+
+        assert packed.variables["swot_results"] == "Summary of swot_chatgpt"
+        assert packed.to_dict()["variables"]["swot_results"]["action"] == "summary"
+
+    def test_shared_summary_packed_once(self):
+        """Test one summary standing in for several outputs appears once, ahead of the packer's own."""
+        packer = ContextPacker(max_prompt_tokens=1500, summaries=lambda task, text: f"Summary of {task.value}")
+        outputs = {PhaseTask.VALIDATE_CLAUDE: _paragraphs("Validation", 10), PhaseTask.BRAINSTORM_CHATGPT: _paragraphs("Ideas", 10)}
+
+        packed = packer.pack(PhaseTask.FACT_CHECK_PERPLEXITY, outputs, "perplexity", summaries=lambda task, text: "Earlier phases")
+
+        assert packed.variables["research_results"] == "Earlier phases"
+
+    def test_drops_when_floors_exceed_budget(self):
+        """Test variables are dropped once truncation floors no longer fit."""
+        packer = ContextPacker(max_prompt_tokens=800)
+        outputs = {PhaseTask.NARRATIVE_CLAUDE: _paragraphs("Narrative", 20), PhaseTask.SWOT_CHATGPT: _paragraphs("SWOT", 20)}
+
+        packed = packer.pack(PhaseTask.BUSINESS_PLAN_CLAUDE, outputs, "claude")
+
+        assert packed.variables["swot_results"] == DROPPED_PLACEHOLDER
+        assert packed.variables["narrative_results"].endswith(TRUNCATION_MARKER)
+        assert packed.used_tokens <= packed.budget_tokens
+
+
+class _EchoAgent(AsyncAgent):
+    """Returns a fixed answer and records prompts."""
+
+    def __init__(self, agent_type: AgentType, content: str) -> None:
+        super().__init__(gateway_provider=None)
+        self.agent_type = agent_type
+        self.content = content
+        self.prompts: dict[str, str] = {}
+
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        self.prompts[request.task_name] = request.prompt
+        return AgentResponse(
+            agent_name=self.agent_type,
+            task_name=request.task_name,
+            content=self.content,
+            success=True,
+        )
+
+
+class TestPhaseIntegration:
+    """Test phases render upstream outputs into their prompts."""
+
+    async def test_same_phase_output_feeds_downstream_task(self):
+        """Test validate_claude sees the brainstorm output produced earlier in Phase 1."""
+        router = AgentRouter(settings=None)
+        chatgpt = _EchoAgent(AgentType.CHATGPT, "Idea: soil sensors for smallholder farms")
+        claude = _EchoAgent(AgentType.CLAUDE, "Validated")
+        router.register_agent(AgentType.CHATGPT, chatgpt)
+        router.register_agent(AgentType.CLAUDE, claude)
+        phase = Phase1Framing(TemplateManager(), router)
+        phase.context_packer = ContextPacker()
+        session = PipelineSession(config=PipelineConfig(topic="AI-powered sustainable agriculture"))
+
+        await phase.execute(session, session.config)
+
+        assert "soil sensors for smallholder farms" in claude.prompts["validate_claude"]
+        packing = session.artifacts["context_packing"]["validate_claude"]
+        assert packing["provider"] == "claude"
+        assert packing["variables"]["brainstormed_results"]["action"] == "full"
+
+    async def test_earlier_phase_outputs_feed_later_phase(self):
+        """Test Phase 4 business plan sees the Phase 3 narrative and SWOT."""
+        router = AgentRouter(settings=None)
+        claude = _EchoAgent(AgentType.CLAUDE, "Business plan body")
+        router.register_agent(AgentType.CLAUDE, claude)
+        router.register_agent(AgentType.CHATGPT, _EchoAgent(AgentType.CHATGPT, "Outline"))
+        router.register_agent(AgentType.GEMINI, _EchoAgent(AgentType.GEMINI, "Charts"))
+        phase = Phase4Writing(TemplateManager(), router)
+        phase.context_packer = ContextPacker()
+        session = PipelineSession(config=PipelineConfig(topic="AI-powered sustainable agriculture"))
+        session.add_result(
+            PhaseResult(
+                phase_number=3,
+                phase_name="Phase 3: Strategy",
+                status=PhaseStatus.COMPLETED,
+                ai_responses=[
+                    PhaseResponse(agent_name=AgentType.CHATGPT, task_name="swot_chatgpt", content="SWOT table"),
+                    PhaseResponse(agent_name=AgentType.CLAUDE, task_name="narrative_claude", content="Narrative arc"),
+                ],
+            )
+        )
+
+        await phase.execute(session, session.config)
+
+        prompt = claude.prompts["business_plan_claude"]
+        assert "Narrative arc" in prompt
+        assert "SWOT table" in prompt
+
+    async def test_overflowing_output_is_summarized_in_pipeline(self):
+        """Test a packer built from settings substitutes an extractive summary, off the event loop."""
+        router = AgentRouter(settings=None)
+        claude = _EchoAgent(AgentType.CLAUDE, "Business plan body")
+        router.register_agent(AgentType.CLAUDE, claude)
+        router.register_agent(AgentType.CHATGPT, _EchoAgent(AgentType.CHATGPT, "Outline"))
+        router.register_agent(AgentType.GEMINI, _EchoAgent(AgentType.GEMINI, "Charts"))
+        phase = Phase4Writing(TemplateManager(), router)
+        phase.context_packer = packer = ContextPacker.from_settings(SimpleNamespace(context_max_prompt_tokens=3000))
+        packing_threads = []
+        pack = packer.pack
+
+        def _tracking_pack(*args, **kwargs):
+            packing_threads.append(threading.current_thread())
+            return pack(*args, **kwargs)
+
+        packer.pack = _tracking_pack  # type: ignore[method-assign]
+        session = PipelineSession(config=PipelineConfig(topic="AI-powered sustainable agriculture"))
+        session.add_result(
+            PhaseResult(
+                phase_number=3,
+                phase_name="Phase 3: Strategy",
+                status=PhaseStatus.COMPLETED,
+                ai_responses=[
+                    PhaseResponse(agent_name=AgentType.CHATGPT, task_name="swot_chatgpt", content=_sentences("swot", 200)),
+                    PhaseResponse(agent_name=AgentType.CLAUDE, task_name="narrative_claude", content="Narrative arc"),
+                ],
+            )
+        )
+
+        await phase.execute(session, session.config)
+
+        packing = session.artifacts["context_packing"]["business_plan_claude"]
+        assert packing["variables"]["swot_results"]["action"] == "summary"
+        assert TRUNCATION_MARKER not in claude.prompts["business_plan_claude"]
+        # Extractive condensing ranks sentences off the event loop
+        assert packing_threads
+        assert threading.main_thread() not in packing_threads
+
+    async def test_ready_context_summary_replaces_earlier_outputs(self):
+        """Test the context summary made before Phase 4 stands in for Phase 3 outputs over budget."""
+        router = AgentRouter(settings=None)
+        claude = _EchoAgent(AgentType.CLAUDE, "Business plan body")
+        router.register_agent(AgentType.CLAUDE, claude)
+        router.register_agent(AgentType.CHATGPT, _EchoAgent(AgentType.CHATGPT, "Outline"))
+        router.register_agent(AgentType.GEMINI, _EchoAgent(AgentType.GEMINI, "Charts"))
+        phase = Phase4Writing(TemplateManager(), router)
+        phase.context_packer = ContextPacker(max_prompt_tokens=3000)
+        session = PipelineSession(config=PipelineConfig(topic="AI-powered sustainable agriculture"))
+        session.add_result(
+            PhaseResult(
+                phase_number=3,
+                phase_name="Phase 3: Strategy",
+                status=PhaseStatus.COMPLETED,
+                ai_responses=[
+                    PhaseResponse(agent_name=AgentType.CHATGPT, task_name="swot_chatgpt", content=_paragraphs("SWOT", 40)),
+                    PhaseResponse(agent_name=AgentType.CLAUDE, task_name="narrative_claude", content="Narrative arc"),
+                ],
+            )
+        )
+        session.artifacts["context_summary_phase_4"] = {"success": True, "summary": "Condensed strategy context"}
+
+        await phase.execute(session, session.config)
+
+        assert "Condensed strategy context" in claude.prompts["business_plan_claude"]
+        packing = session.artifacts["context_packing"]["business_plan_claude"]
+        assert packing["variables"]["swot_results"]["action"] == "summary"
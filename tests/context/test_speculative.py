@@ -0,0 +1,111 @@
+"""
+Tests for speculative background summarization.
+"""
+
+import asyncio
+from datetime import datetime
+
+from context.speculative import SpeculativeSummarizer, context_fingerprint
+from context.summarizer import SummaryResult
+from core.models import PhaseResult, PhaseStatus, PipelineConfig, PipelineSession
+
+
+class _SlowSummary:
+    """Stands in for ContextSummary; finishes when released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.calls: list[int] = []
+
+    async def summarize_phase_context(self, session_results, current_phase: int) -> SummaryResult:
+        self.calls.append(current_phase)
+        await self.release.wait()
+        return SummaryResult(
+            original_text="context",
+            summarized_text="summary",
+            tokens_original=100,
+            tokens_summary=20,
+            reduction_ratio=0.8,
+        )
+
+
+def _session(*phases: int) -> PipelineSession:
+    session = PipelineSession(config=PipelineConfig(topic="AI-powered sustainable agriculture"))
+    for phase in phases:
+        session.add_result(
+            PhaseResult(
+                phase_number=phase,
+                phase_name=f"Phase {phase}",
+                status=PhaseStatus.COMPLETED,
+                started_at=datetime(2026, 1, 1, 12, phase),
+            )
+        )
+    return session
+
+
+class TestContextFingerprint:
+    """Test fingerprints of summarized context."""
+
+    def test_changes_with_phase_set(self):
+        """Test only earlier phases affect the fingerprint."""
+        session = _session(1, 2)
+
+        assert context_fingerprint(session, 2) != context_fingerprint(session, 3)
+        assert context_fingerprint(session, 3) == context_fingerprint(session, 4)
+        assert context_fingerprint(session, 3) != context_fingerprint(_session(1, 2), 3)
+
+
+class TestSpeculativeSummarizer:
+    """Test background summary lifecycle."""
+
+    async def test_ready_summary_is_taken(self):
+        """Test a finished summary is returned and started only once per fingerprint."""
+        summary = _SlowSummary()
+        summarizer = SpeculativeSummarizer(summary)
+        session = _session(1)
+
+        summarizer.start(session, 2)
+        summarizer.start(session, 2)
+        summary.release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        result = await summarizer.take(session, 2)
+
+        assert result is not None and result.summarized_text == "summary"
+        assert summary.calls == [2]
+
+    async def test_unfinished_summary_falls_back_and_reports_late(self):
+        """Test the phase proceeds without waiting and the summary is delivered later."""
+        summary = _SlowSummary()
+        late: list[tuple[int, str]] = []
+        summarizer = SpeculativeSummarizer(
+            summary,
+            wait_seconds=0.01,
+            on_late_summary=lambda session, phase, result: late.append((phase, result.summarized_text)),
+        )
+        session = _session(1)
+        task = summarizer.start(session, 2)
+
+        assert await summarizer.take(session, 2) is None
+
+        summary.release.set()
+        await task
+        await asyncio.sleep(0)
+        assert late == [(2, "summary")]
+
+    async def test_newer_phase_set_supersedes_pending(self):
+        """Test a pending summary is cancelled when a later phase's summary starts."""
+        summary = _SlowSummary()
+        summarizer = SpeculativeSummarizer(summary)
+        session = _session(1)
+        first = summarizer.start(session, 2)
+
+        session.add_result(PhaseResult(phase_number=2, phase_name="Phase 2", status=PhaseStatus.COMPLETED))
+        summarizer.start(session, 3)
+        await asyncio.sleep(0)
+
+        assert first.cancelled()
+        assert not summarizer.is_started(session, 2)
+        await summarizer.discard(session.session_id)
+        assert not summarizer.is_started(session, 3)
@@ -9,6 +9,7 @@ from src.context.tokenizer import (
     ModelLimits,
     TokenCounter,
     TokenCountResult,
+    get_token_counter,
 )
 
 
@@ -188,3 +189,50 @@ class TestTokenCounterThreshold:
         result = counter.count(text, model_name="claude")
         # With 90% threshold, should not summarize yet
         assert counter.should_summarize(result, provider="claude", threshold=0.9) is False
+
+
+class TestTokenCounterMemo:
+    """Test suite for memoized and batch counting."""
+
+    def test_repeated_count_is_memoized(self) -> None:
+        """Test the same text is tokenized only once."""
+        counter = TokenCounter()
+        calls = []
+        original = counter._count_uncached
+
+        def _tracking(text: str, estimate_only: bool):
+            calls.append(text)
+            return original(text, estimate_only)
+
+        counter._count_uncached = _tracking  # type: ignore[method-assign]
+        first = counter.count("Market analysis " * 50, model_name="claude")
+        second = counter.count("Market analysis " * 50, model_name="gemini")
+
+        assert first.total_tokens == second.total_tokens
+        assert second.model_name == "gemini"
+        assert len(calls) == 1
+
+    def test_memo_does_not_hold_text(self) -> None:
+        """Test memo keys are fixed-size digests rather than the counted text."""
+        counter = TokenCounter()
+        text = "Market analysis " * 500
+
+        counter.count(text)
+
+        assert all(len(key[0]) == 16 for key in counter._memo)
+        assert text not in {key[0] for key in counter._memo}
+
+    def test_count_many_matches_count(self) -> None:
+        """Test batch counting returns the same counts in input order."""
+        counter = TokenCounter()
+        texts = ["alpha " * 10, "", "beta " * 300]
+
+        results = counter.count_many(texts, model_name="claude")
+
+        assert [result.total_tokens for result in results] == [
+            TokenCounter().count(text).total_tokens for text in texts
+        ]
+
+    def test_shared_counter(self) -> None:
+        """Test the process-wide counter is reused."""
+        assert get_token_counter() is get_token_counter()
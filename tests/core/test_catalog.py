@@ -0,0 +1,110 @@
+"""
+Tests for the session catalog.
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from core.catalog import SessionCatalog, catalog_path, open_catalog
+from core.models import DocumentType, PipelineConfig, PipelineSession, PipelineState
+
+runner = CliRunner()
+
+
+def _session(topic: str, state: PipelineState, updated_at: datetime, doc_type=DocumentType.BIZPLAN) -> PipelineSession:
+    return PipelineSession(
+        config=PipelineConfig(topic=topic, doc_type=doc_type),
+        state=state,
+        updated_at=updated_at,
+    )
+
+
+class TestSessionCatalog:
+    """Test catalog queries."""
+
+    def test_query_filters_and_pagination(self, tmp_path: Path):
+        """Test filters combine and results are newest first, page by page."""
+        catalog = SessionCatalog.for_output_dir(tmp_path)
+        now = datetime.now()
+        for index in range(5):
+            session = _session(f"Smart farm plan {index}", PipelineState.COMPLETED, now - timedelta(hours=index))
+            catalog.upsert(session, tmp_path / session.session_id)
+        catalog.upsert(_session("Failed robotics plan", PipelineState.FAILED, now), tmp_path / "failed")
+        catalog.upsert(
+            _session("Research on batteries", PipelineState.COMPLETED, now, DocumentType.RD), tmp_path / "rd"
+        )
+
+        first_page = catalog.query(state="completed", doc_type="bizplan", limit=2)
+        second_page = catalog.query(state="completed", doc_type="bizplan", limit=2, offset=2)
+
+        assert [entry.topic for entry in first_page] == ["Smart farm plan 0", "Smart farm plan 1"]
+        assert [entry.topic for entry in second_page] == ["Smart farm plan 2", "Smart farm plan 3"]
+        assert catalog.count(state="completed", doc_type="bizplan") == 5
+        assert [entry.topic for entry in catalog.query(topic="ROBOTICS")] == ["Failed robotics plan"]
+        assert catalog.count(since=now - timedelta(minutes=30)) == 3
+        catalog.close()
+
+    def test_upsert_replaces_row(self, tmp_path: Path):
+        """Test a state transition updates the existing row."""
+        catalog = SessionCatalog.for_output_dir(tmp_path)
+        session = _session("Smart farm business plan", PipelineState.PHASE_2, datetime.now())
+        catalog.upsert(session, tmp_path / session.session_id)
+        session.state = PipelineState.COMPLETED
+        session.current_phase = 5
+        catalog.upsert(session, tmp_path / session.session_id)
+
+        entry = catalog.get(session.session_id)
+
+        assert catalog.count() == 1
+        assert entry.state == "completed"
+        assert entry.current_phase == 5
+        catalog.close()
+
+    def test_open_catalog_builds_from_snapshots(self, tmp_path: Path):
+        """Test the first open indexes existing session directories."""
+        session = _session("Existing session topic", PipelineState.PHASE_3, datetime.now())
+        session_dir = tmp_path / session.session_id
+        session_dir.mkdir()
+        (session_dir / "pipeline_state.json").write_text(json.dumps(session.model_dump(mode="json")))
+        (tmp_path / "not-a-session").mkdir()
+
+        catalog = open_catalog(tmp_path)
+
+        assert catalog_path(tmp_path).exists()
+        assert [entry.session_id for entry in catalog.query()] == [session.session_id]
+        assert catalog.get(session.session_id).session_dir == session_dir
+        catalog.close()
+
+    def test_reindex_drops_removed_sessions(self, tmp_path: Path):
+        """Test reindex removes rows whose directories are gone."""
+        catalog = SessionCatalog.for_output_dir(tmp_path)
+        catalog.upsert(_session("Deleted session topic", PipelineState.FAILED, datetime.now()), tmp_path / "gone")
+
+        assert catalog.reindex(tmp_path) == 0
+        assert catalog.count() == 0
+        catalog.close()
+
+
+class TestSessionsCommand:
+    """Test the sessions CLI."""
+
+    def test_list_and_reindex(self, tmp_path: Path, monkeypatch):
+        """Test reindex then list shows catalogued sessions."""
+        from cli import sessions
+
+        session = _session("Catalog listing topic", PipelineState.COMPLETED, datetime.now())
+        session_dir = tmp_path / session.session_id
+        session_dir.mkdir()
+        (session_dir / "pipeline_state.json").write_text(json.dumps(session.model_dump(mode="json")))
+        monkeypatch.setenv("AC_OUTPUT_DIR", str(tmp_path))
+
+        reindexed = runner.invoke(sessions.app, ["reindex"])
+        listed = runner.invoke(sessions.app, ["list", "--state", "completed"])
+
+        assert reindexed.exit_code == 0
+        assert "Indexed 1 sessions" in reindexed.stdout
+        assert listed.exit_code == 0
+        assert session.session_id in listed.stdout
@@ -0,0 +1,156 @@
+"""
+Tests for the warm browser daemon and BrowserPool's daemon attachment.
+"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gateway.browser_daemon import BrowserDaemon, BrowserDaemonState
+from gateway.browser_pool import BrowserPool
+
+
+@pytest.fixture
+def daemon(tmp_path: Path) -> BrowserDaemon:
+    """Create daemon manager in a temporary directory."""
+    return BrowserDaemon(state_dir=tmp_path / "browserd", port=9444)
+
+
+def _write_state(daemon: BrowserDaemon, pid: int = 1234) -> BrowserDaemonState:
+    state = BrowserDaemonState(pid=pid, port=daemon.port, headless=True, started_at=time.time())
+    daemon.state_dir.mkdir(parents=True, exist_ok=True)
+    daemon.state_file.write_text(json.dumps(state.__dict__))
+    return state
+
+
+class TestBrowserDaemon:
+    """Test BrowserDaemon state handling."""
+
+    def test_no_state_means_not_running(self, daemon: BrowserDaemon):
+        """Test a missing state file reports no daemon."""
+        assert daemon.get_endpoint() is None
+        assert daemon.status() is None
+        assert daemon.stop() is False
+
+    def test_endpoint_when_reachable(self, daemon: BrowserDaemon):
+        """Test a reachable daemon exposes its CDP endpoint."""
+        _write_state(daemon)
+
+        with patch.object(daemon, "probe", return_value={"Browser": "Chrome/120"}):
+            assert daemon.get_endpoint() == "http://127.0.0.1:9444"
+
+    def test_stale_state_is_cleared(self, daemon: BrowserDaemon):
+        """Test an unreachable daemon's state file is removed."""
+        _write_state(daemon)
+
+        with patch.object(daemon, "probe", return_value=None):
+            assert daemon.get_endpoint() is None
+
+        assert not daemon.state_file.exists()
+
+    def test_corrupted_state_ignored(self, daemon: BrowserDaemon):
+        """Test a corrupted state file is treated as no daemon."""
+        daemon.state_dir.mkdir(parents=True)
+        daemon.state_file.write_text("{not json")
+
+        assert daemon.load_state() is None
+
+    def test_start_reuses_running_daemon(self, daemon: BrowserDaemon):
+        """Test start does not launch a second browser."""
+        state = _write_state(daemon)
+
+        with (
+            patch.object(daemon, "probe", return_value={"Browser": "Chrome/120"}),
+            patch("gateway.browser_daemon.subprocess.Popen") as popen,
+        ):
+            assert daemon.start() == state
+
+        popen.assert_not_called()
+
+    def test_stop_signals_process(self, daemon: BrowserDaemon):
+        """Test stop terminates the browser and clears state."""
+        _write_state(daemon, pid=4321)
+
+        with (
+            patch.object(daemon, "probe", return_value={"Browser": "Chrome/120"}),
+            patch("gateway.browser_daemon.os.kill") as kill,
+        ):
+            assert daemon.stop() is True
+
+        assert kill.call_args.args[0] == 4321
+        assert not daemon.state_file.exists()
+
+
+class TestBrowserPoolDaemonAttach:
+    """Test BrowserPool behaviour when attached to the daemon."""
+
+    @pytest.fixture
+    def remote_pool(self) -> BrowserPool:
+        """Create a pool that looks attached to a daemon."""
+        pool = BrowserPool()
+        pool._initialized = True
+        pool._remote_endpoint = "http://127.0.0.1:9444"
+        pool._browser = MagicMock()
+        self.shared_context = MagicMock()
+        self.shared_context.pages = []
+        self.shared_context.cookies = AsyncMock(return_value=[])
+        self.shared_context.add_cookies = AsyncMock()
+        self.shared_context.close = AsyncMock()
+        pool._browser.contexts = [self.shared_context]
+        return pool
+
+    async def test_providers_share_daemon_context(self, remote_pool: BrowserPool):
+        """Test providers use the daemon's persistent context."""
+        claude = await remote_pool.get_context("claude")
+        gemini = await remote_pool.get_context("gemini")
+
+        assert claude is self.shared_context
+        assert gemini is self.shared_context
+        remote_pool._browser.new_context.assert_not_called()
+
+    async def test_preload_skips_warm_session(self, remote_pool: BrowserPool):
+        """Test stored cookies are not re-injected over a warm session."""
+        self.shared_context.cookies.return_value = [{"name": "sid", "domain": ".claude.ai"}]
+
+        await remote_pool.preload_context("claude", [{"name": "sid", "domain": "claude.ai"}])
+
+        self.shared_context.add_cookies.assert_not_called()
+
+    async def test_preload_injects_into_cold_context(self, remote_pool: BrowserPool):
+        """Test cookies are injected when the daemon has none for the provider."""
+        cookies = [{"name": "sid", "domain": "gemini.google.com"}]
+
+        await remote_pool.preload_context("gemini", cookies)
+
+        self.shared_context.add_cookies.assert_awaited_once_with(cookies)
+
+    async def test_close_all_detaches_without_closing_context(self, remote_pool: BrowserPool):
+        """Test close_all closes only this pool's pages and leaves the daemon running."""
+        foreign = MagicMock()
+        foreign.close = AsyncMock()
+        self.shared_context.pages = [foreign]  # e.g. another process's page or the daemon's tab
+        owned = MagicMock()
+        owned.is_closed.return_value = False
+        owned.close = AsyncMock()
+        self.shared_context.new_page = AsyncMock(return_value=owned)
+        browser = remote_pool._browser
+        await remote_pool.get_page("claude")
+
+        await remote_pool.close_all()
+
+        owned.close.assert_awaited_once()
+        foreign.close.assert_not_called()
+        self.shared_context.close.assert_not_called()
+        browser.close.assert_not_called()
+        assert not remote_pool.is_remote
+        assert not remote_pool.is_initialized
+
+    async def test_discovery_respects_setting(self):
+        """Test daemon discovery can be disabled via settings."""
+        settings = MagicMock(use_browser_daemon=False)
+
+        with patch("core.config.get_settings", return_value=settings):
+            assert BrowserPool._discover_daemon_endpoint() is None
@@ -0,0 +1,100 @@
+"""
+Tests for response-completion detection in BaseProvider.
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from gateway.chatgpt_provider import ChatGPTProvider
+from gateway.claude_provider import ClaudeProvider
+from gateway.gemini_provider import GeminiProvider
+from gateway.models import GatewayRequest
+from gateway.perplexity_provider import PerplexityProvider
+from gateway.selector_loader import SelectorLoader
+
+SELECTORS_PATH = Path(__file__).parents[2] / "src" / "gateway" / "selectors.yaml"
+
+
+class TestCompletionSignals:
+    """Test completion signal resolution."""
+
+    def test_signals_from_selectors_yaml(self, tmp_path: Path):
+        """Test stop/streaming selectors and stable window come from selectors.yaml."""
+        provider = ChatGPTProvider(profile_dir=tmp_path, selector_loader=SelectorLoader(SELECTORS_PATH))
+
+        response_selector, busy_selector, stable_ms = provider.get_completion_signals()
+
+        assert response_selector.startswith("[data-message-author-role='assistant']")
+        assert "stop-button" in busy_selector
+        assert ".result-streaming" in busy_selector
+        assert stable_ms == 1500
+
+    def test_defaults_without_selector_loader(self, tmp_path: Path):
+        """Test class defaults are used when no selector loader is set."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+
+        response_selector, busy_selector, stable_ms = provider.get_completion_signals()
+
+        assert response_selector == ClaudeProvider.DEFAULT_RESPONSE_SELECTOR
+        assert busy_selector == ClaudeProvider.DEFAULT_BUSY_SELECTOR
+        assert stable_ms == ClaudeProvider.DEFAULT_STABLE_MS
+
+
+class TestWaitForResponse:
+    """Test wait_for_response result handling."""
+
+    async def test_returns_completed_text(self, tmp_path: Path):
+        """Test the observer result is stripped and passed through."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value={"completed": True, "text": "  answer \n"})
+
+        text, completed = await provider.wait_for_response(page, timeout_ms=5000)
+
+        assert text == "answer"
+        assert completed is True
+        args = page.evaluate.call_args.args[1]
+        assert args[0] == ClaudeProvider.DEFAULT_RESPONSE_SELECTOR
+        assert args[3] == 5000
+
+    async def test_timeout_reports_partial_text(self, tmp_path: Path):
+        """Test a deadline hit returns streamed text with completed=False."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value={"completed": False, "text": "partial"})
+
+        text, completed = await provider.wait_for_response(page, timeout_ms=100)
+
+        assert text == "partial"
+        assert completed is False
+
+    async def test_missing_response_selector_raises(self, tmp_path: Path):
+        """Test a provider without any response selector is rejected."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+        provider.DEFAULT_RESPONSE_SELECTOR = None
+
+        with pytest.raises(ValueError):
+            await provider.wait_for_response(MagicMock(), timeout_ms=100)
+
+
+class TestIncompleteResponse:
+    """Test answers cut off at the deadline are reported as failures."""
+
+    @pytest.mark.parametrize("provider_class", [ChatGPTProvider, ClaudeProvider, GeminiProvider, PerplexityProvider])
+    async def test_cut_off_answer_is_not_success(self, tmp_path: Path, provider_class: type):
+        """Test partial text is kept in metadata, not returned as a successful answer."""
+        provider = provider_class(profile_dir=tmp_path)
+        page = MagicMock()
+        provider.acquire_chat_page = AsyncMock(return_value=page)
+        provider.release_chat_page = AsyncMock()
+        provider.submit_prompt = AsyncMock(return_value=None)
+        provider.wait_for_response = AsyncMock(return_value=("half an answer", False))
+
+        response = await provider.send_message(GatewayRequest(task_name="test", prompt="Hello", timeout=1))
+
+        assert response.success is False
+        assert response.content == ""
+        assert response.metadata == {"completed": False, "partial": "half an answer"}
+        provider.release_chat_page.assert_awaited_once_with(page, reusable=False)
@@ -3,10 +3,12 @@ Tests for cookie storage functionality.
 """
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from gateway.cookie_encryption import CookieEncryption
 from gateway.cookie_storage import CookieStorage, SessionMetadata
 
 
@@ -326,3 +328,94 @@ class TestCookieStorage:
 
         with pytest.raises(ValueError, match="Cannot save empty cookie list"):
             storage.save_cookies([])
+
+
+class TestCookieStorageCache:
+    """Test the process-wide decrypted cookie and metadata cache."""
+
+    def test_decrypts_once_across_instances(
+        self, temp_profile_dir: Path, sample_cookies: list[dict], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test repeated loads from new instances reuse the decrypted cookies."""
+        CookieStorage(temp_profile_dir).save_cookies(sample_cookies)
+        calls = []
+        original = CookieEncryption.decrypt_cookies
+        monkeypatch.setattr(
+            CookieEncryption,
+            "decrypt_cookies",
+            lambda self, data: calls.append(data) or original(self, data),
+        )
+
+        for _ in range(5):
+            assert CookieStorage(temp_profile_dir).load_cookies() == sample_cookies
+
+        assert calls == []
+
+    def test_reloads_after_external_change(self, temp_profile_dir: Path, sample_cookies: list[dict]) -> None:
+        """Test a cookies file rewritten by another process is decrypted again."""
+        storage = CookieStorage(temp_profile_dir)
+        storage.save_cookies(sample_cookies)
+        storage.load_cookies()
+
+        # Simulate another process writing new cookies
+        updated = [dict(sample_cookies[0], value="rotated")]
+        storage.cookies_path.write_text(storage.encryption.encrypt_cookies(updated))
+        stat = storage.cookies_path.stat()
+        os.utime(storage.cookies_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert storage.load_cookies() == updated
+
+    def test_reloads_after_key_replaced(
+        self, temp_profile_dir: Path, tmp_path: Path, sample_cookies: list[dict]
+    ) -> None:
+        """Test a new key written by another process is used instead of the cached one."""
+        storage = CookieStorage(temp_profile_dir)
+        storage.save_cookies(sample_cookies)
+        storage.load_cookies()
+
+        # Simulate another process logging in again with a fresh key
+        other = CookieEncryption(tmp_path / "other.key")
+        updated = [dict(sample_cookies[0], value="relogged")]
+        storage.cookies_path.write_text(other.encrypt_cookies(updated))
+        storage.key_path.write_bytes(other.key_path.read_bytes())
+        for path in (storage.cookies_path, storage.key_path):
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert CookieStorage(temp_profile_dir).load_cookies() == updated
+
+    def test_loaded_cookies_are_copies(self, temp_profile_dir: Path, sample_cookies: list[dict]) -> None:
+        """Test callers cannot alter the cached cookies."""
+        storage = CookieStorage(temp_profile_dir)
+        storage.save_cookies(sample_cookies)
+
+        storage.load_cookies()[0]["value"] = "changed"
+
+        assert storage.load_cookies()[0]["value"] == "test_token_value"
+
+    def test_mark_validated_write_is_debounced(self, temp_profile_dir: Path) -> None:
+        """Test validation updates are visible at once but written on flush."""
+        storage = CookieStorage(temp_profile_dir)
+        storage.save_metadata(SessionMetadata(provider_name="test_provider", last_validated="2026-01-01"))
+        written = storage.metadata_path.read_text()
+
+        storage.mark_validated()
+        storage.mark_validated()
+
+        assert storage.metadata_path.read_text() == written
+        assert CookieStorage(temp_profile_dir).load_metadata().last_validated > "2026-01-01"
+
+        storage.flush()
+        assert storage.metadata_path.read_text() != written
+        assert storage._read_metadata().last_validated > "2026-01-01"
+
+    def test_delete_session_clears_cache(self, temp_profile_dir: Path, sample_cookies: list[dict]) -> None:
+        """Test cached cookies do not outlive deleted files."""
+        storage = CookieStorage(temp_profile_dir)
+        storage.save_cookies(sample_cookies)
+
+        storage.delete_session()
+
+        with pytest.raises(FileNotFoundError):
+            CookieStorage(temp_profile_dir).load_cookies()
+        assert storage.load_metadata() is None
@@ -0,0 +1,135 @@
+"""
+Tests for BrowserPool page pooling and provider page reuse.
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gateway.browser_pool import BrowserPool
+from gateway.claude_provider import ClaudeProvider
+from gateway.provider_context import ProviderContext
+
+
+def _make_page() -> MagicMock:
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.goto = AsyncMock()
+    page.close = AsyncMock()
+    return page
+
+
+@pytest.fixture
+def pool() -> BrowserPool:
+    """Create an initialized pool backed by a mock context."""
+    pool = BrowserPool()
+    pool._initialized = True
+    pool._browser = MagicMock()
+    context = MagicMock()
+    context.pages = []
+    context.add_cookies = AsyncMock()
+    context.new_page = AsyncMock(side_effect=lambda: _make_page())
+    pool._browser.new_context = AsyncMock(return_value=context)
+    return pool
+
+
+class TestPagePool:
+    """Test BrowserPool.acquire_page / release_page."""
+
+    async def test_new_page_is_navigated(self, pool: BrowserPool):
+        """Test an empty pool creates and navigates a page."""
+        page = await pool.acquire_page("claude", "https://claude.ai")
+
+        page.goto.assert_awaited_once()
+        assert page.goto.call_args.args[0] == "https://claude.ai"
+
+    async def test_released_page_is_recycled_without_navigation(self, pool: BrowserPool):
+        """Test a used page is reset instead of reloaded."""
+        reset = AsyncMock(return_value=True)
+        page = await pool.acquire_page("claude", "https://claude.ai", reset=reset)
+        await pool.release_page("claude", page)
+
+        again = await pool.acquire_page("claude", "https://claude.ai", reset=reset)
+
+        assert again is page
+        reset.assert_awaited_once_with(page)
+        assert page.goto.await_count == 1
+
+    async def test_failed_reset_discards_page(self, pool: BrowserPool):
+        """Test a page that cannot start a new chat is closed and replaced."""
+        page = await pool.acquire_page("claude", "https://claude.ai")
+        await pool.release_page("claude", page)
+
+        again = await pool.acquire_page(
+            "claude", "https://claude.ai", reset=AsyncMock(return_value=False)
+        )
+
+        assert again is not page
+        page.close.assert_awaited_once()
+
+    async def test_unreusable_page_closed(self, pool: BrowserPool):
+        """Test pages released after errors are not pooled."""
+        page = await pool.acquire_page("claude", "https://claude.ai")
+
+        await pool.release_page("claude", page, reusable=False)
+
+        page.close.assert_awaited_once()
+        assert pool.idle_page_count == 0
+
+    async def test_pool_size_caps_idle_pages(self, pool: BrowserPool):
+        """Test idle pages beyond page_pool_size are closed."""
+        pool.page_pool_size = 1
+        first = await pool.acquire_page("claude", "https://claude.ai")
+        second = await pool.acquire_page("claude", "https://claude.ai")
+
+        await pool.release_page("claude", first)
+        await pool.release_page("claude", second)
+
+        assert pool.idle_page_count == 1
+        second.close.assert_awaited_once()
+
+    async def test_prewarmed_page_used_without_reset(self, pool: BrowserPool):
+        """Test prewarmed pages are handed out as-is."""
+        reset = AsyncMock(return_value=True)
+        pool.prewarm("claude", "https://claude.ai")
+
+        page = await pool.acquire_page("claude", "https://claude.ai", reset=reset)
+
+        reset.assert_not_called()
+        page.goto.assert_awaited_once()
+        assert pool.idle_page_count == 0
+
+    async def test_cookies_tracked_per_context(self, pool: BrowserPool):
+        """Test preloaded cookies are remembered until the context closes."""
+        await pool.preload_context("claude", [{"name": "sid", "domain": "claude.ai"}])
+        assert pool.has_cookies("claude")
+
+        await pool.close_context("claude")
+        assert not pool.has_cookies("claude")
+
+
+class TestProviderPageReuse:
+    """Test providers reuse pages and inject cookies once."""
+
+    async def test_cookies_injected_once_per_context(self, pool: BrowserPool, tmp_path: Path):
+        """Test repeated acquisitions read and inject cookies only once."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+        provider._storage = MagicMock()
+        provider._storage.load_cookies.return_value = [{"name": "sid", "domain": "claude.ai"}]
+        provider._browser_manager = ProviderContext("claude", pool=pool)
+
+        with patch.object(provider, "start_new_chat", AsyncMock(return_value=True)):
+            page = await provider.acquire_chat_page()
+            await provider.release_chat_page(page)
+            again = await provider.acquire_chat_page()
+
+        assert again is page
+        provider._storage.load_cookies.assert_called_once()
+
+    async def test_start_new_chat_without_selector_discards(self, tmp_path: Path):
+        """Test pages cannot be recycled when no new-chat control is known."""
+        provider = ClaudeProvider(profile_dir=tmp_path)
+        provider.DEFAULT_NEW_CHAT_SELECTOR = None
+
+        assert await provider.start_new_chat(_make_page()) is False
@@ -0,0 +1,202 @@
+"""
+Tests for the per-provider adaptive rate governor.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from agents.base import AgentRequest, AgentResponse, AsyncAgent
+from agents.router import AgentRouter, PhaseTask
+from core.config import AigenFlowSettings
+from core.models import AgentType, DocumentType
+from gateway.rate_limiter import (
+    GovernorConfig,
+    ProviderGovernor,
+    RateGovernor,
+    RequestOutcome,
+    classify_outcome,
+    get_rate_governor,
+)
+
+
+def _fast_config(**overrides) -> GovernorConfig:
+    values = {"requests_per_minute": 60000.0, "burst": 100, "min_concurrency": 1, "max_concurrency": 4}
+    values.update(overrides)
+    return GovernorConfig(**values)
+
+
+class TestClassifyOutcome:
+    """Test outcome classification."""
+
+    def test_success(self):
+        """Test successful responses count as success."""
+        assert classify_outcome(SimpleNamespace(success=True, error=None)) == RequestOutcome.SUCCESS
+
+    @pytest.mark.parametrize(
+        "message",
+        ["Rate limit exceeded", "HTTP 429", "You've reached our usage limit", "Too many requests"],
+    )
+    def test_rate_limit_messages(self, message: str):
+        """Test provider throttling messages are recognized."""
+        assert classify_outcome(SimpleNamespace(success=False, error=message)) == RequestOutcome.RATE_LIMITED
+
+    def test_timeouts(self):
+        """Test timeout errors and messages are recognized."""
+        assert classify_outcome(error=TimeoutError()) == RequestOutcome.TIMEOUT
+        assert (
+            classify_outcome(SimpleNamespace(success=False, error="Timeout waiting for response after 120s"))
+            == RequestOutcome.TIMEOUT
+        )
+
+    def test_other_errors(self):
+        """Test unrelated failures do not count as throttling."""
+        assert classify_outcome(SimpleNamespace(success=False, error="Input field not found")) == RequestOutcome.ERROR
+
+
+class TestProviderGovernor:
+    """Test token bucket and AIMD behaviour."""
+
+    @pytest.mark.parametrize("overrides", [{"requests_per_minute": 0}, {"requests_per_minute": -1.0}, {"burst": 0}])
+    def test_rejects_limits_that_never_admit(self, overrides):
+        """Test a zero rate or empty bucket is refused instead of dividing by zero later."""
+        with pytest.raises(ValueError):
+            _fast_config(**overrides)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"provider_requests_per_minute": 0},
+            {"provider_burst": 0},
+            {"provider_requests_per_minute_overrides": {"claude": 0}},
+        ],
+    )
+    def test_settings_reject_limits_that_never_admit(self, values):
+        """Test settings validation catches the same limits."""
+        with pytest.raises(ValidationError):
+            AigenFlowSettings(**values)
+
+    async def test_success_grows_concurrency_to_ceiling(self):
+        """Test additive increase stops at max_concurrency."""
+        governor = ProviderGovernor("claude", _fast_config(max_concurrency=3))
+
+        for _ in range(20):
+            async with governor.slot():
+                pass
+
+        assert governor.concurrency_limit == 3
+        assert governor.stats.successes == 20
+
+    async def test_throttle_halves_limits(self):
+        """Test rate-limit signals cut concurrency and rate multiplicatively."""
+        governor = ProviderGovernor("claude", _fast_config())
+        governor.concurrency_limit = 4.0
+
+        async with governor.slot() as slot:
+            slot.record(RequestOutcome.RATE_LIMITED)
+
+        assert governor.concurrency_limit == 2.0
+        assert governor.rate_per_second == pytest.approx(500.0)
+        assert governor.snapshot()["rate_limited"] == 1
+
+    async def test_concurrency_limit_enforced(self):
+        """Test no more than concurrency_limit requests run at once."""
+        governor = ProviderGovernor("claude", _fast_config(max_concurrency=2))
+        governor.concurrency_limit = 2.0
+        running = peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with governor.slot() as slot:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                slot.record(RequestOutcome.ERROR)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert governor.in_flight == 0
+
+    async def test_token_bucket_paces_requests(self):
+        """Test requests beyond the burst wait for refills."""
+        governor = ProviderGovernor("claude", _fast_config(requests_per_minute=1200.0, burst=1, max_concurrency=4))
+        governor.concurrency_limit = 4.0
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(3):
+            async with governor.slot() as slot:
+                slot.record(RequestOutcome.ERROR)
+
+        # 20 req/s with a burst of one: the 2nd and 3rd request wait ~50ms each
+        assert loop.time() - start >= 0.09
+
+    async def test_exception_releases_slot(self):
+        """Test a raising block frees its slot and records a timeout."""
+        governor = ProviderGovernor("claude", _fast_config())
+
+        with pytest.raises(TimeoutError):
+            async with governor.slot():
+                raise TimeoutError()
+
+        assert governor.in_flight == 0
+        assert governor.stats.timeouts == 1
+
+
+class _Agent(AsyncAgent):
+    def __init__(self, response: AgentResponse) -> None:
+        super().__init__(gateway_provider=None)
+        self.response = response
+
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        return self.response
+
+
+class TestRouterIntegration:
+    """Test AgentRouter feeds outcomes into the governor."""
+
+    async def test_router_records_rate_limit(self):
+        """Test a rate-limited agent response shrinks that provider's limits."""
+        governor = RateGovernor(default_config=_fast_config())
+        router = AgentRouter(settings=None, rate_governor=governor)
+        router.register_agent(
+            AgentType.CHATGPT,
+            _Agent(
+                AgentResponse(
+                    agent_name=AgentType.CHATGPT,
+                    task_name="brainstorm_chatgpt",
+                    content="",
+                    success=False,
+                    error="Too many requests in 1 hour. Try again later.",
+                )
+            ),
+        )
+
+        await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        assert governor.snapshot()["chatgpt"]["rate_limited"] == 1
+
+    def test_disabled_without_settings(self):
+        """Test no governor is created unless enabled in settings."""
+        assert AgentRouter(settings=None).rate_governor is None
+        assert get_rate_governor(SimpleNamespace(enable_rate_governor=False)) is None
+
+    def test_overrides_from_settings(self):
+        """Test per-provider overrides are applied and unknown names ignored."""
+        settings = SimpleNamespace(
+            provider_requests_per_minute=6.0,
+            provider_burst=2,
+            provider_max_concurrency=3,
+            provider_backoff_factor=0.5,
+            provider_requests_per_minute_overrides={"claude": 2.0, "unknown": 1.0},
+        )
+
+        governor = RateGovernor.from_settings(settings)
+
+        assert governor.get(AgentType.CLAUDE).config.requests_per_minute == 2.0
+        assert governor.get(AgentType.GEMINI).config.requests_per_minute == 6.0
+        assert governor.get(AgentType.GEMINI).config.max_concurrency == 3
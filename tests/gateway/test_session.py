@@ -2,10 +2,18 @@
 Tests for gateway session management.
 """
 
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
+from gateway.base import BaseProvider, GatewayResponse
 from gateway.chatgpt_provider import ChatGPTProvider
 from gateway.claude_provider import ClaudeProvider
+from gateway.cookie_storage import CookieStorage, SessionMetadata
 from gateway.session import SessionManager
 
 
@@ -59,3 +67,104 @@ class TestSessionManager:
 
         # Should run login flow
         await manager.login_all_expired()
+
+
+class _ProbeProvider(BaseProvider):
+    """Provider whose browser probe sleeps and counts calls."""
+
+    def __init__(self, profile_dir: Path, valid: bool = True, delay: float = 0.0) -> None:
+        super().__init__(profile_dir)
+        self._storage = CookieStorage(profile_dir)
+        self.valid = valid
+        self.delay = delay
+        self.probes = 0
+
+    async def send_message(self, request):
+        return GatewayResponse(content="", success=True)
+
+    async def submit_prompt(self, page, request):
+        return None
+
+    async def check_session(self) -> bool:
+        self.probes += 1
+        await asyncio.sleep(self.delay)
+        if self.valid:
+            self._storage.mark_validated()
+        return self.valid
+
+    async def login_flow(self) -> None:
+        return None
+
+    def save_session(self) -> None:
+        return None
+
+    def load_session(self) -> bool:
+        return True
+
+
+def _store_session(profile_dir: Path, expires: float, last_validated: datetime | None = None) -> None:
+    metadata = SessionMetadata(provider_name=profile_dir.name)
+    if last_validated is not None:
+        metadata.last_validated = last_validated.isoformat()
+    CookieStorage(profile_dir).save_cookies([{"name": "sid", "value": "x", "expires": expires}], metadata)
+
+
+class TestSessionChecks:
+    """Tests for concurrent, TTL-cached session checks."""
+
+    async def test_probes_run_concurrently(self, tmp_path: Path):
+        """Test slow probes overlap instead of adding up."""
+        manager = SessionManager()
+        for name in ("chatgpt", "claude", "gemini"):
+            _store_session(tmp_path / name, expires=-1, last_validated=datetime(2020, 1, 1, tzinfo=UTC))
+            manager.register(name, _ProbeProvider(tmp_path / name, delay=0.3))
+
+        started = time.perf_counter()
+        results = await manager.check_all_sessions()
+
+        assert results == {"chatgpt": True, "claude": True, "gemini": True}
+        assert time.perf_counter() - started < 0.8
+
+    async def test_probe_timeout_counts_as_invalid(self, tmp_path: Path):
+        """Test a hanging probe is cut off at the per-provider timeout."""
+        manager = SessionManager(SimpleNamespace(session_check_timeout=0.05, session_check_ttl_minutes=0))
+        _store_session(tmp_path / "claude", expires=-1)
+        manager.register("claude", _ProbeProvider(tmp_path / "claude", delay=5))
+
+        assert await manager.check_all_sessions() == {"claude": False}
+
+    async def test_expired_cookies_skip_browser(self, tmp_path: Path):
+        """Test sessions whose cookies all expired are invalid without a probe."""
+        manager = SessionManager()
+        _store_session(tmp_path / "gemini", expires=(datetime.now(UTC) - timedelta(days=1)).timestamp())
+        provider = _ProbeProvider(tmp_path / "gemini")
+        manager.register("gemini", provider)
+
+        assert await manager.check_all_sessions() == {"gemini": False}
+        assert provider.probes == 0
+
+    async def test_recent_validation_trusted_within_ttl(self, tmp_path: Path):
+        """Test a session validated within the TTL is not probed again."""
+        manager = SessionManager(SimpleNamespace(session_check_ttl_minutes=30))
+        _store_session(tmp_path / "chatgpt", expires=(datetime.now(UTC) + timedelta(days=30)).timestamp())
+        provider = _ProbeProvider(tmp_path / "chatgpt")
+        manager.register("chatgpt", provider)
+
+        assert await manager.get_valid_session() is provider
+        assert await manager.get_valid_session() is provider
+        assert provider.probes == 0
+
+        await manager.check_all_sessions(force=True)
+        assert provider.probes == 1
+
+    async def test_stale_validation_probed(self, tmp_path: Path):
+        """Test a validation older than the TTL triggers a probe that refreshes it."""
+        manager = SessionManager(SimpleNamespace(session_check_ttl_minutes=30))
+        _store_session(tmp_path / "claude", expires=-1, last_validated=datetime.now(UTC) - timedelta(hours=2))
+        provider = _ProbeProvider(tmp_path / "claude")
+        manager.register("claude", provider)
+
+        await manager.check_all_sessions()
+        await manager.check_all_sessions()
+
+        assert provider.probes == 1
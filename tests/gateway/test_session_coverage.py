@@ -39,6 +39,10 @@ class MockProvider(BaseProvider):
         from src.gateway.base import GatewayResponse
         return GatewayResponse(content="mock", success=True)
 
+    async def submit_prompt(self, page, request):
+        """Mock submit prompt."""
+        return None
+
     async def check_session(self) -> bool:
         """Mock check session."""
         if self.should_fail:
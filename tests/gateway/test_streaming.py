@@ -0,0 +1,196 @@
+"""
+Tests for streamed response capture (provider, agent and router).
+"""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agents.base import AgentRequest, AgentResponse, AgentStreamChunk, AsyncAgent
+from agents.router import AgentRouter, PhaseTask
+from core.exceptions import GatewayException
+from core.models import AgentType, DocumentType
+from gateway.base import GatewayResponse, StreamChunk
+from gateway.claude_provider import ClaudeProvider
+from gateway.rate_limiter import GovernorConfig, RateGovernor
+from output.formatter import PartialOutputWriter
+
+
+def _snapshots(*texts: str | None, busy: bool = False) -> AsyncMock:
+    return AsyncMock(side_effect=[{"text": text, "busy": busy} for text in texts])
+
+
+@pytest.fixture
+def provider(tmp_path: Path) -> ClaudeProvider:
+    """Create a provider that polls without delay."""
+    provider = ClaudeProvider(profile_dir=tmp_path)
+    provider.STREAM_POLL_INTERVAL = 0
+    provider.DEFAULT_STABLE_MS = 0
+    return provider
+
+
+class TestStreamResponse:
+    """Test BaseProvider.stream_response."""
+
+    async def test_yields_growing_text_then_completes(self, provider: ClaudeProvider):
+        """Test each text change is yielded and a stable text completes the stream."""
+        page = MagicMock()
+        page.evaluate = _snapshots(None, "Hel", "Hello", "Hello")
+
+        snapshots = [item async for item in provider.stream_response(page, timeout_ms=5000)]
+
+        assert snapshots == [("Hel", False), ("Hello", False), ("Hello", True)]
+
+    async def test_previous_answer_is_not_streamed(self, provider: ClaudeProvider):
+        """Test text already on the page before sending is ignored."""
+        page = MagicMock()
+        page.evaluate = _snapshots("old", "old", "new", "new")
+
+        snapshots = [item async for item in provider.stream_response(page, timeout_ms=5000)]
+
+        assert snapshots == [("new", False), ("new", True)]
+
+    async def test_stall_after_first_token_raises(self, provider: ClaudeProvider):
+        """Test an inter-token gap longer than idle_timeout is reported as a stall."""
+        provider.STREAM_POLL_INTERVAL = 0.01
+        page = MagicMock()
+        page.evaluate = AsyncMock(
+            side_effect=[{"text": None, "busy": False}] + [{"text": "Hel", "busy": True}] * 100
+        )
+
+        with pytest.raises(GatewayException, match="stalled"):
+            async for _ in provider.stream_response(page, timeout_ms=5000, idle_timeout=0.05):
+                pass
+
+
+class TestSendMessageStream:
+    """Test BaseProvider.send_message_stream."""
+
+    async def test_deltas_and_final_response(self, provider: ClaudeProvider):
+        """Test deltas concatenate to the final content and the page is recycled."""
+        page = MagicMock()
+        page.evaluate = _snapshots(None, "Hel", "Hello", "Hello")
+        request = MagicMock(task_name="t", prompt="p", timeout=5)
+
+        with (
+            patch.object(provider, "acquire_chat_page", AsyncMock(return_value=page)),
+            patch.object(provider, "submit_prompt", AsyncMock(return_value=None)),
+            patch.object(provider, "release_chat_page", AsyncMock()) as release,
+        ):
+            chunks = [chunk async for chunk in provider.send_message_stream(request)]
+
+        assert "".join(chunk.delta for chunk in chunks) == "Hello"
+        assert chunks[-1].done is True
+        assert chunks[-1].response.content == "Hello"
+        assert chunks[-1].response.success is True
+        release.assert_awaited_once_with(page, reusable=True)
+
+    async def test_stall_returns_failed_response_with_partial(self, provider: ClaudeProvider):
+        """Test a stalled stream ends with a failure and discards the page."""
+        page = MagicMock()
+        request = MagicMock(task_name="t", prompt="p", timeout=5)
+
+        async def stalled(*args, **kwargs):
+            yield "partial", False
+            raise GatewayException(message="claude stream stalled for 31s")
+
+        with (
+            patch.object(provider, "acquire_chat_page", AsyncMock(return_value=page)),
+            patch.object(provider, "submit_prompt", AsyncMock(return_value=None)),
+            patch.object(provider, "stream_response", stalled),
+            patch.object(provider, "release_chat_page", AsyncMock()) as release,
+        ):
+            chunks = [chunk async for chunk in provider.send_message_stream(request)]
+
+        final = chunks[-1].response
+        assert final.success is False
+        assert "stalled" in final.error
+        assert final.metadata["partial"] == "partial"
+        release.assert_awaited_once_with(page, reusable=False)
+
+
+class _StreamingGateway:
+    agent_type = AgentType.CHATGPT
+
+    async def send_message_stream(self, request, idle_timeout=None):
+        yield StreamChunk(delta="Hi ", text="Hi ")
+        yield StreamChunk(delta="there", text="Hi there")
+        yield StreamChunk(
+            text="Hi there",
+            done=True,
+            response=GatewayResponse(content="Hi there", success=True, tokens_used=2),
+        )
+
+
+class _StreamingAgent(AsyncAgent):
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        raise AssertionError("execute() should not be used when streaming")
+
+
+class TestRouterStreaming:
+    """Test AgentRouter.execute_stream and stream_listener."""
+
+    async def test_execute_stream_yields_agent_chunks(self):
+        """Test the router forwards deltas and a validated final response."""
+        router = AgentRouter(settings=None)
+        router.register_agent(AgentType.CHATGPT, _StreamingAgent(_StreamingGateway()))
+
+        chunks = [
+            chunk
+            async for chunk in router.execute_stream(
+                1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN
+            )
+        ]
+
+        assert [chunk.delta for chunk in chunks[:-1]] == ["Hi ", "there"]
+        assert chunks[-1].response.content == "Hi there"
+        assert chunks[-1].response.task_name == PhaseTask.BRAINSTORM_CHATGPT.value
+
+    async def test_governed_stream_releases_slot_with_outcome(self):
+        """Test a stream run under the rate governor holds a slot and records its outcome."""
+        governor = RateGovernor(
+            default_config=GovernorConfig(requests_per_minute=60000.0, burst=100, max_concurrency=4)
+        )
+        router = AgentRouter(settings=None, rate_governor=governor)
+        router.register_agent(AgentType.CHATGPT, _StreamingAgent(_StreamingGateway()))
+
+        chunks = [
+            chunk
+            async for chunk in router.execute_stream(
+                1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN
+            )
+        ]
+
+        assert chunks[-1].response.content == "Hi there"
+        snapshot = governor.snapshot()["chatgpt"]
+        assert (snapshot["successes"], snapshot["in_flight"]) == (1, 0)
+
+    async def test_execute_notifies_listener(self):
+        """Test execute() streams through the listener when one is set."""
+        router = AgentRouter(settings=None)
+        router.register_agent(AgentType.CHATGPT, _StreamingAgent(_StreamingGateway()))
+        seen: list[AgentStreamChunk] = []
+        router.stream_listener = lambda phase, task, chunk: seen.append(chunk)
+
+        response = await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        assert response.content == "Hi there"
+        assert len(seen) == 3
+        assert seen[-1].done is True
+
+
+class TestPartialOutputWriter:
+    """Test partial output files."""
+
+    def test_write_throttles_and_discard_removes(self, tmp_path: Path):
+        """Test rewrites are throttled and the file is removed on completion."""
+        writer = PartialOutputWriter(tmp_path, interval=60)
+
+        path = writer.write("phase1_task", "Hel")
+        assert writer.write("phase1_task", "Hello") is None
+        assert path.read_text(encoding="utf-8") == "Hel"
+
+        writer.discard("phase1_task")
+        assert not path.exists()
+        assert not (tmp_path / "partial").exists()
@@ -0,0 +1,130 @@
+"""
+Tests for sliding-window budget enforcement.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.router import AgentRouter, PhaseTask
+from core.exceptions import BudgetException
+from core.models import AgentType, DocumentType
+from monitoring.budget import DAY, AdmissionAction, BudgetGuard, RollingWindow
+from monitoring.tracker import BudgetConfig, TokenTracker, TokenUsage
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _usage(cost_tokens: int, timestamp: datetime | None = None) -> TokenUsage:
+    # ChatGPT output costs $30 per 1M tokens
+    return TokenUsage(
+        provider=AgentType.CHATGPT,
+        input_tokens=0,
+        output_tokens=cost_tokens,
+        timestamp=timestamp or datetime.now(),
+        task="brainstorm_chatgpt",
+    )
+
+
+class TestRollingWindow:
+    """Test bucketed window sums."""
+
+    def test_spending_ages_out(self):
+        """Test spending leaves the window once its bucket is older than the window."""
+        window = RollingWindow("daily", DAY, limit=1.0)
+        window.add(0.8, 0.0)
+
+        assert window.wait_for(0.5, DAY / 2) == pytest.approx(DAY + window.bucket_seconds - DAY / 2)
+        window.expire(DAY + window.bucket_seconds)
+        assert window.spent == 0.0
+        assert window.wait_for(2.0, DAY) is None
+
+
+class TestBudgetGuard:
+    """Test admission decisions."""
+
+    def test_reservations_block_concurrent_requests(self):
+        """Test an admitted request's estimate counts until it settles."""
+        guard = BudgetGuard(BudgetConfig(daily_budget=0.05, weekly_budget=0, monthly_budget=0), clock=_Clock())
+
+        first = guard.admit(AgentType.CHATGPT, "brainstorm_chatgpt", prompt_tokens=0)
+        second = guard.admit(AgentType.CHATGPT, "brainstorm_chatgpt", prompt_tokens=0)
+        guard.settle(first, _usage(100))
+        third = guard.admit(AgentType.CHATGPT, "brainstorm_chatgpt", prompt_tokens=0)
+
+        assert first.action == AdmissionAction.ALLOW
+        assert first.estimated_cost == pytest.approx(0.03)  # 1000 default output tokens
+        assert second.action == AdmissionAction.REJECT
+        assert second.period == "daily"
+        assert third.action == AdmissionAction.ALLOW
+        assert third.estimated_cost == pytest.approx(0.003)  # learned 100-token outputs
+
+    def test_defer_until_spending_ages_out(self):
+        """Test a request is deferred when old spending expires within max_defer."""
+        clock = _Clock()
+        guard = BudgetGuard(
+            BudgetConfig(daily_budget=0.05, weekly_budget=0, monthly_budget=0), max_defer=DAY, clock=clock
+        )
+        guard.settle(None, _usage(1500))
+        clock.now += DAY / 2
+
+        decision = guard.admit(AgentType.CHATGPT, "brainstorm_chatgpt", prompt_tokens=0)
+
+        assert decision.action == AdmissionAction.DEFER
+        assert 0 < decision.retry_after <= DAY / 2 + DAY / 24
+
+    def test_seeded_from_tracker(self):
+        """Test past usage counts toward the windows it falls in."""
+        tracker = TokenTracker()
+        tracker.track(_usage(1000, datetime.now() - timedelta(days=3)))
+        config = BudgetConfig(daily_budget=0.04, weekly_budget=0.04, monthly_budget=0)
+
+        guard = BudgetGuard.from_tracker(tracker, config=config)
+        decision = guard.admit(AgentType.CHATGPT, "brainstorm_chatgpt", prompt_tokens=0)
+
+        assert [window.spent for window in guard.windows] == pytest.approx([0.0, 0.03])
+        assert decision.action == AdmissionAction.REJECT
+        assert decision.period == "weekly"
+
+
+class TestBudgetAlerts:
+    """Test alert de-duplication."""
+
+    def test_threshold_alerts_once(self):
+        """Test a crossed threshold alerts once and higher ones alert as they are crossed."""
+        tracker = TokenTracker(BudgetConfig(daily_budget=0.1, weekly_budget=0, monthly_budget=0))
+        tracker.track(_usage(2000))
+
+        first = tracker.check_budget()
+        second = tracker.check_budget()
+        tracker.track(_usage(1200))
+        third = tracker.check_budget()
+
+        assert [alert.threshold for alert in first] == [50]
+        assert second == []
+        assert [alert.threshold for alert in third] == [75, 90]
+
+
+class TestRouterAdmission:
+    """Test the router consults the guard before running agents."""
+
+    async def test_rejected_request_never_runs(self):
+        """Test a request over budget raises without calling the agent."""
+        guard = BudgetGuard(BudgetConfig(daily_budget=0.001, weekly_budget=0, monthly_budget=0))
+        router = AgentRouter(settings=SimpleNamespace(), budget_guard=guard)
+        agent = MagicMock()
+        agent.execute = AsyncMock()
+        router.register_agent(AgentType.CHATGPT, agent)
+
+        with pytest.raises(BudgetException):
+            await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        agent.execute.assert_not_called()
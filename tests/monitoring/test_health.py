@@ -0,0 +1,183 @@
+"""
+Tests for provider health and health-aware routing.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agents.base import AgentResponse
+from agents.router import AgentRouter, PhaseTask
+from core.config import AigenFlowSettings
+from core.models import AgentType, DocumentType
+from monitoring.health import CircuitState, ProviderHealthTracker
+from monitoring.ledger import UsageLedger
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _QueueingGovernor:
+    """Rate governor whose slots take a while to acquire."""
+
+    def get(self, agent_type: AgentType) -> "_QueueingGovernor":
+        return self
+
+    @asynccontextmanager
+    async def slot(self):
+        await asyncio.sleep(0.2)
+        yield SimpleNamespace(record=lambda outcome: None)
+
+
+def _agent(agent_type: AgentType, success: bool = True) -> MagicMock:
+    agent = MagicMock()
+    agent.execute = AsyncMock(
+        return_value=AgentResponse(
+            content="answer" if success else "", agent_name=agent_type, task_name="task", success=success
+        )
+    )
+    return agent
+
+
+class TestProviderHealthTracker:
+    """Test EWMA statistics, circuit state and selection."""
+
+    def test_ewma_latency_and_success(self):
+        """Test latency and success rate follow recent responses."""
+        tracker = ProviderHealthTracker(alpha=0.5)
+        tracker.record(AgentType.CHATGPT, 10.0, success=True)
+        tracker.record(AgentType.CHATGPT, 20.0, success=False)
+
+        [health] = tracker.snapshot()
+
+        assert health.latency == pytest.approx(15.0)
+        assert health.success_rate == pytest.approx(0.5)
+        assert (health.requests, health.failures) == (2, 1)
+
+    def test_circuit_opens_and_probes(self):
+        """Test consecutive failures open the circuit until a half-open probe succeeds."""
+        clock = _Clock()
+        tracker = ProviderHealthTracker(circuit_threshold=2, circuit_timeout=60.0, clock=clock)
+        tracker.record(AgentType.GEMINI, 1.0, success=False)
+        tracker.record(AgentType.GEMINI, 1.0, success=False)
+
+        assert not tracker.is_available(AgentType.GEMINI)
+        clock.now += 60.0
+        with tracker.observe(AgentType.GEMINI) as probe:
+            assert not tracker.is_available(AgentType.GEMINI)  # probe in flight
+            probe.record(SimpleNamespace(success=True))
+
+        assert tracker.snapshot()[0].state == CircuitState.CLOSED
+
+    def test_choose_prefers_mapped_provider_unless_clearly_faster(self):
+        """Test the mapped provider keeps similar loads and loses to a much faster one."""
+        tracker = ProviderHealthTracker(alpha=1.0)
+        tracker.record(AgentType.CHATGPT, 30.0, success=True)
+        tracker.record(AgentType.CLAUDE, 27.0, success=True)
+
+        assert tracker.choose([AgentType.CHATGPT, AgentType.CLAUDE]) == AgentType.CHATGPT
+        tracker.record(AgentType.CHATGPT, 120.0, success=True)
+        assert tracker.choose([AgentType.CHATGPT, AgentType.CLAUDE]) == AgentType.CLAUDE
+
+    def test_persisted_in_ledger(self, tmp_path: Path):
+        """Test a new tracker (new process) starts from the saved health."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+        ProviderHealthTracker(circuit_threshold=1, ledger=ledger).record(AgentType.PERPLEXITY, 5.0, success=False)
+
+        [health] = ProviderHealthTracker(ledger=UsageLedger(tmp_path / "usage.db")).snapshot()
+
+        assert (health.provider, health.latency, health.state) == ("perplexity", 5.0, CircuitState.OPEN)
+        ledger.close()
+
+
+class TestHealthRouting:
+    """Test the router shifts provider-flexible tasks away from degraded providers."""
+
+    async def test_flexible_task_fails_over_and_avoids_open_circuit(self):
+        """Test a failed flexible task fails over to an alternative, and the open circuit is then skipped."""
+        tracker = ProviderHealthTracker(circuit_threshold=2)
+        router = AgentRouter(settings=SimpleNamespace(), provider_health=tracker)
+        chatgpt, claude = _agent(AgentType.CHATGPT, success=False), _agent(AgentType.CLAUDE)
+        router.register_agent(AgentType.CHATGPT, chatgpt)
+        router.register_agent(AgentType.CLAUDE, claude)
+
+        responses = [
+            await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN) for _ in range(4)
+        ]
+
+        assert all(response.success and response.agent_name == AgentType.CLAUDE for response in responses)
+        # Never more attempts than it takes to open the circuit
+        assert 1 <= chatgpt.execute.await_count <= 2
+
+    async def test_fallback_chain_shares_router_circuit_state(self):
+        """Test the router's failover reads and writes the router's health tracker."""
+        tracker = ProviderHealthTracker(circuit_threshold=1)
+        router = AgentRouter(settings=SimpleNamespace(), provider_health=tracker)
+        chatgpt, claude = _agent(AgentType.CHATGPT, success=False), _agent(AgentType.CLAUDE)
+        router.register_agent(AgentType.CHATGPT, chatgpt)
+        router.register_agent(AgentType.CLAUDE, claude)
+
+        await router.execute(3, PhaseTask.SWOT_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        assert router.fallback_chain.provider_health is tracker
+        assert router.fallback_chain._is_circuit_open(AgentType.CHATGPT)
+        assert {health.provider: health.requests for health in tracker.snapshot()} == {"chatgpt": 1, "claude": 1}
+
+    async def test_resolved_route_is_used_for_execution(self):
+        """Test the provider chosen for scheduling also executes the task, even if health changes."""
+        tracker = ProviderHealthTracker(circuit_threshold=1)
+        tracker.record(AgentType.CHATGPT, 1.0, success=False)
+        router = AgentRouter(settings=SimpleNamespace(), provider_health=tracker)
+        chatgpt, claude = _agent(AgentType.CHATGPT), _agent(AgentType.CLAUDE)
+        router.register_agent(AgentType.CHATGPT, chatgpt)
+        router.register_agent(AgentType.CLAUDE, claude)
+
+        routed = router.resolve_agent_type(1, PhaseTask.BRAINSTORM_CHATGPT, DocumentType.BIZPLAN)
+        tracker.record(AgentType.CHATGPT, 1.0, success=True)
+        await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        assert routed == AgentType.CLAUDE
+        claude.execute.assert_awaited_once()
+        chatgpt.execute.assert_not_called()
+
+    async def test_latency_excludes_governor_queueing(self):
+        """Test time spent waiting for a rate governor slot is not provider latency."""
+        tracker = ProviderHealthTracker()
+        router = AgentRouter(settings=SimpleNamespace(), rate_governor=_QueueingGovernor(), provider_health=tracker)
+        router.register_agent(AgentType.CHATGPT, _agent(AgentType.CHATGPT))
+
+        await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt", DocumentType.BIZPLAN)
+
+        [health] = tracker.snapshot()
+        assert health.latency < 0.1
+
+    def test_health_needs_an_explicit_ledger(self, tmp_path: Path):
+        """Test only a router given a ledger shares and persists provider health."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+
+        assert AgentRouter(settings=AigenFlowSettings()).provider_health is None
+        assert AgentRouter(settings=AigenFlowSettings(), usage_ledger=ledger).provider_health.ledger is ledger
+        ledger.close()
+
+    async def test_pinned_task_stays_on_mapped_provider(self):
+        """Test tasks without alternatives ignore provider health."""
+        tracker = ProviderHealthTracker(circuit_threshold=1)
+        tracker.record(AgentType.CLAUDE, 1.0, success=False)
+        router = AgentRouter(settings=SimpleNamespace(), provider_health=tracker)
+        claude, chatgpt = _agent(AgentType.CLAUDE), _agent(AgentType.CHATGPT)
+        router.register_agent(AgentType.CLAUDE, claude)
+        router.register_agent(AgentType.CHATGPT, chatgpt)
+
+        await router.execute(4, PhaseTask.BUSINESS_PLAN_CLAUDE, "prompt", DocumentType.BIZPLAN)
+
+        claude.execute.assert_awaited_once()
+        chatgpt.execute.assert_not_called()
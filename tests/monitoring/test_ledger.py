@@ -0,0 +1,148 @@
+"""
+Tests for the persistent usage ledger.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from agents.base import AgentResponse
+from agents.router import AgentRouter, PhaseTask
+from core.models import AgentType, DocumentType
+from monitoring.budget import BudgetGuard
+from monitoring.ledger import UsageLedger, _segments, get_usage_ledger
+from monitoring.stats import Period, StatsCollector
+from monitoring.tracker import BudgetConfig, TokenTracker, TokenUsage
+
+
+def _usage(provider: AgentType, timestamp: datetime, phase: int = 1, tokens: int = 1000) -> TokenUsage:
+    return TokenUsage(
+        provider=provider, input_tokens=tokens, output_tokens=tokens, timestamp=timestamp, phase=phase
+    )
+
+
+class TestSegments:
+    """Test splitting query ranges into rollup pieces."""
+
+    def test_range_spanning_days(self):
+        """Test whole days come from the daily rollup and only edges from raw rows."""
+        start = 86400 * 10 + 1800  # 00:30 on day 10
+        end = 86400 * 13 + 7200 + 60  # 02:01 on day 13
+
+        segments = _segments(start, end)
+
+        assert [source for source, _, _ in segments] == ["raw", "hour", "day", "hour", "raw"]
+        assert segments[0][1] == start and segments[-1][2] == end
+        assert all(segments[i][2] == segments[i + 1][1] for i in range(len(segments) - 1))
+
+    def test_short_range_is_raw(self):
+        """Test a range inside one hour reads raw rows only."""
+        assert _segments(100.0, 200.0) == [("raw", 100.0, 200.0)]
+
+
+class TestUsageLedger:
+    """Test recording and period totals."""
+
+    def test_totals_match_raw_rows(self, tmp_path: Path):
+        """Test rollup-backed totals equal a direct sum over any range."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+        now = datetime.now()
+        usages = [
+            _usage(AgentType.CLAUDE if i % 2 else AgentType.GEMINI, now - timedelta(hours=7 * i), phase=i % 5 + 1)
+            for i in range(200)
+        ]
+        ledger.record_many(usages)
+
+        for days in (1, 7, 30):
+            since = now - timedelta(days=days)
+            expected = [usage for usage in usages if usage.timestamp >= since]
+            totals = ledger.totals(since=since)
+            assert sum(entry.requests for entry in totals) == len(expected)
+            assert sum(entry.total_tokens for entry in totals) == sum(usage.total_tokens for usage in expected)
+            assert abs(sum(entry.cost for entry in totals) - sum(u.estimated_cost for u in expected)) < 1e-9
+
+        claude = ledger.totals(provider="claude")
+        assert {entry.provider for entry in claude} == {"claude"}
+        assert sum(entry.requests for entry in claude) == 100
+        ledger.close()
+
+    def test_survives_reopen(self, tmp_path: Path):
+        """Test usage is still reported by a new process (new connection)."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+        ledger.record(_usage(AgentType.CHATGPT, datetime.now()))
+        ledger.close()
+
+        summary = StatsCollector(ledger=UsageLedger(tmp_path / "usage.db")).get_summary(Period.DAILY)
+
+        assert summary.request_count == 1
+        assert summary.by_provider == {"chatgpt": 2000}
+        assert summary.cost_by_provider["chatgpt"] > 0
+
+    def test_unconfigured_settings_open_no_ledger(self):
+        """Test settings without a ledger path (e.g. mocks) never open the default ledger."""
+        assert get_usage_ledger(SimpleNamespace(enable_usage_ledger=True)) is None
+        assert get_usage_ledger(MagicMock()) is None
+
+
+class TestLedgerBackedTracker:
+    """Test TokenTracker with a ledger."""
+
+    def test_budget_uses_period_spending(self, tmp_path: Path):
+        """Test old usage counts toward the weekly budget but not the daily one."""
+        tracker = TokenTracker(ledger=UsageLedger(tmp_path / "usage.db"))
+        tracker.track(_usage(AgentType.CHATGPT, datetime.now() - timedelta(days=3), tokens=2_000_000))
+
+        periods = {alert.period for alert in tracker.check_budget()}
+
+        assert tracker.get_summary()["request_count"] == 1
+        assert len(tracker._usage_records) == 0
+        assert "daily" not in periods
+        assert "weekly" in periods
+
+
+class TestRouterRecording:
+    """Test the router records agent responses."""
+
+    async def test_execute_records_usage(self, tmp_path: Path):
+        """Test each executed task lands in the ledger with its phase and task."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+        router = AgentRouter(settings=SimpleNamespace(), usage_ledger=ledger)
+        agent = MagicMock()
+        agent.execute = AsyncMock(
+            return_value=AgentResponse(
+                content="answer", agent_name=AgentType.CHATGPT, task_name="brainstorm", tokens_used=50
+            )
+        )
+        router.register_agent(AgentType.CHATGPT, agent)
+
+        await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt " * 100, DocumentType.BIZPLAN)
+
+        [entry] = ledger.totals()
+        assert (entry.provider, entry.phase, entry.output_tokens, entry.requests) == ("chatgpt", 1, 50, 1)
+        assert entry.input_tokens > 0
+        ledger.close()
+
+    async def test_failed_response_only_releases_reservation(self, tmp_path: Path):
+        """Test a failed response is not recorded as usage and frees its budget reservation."""
+        ledger = UsageLedger(tmp_path / "usage.db")
+        guard = BudgetGuard(BudgetConfig(daily_budget=10.0, weekly_budget=0, monthly_budget=0))
+        router = AgentRouter(settings=SimpleNamespace(), usage_ledger=ledger, budget_guard=guard)
+        agent = MagicMock()
+        agent.execute = AsyncMock(
+            return_value=AgentResponse(
+                content="",
+                agent_name=AgentType.CHATGPT,
+                task_name="brainstorm",
+                success=False,
+                error="Timeout",
+                tokens_used=50,
+            )
+        )
+        router.register_agent(AgentType.CHATGPT, agent)
+
+        await router.execute(1, PhaseTask.BRAINSTORM_CHATGPT, "prompt " * 100, DocumentType.BIZPLAN)
+
+        assert ledger.totals() == []
+        assert [(window.spent, window.reserved) for window in guard.windows] == [(0.0, 0.0)]
+        ledger.close()
@@ -0,0 +1,81 @@
+"""
+Tests for the columnar in-memory usage store.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from core.models import AgentType
+from monitoring.tracker import TokenUsage, UsageColumns
+
+
+def _records(count: int, shuffled: bool) -> list[TokenUsage]:
+    rng = random.Random(7)
+    now = datetime.now()
+    records = [
+        TokenUsage(
+            provider=rng.choice(list(AgentType)),
+            input_tokens=rng.randint(0, 5000),
+            output_tokens=rng.randint(0, 5000),
+            timestamp=now - timedelta(minutes=count - index),
+            phase=rng.randint(1, 5),
+            task=f"task_{index % 3}",
+        )
+        for index in range(count)
+    ]
+    if shuffled:
+        rng.shuffle(records)
+    return records
+
+
+def _expected(records: list[TokenUsage], since: datetime | None) -> dict[tuple[str, int], tuple[int, int, int]]:
+    expected: dict[tuple[str, int], tuple[int, int, int]] = {}
+    for record in records:
+        if since is not None and record.timestamp < since:
+            continue
+        key = (record.provider.value, record.phase)
+        input_tokens, output_tokens, requests = expected.get(key, (0, 0, 0))
+        expected[key] = (input_tokens + record.input_tokens, output_tokens + record.output_tokens, requests + 1)
+    return expected
+
+
+class TestUsageColumns:
+    """Test aggregation and record access."""
+
+    def test_totals_match_records(self):
+        """Test grouped totals and cost() match per-record sums, in and out of time order."""
+        for shuffled in (False, True):
+            records = _records(500, shuffled)
+            columns = UsageColumns()
+            for record in records:
+                columns.append(record)
+
+            for since in (None, datetime.now() - timedelta(hours=2)):
+                totals = columns.totals(since=since)
+                actual = {
+                    (entry.provider, entry.phase): (entry.input_tokens, entry.output_tokens, entry.requests)
+                    for entry in totals
+                }
+                assert actual == _expected(records, since)
+                selected = [record for record in records if since is None or record.timestamp >= since]
+                assert abs(sum(entry.cost for entry in totals) - sum(r.estimated_cost for r in selected)) < 1e-9
+                assert abs(columns.cost(since=since) - sum(r.estimated_cost for r in selected)) < 1e-9
+
+    def test_records_round_trip(self):
+        """Test indexing rebuilds equal TokenUsage records."""
+        records = _records(3, shuffled=False)
+        columns = UsageColumns()
+        for record in records:
+            columns.append(record)
+
+        assert len(columns) == 3
+        assert columns[-1] == records[-1]
+        assert list(columns) == records
+
+    def test_provider_filter(self):
+        """Test totals for one provider, including one never recorded."""
+        columns = UsageColumns()
+        columns.append(TokenUsage(provider=AgentType.GEMINI, input_tokens=10, output_tokens=5))
+
+        assert [entry.provider for entry in columns.totals(provider="gemini")] == ["gemini"]
+        assert columns.totals(provider="claude") == []
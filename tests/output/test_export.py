@@ -0,0 +1,71 @@
+"""
+Tests for parallel multi-format export.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from output.export import DocumentExporter, expand_formats, write_atomic
+from output.formatters import OutputFormat
+
+CONTENT = "# Business Plan\n\n## Market\n\n- Size **4.2B**\n\n| Year | Revenue |\n|---|---|\n| 2026 | 10 |\n"
+
+
+class TestExpandFormats:
+    """Test format resolution."""
+
+    def test_all_expands_once(self):
+        """Test ALL expands to every concrete format without duplicates."""
+        assert expand_formats(["md", OutputFormat.ALL, "pdf"]) == [
+            OutputFormat.MARKDOWN,
+            OutputFormat.DOCX,
+            OutputFormat.PDF,
+        ]
+
+    def test_unknown_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown output format"):
+            expand_formats(["odt"])
+
+
+class TestWriteAtomic:
+    """Test temp-file-and-rename writes."""
+
+    def test_replaces_without_leftovers(self, tmp_path: Path):
+        """Test the destination is replaced and no temporary file remains."""
+        path = tmp_path / "doc.md"
+        path.write_text("old")
+
+        write_atomic(path, "new")
+
+        assert path.read_text() == "new"
+        assert [item.name for item in tmp_path.iterdir()] == ["doc.md"]
+
+
+class TestDocumentExporter:
+    """Test concurrent export."""
+
+    async def test_exports_all_formats(self, tmp_path: Path):
+        """Test every format is written from a single parse in the process pool."""
+        written = await DocumentExporter().export(CONTENT, tmp_path, "plan", [OutputFormat.ALL], {"title": "Plan"})
+
+        assert set(written) == {OutputFormat.MARKDOWN, OutputFormat.DOCX, OutputFormat.PDF}
+        assert written[OutputFormat.MARKDOWN].read_text(encoding="utf-8") == CONTENT
+        assert written[OutputFormat.DOCX].read_bytes()[:2] == b"PK"
+        assert written[OutputFormat.PDF].read_bytes()[:4] == b"%PDF"
+
+    async def test_failed_format_left_out(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test a renderer failure does not prevent the other formats."""
+        from output.formatters import PdfFormatter
+
+        def broken(self, document, metadata=None):
+            raise RuntimeError("font missing")
+
+        monkeypatch.setattr(PdfFormatter, "render", broken)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            written = await DocumentExporter(executor).export(CONTENT, tmp_path, "plan", ["md", "pdf"])
+
+        assert set(written) == {OutputFormat.MARKDOWN}
+        assert not (tmp_path / "plan.pdf").exists()
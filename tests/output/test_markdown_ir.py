@@ -0,0 +1,93 @@
+"""
+Tests for the shared Markdown intermediate representation.
+"""
+
+from output.markdown_ir import BlockType, Run, parse_inline, parse_markdown, plain_text
+
+SAMPLE = """# 사업계획서
+
+**문서 유형**: BIZPLAN
+**언어**: ko
+
+---
+
+## 시장 분석
+
+- 시장 규모 **4.2조 원**
+- 연평균 성장률 12%
+
+1. 1단계 진출
+2. 2단계 확장
+
+| 구분 | 2026 | 2027 |
+|------|------|------|
+| 매출 | 10 | *25* |
+
+```
+raw *text*
+```
+"""
+
+
+class TestParseMarkdown:
+    """Test block parsing."""
+
+    def test_block_sequence(self):
+        """Test each construct becomes one block in document order."""
+        document = parse_markdown(SAMPLE)
+
+        assert [block.type for block in document.blocks] == [
+            BlockType.HEADING,
+            BlockType.PARAGRAPH,
+            BlockType.PARAGRAPH,
+            BlockType.RULE,
+            BlockType.HEADING,
+            BlockType.BULLET_LIST,
+            BlockType.NUMBERED_LIST,
+            BlockType.TABLE,
+            BlockType.CODE,
+        ]
+        assert document.blocks[4].level == 2
+
+    def test_lists_and_tables_grouped(self):
+        """Test consecutive items and rows are collected into one block."""
+        blocks = parse_markdown(SAMPLE).blocks
+
+        assert [plain_text(item) for item in blocks[5].items] == ["시장 규모 4.2조 원", "연평균 성장률 12%"]
+        assert [plain_text(item) for item in blocks[6].items] == ["1단계 진출", "2단계 확장"]
+        assert [[plain_text(cell) for cell in row] for row in blocks[7].rows] == [
+            ["구분", "2026", "2027"],
+            ["매출", "10", "25"],
+        ]
+        assert blocks[8].text == "raw *text*"
+
+    def test_blank_line_separates_lists(self):
+        """Test a blank line starts a new list."""
+        blocks = parse_markdown("- a\n- b\n\n- c").blocks
+
+        assert [len(block.items) for block in blocks] == [2, 1]
+
+
+class TestParseInline:
+    """Test inline runs."""
+
+    def test_bold_italic_and_code(self):
+        """Test markers become run flags."""
+        assert parse_inline("a **b** *c* `d`") == [
+            Run("a "),
+            Run("b", bold=True),
+            Run(" "),
+            Run("c", italic=True),
+            Run(" "),
+            Run("d", code=True),
+        ]
+
+    def test_nested_emphasis(self):
+        """Test italic inside bold keeps both flags."""
+        runs = parse_inline("**bold *both* bold**")
+
+        assert Run("both", bold=True, italic=True) in runs
+
+    def test_unclosed_and_intraword_markers_literal(self):
+        """Test unclosed markers and snake_case stay as text."""
+        assert plain_text(parse_inline("**unclosed and snake_case_name")) == "**unclosed and snake_case_name"
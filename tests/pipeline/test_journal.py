@@ -0,0 +1,209 @@
+"""
+Tests for the append-only session journal.
+"""
+
+import json
+from pathlib import Path
+
+from agents.router import AgentRouter, PhaseTask
+from core.models import (
+    AgentResponse,
+    AgentType,
+    DocumentType,
+    PhaseResult,
+    PhaseStatus,
+    PipelineConfig,
+    PipelineSession,
+    PipelineState,
+)
+from monitoring.health import ProviderHealthTracker
+from pipeline.base import BasePhase
+from pipeline.journal import (
+    JOURNAL_FILENAME,
+    SNAPSHOT_FILENAME,
+    SessionJournal,
+    read_events,
+    replay_session,
+)
+
+
+def _session() -> PipelineSession:
+    return PipelineSession(config=PipelineConfig(topic="Journal replay test topic"))
+
+
+def _response(task: PhaseTask, success: bool = True) -> AgentResponse:
+    return AgentResponse(agent_name=AgentType.CLAUDE, task_name=task.value, content=f"{task.value} output", success=success)
+
+
+def _phase_result(phase_number: int) -> PhaseResult:
+    return PhaseResult(
+        phase_number=phase_number,
+        phase_name=f"Phase {phase_number}",
+        status=PhaseStatus.COMPLETED,
+        ai_responses=[_response(PhaseTask.BRAINSTORM_CHATGPT)],
+    )
+
+
+class _GraphPhase(BasePhase):
+    def __init__(self) -> None:
+        self.calls: list[PhaseTask] = []
+
+    def get_tasks(self, session: PipelineSession) -> list[PhaseTask]:
+        return [PhaseTask.BRAINSTORM_CHATGPT, PhaseTask.VALIDATE_CLAUDE]
+
+    async def execute(self, session, config):
+        raise NotImplementedError
+
+    def validate_result(self, result: PhaseResult) -> bool:
+        return True
+
+    async def run(self, session: PipelineSession) -> list[AgentResponse]:
+        async def _run_task(task: PhaseTask) -> AgentResponse:
+            self.calls.append(task)
+            return _response(task)
+
+        return await self.run_task_graph(session, self.get_tasks(session), _run_task)
+
+
+class TestReplay:
+    """Test rebuilding sessions from the journal."""
+
+    def test_replays_phases_and_state(self, tmp_path: Path):
+        """Test a session is rebuilt from events alone."""
+        session = _session()
+        journal = SessionJournal(tmp_path, flush_interval=0.01)
+        journal.record_session(session)
+        session.add_result(_phase_result(1))
+        session.state = PipelineState.PHASE_1
+        session.artifacts["note"] = "kept"
+        journal.record_phase(session.results[0])
+        journal.record_state(session)
+        journal.close()
+
+        replayed = replay_session(tmp_path)
+
+        assert replayed.session_id == session.session_id
+        assert replayed.state == PipelineState.PHASE_1
+        assert replayed.current_phase == 1
+        assert replayed.artifacts == {"note": "kept"}
+        assert [result.phase_number for result in replayed.results] == [1]
+
+    def test_state_events_carry_changed_artifacts(self, tmp_path: Path):
+        """Test each state event holds only changed artifacts and replay merges them."""
+        session = _session()
+        journal = SessionJournal(tmp_path, flush_interval=0.01)
+        journal.record_session(session)
+        session.artifacts.update(summary={"text": "long summary"}, note="first", scratch=1)
+        journal.record_state(session)
+        session.artifacts["note"] = "second"
+        del session.artifacts["scratch"]
+        journal.record_state(session)
+        journal.record_state(session)
+        journal.close()
+
+        states = [event for event in read_events(tmp_path / JOURNAL_FILENAME) if event["event"] == "state"]
+
+        assert states[0]["artifacts"] == {"summary": {"text": "long summary"}, "note": "first", "scratch": 1}
+        assert states[1]["artifacts"] == {"note": "second"}
+        assert states[1]["removed_artifacts"] == ["scratch"]
+        assert states[2]["artifacts"] == {}
+        assert replay_session(tmp_path).artifacts == {"summary": {"text": "long summary"}, "note": "second"}
+
+    def test_torn_line_skipped(self, tmp_path: Path):
+        """Test a partially written last line does not prevent replay."""
+        journal = SessionJournal(tmp_path)
+        journal.record_session(_session())
+        journal.close()
+        with open(tmp_path / JOURNAL_FILENAME, "a", encoding="utf-8") as handle:
+            handle.write('{"event": "phase", "res')
+
+        assert replay_session(tmp_path) is not None
+
+    def test_flush_writes_batch(self, tmp_path: Path):
+        """Test flush() returns once queued events are on disk."""
+        journal = SessionJournal(tmp_path, flush_interval=60.0)
+        for _ in range(3):
+            journal.record_task_started(1, PhaseTask.BRAINSTORM_CHATGPT)
+
+        journal.flush()
+
+        assert len(list(read_events(tmp_path / JOURNAL_FILENAME))) == 3
+        journal.close()
+
+
+class TestCompaction:
+    """Test snapshot compaction."""
+
+    def test_snapshot_and_carried_tasks(self, tmp_path: Path):
+        """Test compaction writes the snapshot and keeps only unfinished-phase tasks."""
+        session = _session()
+        journal = SessionJournal(tmp_path)
+        journal.record_session(session)
+        journal.record_task_completed(1, PhaseTask.BRAINSTORM_CHATGPT, _response(PhaseTask.BRAINSTORM_CHATGPT))
+        session.add_result(_phase_result(1))
+        journal.record_phase(session.results[0])
+        journal.record_task_completed(2, PhaseTask.DEEP_SEARCH_GEMINI, _response(PhaseTask.DEEP_SEARCH_GEMINI))
+
+        journal.compact(session)
+
+        snapshot = json.loads((tmp_path / SNAPSHOT_FILENAME).read_text(encoding="utf-8"))
+        assert snapshot["session_id"] == session.session_id
+        assert (tmp_path / "phase1_results.json").exists()
+        events = list(read_events(tmp_path / JOURNAL_FILENAME))
+        assert [(event["event"], event["phase"]) for event in events] == [("task_completed", 2)]
+        assert replay_session(tmp_path).current_phase == 1
+
+    def test_journal_removed_when_nothing_pending(self, tmp_path: Path):
+        """Test a fully finished session leaves only the snapshot."""
+        session = _session()
+        journal = SessionJournal(tmp_path)
+        journal.record_session(session)
+        session.add_result(_phase_result(1))
+        journal.record_phase(session.results[0])
+
+        journal.compact(session)
+
+        assert not (tmp_path / JOURNAL_FILENAME).exists()
+        assert replay_session(tmp_path).results[0].phase_number == 1
+
+
+class TestTaskReplay:
+    """Test that resumed phases skip tasks that already succeeded."""
+
+    async def test_successful_task_not_rerun(self, tmp_path: Path):
+        """Test only the task without a successful response runs again."""
+        first = SessionJournal(tmp_path)
+        first.record_task_completed(1, PhaseTask.BRAINSTORM_CHATGPT, _response(PhaseTask.BRAINSTORM_CHATGPT))
+        first.record_task_completed(1, PhaseTask.VALIDATE_CLAUDE, _response(PhaseTask.VALIDATE_CLAUDE, success=False))
+        first.close()
+
+        phase = _GraphPhase()
+        phase.journal = SessionJournal(tmp_path)
+        responses = await phase.run(_session())
+        phase.journal.close()
+
+        assert phase.calls == [PhaseTask.VALIDATE_CLAUDE]
+        assert [response.success for response in responses] == [True, True]
+
+    async def test_replayed_task_releases_route(self, tmp_path: Path):
+        """Test a route resolved for scheduling is not left behind when the task is replayed."""
+        first = SessionJournal(tmp_path)
+        first.record_task_completed(1, PhaseTask.BRAINSTORM_CHATGPT, _response(PhaseTask.BRAINSTORM_CHATGPT))
+        first.close()
+        tracker = ProviderHealthTracker(circuit_threshold=1)
+        tracker.record(AgentType.CHATGPT, 1.0, success=False)
+        router = AgentRouter(settings=None, provider_health=tracker)
+        router.register_agent(AgentType.CHATGPT, object())
+        router.register_agent(AgentType.CLAUDE, object())
+
+        phase = _GraphPhase()
+        phase.agent_router = router
+        phase.journal = SessionJournal(tmp_path)
+        await phase.run(_session())
+        phase.journal.close()
+
+        assert PhaseTask.BRAINSTORM_CHATGPT not in phase.calls
+        assert router._routes == {}
+        # Health changed since: the next run routes afresh instead of reusing the old route
+        tracker.record(AgentType.CHATGPT, 0.1, success=True)
+        assert router.resolve_agent_type(1, PhaseTask.BRAINSTORM_CHATGPT, DocumentType.BIZPLAN) == AgentType.CHATGPT
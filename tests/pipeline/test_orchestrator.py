@@ -3,11 +3,14 @@ Tests for orchestrator layer.
 """
 
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from agents.base import AgentRequest, AgentResponse, AsyncAgent
+from core.catalog import SessionCatalog, catalog_path
 from core.models import AgentType, PhaseStatus, PipelineConfig
+from pipeline.journal import SessionJournal
 from pipeline.orchestrator import PipelineOrchestrator
 from pipeline.state import PipelineState
 
@@ -153,3 +156,41 @@ class TestPipelineOrchestrator:
         assert (output_dir / "pipeline_state.json").exists()
         assert (output_dir / "phase1_results.json").exists()
         assert (output_dir / "phase5_results.json").exists()
+
+    @pytest.mark.anyio
+    async def test_run_pipeline_survives_journal_compaction_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        def _fail_compact(self, session):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(SessionJournal, "compact", _fail_compact)
+        orchestrator = PipelineOrchestrator(settings=None)
+        for agent_type in AgentType:
+            orchestrator.agent_router.register_agent(agent_type, _SuccessAgent(agent_type.value))
+
+        session = await orchestrator.run_pipeline(
+            PipelineConfig(topic="Test topic for compaction failure", output_dir=tmp_path)
+        )
+
+        assert session.state.value == "completed"
+        assert SessionCatalog.for_output_dir(tmp_path).get(session.session_id).state == "completed"
+
+    @pytest.mark.anyio
+    async def test_run_pipeline_catalogs_under_configured_output_dir(self, tmp_path: Path):
+        root = tmp_path / "output"
+        orchestrator = PipelineOrchestrator(settings=SimpleNamespace(output_dir=root))
+        for agent_type in AgentType:
+            orchestrator.agent_router.register_agent(agent_type, _SuccessAgent(agent_type.value))
+
+        session = await orchestrator.run_pipeline(
+            PipelineConfig(topic="Test topic for a custom output directory", output_dir=tmp_path / "custom")
+        )
+
+        catalog = SessionCatalog.for_output_dir(root)
+        entry = catalog.get(session.session_id)
+        catalog.close()
+        assert entry.state == "completed"
+        assert entry.session_dir == tmp_path / "custom" / session.session_id
+        assert not catalog_path(tmp_path / "custom").exists()
+        assert orchestrator._catalogs == {}
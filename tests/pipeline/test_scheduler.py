@@ -0,0 +1,243 @@
+"""
+Tests for TaskScheduler task-graph execution.
+"""
+
+import asyncio
+
+import pytest
+
+from agents.base import AgentRequest, AsyncAgent
+from agents.router import AgentMapping, AgentRouter, PhaseTask
+from core.exceptions import PipelineException
+from core.models import AgentResponse, AgentType, PhaseStatus, PipelineConfig, PipelineSession
+from pipeline.phase5_review import Phase5Review
+from pipeline.scheduler import ScheduledTask, TaskScheduler
+from templates.manager import TemplateManager
+
+
+class _DummyGateway:
+    """Dummy gateway for testing."""
+    pass
+
+
+class _SlowAgent(AsyncAgent):
+    """Agent that records start/end events around a short sleep."""
+
+    def __init__(self, name: str, events: list[tuple[str, str]]) -> None:
+        super().__init__(gateway_provider=_DummyGateway())
+        self._name = name
+        self._events = events
+
+    async def execute(self, request: AgentRequest) -> AgentResponse:
+        self._events.append(("start", request.task_name))
+        await asyncio.sleep(0.01)
+        self._events.append(("end", request.task_name))
+        return AgentResponse(
+            agent_name=AgentType(self._name),
+            task_name=request.task_name,
+            content="ok",
+            success=True,
+        )
+
+
+def _recorder(key: str, events: list[tuple[str, str]], delay: float = 0.01):
+    async def _run() -> str:
+        events.append(("start", key))
+        await asyncio.sleep(delay)
+        events.append(("end", key))
+        return key
+
+    return _run
+
+
+class TestTaskScheduler:
+    """Test suite for TaskScheduler."""
+
+    async def test_results_keyed_by_task(self):
+        """Test run returns each task's value under its key."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler()
+
+        results = await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events)),
+                ScheduledTask(key="b", run=_recorder("b", events)),
+            ]
+        )
+
+        assert results == {"a": "a", "b": "b"}
+
+    async def test_independent_tasks_run_concurrently(self):
+        """Test tasks on different providers overlap."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler()
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events), resource="gemini"),
+                ScheduledTask(key="b", run=_recorder("b", events), resource="perplexity"),
+            ]
+        )
+
+        assert events[:2] == [("start", "a"), ("start", "b")]
+
+    async def test_dependency_waits_for_upstream(self):
+        """Test a task starts only after the tasks it consumes finish."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler()
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="b", run=_recorder("b", events), depends_on=("a",)),
+                ScheduledTask(key="a", run=_recorder("a", events)),
+            ]
+        )
+
+        assert events.index(("end", "a")) < events.index(("start", "b"))
+
+    async def test_callable_resource_resolved_after_dependencies(self):
+        """Test a callable resource is resolved once the task's dependencies finish."""
+        events: list[tuple[str, str]] = []
+        resolved: list[tuple[str, list[tuple[str, str]]]] = []
+        scheduler = TaskScheduler()
+
+        def _resource() -> str:
+            resolved.append(("claude", list(events)))
+            return "claude"
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events)),
+                ScheduledTask(key="b", run=_recorder("b", events), depends_on=("a",), resource=_resource),
+            ]
+        )
+
+        assert resolved == [("claude", [("start", "a"), ("end", "a")])]
+        assert "claude" in scheduler._semaphores
+
+    async def test_provider_limit_serializes_same_provider(self):
+        """Test the per-provider limit keeps same-provider tasks apart."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler(default_limit=1)
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events), resource="claude"),
+                ScheduledTask(key="b", run=_recorder("b", events), resource="claude"),
+            ]
+        )
+
+        assert events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    async def test_provider_limits_override_default(self):
+        """Test explicit provider limits allow more concurrency."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler(provider_limits={"claude": 2})
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events), resource="claude"),
+                ScheduledTask(key="b", run=_recorder("b", events), resource="claude"),
+            ]
+        )
+
+        assert events[:2] == [("start", "a"), ("start", "b")]
+
+    async def test_global_limit_of_one_is_sequential(self):
+        """Test max_concurrency=1 runs tasks in declaration order."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler(max_concurrency=1)
+
+        await scheduler.run(
+            [
+                ScheduledTask(key="a", run=_recorder("a", events), resource="gemini"),
+                ScheduledTask(key="b", run=_recorder("b", events), resource="perplexity"),
+            ]
+        )
+
+        assert events == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    async def test_external_dependencies_are_satisfied(self):
+        """Test dependencies outside the graph do not block."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler()
+
+        results = await scheduler.run(
+            [ScheduledTask(key="b", run=_recorder("b", events), depends_on=("earlier_phase",))]
+        )
+
+        assert results == {"b": "b"}
+
+    async def test_cycle_raises(self):
+        """Test a dependency cycle is rejected before anything runs."""
+        events: list[tuple[str, str]] = []
+        scheduler = TaskScheduler()
+
+        with pytest.raises(PipelineException):
+            await scheduler.run(
+                [
+                    ScheduledTask(key="a", run=_recorder("a", events), depends_on=("b",)),
+                    ScheduledTask(key="b", run=_recorder("b", events), depends_on=("a",)),
+                ]
+            )
+
+        assert events == []
+
+    async def test_task_exception_propagates(self):
+        """Test the first task failure is raised to the caller."""
+
+        async def _boom() -> None:
+            raise RuntimeError("boom")
+
+        scheduler = TaskScheduler()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await scheduler.run([ScheduledTask(key="a", run=_boom)])
+
+    def test_invalid_limits_rejected(self):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            TaskScheduler(default_limit=0)
+        with pytest.raises(ValueError):
+            TaskScheduler(max_concurrency=0)
+
+
+class TestTaskDependencies:
+    """Test suite for the task dependency table."""
+
+    def test_every_task_declared(self):
+        """Test every PhaseTask has a dependency entry."""
+        dependencies = AgentMapping.get_task_dependencies()
+        assert set(dependencies) == set(PhaseTask)
+
+    def test_research_tasks_independent(self):
+        """Test Phase 2 research tasks do not depend on each other."""
+        dependencies = AgentMapping.get_task_dependencies()
+        assert PhaseTask.DEEP_SEARCH_GEMINI not in dependencies[PhaseTask.FACT_CHECK_PERPLEXITY]
+        assert PhaseTask.FACT_CHECK_PERPLEXITY not in dependencies[PhaseTask.DEEP_SEARCH_GEMINI]
+
+    async def test_phase5_verify_overlaps_claude_review(self):
+        """Test VERIFY_PERPLEXITY runs alongside the Claude review chain."""
+        events: list[tuple[str, str]] = []
+        router = AgentRouter(settings=None)
+        router.register_agent(AgentType.PERPLEXITY, _SlowAgent("perplexity", events))
+        router.register_agent(AgentType.CLAUDE, _SlowAgent("claude", events))
+
+        phase = Phase5Review(template_manager=TemplateManager(), agent_router=router)
+        session = PipelineSession(config=PipelineConfig(topic="Scheduler overlap test topic"))
+
+        result = await phase.execute(session, session.config)
+
+        assert result.status == PhaseStatus.COMPLETED
+        assert [r.task_name for r in result.ai_responses] == [
+            PhaseTask.VERIFY_PERPLEXITY.value,
+            PhaseTask.FINAL_REVIEW_CLAUDE.value,
+            PhaseTask.POLISH_CLAUDE.value,
+        ]
+        assert events[:2] == [
+            ("start", PhaseTask.VERIFY_PERPLEXITY.value),
+            ("start", PhaseTask.FINAL_REVIEW_CLAUDE.value),
+        ]
+        assert events.index(("end", PhaseTask.FINAL_REVIEW_CLAUDE.value)) < events.index(
+            ("start", PhaseTask.POLISH_CLAUDE.value)
+        )
@@ -4,6 +4,8 @@ Tests for FallbackChain.
 Tests follow TDD principles: written before implementation.
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -373,3 +375,81 @@ class TestFallbackChain:
 
         assert response.metadata.get("fallback_used") is True
         assert response.metadata.get("original_provider") == AgentType.CLAUDE
+
+
+class TestHedging:
+    """Test suite for hedged requests."""
+
+    @staticmethod
+    def _provider(delay: float, success: bool = True) -> MagicMock:
+        async def send_message(request: GatewayRequest) -> GatewayResponse:
+            await asyncio.sleep(delay)
+            return GatewayResponse(content=f"after {delay}", success=success, error=None if success else "failed")
+
+        provider = MagicMock()
+        provider.send_message = AsyncMock(side_effect=send_message)
+        return provider
+
+    @staticmethod
+    def _config(**overrides) -> FallbackConfig:
+        return FallbackConfig(
+            fallback_order=[AgentType.CLAUDE, AgentType.GEMINI],
+            enable_hedging=True,
+            hedge_default_delay_ms=20,
+            **overrides,
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged(self) -> None:
+        """Test the next provider answers when the primary is stuck, and the primary is cancelled."""
+        providers = {AgentType.CLAUDE: self._provider(10.0), AgentType.GEMINI: self._provider(0.01)}
+        chain = FallbackChain(self._config())
+
+        started = time.monotonic()
+        response = await chain.execute(GatewayRequest(task_name="test", prompt="Hello"), AgentType.CLAUDE, providers)
+
+        assert time.monotonic() - started < 1.0
+        assert response.content == "after 0.01"
+        assert response.metadata["hedged"] is True
+        assert response.metadata["final_provider"] == AgentType.GEMINI.value
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_caps_duplicates(self) -> None:
+        """Test requests wait for the primary once hedge tokens run out."""
+        providers = {AgentType.CLAUDE: self._provider(0.05), AgentType.GEMINI: self._provider(0.01)}
+        chain = FallbackChain(self._config(hedge_budget_ratio=0.0, hedge_budget_burst=1.0))
+        request = GatewayRequest(task_name="test", prompt="Hello")
+
+        first = await chain.execute(request, AgentType.CLAUDE, providers)
+        second = await chain.execute(request, AgentType.CLAUDE, providers)
+
+        assert first.metadata.get("hedged") is True
+        assert "hedged" not in second.metadata
+        assert providers[AgentType.GEMINI].send_message.call_count == 1
+
+    def test_hedge_delay_uses_latency_percentile(self) -> None:
+        """Test the delay follows recent response times once enough are recorded."""
+        chain = FallbackChain(self._config(hedge_min_samples=5, hedge_percentile=90.0))
+        for seconds in (0.1, 0.2, 0.3, 0.4, 5.0):
+            chain._record_latency(AgentType.CLAUDE, seconds)
+        chain._record_latency(AgentType.GEMINI, 1.0)
+
+        assert chain.hedge_delay(AgentType.CLAUDE) == 5.0
+        assert chain.hedge_delay(AgentType.GEMINI) == 0.02
+
+    @pytest.mark.asyncio
+    async def test_cancelled_losers_do_not_lower_hedge_delay(self) -> None:
+        """Test cancelled hedge losers are not sampled, so the delay does not drift down."""
+        providers = {AgentType.CLAUDE: self._provider(10.0), AgentType.GEMINI: self._provider(0.01)}
+        chain = FallbackChain(self._config(hedge_min_samples=3, hedge_budget_ratio=1.0))
+        for _ in range(3):
+            chain._record_latency(AgentType.CLAUDE, 0.05)
+        delay = chain.hedge_delay(AgentType.CLAUDE)
+        request = GatewayRequest(task_name="test", prompt="Hello")
+
+        for _ in range(5):
+            response = await chain.execute(request, AgentType.CLAUDE, providers)
+            assert response.metadata["hedged"] is True
+
+        assert chain.hedge_delay(AgentType.CLAUDE) == delay
+        assert len(chain._latencies[AgentType.CLAUDE]) == 3